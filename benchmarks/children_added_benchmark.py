@@ -0,0 +1,76 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark of the insertion of many children into an active widget.
+
+The children are inserted into a Container, a Notebook and a Menu of a
+shown window, either one by one with `set_parent`, which notifies the
+parent with `child_added` for each child, or at once with
+`insert_children`, which notifies the parent with `children_added`. The
+reported time includes processing the events until the relayout is
+done.
+
+Usage: python children_added_benchmark.py [n_children ...]
+
+"""
+import sys
+import time
+
+from enaml.qt.QtWidgets import QApplication
+from enaml.qt.qt_application import QtApplication
+from enaml.widgets.api import (
+    Action, Container, Label, MainWindow, Menu, MenuBar, Notebook, Page
+)
+
+
+def make_children(kind, n_children):
+    if kind == 'container':
+        return [Label(text='label %d' % i) for i in range(n_children)]
+    if kind == 'notebook':
+        return [Page(title='page %d' % i) for i in range(n_children)]
+    return [Action(text='action %d' % i) for i in range(n_children)]
+
+
+def run(kind, n_children, batch):
+    window = MainWindow()
+    menu_bar = MenuBar(parent=window)
+    menu = Menu(title='menu', parent=menu_bar)
+    content = Container(parent=window)
+    notebook = Notebook(parent=content)
+    parent = {'container': content, 'notebook': notebook, 'menu': menu}[kind]
+    window.show()
+    QApplication.processEvents()
+
+    children = make_children(kind, n_children)
+    start = time.perf_counter()
+    if batch:
+        parent.insert_children(None, children)
+    else:
+        for child in children:
+            child.set_parent(parent)
+    QApplication.processEvents()
+    elapsed = time.perf_counter() - start
+    window.close()
+    window.destroy()
+    QApplication.processEvents()
+    return elapsed
+
+
+def main(sizes=(1000,)):
+    app = QtApplication()
+    for n_children in sizes:
+        for kind in ('container', 'notebook', 'menu'):
+            single = run(kind, n_children, False)
+            batch = run(kind, n_children, True)
+            print('%-9s %5d children: one by one %8.1f ms   batch %8.1f ms'
+                  % (kind, n_children, single * 1000, batch * 1000))
+    app.destroy()
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]]
+    main(*(sizes and [sizes]))
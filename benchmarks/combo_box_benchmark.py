@@ -0,0 +1,84 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the update of the items of large combo boxes.
+
+A ComboBox and an ObjectCombo are filled with many items, then a single
+item is appended, a single item is replaced and the first item is
+removed. The time of each update is reported along with the number of
+calls to the `to_string` function of the ObjectCombo.
+
+Usage: python combo_box_benchmark.py [n_items] [n_updates]
+
+"""
+import sys
+import time
+
+from enaml.qt.QtWidgets import QApplication
+from enaml.qt.qt_application import QtApplication
+from enaml.widgets.api import ComboBox, ObjectCombo, Window, Container
+
+
+def bench(widget, make, n_items, n_updates):
+    """ Time the updates of the items of a combo box.
+
+    """
+    results = []
+    edits = (
+        ('append', lambda items, i: items + [make(n_items + i)]),
+        ('replace', lambda items, i: items[:10] + [make(-i)] + items[11:]),
+        ('remove first', lambda items, i: items[1:]),
+    )
+    for label, edit in edits:
+        items = widget.items = [make(v) for v in range(n_items)]
+        QApplication.processEvents()
+        start = time.perf_counter()
+        for i in range(n_updates):
+            items = edit(items, i + 1)
+            widget.items = items
+            QApplication.processEvents()
+        results.append((label, (time.perf_counter() - start) / n_updates))
+    return results
+
+
+def main(n_items=20000, n_updates=20):
+    app = QtApplication()
+    calls = [0]
+
+    def to_string(item):
+        calls[0] += 1
+        return 'item %d' % item
+
+    window = Window()
+    container = Container(parent=window)
+    combo = ComboBox(parent=container)
+    obj_combo = ObjectCombo(parent=container, to_string=to_string)
+    values = list(range(n_items))
+
+    start = time.perf_counter()
+    combo.items = [str(v) for v in values]
+    obj_combo.items = values
+    window.show()
+    QApplication.processEvents()
+    print('%d items, show %.1f ms, %d to_string calls'
+          % (n_items, (time.perf_counter() - start) * 1e3, calls[0]))
+
+    for label, elapsed in bench(combo, str, n_items, n_updates):
+        print('ComboBox     %-12s %8.3f ms' % (label, elapsed * 1e3))
+    for label, elapsed in bench(obj_combo, int, n_items, n_updates):
+        print('ObjectCombo  %-12s %8.3f ms' % (label, elapsed * 1e3))
+    obj_combo.items = values
+    QApplication.processEvents()
+    calls[0] = 0
+    obj_combo.items = values + [n_items]
+    QApplication.processEvents()
+    print('ObjectCombo  append: %d to_string calls' % calls[0])
+    window.close()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,74 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Stress benchmark for the delivery of deferred calls.
+
+Several worker threads post deferred calls as fast as they can while the
+main gui thread executes them. The end-to-end latency of each call and
+the CPU time consumed by the gui thread are reported.
+
+Usage: python deferred_call_benchmark.py [n_calls] [n_threads]
+
+"""
+import sys
+import threading
+import time
+
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.q_deferred_caller import deferredCall
+
+
+def percentile(values, fraction):
+    """ Get the given fraction percentile of a sorted list of values.
+
+    """
+    index = min(int(len(values) * fraction), len(values) - 1)
+    return values[index]
+
+
+def main(n_calls=100000, n_threads=4):
+    app = QtApplication()
+    latencies = []
+    per_thread = n_calls // n_threads
+    total = per_thread * n_threads
+
+    def callback(posted):
+        latencies.append(time.perf_counter() - posted)
+        if len(latencies) == total:
+            app.stop()
+
+    def worker():
+        for _ in range(per_thread):
+            deferredCall(callback, time.perf_counter())
+
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+
+    def start():
+        for t in threads:
+            t.start()
+
+    app.deferred_call(start)
+    cpu_start = time.thread_time()
+    wall_start = time.perf_counter()
+    app.start()
+    wall = time.perf_counter() - wall_start
+    cpu = time.thread_time() - cpu_start
+    for t in threads:
+        t.join()
+
+    latencies.sort()
+    print('calls:            %d (%d threads)' % (total, n_threads))
+    print('wall time:        %.3f s' % wall)
+    print('gui thread cpu:   %.3f s' % cpu)
+    print('throughput:       %.0f calls/s' % (total / wall))
+    print('latency median:   %.3f ms' % (percentile(latencies, 0.5) * 1e3))
+    print('latency p99:      %.3f ms' % (percentile(latencies, 0.99) * 1e3))
+    print('latency max:      %.3f ms' % (latencies[-1] * 1e3))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,111 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark of the dock area hit testing performed during a drag.
+
+A dock area is filled with a grid of dock items, split in columns of
+tabbed and stacked items. The number of hit tests per second is then
+measured for the full layout walk of 'layout_hit_test' and for the
+LayoutHitIndex used by the dock manager during a drag session.
+
+Usage: python dock_hit_test_benchmark.py [n_items ...]
+
+"""
+import random
+import sys
+import time
+
+from enaml.layout.api import (
+    DockLayout, HSplitLayout, TabLayout, VSplitLayout
+)
+from enaml.qt.QtCore import QPoint
+from enaml.qt.QtWidgets import QApplication
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.docking.dock_manager import DockManager
+from enaml.qt.docking.layout_handling import LayoutHitIndex, layout_hit_test
+from enaml.qt.docking.q_dock_area import QDockArea
+from enaml.qt.docking.q_dock_item import QDockItem
+
+
+def make_layout(names, n_columns=8):
+    """ Create a layout of columns alternating split and tabbed items.
+
+    """
+    columns = []
+    size = max(1, len(names) // n_columns)
+    for index in range(0, len(names), size):
+        chunk = names[index:index + size]
+        if len(columns) % 2:
+            columns.append(TabLayout(*chunk))
+        else:
+            columns.append(VSplitLayout(*chunk))
+    return DockLayout(HSplitLayout(*columns))
+
+
+def measure(func, points, min_time=0.5):
+    """ Get the number of calls per second of a hit test function.
+
+    """
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        for pos in points:
+            func(pos)
+        count += len(points)
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def run(n_items):
+    area = QDockArea()
+    area.resize(1600, 1200)
+    manager = DockManager(area)
+    names = []
+    for index in range(n_items):
+        item = QDockItem(area)
+        name = 'item%d' % index
+        item.setObjectName(name)
+        manager.add_item(item)
+        names.append(name)
+    manager.apply_layout(make_layout(names))
+    area.show()
+    QApplication.processEvents()
+
+    rand = random.Random(0)
+    points = [QPoint(rand.randrange(area.width()),
+                     rand.randrange(area.height())) for _ in range(1000)]
+
+    start = time.perf_counter()
+    index = LayoutHitIndex(area)
+    build = time.perf_counter() - start
+
+    assert area.centralWidget() is not None
+    for pos in points:
+        assert index.hit_test(pos) is layout_hit_test(area, pos)
+    walk_rate = measure(lambda pos: layout_hit_test(area, pos), points)
+    index_rate = measure(index.hit_test, points)
+
+    print('%5d items: walk %9.0f hits/s   index %9.0f hits/s   '
+          'speedup %5.1fx   index build %.2f ms'
+          % (n_items, walk_rate, index_rate, index_rate / walk_rate,
+             build * 1e3))
+
+    area.hide()
+    return area, manager
+
+
+def main(sizes=(10, 40, 80, 160)):
+    app = QtApplication()
+    areas = [run(n_items) for n_items in sizes]
+    del areas
+    app.destroy()
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]]
+    main(*(sizes and [sizes]))
@@ -0,0 +1,120 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark of the proximity search performed when dragging a floating
+dock frame.
+
+A number of floating dock items are laid out on a grid spanning a few
+virtual monitors. The number of proximity queries per second is then
+measured for a linear scan over all the frames, which is what the
+proximity handler used to do, and for the spatial index of the handler.
+The rate of full 'drag_move_frame' calls is reported as well.
+
+Usage: python dock_proximity_benchmark.py [n_frames ...]
+
+"""
+import random
+import sys
+import time
+
+from enaml.layout.api import DockLayout, ItemLayout
+from enaml.qt.QtCore import QPoint, QRect
+from enaml.qt.QtWidgets import QApplication
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.docking.dock_manager import DockManager
+from enaml.qt.docking.q_dock_area import QDockArea
+from enaml.qt.docking.q_dock_item import QDockItem
+
+
+def linear_proximal_frames(handler, rect, distance):
+    """ The proximity search walking all the frames of a handler.
+
+    """
+    d = max(0, distance)
+    return [frame for frame in handler._nodes
+            if rect.intersects(frame.frameGeometry().adjusted(-d, -d, d, d))]
+
+
+def measure(func, args, min_time=0.5):
+    """ Get the number of calls per second of a function.
+
+    """
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        for arg in args:
+            func(*arg)
+        count += len(args)
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def run(n_frames, width=5760, height=2160):
+    rand = random.Random(0)
+    area = QDockArea()
+    manager = DockManager(area)
+    items = []
+    for index in range(n_frames):
+        item = QDockItem(area)
+        name = 'item%d' % index
+        item.setObjectName(name)
+        manager.add_item(item)
+        x = rand.randrange(width - 300)
+        y = rand.randrange(height - 200)
+        w = rand.randrange(150, 300)
+        h = rand.randrange(100, 200)
+        items.append(ItemLayout(name, floating=True, geometry=(x, y, w, h)))
+    manager.apply_layout(DockLayout(*items))
+    area.show()
+    QApplication.processEvents()
+
+    handler = manager._proximity_handler
+    dist = manager._snap_dist
+    frames = list(handler._nodes)
+    queries = []
+    for _ in range(500):
+        frame = rand.choice(frames)
+        pos = QPoint(rand.randrange(width), rand.randrange(height))
+        queries.append((QRect(pos, frame.frameGeometry().size()), dist))
+
+    for rect, d in queries:
+        expected = linear_proximal_frames(handler, rect, d)
+        assert list(handler.proximalFrames(rect, d)) == expected
+
+    linear_rate = measure(
+        lambda rect, d: linear_proximal_frames(handler, rect, d), queries
+    )
+    index_rate = measure(
+        lambda rect, d: list(handler.proximalFrames(rect, d)), queries
+    )
+
+    frame = frames[0]
+    moves = [(frame, QPoint(rand.randrange(width), rand.randrange(height)),
+              QPoint(0, 0)) for _ in range(200)]
+    drag_rate = measure(manager.drag_move_frame, moves)
+    manager._overlay.hide()
+
+    print('%5d frames: linear %9.0f queries/s   index %9.0f queries/s   '
+          'speedup %5.1fx   drag_move_frame %7.0f moves/s'
+          % (n_frames, linear_rate, index_rate, index_rate / linear_rate,
+             drag_rate))
+
+    area.hide()
+    return area, manager
+
+
+def main(sizes=(10, 100, 400)):
+    app = QtApplication()
+    areas = [run(n_frames) for n_frames in sizes]
+    del areas
+    app.destroy()
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]]
+    main(*(sizes and [sizes]))
@@ -0,0 +1,81 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark of the resizing of a flow area holding many items.
+
+A flow area is filled with thumbnail sized flow items and shown, then
+resized through a range of widths. The time of each resize is measured
+for the complete relayout performed by Qt, which queries the height for
+width of the flow layout several times before setting its geometry. The
+time to change the preferred size of a single item near the end of the
+flow is reported as well.
+
+Usage: python flow_layout_benchmark.py [n_items ...]
+
+"""
+import random
+import sys
+import time
+
+from enaml.qt.QtCore import QSize
+from enaml.qt.QtWidgets import QApplication
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.qt_flow_area import QFlowArea
+from enaml.qt.qt_flow_item import QFlowItem
+
+
+def run(n_items, n_resizes=20):
+    rand = random.Random(0)
+    area = QFlowArea()
+    layout = area.layout()
+    items = []
+    for _ in range(n_items):
+        item = QFlowItem()
+        item.setPreferredSize(
+            QSize(rand.randrange(80, 160), rand.randrange(80, 120))
+        )
+        layout.addWidget(item)
+        items.append(item)
+    area.resize(1000, 800)
+    start = time.perf_counter()
+    area.show()
+    QApplication.processEvents()
+    show_time = time.perf_counter() - start
+
+    widths = [800 + 400 * i // n_resizes for i in range(n_resizes)]
+    start = time.perf_counter()
+    for width in widths:
+        area.resize(width, 800)
+        QApplication.processEvents()
+    resize_time = (time.perf_counter() - start) / n_resizes
+
+    start = time.perf_counter()
+    for i in range(n_resizes):
+        item = items[-1 - i]
+        item.setPreferredSize(QSize(100 + i, 100))
+        QApplication.processEvents()
+    update_time = (time.perf_counter() - start) / n_resizes
+
+    print('%6d items: show %8.1f ms   resize %8.1f ms   '
+          'item update %8.1f ms'
+          % (n_items, show_time * 1000, resize_time * 1000,
+             update_time * 1000))
+    area.hide()
+    area.deleteLater()
+    QApplication.processEvents()
+
+
+def main(sizes=(500, 2000, 10000)):
+    app = QtApplication()
+    for n_items in sizes:
+        run(n_items)
+    app.destroy()
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]]
+    main(*(sizes and [sizes]))
@@ -0,0 +1,86 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the display of encoded image thumbnails.
+
+ImageViews are created for distinct JPEG images, which are scaled to
+thumbnails. The time during which the gui thread is blocked to create the
+views is reported, along with the time until all the images are
+displayed, when the images are decoded on the gui thread or on worker
+threads.
+
+Usage: python image_decoding_benchmark.py [n_images] [size]
+
+"""
+import sys
+import time
+
+from enaml.image import Image
+from enaml.qt.QtCore import QBuffer, QByteArray, QIODevice
+from enaml.qt.QtGui import QColor, QImage, QPainter
+from enaml.qt.QtWidgets import QApplication
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.q_resource_helpers import RESOURCE_CACHE
+from enaml.widgets.api import ImageView
+
+
+def make_jpeg(index, size):
+    """ Encode a JPEG image with some content.
+
+    """
+    qimage = QImage(size, size, QImage.Format_RGB32)
+    qimage.fill(QColor(index % 256, (index * 7) % 256, (index * 13) % 256))
+    painter = QPainter(qimage)
+    for i in range(0, size, 8):
+        painter.drawLine(0, i, size, (i * index) % size)
+    painter.end()
+    array = QByteArray()
+    buffer = QBuffer(array)
+    buffer.open(QIODevice.WriteOnly)
+    qimage.save(buffer, 'JPEG')
+    return bytes(array)
+
+
+def run(data, decode_async):
+    """ Create the image views of the thumbnails and time the display.
+
+    The views are not laid out in a window, so that only the cost of
+    the images is measured.
+
+    """
+    RESOURCE_CACHE.clear()
+    views = []
+    for item in data:
+        image = Image(data=item, size=(64, 64), decode_async=decode_async)
+        views.append(ImageView(image=image))
+    start = time.perf_counter()
+    for view in views:
+        view.initialize()
+        view.activate_proxy()
+    blocked = time.perf_counter() - start
+    widgets = [view.proxy.widget for view in views]
+    while any(widget.pixmap() is None for widget in widgets):
+        QApplication.processEvents()
+    total = time.perf_counter() - start
+    for view in views:
+        view.destroy()
+    return blocked, total
+
+
+def main(n_images=300, size=512):
+    app = QtApplication()
+    data = [make_jpeg(i, size) for i in range(n_images)]
+    print('%d images of %dx%d' % (n_images, size, size))
+    for decode_async in (False, True):
+        blocked, total = run(data, decode_async)
+        label = 'worker threads' if decode_async else 'gui thread'
+        print('%-14s  blocked %7.1f ms   all images %7.1f ms'
+              % (label, blocked * 1e3, total * 1e3))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,131 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the frame rate of an ImageView fed with numpy frames.
+
+Each frame is a numpy array which is wrapped in an Image and set on an
+ImageView. The frames are either passed directly to the Image, in which
+case the QImage is built over the array, or first copied to bytes with
+`tobytes()`. The time spent building the QImage of each frame is also
+reported on its own.
+
+In the live mode, the frames are copied into the buffer of a single Image
+and the view is refreshed with `update_image`, which throttles the
+refreshes to the refresh rate of the screen. The view is scaled to fit a
+window of half the size of the frames in all modes.
+
+Usage: python image_frame_rate_benchmark.py [n_frames] [width] [height]
+
+"""
+import sys
+import time
+
+import numpy as np
+
+from enaml.image import Image
+from enaml.qt.QtWidgets import QApplication
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.q_resource_helpers import QImage_from_Image
+from enaml.widgets.api import ImageView, Window
+
+
+FORMATS = {
+    'argb32': lambda w, h: np.zeros((h, w), np.uint32),
+    'rgb888': lambda w, h: np.zeros((h, w, 3), np.uint8),
+    'grayscale8': lambda w, h: np.zeros((h, w), np.uint8),
+    'grayscale16': lambda w, h: np.zeros((h, w), np.uint16),
+}
+
+
+def make_frames(format, width, height, count=4):
+    """ Create a few frames with different contents.
+
+    """
+    frames = []
+    for i in range(count):
+        frame = FORMATS[format](width, height)
+        frame[...] = (i + 1) * 37
+        frames.append(frame)
+    return frames
+
+
+def bench_convert(frames, format, size, n_frames, copy):
+    """ Time the creation of the QImage of each frame.
+
+    """
+    start = time.perf_counter()
+    for i in range(n_frames):
+        frame = frames[i % len(frames)]
+        data = frame.tobytes() if copy else frame
+        image = Image(format=format, raw_size=size, data=data)
+        QImage_from_Image(image)
+    return (time.perf_counter() - start) / n_frames
+
+
+def bench_view(view, frames, format, size, n_frames, copy):
+    """ Time the display of each frame in an image view.
+
+    """
+    start = time.perf_counter()
+    for i in range(n_frames):
+        frame = frames[i % len(frames)]
+        data = frame.tobytes() if copy else frame
+        view.image = Image(format=format, raw_size=size, data=data)
+        QApplication.processEvents()
+    return (time.perf_counter() - start) / n_frames
+
+
+def bench_live(view, frames, format, size, n_frames):
+    """ Time the in place update of the frames of an image view.
+
+    """
+    buffer = frames[0].copy()
+    view.image = Image(format=format, raw_size=size, data=buffer)
+    QApplication.processEvents()
+    widget = view.proxy.widget
+    refreshes = []
+    refresh = widget._refreshImage
+    widget._refreshImage = lambda: refreshes.append(1) or refresh()
+    start = time.perf_counter()
+    for i in range(n_frames):
+        buffer[...] = frames[i % len(frames)]
+        view.update_image()
+        QApplication.processEvents()
+    elapsed = time.perf_counter() - start
+    del widget._refreshImage
+    return elapsed / n_frames, len(refreshes)
+
+
+def main(n_frames=200, width=1920, height=1080):
+    app = QtApplication()
+    window = Window(initial_size=(width // 2, height // 2))
+    view = ImageView(parent=window, scale_to_fit=True)
+    window.show()
+    QApplication.processEvents()
+    size = (width, height)
+    print('%d frames of %dx%d' % (n_frames, width, height))
+    for format in FORMATS:
+        frames = make_frames(format, width, height)
+        mb = frames[0].nbytes / 1e6
+        for copy in (True, False):
+            label = 'tobytes' if copy else 'buffer'
+            convert = bench_convert(frames, format, size, n_frames, copy)
+            display = bench_view(view, frames, format, size, n_frames,
+                                 copy)
+            print('%-12s %5.1f MB %-8s  QImage %7.3f ms   '
+                  'ImageView %7.2f ms (%6.1f fps)'
+                  % (format, mb, label, convert * 1e3, display * 1e3,
+                     1.0 / display))
+        live, refreshes = bench_live(view, frames, format, size, n_frames)
+        print('%-12s %5.1f MB %-8s  %d refreshes        '
+              'ImageView %7.2f ms (%6.1f fps)'
+              % (format, mb, 'live', refreshes, live * 1e3, 1.0 / live))
+    window.close()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
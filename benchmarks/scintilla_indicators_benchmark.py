@@ -0,0 +1,125 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the update of the indicators and markers of a Scintilla.
+
+A Scintilla editor holds a large document and a linter like set of
+indicators and markers. The sets are updated repeatedly with a few
+diagnostics added and removed each time, as after a keystroke, and the
+time of each update is reported. The same updates are also timed when
+every indicator and marker is cleared and added again, which is what
+the editor used to do.
+
+Usage: python scintilla_indicators_benchmark.py [n_lines] [n_indicators]
+                                                [n_updates]
+
+"""
+import random
+import sys
+import time
+
+from enaml.qt.QtWidgets import QApplication
+from enaml.qt.qt_application import QtApplication
+from enaml.image import Image
+from enaml.scintilla.api import Scintilla, ScintillaIndicator, ScintillaMarker
+from enaml.widgets.api import Container, Window
+
+# A 1x1 transparent PNG used as the image of the markers.
+PNG = (
+    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01'
+    b'\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\x0bIDATx\x9cc`\x00\x02'
+    b'\x00\x00\x05\x00\x01z^\xab?\x00\x00\x00\x00IEND\xaeB`\x82'
+)
+
+
+def make_diagnostics(rand, n_lines, n_indicators):
+    """ Create the (line, start, stop, style) of random diagnostics.
+
+    """
+    styles = ('squiggle', 'plain', 'box')
+    diagnostics = set()
+    while len(diagnostics) < n_indicators:
+        line = rand.randrange(n_lines)
+        start = rand.randrange(40)
+        diagnostics.add((line, start, start + rand.randint(1, 20),
+                         rand.choice(styles)))
+    return diagnostics
+
+
+def update(editor, diagnostics, image):
+    """ Set the indicators and markers of the diagnostics on an editor.
+
+    """
+    editor.indicators = [
+        ScintillaIndicator(start=(line, start), stop=(line, stop),
+                           style=style, color='#ff0000')
+        for line, start, stop, style in diagnostics
+    ]
+    editor.markers = [
+        ScintillaMarker(line=line, image=image)
+        for line, _, _, _ in diagnostics
+    ]
+
+
+def clear(editor):
+    """ Clear every indicator and marker of an editor.
+
+    """
+    proxy = editor.proxy
+    w = proxy.widget
+    w.markerDeleteAll()
+    lines = w.lines()
+    column = w.lineLength(lines)
+    for style_id in proxy._indicator_styles.values():
+        w.clearIndicatorRange(0, 0, lines, column, style_id)
+    # Drop the declared sets so that they are all added again.
+    editor.indicators = []
+    editor.markers = []
+
+
+def bench(editor, n_lines, n_indicators, n_updates, full):
+    """ Time the updates of the diagnostics of an editor.
+
+    """
+    rand = random.Random(0)
+    image = Image(data=PNG)
+    diagnostics = make_diagnostics(rand, n_lines, n_indicators)
+    update(editor, diagnostics, image)
+    QApplication.processEvents()
+    elapsed = 0.0
+    for _ in range(n_updates):
+        # A keystroke fixes a few diagnostics and reports a few new ones.
+        diagnostics = set(rand.sample(sorted(diagnostics), n_indicators - 5))
+        diagnostics |= make_diagnostics(rand, n_lines, 5)
+        start = time.perf_counter()
+        if full:
+            clear(editor)
+        update(editor, diagnostics, image)
+        QApplication.processEvents()
+        elapsed += time.perf_counter() - start
+    return elapsed / n_updates
+
+
+def main(n_lines=20000, n_indicators=2000, n_updates=50):
+    app = QtApplication()
+    window = Window(initial_size=(800, 600))
+    container = Container(parent=window)
+    editor = Scintilla(parent=container)
+    window.show()
+    QApplication.processEvents()
+    editor.proxy.set_text('\n'.join('x = %d  # some code of the line %d'
+                                    % (i, i) for i in range(n_lines)))
+    print('%d lines, %d indicators and markers, %d updates'
+          % (n_lines, n_indicators, n_updates))
+    for label, full in (('diff', False), ('clear and refill', True)):
+        elapsed = bench(editor, n_lines, n_indicators, n_updates, full)
+        print('%-18s %8.2f ms per update' % (label, elapsed * 1e3))
+    window.close()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,98 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the scrolling throughput of a TableView.
+
+A TableView displays NumPy columns of increasing lengths through a
+ColumnTableProvider. The time to show the view is reported, then the
+view is scrolled page by page and repainted after each step, to report
+the number of frames per second and the number of cells fetched from
+the provider per frame. Both should not depend on the number of rows.
+
+Usage: python table_view_benchmark.py [n_columns] [n_frames]
+
+"""
+import sys
+import time
+
+import numpy as np
+from atom.api import Int
+
+from enaml.qt.QtWidgets import QApplication
+from enaml.qt.qt_application import QtApplication
+from enaml.widgets.api import (
+    ColumnTableProvider, Container, TableView, Window
+)
+
+
+class CountingProvider(ColumnTableProvider):
+    """ A column provider counting the cells it fetches.
+
+    """
+    cells = Int()
+
+    def fetch(self, first_row, last_row, first_column, last_column):
+        self.cells += (last_row - first_row) * (last_column - first_column)
+        return super(CountingProvider, self).fetch(
+            first_row, last_row, first_column, last_column
+        )
+
+
+def make_columns(n_rows, n_columns):
+    """ Create the columns of a table alternating floats and integers.
+
+    """
+    rand = np.random.RandomState(0)
+    columns = []
+    for i in range(n_columns):
+        if i % 2:
+            columns.append(rand.randint(0, 1000000, n_rows))
+        else:
+            columns.append(rand.random_sample(n_rows))
+    return columns
+
+
+def bench(n_rows, n_columns, n_frames):
+    """ Time the display and the scrolling of a table.
+
+    """
+    provider = CountingProvider(columns=make_columns(n_rows, n_columns))
+    window = Window(initial_size=(1000, 700))
+    container = Container(parent=window)
+    table = TableView(parent=container, provider=provider)
+    start = time.perf_counter()
+    window.show()
+    QApplication.processEvents()
+    show = time.perf_counter() - start
+    widget = table.proxy.widget
+    bar = widget.verticalScrollBar()
+    viewport = widget.viewport()
+    provider.cells = 0
+    start = time.perf_counter()
+    for i in range(n_frames):
+        bar.setValue(bar.value() + bar.pageStep())
+        viewport.repaint()
+    scroll = (time.perf_counter() - start) / n_frames
+    cells = provider.cells / n_frames
+    window.close()
+    QApplication.processEvents()
+    return show, scroll, cells
+
+
+def main(n_columns=8, n_frames=200):
+    app = QtApplication()
+    print('%d columns, %d frames scrolled page by page' % (n_columns,
+                                                            n_frames))
+    for n_rows in (10000, 100000, 1000000, 10000000):
+        show, scroll, cells = bench(n_rows, n_columns, n_frames)
+        print('%9d rows  show %7.1f ms   frame %6.2f ms (%6.1f fps)   '
+              '%5.0f cells fetched per frame'
+              % (n_rows, show * 1e3, scroll * 1e3, 1.0 / scroll, cells))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
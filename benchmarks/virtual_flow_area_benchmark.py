@@ -0,0 +1,107 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark of a flow area holding many items, with and without
+virtualization.
+
+A flow area is filled with thumbnail sized flow items, either using a
+Looper which creates every item or a VirtualLooper which only creates
+the visible items. The time to show the window, the average time of a
+scroll step and the number of flow items created are reported.
+
+Usage: python virtual_flow_area_benchmark.py [n_items ...]
+
+"""
+import sys
+import time
+
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.qt.QtWidgets import QApplication
+from enaml.qt.qt_application import QtApplication
+from enaml.widgets.api import FlowItem
+
+
+SOURCE = """
+from enaml.core.api import Looper
+from enaml.widgets.api import (
+    Container, FlowArea, FlowItem, Label, VirtualLooper, Window
+)
+
+enamldef LooperMain(Window):
+    attr data
+    alias area
+    initial_size = (1000, 800)
+    Container:
+        FlowArea: area:
+            Looper:
+                iterable = data
+                FlowItem:
+                    preferred_size = (120, 90)
+                    Container:
+                        Label:
+                            text = str(loop.item)
+
+enamldef VirtualMain(Window):
+    attr data
+    alias area
+    initial_size = (1000, 800)
+    Container:
+        FlowArea: area:
+            VirtualLooper:
+                iterable = data
+                item_size = (120, 90)
+                FlowItem:
+                    Container:
+                        Label:
+                            text << str(loop.item)
+"""
+
+
+def compile_source(source):
+    code = EnamlCompiler.compile(parse(source, '<benchmark>'), '<benchmark>')
+    namespace = {}
+    exec(code, namespace)
+    return namespace
+
+
+def run(name, factory, n_items, n_scrolls=20):
+    start = time.perf_counter()
+    win = factory(data=list(range(n_items)))
+    win.show()
+    QApplication.processEvents()
+    show_time = time.perf_counter() - start
+
+    bar = win.area.proxy.widget.verticalScrollBar()
+    step = bar.pageStep()
+    start = time.perf_counter()
+    for i in range(n_scrolls):
+        bar.setValue(bar.value() + step)
+        QApplication.processEvents()
+    scroll_time = (time.perf_counter() - start) / n_scrolls
+
+    created = sum(isinstance(c, FlowItem) for c in win.area.children)
+    print('%-8s %6d items: show %8.1f ms   scroll %6.1f ms   '
+          '%6d widgets'
+          % (name, n_items, show_time * 1000, scroll_time * 1000, created))
+    win.close()
+    win.destroy()
+    QApplication.processEvents()
+
+
+def main(sizes=(500, 2000, 10000)):
+    app = QtApplication()
+    namespace = compile_source(SOURCE)
+    for n_items in sizes:
+        run('looper', namespace['LooperMain'], n_items)
+        run('virtual', namespace['VirtualMain'], n_items)
+    app.destroy()
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]]
+    main(*(sizes and [sizes]))
@@ -0,0 +1,114 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Benchmark the registration of plugins in a running UI workbench.
+
+Each plugin contributes a command and an action item to a shared menu.
+The plugins are registered one at a time with `register` and all at once
+with `register_many`, and the number of times the commands and the menus
+of the window were refreshed is reported along with the elapsed time.
+
+Usage: python workbench_register_benchmark.py [n_plugins ...]
+
+"""
+import sys
+import time
+
+import enaml
+from enaml.qt.qt_application import QtApplication
+from enaml.workbench.api import Extension, PluginManifest
+from enaml.workbench.core.api import Command
+from enaml.workbench.ui.api import ActionItem, MenuItem, UIWorkbench
+
+with enaml.imports():
+    from enaml.workbench.core.core_manifest import CoreManifest
+    from enaml.workbench.ui.ui_manifest import UIManifest
+
+
+COMMANDS_POINT = 'enaml.workbench.core.commands'
+
+ACTIONS_POINT = 'enaml.workbench.ui.actions'
+
+
+def handler(event):
+    pass
+
+
+def make_host():
+    """ Create the manifest which contributes the shared plugin menu.
+
+    """
+    manifest = PluginManifest(id='bench.host')
+    extension = Extension(parent=manifest, id='menus', point=ACTIONS_POINT)
+    MenuItem(parent=extension, path='/plugins', label='Plugins')
+    return manifest
+
+
+def make_plugin(index):
+    """ Create a manifest contributing a command and an action item.
+
+    """
+    plugin_id = 'bench.plugin%d' % index
+    command_id = plugin_id + '.command'
+    manifest = PluginManifest(id=plugin_id)
+    commands = Extension(parent=manifest, id='commands', point=COMMANDS_POINT)
+    Command(parent=commands, id=command_id, handler=handler)
+    actions = Extension(parent=manifest, id='actions', point=ACTIONS_POINT)
+    ActionItem(parent=actions, path='/plugins/action%d' % index,
+               label='Action %d' % index, command=command_id)
+    return manifest
+
+
+def run(n_plugins, bulk):
+    workbench = UIWorkbench()
+    workbench.register_many([CoreManifest(), UIManifest(), make_host()])
+    workbench.get_plugin('enaml.workbench.core')
+    ui = workbench.get_plugin('enaml.workbench.ui')
+    ui.show_window()
+
+    counts = {'commands': 0, 'menus': 0}
+
+    def on_commands(change):
+        if change['type'] == 'update':
+            counts['commands'] += 1
+
+    def on_menus(change):
+        if change['type'] == 'update':
+            counts['menus'] += 1
+
+    workbench.get_extension_point(COMMANDS_POINT).observe(
+        'extensions', on_commands
+    )
+    ui._model.observe('menus', on_menus)
+
+    manifests = [make_plugin(i) for i in range(n_plugins)]
+    start = time.perf_counter()
+    if bulk:
+        workbench.register_many(manifests)
+    else:
+        for manifest in manifests:
+            workbench.register(manifest)
+    elapsed = time.perf_counter() - start
+    refreshes = dict(counts)
+
+    workbench.unregister('enaml.workbench.ui')
+    return elapsed, refreshes
+
+
+def main(*sizes):
+    QtApplication()
+    for n_plugins in sizes or (10, 50, 150):
+        for bulk in (False, True):
+            elapsed, counts = run(n_plugins, bulk)
+            name = 'register_many' if bulk else 'register'
+            print('%4d plugins %-14s %8.3f s  commands refreshed: %4d  '
+                  'menus rebuilt: %4d' % (n_plugins, name, elapsed,
+                                          counts['commands'], counts['menus']))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -6,6 +6,7 @@
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
 from heapq import heappush, heappop
+from inspect import isawaitable
 from itertools import count
 from threading import Lock
 
@@ -67,14 +68,33 @@ class ScheduledTask(Atom):
         by the scheduler loop.
 
         """
+        awaiting = False
         try:
             if self._valid:
-                self._result = self._callback(*self._args, **self._kwargs)
-                if self._notify is not None:
-                    self._notify(self._result)
+                result = self._callback(*self._args, **self._kwargs)
+                if isawaitable(result):
+                    app = Application.instance()
+                    awaiting = app._await_task(self, result)
+                if not awaiting:
+                    self._complete(result)
         finally:
-            del self._notify
-            self._pending = False
+            if not awaiting:
+                self._finish()
+
+    def _complete(self, result):
+        """ Store the result of the task and notify the listener.
+
+        """
+        self._result = result
+        if self._notify is not None:
+            self._notify(result)
+
+    def _finish(self):
+        """ Mark the task as no longer pending.
+
+        """
+        del self._notify
+        self._pending = False
 
     #--------------------------------------------------------------------------
     # Public API
@@ -230,6 +250,31 @@ class Application(Atom):
                 priority, ignored, task = heappop(heap)
                 self.deferred_call(self._process_task, task)
 
+    def _await_task(self, task, awaitable):
+        """ Await the awaitable returned by the callback of a task.
+
+        Applications which integrate with an asynchronous event loop
+        should reimplement this method to run the awaitable and then
+        call `_complete` and `_finish` on the task.
+
+        Parameters
+        ----------
+        task : ScheduledTask
+            The task whose callback returned the awaitable.
+
+        awaitable : awaitable
+            The awaitable returned by the callback of the task.
+
+        Returns
+        -------
+        result : bool
+            True if the awaitable will be awaited, False if it should
+            be used as the result of the task. The default
+            implementation returns False.
+
+        """
+        return False
+
     @observe('style_sheet.destroyed')
     def _clear_destroyed_style_sheet(self, change):
         """ An observer which clears a destroyed style sheet.
@@ -319,6 +364,25 @@ class Application(Atom):
         """
         raise NotImplementedError
 
+    def warm_up_images(self, images, callback=None):
+        """ Decode a batch of images in the background.
+
+        The images are decoded on worker threads and cached by the
+        toolkit, so that they do not need to be decoded on the gui
+        thread when they are first used.
+
+        Parameters
+        ----------
+        images : iterable
+            The Image objects to decode.
+
+        callback : callable, optional
+            A callable invoked without arguments on the main gui thread
+            once all the images are decoded.
+
+        """
+        raise NotImplementedError
+
     #--------------------------------------------------------------------------
     # Public API
     #--------------------------------------------------------------------------
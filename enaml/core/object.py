@@ -221,13 +221,15 @@ class Object(Atom):
                     old_parent.child_removed(child)
 
         self._children = new
-        child_added = self.child_added
         child_moved = self.child_moved
+        added = []
         for child in insert_list:
             if child in insert_set:
-                child_added(child)
+                added.append(child)
             else:
                 child_moved(child)
+        if added:
+            self.children_added(added)
 
     def parent_changed(self, old, new):
         """ A method invoked when the parent of the object changes.
@@ -260,6 +262,24 @@ class Object(Atom):
         """
         pass
 
+    def children_added(self, children):
+        """ A method invoked when children are added to the object.
+
+        This method is called once by `insert_children` for all of the
+        new children. The default implementation calls `child_added`
+        for each child, in order. Subclasses may reimplement this method
+        to process the children as a batch.
+
+        Parameters
+        ----------
+        children : list
+            The children added to this object.
+
+        """
+        child_added = self.child_added
+        for child in children:
+            child_added(child)
+
     def child_moved(self, child):
         """ A method invoked when a child is moved in the object.
 
@@ -5,11 +5,23 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Atom, Enum, Bytes, Value, Coerced
+from atom.api import Atom, Bool, Enum, Value, Coerced
 
 from enaml.layout.geometry import Size
 
 
+def coerce_data(data):
+    """ Coerce the data of an image to bytes or a memoryview.
+
+    Strings are encoded to bytes and the other objects supporting the
+    buffer protocol are wrapped in a memoryview, without copying them.
+
+    """
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    return memoryview(data)
+
+
 class Image(Atom):
     """ An object representing an image.
 
@@ -34,8 +46,14 @@ class Image(Atom):
         'pgm',      # Portable Graymap
         'ppm',      # Portable Pixmap
         'tiff',     # Tagged Image File Format
-        'argb32',   # Raw data in the 0xAARRGGBB format.
-                    # The `raw_size` of the image must be provided.
+        'argb32',       # Raw data in the 0xAARRGGBB format.
+                        # The `raw_size` of the image must be provided.
+        'rgb888',       # Raw data in the 8-8-8 RGB byte order.
+                        # The `raw_size` of the image must be provided.
+        'grayscale8',   # Raw 8-bit grayscale data.
+                        # The `raw_size` of the image must be provided.
+        'grayscale16',  # Raw 16-bit grayscale data.
+                        # The `raw_size` of the image must be provided.
     )
 
     #: The (width, height) raw size of the image. This must be provided
@@ -54,9 +72,18 @@ class Image(Atom):
     #: The transform mode to use when the toolkit scales the image.
     transform_mode = Enum('smooth', 'fast')
 
-    # XXX this needs to be augmented to support arrays.
-    #: The bytestring holding the data for the image.
-    data = Bytes()
+    #: The data for the image. This is either a bytestring or, for the
+    #: raw formats, a memoryview over any object which supports the
+    #: buffer protocol, such as a numpy array. The buffer is used in
+    #: place by the toolkit and should not be modified afterwards. The
+    #: rows of a raw image start at the stride of the buffer for a
+    #: multi-dimensional buffer, and are packed otherwise.
+    data = Coerced((bytes, memoryview), factory=bytes, coercer=coerce_data)
+
+    #: Whether the toolkit may decode the image on a worker thread. The
+    #: consumers of the image then display a placeholder until the image
+    #: is decoded, instead of blocking the gui thread.
+    decode_async = Bool(False)
 
     #: Storage space for use by a toolkit backend to use as needed.
     #: This should not typically be manipulated by user code.
@@ -0,0 +1,746 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+""" Compact serialization of dock layout trees.
+
+A dock layout is encoded as a tree of plain lists, referred to as the
+layout data. The first element of each list is a one character tag
+identifying the node type, and the remaining elements hold the node
+state in a fixed order:
+
+    ItemLayout      ['i', name, flags, geometry]
+    TabLayout       ['t', items, tab_position, index]
+    SplitLayout     ['s', items, orientation, sizes]
+    DockBarLayout   ['b', items, position]
+    AreaLayout      ['a', item, dock_bars, flags, geometry]
+    DockLayout      ['d', items]
+
+The flags are a bit field of the 'floating', 'linked' and 'maximized'
+attributes, the geometry is None when it is the default geometry, and
+the orientation is stored as 'h' or 'v'.
+
+The layout data can be stored as JSON text or as a binary string. Both
+forms are versioned, and both decode to the layout data, which can be
+checked by a DockLayoutDataValidator before any layout node is created.
+Decoding raises a ValueError for malformed input, so that the decoded
+data always has the structure described above.
+
+"""
+import json
+
+from .dock_layout import (
+    ItemLayout, TabLayout, SplitLayout, HSplitLayout, VSplitLayout,
+    DockBarLayout, AreaLayout, DockLayout, DockLayoutValidator
+)
+
+
+#: The version of the serialized layout formats.
+LAYOUT_VERSION = 1
+
+#: The header of the binary layout format.
+_MAGIC = b'EDL'
+
+#: The flag bits of the item and area layouts.
+_FLOATING = 0x1
+_LINKED = 0x2
+_MAXIMIZED = 0x4
+
+#: The extra flag bits used by the binary format.
+_HAS_GEOMETRY = 0x8
+_HAS_ITEM = 0x10
+
+_TAB_POSITIONS = ('top', 'bottom', 'left', 'right')
+
+_BAR_POSITIONS = ('top', 'right', 'bottom', 'left')
+
+_ORIENTATIONS = ('h', 'v')
+
+_DEFAULT_GEOMETRY = (-1, -1, -1, -1)
+
+#: The length of the layout data of each tag.
+_DATA_LENGTHS = {'i': 4, 't': 4, 's': 4, 'b': 3, 'a': 5, 'd': 2}
+
+#: The tags of the layout data which can be a child of each tag.
+_ITEM_TAGS = {
+    't': ('i',),
+    's': ('i', 't', 's'),
+    'b': ('i',),
+    'a': ('i', 't', 's'),
+    'd': ('i', 'a'),
+}
+
+
+def _flags(node):
+    """ Get the flags of an item or area layout.
+
+    """
+    flags = 0
+    if node.floating:
+        flags |= _FLOATING
+    if node.linked:
+        flags |= _LINKED
+    if node.maximized:
+        flags |= _MAXIMIZED
+    return flags
+
+
+def _geometry(node):
+    """ Get the geometry of an item or area layout as a list or None.
+
+    """
+    geo = node.geometry
+    geo = [geo.x, geo.y, geo.width, geo.height]
+    if tuple(geo) == _DEFAULT_GEOMETRY:
+        return None
+    return geo
+
+
+def _state(flags, geometry):
+    """ Get the keyword state of an item or area layout.
+
+    """
+    state = {}
+    if flags & _FLOATING:
+        state['floating'] = True
+    if flags & _LINKED:
+        state['linked'] = True
+    if flags & _MAXIMIZED:
+        state['maximized'] = True
+    if geometry is not None:
+        state['geometry'] = geometry
+    return state
+
+
+def _is_int(value):
+    """ Get whether a value of the layout data is an integer.
+
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _check_geometry(tag, geometry):
+    """ Check the geometry of the layout data of an item or area.
+
+    """
+    if geometry is None:
+        return
+    if (not isinstance(geometry, list) or len(geometry) != 4 or
+            not all(_is_int(value) for value in geometry)):
+        raise ValueError("invalid geometry in '%s' layout data" % tag)
+
+
+def _check_items(tag, items, tags):
+    """ Check the child items of the layout data of a node.
+
+    """
+    if not isinstance(items, list):
+        raise ValueError("invalid items in '%s' layout data" % tag)
+    for item in items:
+        _check_data(item, tags)
+
+
+def _check_data(node, tags=None):
+    """ Check the structure of the layout data of a node.
+
+    Parameters
+    ----------
+    node : object
+        The layout data to check.
+
+    tags : tuple, optional
+        The tags allowed for the node. By default, any tag is allowed.
+
+    Raises
+    ------
+    ValueError
+        If the data is not valid layout data.
+
+    """
+    if not isinstance(node, list) or not node:
+        raise ValueError("invalid layout data node")
+    tag = node[0]
+    if not isinstance(tag, str) or tag not in _DATA_LENGTHS:
+        raise ValueError("invalid layout data tag '%s'" % (tag,))
+    if tags is not None and tag not in tags:
+        raise ValueError("unexpected '%s' layout data item" % tag)
+    if len(node) != _DATA_LENGTHS[tag]:
+        raise ValueError("invalid length of '%s' layout data" % tag)
+    if tag == 'i':
+        if not isinstance(node[1], str) or not _is_int(node[2]):
+            raise ValueError("invalid 'i' layout data")
+        _check_geometry(tag, node[3])
+    elif tag == 't':
+        if node[2] not in _TAB_POSITIONS or not _is_int(node[3]):
+            raise ValueError("invalid 't' layout data")
+        _check_items(tag, node[1], _ITEM_TAGS[tag])
+    elif tag == 's':
+        sizes = node[3]
+        if (node[2] not in _ORIENTATIONS or not isinstance(sizes, list) or
+                not all(_is_int(size) for size in sizes)):
+            raise ValueError("invalid 's' layout data")
+        _check_items(tag, node[1], _ITEM_TAGS[tag])
+    elif tag == 'b':
+        if node[2] not in _BAR_POSITIONS:
+            raise ValueError("invalid 'b' layout data")
+        _check_items(tag, node[1], _ITEM_TAGS[tag])
+    elif tag == 'a':
+        if not _is_int(node[3]):
+            raise ValueError("invalid 'a' layout data")
+        _check_geometry(tag, node[4])
+        if node[1] is not None:
+            _check_data(node[1], _ITEM_TAGS[tag])
+        _check_items(tag, node[2], ('b',))
+    else:
+        _check_items(tag, node[1], _ITEM_TAGS[tag])
+
+
+#------------------------------------------------------------------------------
+# Layout Data
+#------------------------------------------------------------------------------
+def layout_to_data(node):
+    """ Convert a layout node into its layout data.
+
+    Parameters
+    ----------
+    node : LayoutNode
+        The layout node to convert. This is typically a DockLayout,
+        but any node of a dock layout tree is supported.
+
+    Returns
+    -------
+    result : list
+        The layout data for the node.
+
+    """
+    if isinstance(node, ItemLayout):
+        return ['i', node.name, _flags(node), _geometry(node)]
+    if isinstance(node, TabLayout):
+        items = [layout_to_data(item) for item in node.items]
+        return ['t', items, node.tab_position, node.index]
+    if isinstance(node, SplitLayout):
+        items = [layout_to_data(item) for item in node.items]
+        return ['s', items, node.orientation[0], list(node.sizes)]
+    if isinstance(node, DockBarLayout):
+        items = [layout_to_data(item) for item in node.items]
+        return ['b', items, node.position]
+    if isinstance(node, AreaLayout):
+        item = node.item
+        if item is not None:
+            item = layout_to_data(item)
+        bars = [layout_to_data(bar) for bar in node.dock_bars]
+        return ['a', item, bars, _flags(node), _geometry(node)]
+    if isinstance(node, DockLayout):
+        return ['d', [layout_to_data(item) for item in node.items]]
+    msg = "cannot serialize a node of type '%s'"
+    raise TypeError(msg % type(node).__name__)
+
+
+def layout_from_data(data):
+    """ Create a layout node from its layout data.
+
+    Parameters
+    ----------
+    data : list
+        The layout data for the node.
+
+    Returns
+    -------
+    result : LayoutNode
+        The layout node described by the data.
+
+    """
+    tag = data[0]
+    if tag == 'i':
+        return ItemLayout(data[1], **_state(data[2], data[3]))
+    if tag == 't':
+        items = [layout_from_data(item) for item in data[1]]
+        return TabLayout(*items, tab_position=data[2], index=data[3])
+    if tag == 's':
+        items = [layout_from_data(item) for item in data[1]]
+        split = HSplitLayout if data[2] == 'h' else VSplitLayout
+        return split(*items, sizes=list(data[3]))
+    if tag == 'b':
+        items = [layout_from_data(item) for item in data[1]]
+        return DockBarLayout(*items, position=data[2])
+    if tag == 'a':
+        item = data[1]
+        if item is not None:
+            item = layout_from_data(item)
+        bars = [layout_from_data(bar) for bar in data[2]]
+        state = _state(data[3], data[4])
+        return AreaLayout(item, dock_bars=bars, **state)
+    if tag == 'd':
+        return DockLayout(*[layout_from_data(item) for item in data[1]])
+    raise ValueError("invalid layout data tag '%s'" % (tag,))
+
+
+class DockLayoutDataValidator(DockLayoutValidator):
+    """ A dock layout validator which operates on layout data.
+
+    The validator emits the same warnings as the DockLayoutValidator,
+    but it walks the decoded layout data, so a stored layout can be
+    checked without creating its layout nodes.
+
+    """
+    #: The mapping of layout data tag to visitor method name.
+    _visitors = {
+        'i': 'visit_ItemLayout',
+        't': 'visit_TabLayout',
+        's': 'visit_SplitLayout',
+        'b': 'visit_DockBarLayout',
+        'a': 'visit_AreaLayout',
+        'd': 'visit_DockLayout',
+    }
+
+    def visit(self, node):
+        """ The main visitor dispatch method.
+
+        Parameters
+        ----------
+        node : list
+            The layout data for a node of the tree.
+
+        """
+        name = self._visitors.get(node[0])
+        if name is None:
+            self.default_visit(node)
+        else:
+            getattr(self, name)(node)
+
+    def default_visit(self, node):
+        """ Raise an error for an unknown layout data tag.
+
+        """
+        raise ValueError("invalid layout data tag '%s'" % (node[0],))
+
+    def visit_ItemLayout(self, node):
+        """ The visitor method for ItemLayout data.
+
+        """
+        name = node[1]
+        flags = node[2]
+        if name in self._seen_items:
+            self.warn("duplicate use of ItemLayout name '%s'" % name)
+        self._seen_items.add(name)
+        if not flags & _FLOATING:
+            if node[3] is not None and -1 not in node[3]:
+                self.warn("non-floating ItemLayout with specific geometry")
+            if flags & _LINKED:
+                self.warn("non-floating ItemLayout marked as linked")
+            if flags & _MAXIMIZED and id(node) in self._cant_maximize:
+                msg = "ItemLayout contained in %s marked as maximized"
+                self.warn(msg % self._cant_maximize[id(node)])
+
+    def visit_TabLayout(self, node):
+        """ The visitor method for TabLayout data.
+
+        """
+        for item in node[1]:
+            self._cant_maximize[id(item)] = 'TabLayout'
+            self.visit(item)
+
+    def visit_SplitLayout(self, node):
+        """ The visitor method for SplitLayout data.
+
+        """
+        items = node[1]
+        sizes = node[3]
+        if len(sizes) > 0 and len(sizes) != len(items):
+            self.warn("SplitLayout sizes length != items length")
+        for item in items:
+            if item[0] == 's' and item[2] == node[2]:
+                msg = "child SplitLayout has same orientation as parent"
+                self.warn(msg)
+            self.visit(item)
+
+    def visit_DockBarLayout(self, node):
+        """ The visitor method for DockBarLayout data.
+
+        """
+        for item in node[1]:
+            self._cant_maximize[id(item)] = 'DockBarLayout'
+            self.visit(item)
+
+    def visit_AreaLayout(self, node):
+        """ The visitor method for AreaLayout data.
+
+        """
+        flags = node[3]
+        if not flags & _FLOATING:
+            if node[4] is not None and -1 not in node[4]:
+                self.warn("non-floating AreaLayout with specific geometry")
+            if flags & _LINKED:
+                self.warn("non-floating AreaLayout marked as linked")
+            if flags & _MAXIMIZED:
+                self.warn("non-floating AreaLayout marked as maximized")
+        if node[1] is not None:
+            self.visit(node[1])
+        seen_positions = set()
+        for bar in node[2]:
+            if bar[2] in seen_positions:
+                msg = "multiple DockBarLayout items in '%s' position"
+                self.warn(msg % bar[2])
+            seen_positions.add(bar[2])
+            self.visit(bar)
+
+    def visit_DockLayout(self, node):
+        """ The visitor method for DockLayout data.
+
+        """
+        has_non_floating_area = False
+        for item in node[1]:
+            if item[0] == 'i':
+                if not item[2] & _FLOATING:
+                    self.warn("non-floating toplevel ItemLayout")
+            elif not item[3] & _FLOATING:
+                if has_non_floating_area:
+                    self.warn("multiple non-floating AreaLayout items")
+                has_non_floating_area = True
+            self.visit(item)
+
+
+#------------------------------------------------------------------------------
+# JSON Format
+#------------------------------------------------------------------------------
+def decode_json(text):
+    """ Decode JSON layout text into layout data.
+
+    Parameters
+    ----------
+    text : str
+        The text produced by 'layout_to_json'.
+
+    Returns
+    -------
+    result : list
+        The layout data stored in the text.
+
+    Raises
+    ------
+    ValueError
+        If the text is not a valid layout.
+
+    """
+    try:
+        state = json.loads(text)
+    except RecursionError:
+        raise ValueError("layout text is nested too deeply")
+    if not isinstance(state, dict):
+        raise ValueError("invalid layout text")
+    version = state.get('version')
+    if version != LAYOUT_VERSION:
+        raise ValueError("unsupported layout version '%s'" % (version,))
+    if 'layout' not in state:
+        raise ValueError("missing layout in layout text")
+    data = state['layout']
+    try:
+        _check_data(data)
+    except RecursionError:
+        raise ValueError("layout text is nested too deeply")
+    return data
+
+
+def layout_to_json(node):
+    """ Serialize a layout node to compact JSON text.
+
+    Parameters
+    ----------
+    node : LayoutNode
+        The layout node to serialize.
+
+    Returns
+    -------
+    result : str
+        The JSON text for the layout.
+
+    """
+    state = {'version': LAYOUT_VERSION, 'layout': layout_to_data(node)}
+    return json.dumps(state, separators=(',', ':'))
+
+
+def layout_from_json(text, available=None):
+    """ Create a layout node from JSON layout text.
+
+    Parameters
+    ----------
+    text : str
+        The text produced by 'layout_to_json'.
+
+    available : iterable, optional
+        The names of the available dock items. If provided, the layout
+        data is validated against them before the layout is created.
+
+    Returns
+    -------
+    result : LayoutNode
+        The layout node stored in the text.
+
+    """
+    data = decode_json(text)
+    if available is not None:
+        DockLayoutDataValidator(available)(data)
+    return layout_from_data(data)
+
+
+#------------------------------------------------------------------------------
+# Binary Format
+#------------------------------------------------------------------------------
+class _BinaryEncoder(object):
+    """ An encoder of layout data into the binary layout format.
+
+    Tags, enum values and flags are stored as single bytes, and strings
+    and integers are stored as variable length integers.
+
+    """
+    def __init__(self):
+        self.buf = bytearray(_MAGIC)
+        self.buf.append(LAYOUT_VERSION)
+
+    def uint(self, value):
+        buf = self.buf
+        while value > 0x7f:
+            buf.append((value & 0x7f) | 0x80)
+            value >>= 7
+        buf.append(value)
+
+    def int(self, value):
+        self.uint(value << 1 if value >= 0 else ((-value) << 1) - 1)
+
+    def str(self, value):
+        data = value.encode('utf-8')
+        self.uint(len(data))
+        self.buf.extend(data)
+
+    def items(self, items):
+        self.uint(len(items))
+        for item in items:
+            self.node(item)
+
+    def geometry(self, geometry):
+        for value in geometry:
+            self.int(value)
+
+    def node(self, node):
+        buf = self.buf
+        tag = node[0]
+        if tag == 'i':
+            flags = node[2]
+            if node[3] is not None:
+                flags |= _HAS_GEOMETRY
+            buf.extend(b'i')
+            self.str(node[1])
+            buf.append(flags)
+            if node[3] is not None:
+                self.geometry(node[3])
+        elif tag == 't':
+            buf.extend(b't')
+            buf.append(_TAB_POSITIONS.index(node[2]))
+            self.int(node[3])
+            self.items(node[1])
+        elif tag == 's':
+            buf.extend(b's')
+            buf.append(_ORIENTATIONS.index(node[2]))
+            self.uint(len(node[3]))
+            for size in node[3]:
+                self.int(size)
+            self.items(node[1])
+        elif tag == 'b':
+            buf.extend(b'b')
+            buf.append(_BAR_POSITIONS.index(node[2]))
+            self.items(node[1])
+        elif tag == 'a':
+            flags = node[3]
+            if node[4] is not None:
+                flags |= _HAS_GEOMETRY
+            if node[1] is not None:
+                flags |= _HAS_ITEM
+            buf.extend(b'a')
+            buf.append(flags)
+            if node[4] is not None:
+                self.geometry(node[4])
+            if node[1] is not None:
+                self.node(node[1])
+            self.items(node[2])
+        elif tag == 'd':
+            buf.extend(b'd')
+            self.items(node[1])
+        else:
+            raise ValueError("invalid layout data tag '%s'" % (tag,))
+
+
+class _BinaryDecoder(object):
+    """ A decoder of the binary layout format into layout data.
+
+    """
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def byte(self):
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def enum(self, values, what):
+        index = self.byte()
+        if index >= len(values):
+            msg = "invalid %s '%d' in binary layout"
+            raise ValueError(msg % (what, index))
+        return values[index]
+
+    def uint(self, value=0):
+        data = self.data
+        pos = self.pos
+        shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        self.pos = pos
+        return value
+
+    def int(self):
+        value = self.uint()
+        return -((value + 1) >> 1) if value & 1 else value >> 1
+
+    def str(self):
+        size = self.uint()
+        start = self.pos
+        end = self.pos = start + size
+        if end > len(self.data):
+            raise IndexError
+        try:
+            return self.data[start:end].decode('utf-8')
+        except UnicodeDecodeError:
+            raise ValueError("invalid item name in binary layout")
+
+    def items(self):
+        return [self.node() for _ in range(self.uint())]
+
+    def geometry(self):
+        return [self.int(), self.int(), self.int(), self.int()]
+
+    def node(self):
+        tag = self.byte()
+        if tag == 0x69:  # 'i'
+            name = self.str()
+            flags = self.byte()
+            geometry = None
+            if flags & _HAS_GEOMETRY:
+                geometry = self.geometry()
+            return ['i', name, flags & ~_HAS_GEOMETRY, geometry]
+        if tag == 0x74:  # 't'
+            position = self.enum(_TAB_POSITIONS, 'tab position')
+            index = self.int()
+            return ['t', self.items(), position, index]
+        if tag == 0x73:  # 's'
+            orientation = self.enum(_ORIENTATIONS, 'orientation')
+            sizes = [self.int() for _ in range(self.uint())]
+            return ['s', self.items(), orientation, sizes]
+        if tag == 0x62:  # 'b'
+            position = self.enum(_BAR_POSITIONS, 'dock bar position')
+            return ['b', self.items(), position]
+        if tag == 0x61:  # 'a'
+            flags = self.byte()
+            geometry = None
+            if flags & _HAS_GEOMETRY:
+                geometry = self.geometry()
+            item = None
+            if flags & _HAS_ITEM:
+                item = self.node()
+            bars = self.items()
+            flags &= ~(_HAS_GEOMETRY | _HAS_ITEM)
+            return ['a', item, bars, flags, geometry]
+        if tag == 0x64:  # 'd'
+            return ['d', self.items()]
+        raise ValueError("invalid binary layout tag '%s'" % chr(tag))
+
+
+def decode_bytes(data):
+    """ Decode a binary layout string into layout data.
+
+    Parameters
+    ----------
+    data : bytes
+        The bytes produced by 'layout_to_bytes'.
+
+    Returns
+    -------
+    result : list
+        The layout data stored in the bytes.
+
+    Raises
+    ------
+    ValueError
+        If the bytes is not a valid layout.
+
+    """
+    data = bytes(data)
+    if data[:len(_MAGIC)] != _MAGIC or len(data) <= len(_MAGIC):
+        raise ValueError("invalid binary layout header")
+    version = data[len(_MAGIC)]
+    if version != LAYOUT_VERSION:
+        raise ValueError("unsupported layout version '%s'" % version)
+    decoder = _BinaryDecoder(data)
+    decoder.pos = len(_MAGIC) + 1
+    try:
+        result = decoder.node()
+        if decoder.pos != len(data):
+            raise ValueError("trailing data in binary layout")
+        # The decoder does not check which nodes contain which.
+        _check_data(result)
+    except IndexError:
+        raise ValueError("truncated binary layout")
+    except RecursionError:
+        raise ValueError("binary layout is nested too deeply")
+    return result
+
+
+def layout_to_bytes(node):
+    """ Serialize a layout node to the compact binary layout format.
+
+    Parameters
+    ----------
+    node : LayoutNode
+        The layout node to serialize.
+
+    Returns
+    -------
+    result : bytes
+        The binary form of the layout.
+
+    """
+    encoder = _BinaryEncoder()
+    encoder.node(layout_to_data(node))
+    return bytes(encoder.buf)
+
+
+def layout_from_bytes(data, available=None):
+    """ Create a layout node from the binary layout format.
+
+    Parameters
+    ----------
+    data : bytes
+        The bytes produced by 'layout_to_bytes'.
+
+    available : iterable, optional
+        The names of the available dock items. If provided, the layout
+        data is validated against them before the layout is created.
+
+    Returns
+    -------
+    result : LayoutNode
+        The layout node stored in the bytes.
+
+    """
+    data = decode_bytes(data)
+    if available is not None:
+        DockLayoutDataValidator(available)(data)
+    return layout_from_data(data)
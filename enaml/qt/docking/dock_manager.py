@@ -13,7 +13,9 @@ from enaml.qt.QtCore import Qt, QPoint, QRect, QObject
 from enaml.qt.QtWidgets import QApplication
 
 from .dock_overlay import DockOverlay
-from .layout_handling import layout_hit_test, plug_frame, iter_containers
+from .layout_handling import (
+    LayoutHitIndex, layout_hit_test, plug_frame, iter_containers
+)
 from .layout_builder import LayoutBuilder
 from .layout_saver import LayoutSaver
 from .proximity_handler import ProximityHandler
@@ -79,6 +81,11 @@ class DockManager(Atom):
     #: A container monitor which tracks toplevel container changes.
     _container_monitor = Typed(DockContainerMonitor)
 
+    #: The mapping of QDockArea to LayoutHitIndex used to hit test the
+    #: dock areas during a drag session. It is cleared when the dragged
+    #: frame is released and whenever the layout is changed.
+    _hit_indexes = Typed(dict, ())
+
     def _default__container_monitor(self):
         return DockContainerMonitor(self)
 
@@ -174,6 +181,10 @@ class DockManager(Atom):
     def apply_layout(self, layout):
         """ Apply a layout to the dock area.
 
+        The splitters, tab widgets and dock containers of the primary
+        dock area are reused for the parts of the layout which match
+        the current layout, so that they are not rebuilt.
+
         Parameters
         ----------
         layout : DockLayout
@@ -182,6 +193,7 @@ class DockManager(Atom):
         """
         available = (i.objectName() for i in self._dock_items)
         DockLayoutValidator(available)(layout)
+        self._hit_indexes.clear()
         LayoutBuilder(self)(layout)
 
     def update_layout(self, ops):
@@ -193,6 +205,7 @@ class DockManager(Atom):
             A list of LayoutOp objects to use for updating the layout.
 
         """
+        self._hit_indexes.clear()
         builder = LayoutBuilder(self)
         for op in ops:
             builder(op)
@@ -224,6 +237,7 @@ class DockManager(Atom):
         del self._dock_items
         del self._proximity_handler
         del self._container_monitor
+        del self._hit_indexes
         del self._overlay
 
     #--------------------------------------------------------------------------
@@ -485,6 +499,7 @@ class DockManager(Atom):
         # frames, or if the target dock area has a maximized widget.
         # This prevents a situation where the docking logic would be
         # non-sensical and maintains a consistent user experience.
+        self._hit_indexes.clear()
         overlay = self._overlay
         overlay.hide()
         guide = overlay.guide_at(pos)
@@ -599,6 +614,25 @@ class DockManager(Atom):
                 if target.rect().contains(local):
                     return target
 
+    def _hit_index(self, area):
+        """ Get the hit index for a dock area in the drag session.
+
+        Parameters
+        ----------
+        area : QDockArea
+            The dock area of interest.
+
+        Returns
+        -------
+        result : LayoutHitIndex
+            A valid hit index for the current layout of the area.
+
+        """
+        index = self._hit_indexes.get(area)
+        if index is None or not index.is_valid():
+            index = self._hit_indexes[area] = LayoutHitIndex(area)
+        return index
+
     def _update_drag_overlay(self, frame, pos):
         """ Update the overlay for a dragged frame.
 
@@ -623,7 +657,7 @@ class DockManager(Atom):
                 overlay.hide()
                 return
             local = target.mapFromGlobal(pos)
-            widget = layout_hit_test(target, local)
+            widget = self._hit_index(target).hit_test(local)
             overlay.mouse_over_area(target, widget, local)
         else:
             overlay.hide()
@@ -13,10 +13,10 @@ from enaml.nodevisitor import NodeVisitor
 from enaml.qt.QtCore import Qt, QRect
 from enaml.qt.QtWidgets import QApplication
 
-from enaml.layout.dock_layout import ItemLayout, AreaLayout
+from enaml.layout.dock_layout import ItemLayout, TabLayout, AreaLayout
 
 from .event_types import QDockItemEvent, DockItemDocked
-from .layout_handling import plug_frame
+from .layout_handling import iter_containers, plug_frame
 from .q_dock_bar import QDockBar
 from .q_dock_splitter import QDockSplitter
 from .q_dock_tab_widget import QDockTabWidget
@@ -117,6 +117,7 @@ class LayoutBuilder(NodeVisitor):
         """
         self.manager = manager
         self._containers = None
+        self._stale = []
 
     def setup(self, node):
         """ Setup the layout updater.
@@ -154,7 +155,7 @@ class LayoutBuilder(NodeVisitor):
     #--------------------------------------------------------------------------
     # Utility Methods
     #--------------------------------------------------------------------------
-    def init_dock_area(self, area, layout):
+    def init_dock_area(self, area, layout, reuse=False):
         """ Initialize and populate a dock area.
 
         This initializer populates the dock area with it children and
@@ -169,11 +170,22 @@ class LayoutBuilder(NodeVisitor):
             The area layout node which describes the children to
             build for the area.
 
+        reuse : bool, optional
+            Whether to reuse the current layout widgets of the area
+            for the matching parts of the layout. The default is False.
+
         """
         containers = self.containers
         if layout.item is not None:
-            self.visit(layout.item)
-            area.setCentralWidget(self.stack.pop())
+            if reuse:
+                widget = self.reuse_widget(area.centralWidget(), layout.item)
+                area.setCentralWidget(widget)
+                self.release_stale_widgets()
+            else:
+                self.visit(layout.item)
+                area.setCentralWidget(self.stack.pop())
+        elif reuse:
+            area.setCentralWidget(None)
         for bar_layout in layout.dock_bars:
             position = self.BAR_POSITIONS[bar_layout.position]
             for item in bar_layout.items:
@@ -212,6 +224,128 @@ class LayoutBuilder(NodeVisitor):
         if layout.maximized:
             frame.showMaximized()
 
+    def reuse_widget(self, widget, node):
+        """ Get the layout widget for a node, reusing an existing one.
+
+        The existing widget is reused if it is of the kind required by
+        the node, in which case its children are updated in place. Its
+        children are in turn reused for the matching child nodes, so
+        that unchanged parts of the layout are left untouched.
+
+        Parameters
+        ----------
+        widget : QWidget or None
+            The existing layout widget at the position of the node.
+
+        node : ItemLayout, TabLayout, or SplitLayout
+            The layout node for which to get the widget.
+
+        Returns
+        -------
+        result : QWidget or None
+            The layout widget for the node, or None if the node has
+            no valid items.
+
+        """
+        if isinstance(node, ItemLayout):
+            container = self.containers.get(node.name)
+            if container is not None:
+                container.showTitleBar()
+            return container
+        if isinstance(node, TabLayout):
+            return self.reuse_tab_widget(widget, node)
+        return self.reuse_splitter(widget, node)
+
+    def reuse_tab_widget(self, widget, node):
+        """ Get the tab widget for a TabLayout, reusing an existing one.
+
+        """
+        containers = self.containers
+        children = [containers.get(item.name) for item in node.items]
+        children = [_f for _f in children if _f]
+        if len(children) == 0:
+            return None
+        if len(children) == 1:
+            children[0].showTitleBar()
+            return children[0]
+        if isinstance(widget, QDockTabWidget):
+            tab_widget = widget
+        else:
+            tab_widget = QDockTabWidget()
+        position = self.TAB_POSITION[node.tab_position]
+        if tab_widget.tabPosition() != position:
+            tab_widget.setTabPosition(position)
+        tab_bar = tab_widget.tabBar()
+        for index, child in enumerate(children):
+            if tab_widget.widget(index) is child:
+                continue
+            current = tab_widget.indexOf(child)
+            if current != -1:
+                tab_bar.moveTab(current, index)
+            else:
+                child.hideTitleBar()
+                tab_widget.insertTab(index, child, child.icon(), child.title())
+        count = len(children)
+        while tab_widget.count() > count:
+            extra = tab_widget.widget(count)
+            tab_widget.removeTab(count)
+            self._stale.append((extra, extra.parent()))
+        if tab_widget.currentIndex() != node.index:
+            tab_widget.setCurrentIndex(node.index)
+        return tab_widget
+
+    def reuse_splitter(self, widget, node):
+        """ Get the splitter for a SplitLayout, reusing an existing one.
+
+        """
+        orientation = self.ORIENTATION[node.orientation]
+        reusable = (isinstance(widget, QDockSplitter) and
+                    widget.orientation() == orientation)
+        if reusable:
+            candidates = [widget.widget(i) for i in range(widget.count())]
+        else:
+            candidates = []
+        children = []
+        for index, item in enumerate(node.items):
+            candidate = candidates[index] if index < len(candidates) else None
+            children.append(self.reuse_widget(candidate, item))
+        children = [_f for _f in children if _f]
+        if len(children) == 0:
+            return None
+        if len(children) == 1:
+            return children[0]
+        splitter = widget if reusable else QDockSplitter(orientation)
+        for index, child in enumerate(children):
+            if splitter.widget(index) is not child:
+                splitter.insertWidget(index, child)
+                child.show()
+        # Stale widgets are hidden so they take no space until released.
+        count = len(children)
+        for index in range(count, splitter.count()):
+            extra = splitter.widget(index)
+            extra.hide()
+            self._stale.append((extra, splitter))
+        if len(node.sizes) >= count:
+            sizes = node.sizes[:count] + [0] * (splitter.count() - count)
+            if splitter.sizes() != sizes:
+                splitter.setSizes(sizes)
+        return splitter
+
+    def release_stale_widgets(self):
+        """ Release the widgets left over by reusing layout widgets.
+
+        The stale widgets are only released once the whole layout has
+        been updated, since they may hold containers which are moved
+        to a part of the layout updated after them.
+
+        """
+        stale = self._stale
+        self._stale = []
+        for widget, parent in stale:
+            if widget.parent() is parent:
+                widget.hide()
+                widget.setParent(None)
+
     @contextmanager
     def dock_context(self, container):
         """ Setup a context for docking onto a QDockContainer target.
@@ -356,27 +490,51 @@ class LayoutBuilder(NodeVisitor):
     def visit_DockLayout(self, node):
         """ Visit a DockLayout node.
 
-        This visitor assemble a new layout from scratch for the dock
-        manager. It is only invoked from the 'apply_layout' method of
-        the dock manager when a completely new layout is being applied.
+        This visitor assemble a new layout for the dock manager. It is
+        only invoked from the 'apply_layout' method of the dock manager
+        when a completely new layout is being applied.
+
+        The splitters and tab widgets of the primary dock area are
+        reused for the matching parts of the new layout, and the dock
+        containers which remain in it are not reset. Unchanged parts of
+        the primary area are therefore left untouched. The dock bars
+        and the floating frames are rebuilt from scratch.
 
         """
-        # Reset everything before applying a completely new layout.
         manager = self.manager
+        dock_area = manager.dock_area()
+        primary = None
+        for item in node.items:
+            if isinstance(item, AreaLayout) and not item.floating:
+                primary = item
+                break
+
+        # Find the containers which stay in the primary layout.
+        kept = set()
+        if primary is not None and primary.item is not None:
+            current = set(iter_containers(dock_area))
+            containers = self.containers
+            for item in primary.item.find_all(ItemLayout):
+                container = containers.get(item.name)
+                if container in current:
+                    kept.add(container)
+
+        # Reset everything else before applying the new layout.
         for container in manager.dock_containers():
-            container.reset()
+            if container in kept:
+                container.showNormal()
+            else:
+                container.reset()
         for window in manager.dock_windows():
             window.close()
-        dock_area = manager.dock_area()
         dock_area.clearDockBars()
-        dock_area.setCentralWidget(None)
+        if primary is None:
+            dock_area.setCentralWidget(None)
 
-        has_primary = False
         for item in node.items:
             if isinstance(item, AreaLayout):
-                if not item.floating and not has_primary:
-                    self.init_dock_area(dock_area, item)
-                    has_primary = True
+                if item is primary:
+                    self.init_dock_area(dock_area, item, reuse=True)
                 else:
                     frame = QDockWindow(manager, dock_area)
                     self.init_dock_area(frame.dockArea(), item)
@@ -5,10 +5,15 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from enaml.qt.QtCore import Qt, QEvent
+from collections import defaultdict
+
+from atom.api import Atom, Int, Typed, Value
+
+from enaml.qt.QtCore import Qt, QEvent, QObject, QPoint, QSize
 from enaml.qt.QtWidgets import QApplication
 
 from .event_types import DockAreaContentsChanged
+from .q_dock_area import QDockArea
 from .q_dock_bar import QDockBar
 from .q_dock_container import QDockContainer
 from .q_dock_splitter import QDockSplitter, QDockSplitterHandle
@@ -195,7 +200,7 @@ def layout_hit_test(area, pos):
             dist = (rect.center() - pt).manhattanLength()
             hits.append((dist, handle))
     if len(hits) > 0:
-        hits.sort()
+        hits.sort(key=lambda hit: hit[0])
         return hits[0][1]
 
     # Check for tab widgets next. A tab widget has dock containers,
@@ -214,6 +219,177 @@ def layout_hit_test(area, pos):
                 return dock_container
 
 
+#: The events of the layout widgets which invalidate a hit index. Tab
+#: switches and dock item visibility changes show and hide containers,
+#: and moving a splitter moves and resizes the widgets it holds.
+_HIT_INDEX_EVENTS = (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide)
+
+
+class LayoutHitMonitor(QObject):
+    """ An event filter which flags the layout changes of a dock area.
+
+    """
+    def __init__(self):
+        """ Initialize a LayoutHitMonitor.
+
+        """
+        super(LayoutHitMonitor, self).__init__()
+        self.changed = False
+
+    def eventFilter(self, obj, event):
+        """ Flag the geometry and visibility changes of the widgets.
+
+        """
+        if event.type() in _HIT_INDEX_EVENTS:
+            self.changed = True
+        return False
+
+
+class LayoutHitIndex(Atom):
+    """ A spatial index of the dock targets of a dock area.
+
+    The index computes the hit rectangles of the splitter handles, tab
+    widgets and visible dock containers once, in area coordinates, and
+    buckets them in a uniform grid. Hit testing a position then only
+    checks the few targets in the grid cell under the position, with
+    the same precedence rules as 'layout_hit_test'.
+
+    The index is a snapshot of the layout. It should be rebuilt when
+    the layout changes, which is the case when 'is_valid' is False.
+
+    """
+    #: The size in pixels of the square cells of the grid.
+    cell_size = Int(128)
+
+    #: The dock area indexed by this object.
+    area = Typed(QDockArea)
+
+    #: The size of the dock area when the index was built.
+    area_size = Typed(QSize)
+
+    #: The central widget of the dock area when the index was built.
+    central_widget = Value()
+
+    #: The mapping of grid cell to (handles, tabs, containers) lists
+    #: of (QRect, widget) pairs, in their order of precedence.
+    _cells = Typed(dict, ())
+
+    #: The event filter installed on the widgets of the dock layout.
+    _monitor = Typed(LayoutHitMonitor)
+
+    def __init__(self, area, **kwargs):
+        """ Initialize a LayoutHitIndex.
+
+        Parameters
+        ----------
+        area : QDockArea
+            The dock area to index.
+
+        """
+        super(LayoutHitIndex, self).__init__(area=area, **kwargs)
+        self.area_size = area.size()
+        self.central_widget = area.centralWidget()
+        cells = defaultdict(lambda: ([], [], []))
+        origin = QPoint(0, 0)
+        for handle in iter_handles(area):
+            offset = handle.mapTo(area, origin)
+            rect = handle.rect().adjusted(-20, -20, 20, 20)
+            self._insert(cells, 0, rect.translated(offset), handle)
+        for tab_widget in iter_tabs(area):
+            offset = tab_widget.mapTo(area, origin)
+            rect = tab_widget.rect().translated(offset)
+            self._insert(cells, 1, rect, tab_widget)
+        for dock_container in iter_containers(area):
+            if not dock_container.isHidden():  # hidden tab
+                offset = dock_container.mapTo(area, origin)
+                rect = dock_container.rect().translated(offset)
+                self._insert(cells, 2, rect, dock_container)
+        self._cells = dict(cells)
+
+        # Watch every widget of the layout, including the hidden tabs,
+        # since the events arrive after the rectangles were computed.
+        monitor = self._monitor = LayoutHitMonitor()
+        stack = [area.centralWidget()]
+        while stack:
+            widget = stack.pop()
+            if widget is None:
+                continue
+            widget.installEventFilter(monitor)
+            if isinstance(widget, QDockSplitter):
+                for index in range(1, widget.count()):
+                    widget.handle(index).installEventFilter(monitor)
+            if isinstance(widget, (QDockSplitter, QDockTabWidget)):
+                for index in range(widget.count()):
+                    stack.append(widget.widget(index))
+
+    def _insert(self, cells, tier, rect, widget):
+        """ Insert a hit rectangle in the grid cells it overlaps.
+
+        """
+        size = self.cell_size
+        entry = (rect, widget)
+        for x in range(rect.left() // size, rect.right() // size + 1):
+            for y in range(rect.top() // size, rect.bottom() // size + 1):
+                cells[(x, y)][tier].append(entry)
+
+    def is_valid(self):
+        """ Get whether the index still matches the dock area.
+
+        Returns
+        -------
+        result : bool
+            False if the area was resized, its central widget was
+            replaced, or a widget of its layout was moved, resized,
+            shown or hidden since the index was built.
+
+        """
+        area = self.area
+        return (not self._monitor.changed and
+                area.size() == self.area_size and
+                area.centralWidget() is self.central_widget)
+
+    def hit_test(self, pos):
+        """ Hit test the indexed dock area for a relevant dock target.
+
+        Parameters
+        ----------
+        pos : QPoint
+            The point of interest expressed in local area coordinates.
+
+        Returns
+        -------
+        result : QWidget or None
+            The relevant dock target under the position. This will be
+            a QDockContainer, QDockTabWidget, or QDockSplitterHandle.
+
+        """
+        size = self.cell_size
+        cell = self._cells.get((pos.x() // size, pos.y() // size))
+        if cell is None:
+            return None
+        handles, tabs, containers = cell
+
+        # The closest handle to the point wins, as in layout_hit_test.
+        best = None
+        best_dist = None
+        for rect, handle in handles:
+            if rect.contains(pos):
+                dist = (rect.center() - pos).manhattanLength()
+                if best is None or dist < best_dist:
+                    best = handle
+                    best_dist = dist
+        if best is not None:
+            return best
+
+        for rect, tab_widget in tabs:
+            if rect.contains(pos):
+                return tab_widget
+
+        for rect, dock_container in containers:
+            if rect.contains(pos):
+                return dock_container
+
+
 #------------------------------------------------------------------------------
 # Layout Unplugging
 #------------------------------------------------------------------------------
@@ -5,20 +5,32 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Atom, Typed, Value
+from atom.api import Atom, Int, Typed, Value
 
-from enaml.qt.QtCore import QObject
+from enaml.qt.QtCore import QObject, QEvent
 
 from .q_dock_frame import QDockFrame
 
 
+#: The frame events which trigger an update of the spatial index. The
+#: move events of a hidden frame are delayed until it is shown.
+_INDEX_EVENTS = (QEvent.Move, QEvent.Resize, QEvent.Show)
+
+
 class ProximityHandler(QObject):
     """ A class which manages movement of free floating dock frames.
 
     This class handles the movement of frames, taking into account the
     state of their link button and their proximity to other frames.
 
+    The frames are kept in a grid spatial index, which is updated when
+    a frame is moved, resized or shown, so that the proximal frames of
+    a rect can be found without testing every frame.
+
     """
+    #: The size, in pixels, of the square cells of the spatial index.
+    CellSize = 256
+
     class GraphNode(Atom):
         """ An internal graph node class for the proximity handler.
 
@@ -32,6 +44,12 @@ class ProximityHandler(QObject):
         #: The tag value used for marking a node during a traversal.
         tag = Value()
 
+        #: The order in which the frame was added to the handler.
+        order = Int()
+
+        #: The keys of the index cells which contain the frame.
+        cells = Typed(list, ())
+
         def link(self, node):
             """ Link this node with another vertex.
 
@@ -59,10 +77,53 @@ class ProximityHandler(QObject):
         """
         super(ProximityHandler, self).__init__()
         self._nodes = {}
+        self._cells = {}
+        self._counter = 0
 
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _cellKeys(self, rect):
+        """ Get the keys of the index cells which intersect a rect.
+
+        """
+        size = self.CellSize
+        x0 = rect.left() // size
+        x1 = rect.right() // size
+        y0 = rect.top() // size
+        y1 = rect.bottom() // size
+        return [
+            (x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)
+        ]
+
+    def _unindexNode(self, node):
+        """ Remove the frame of a node from the spatial index.
+
+        """
+        cells = self._cells
+        frame = node.frame
+        for key in node.cells:
+            cell = cells[key]
+            cell.discard(frame)
+            if not cell:
+                del cells[key]
+        node.cells = []
+
+    def _indexNode(self, node):
+        """ Update the spatial index for the frame of a node.
+
+        """
+        self._unindexNode(node)
+        cells = self._cells
+        frame = node.frame
+        keys = self._cellKeys(frame.frameGeometry())
+        for key in keys:
+            cell = cells.get(key)
+            if cell is None:
+                cell = cells[key] = set()
+            cell.add(frame)
+        node.cells = keys
+
     def _onLinkToggled(self):
         """ Handle the 'linkButtonToggled' signal on a dock frame.
 
@@ -85,8 +146,11 @@ class ProximityHandler(QObject):
         nodes = self._nodes
         if frame in nodes:
             return
-        nodes[frame] = self.GraphNode(frame=frame)
+        self._counter += 1
+        node = nodes[frame] = self.GraphNode(frame=frame, order=self._counter)
+        self._indexNode(node)
         frame.linkButtonToggled.connect(self._onLinkToggled)
+        frame.installEventFilter(self)
 
     def removeFrame(self, frame):
         """ Remove a dock frame from the proximity handler.
@@ -101,8 +165,11 @@ class ProximityHandler(QObject):
         nodes = self._nodes
         if frame not in nodes:
             return
-        nodes.pop(frame).unlink()
+        node = nodes.pop(frame)
+        node.unlink()
+        self._unindexNode(node)
         frame.linkButtonToggled.disconnect(self._onLinkToggled)
+        frame.removeEventFilter(self)
 
     def hasLinkedFrames(self, frame):
         """ Get whether or not the frame has linked proximal frames.
@@ -193,7 +260,30 @@ class ProximityHandler(QObject):
 
         """
         d = max(0, distance)
-        for frame in self._nodes:
+        cells = self._cells
+        found = set()
+        for key in self._cellKeys(rect.adjusted(-d, -d, d, d)):
+            cell = cells.get(key)
+            if cell is not None:
+                found.update(cell)
+        if not found:
+            return
+        nodes = self._nodes
+        found = sorted(found, key=lambda frame: nodes[frame].order)
+        for frame in found:
             f_rect = frame.frameGeometry().adjusted(-d, -d, d, d)
             if rect.intersects(f_rect):
                 yield frame
+
+    #--------------------------------------------------------------------------
+    # QObject API
+    #--------------------------------------------------------------------------
+    def eventFilter(self, obj, event):
+        """ Update the spatial index when a frame geometry changes.
+
+        """
+        if event.type() in _INDEX_EVENTS:
+            node = self._nodes.get(obj)
+            if node is not None:
+                self._indexNode(node)
+        return False
@@ -0,0 +1,270 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import asyncio
+import heapq
+import selectors
+import sys
+import threading
+from asyncio import events
+from math import ceil
+
+from .QtCore import QEventLoop, QSocketNotifier, QThread, QTimer
+from .QtWidgets import QApplication
+
+
+class QSelector(selectors.DefaultSelector):
+    """ A selector which never blocks and which watches its file
+    descriptors with QSocketNotifier objects.
+
+    Whenever one of the registered file descriptors becomes ready, the
+    step callback is invoked so that the event loop can process it.
+
+    """
+    def __init__(self, step):
+        """ Initialize a QSelector.
+
+        Parameters
+        ----------
+        step : callable
+            A callable which runs one iteration of the event loop.
+
+        """
+        super(QSelector, self).__init__()
+        self._step = step
+        self._notifiers = {}
+
+    def _update_notifiers(self, fd, events):
+        """ Create or destroy the notifiers watching a file descriptor.
+
+        """
+        for event, kind in ((selectors.EVENT_READ, QSocketNotifier.Read),
+                            (selectors.EVENT_WRITE, QSocketNotifier.Write)):
+            key = (fd, kind)
+            notifier = self._notifiers.get(key)
+            if events & event:
+                if notifier is None:
+                    notifier = QSocketNotifier(fd, kind)
+                    notifier.activated.connect(self._on_activated)
+                    self._notifiers[key] = notifier
+            elif notifier is not None:
+                notifier.setEnabled(False)
+                notifier.activated.disconnect(self._on_activated)
+                notifier.deleteLater()
+                del self._notifiers[key]
+
+    def _on_activated(self, fd):
+        """ Handle the activation of a socket notifier.
+
+        """
+        self._step()
+
+    def register(self, fileobj, events, data=None):
+        key = super(QSelector, self).register(fileobj, events, data)
+        self._update_notifiers(key.fd, events)
+        return key
+
+    def unregister(self, fileobj):
+        key = super(QSelector, self).unregister(fileobj)
+        self._update_notifiers(key.fd, 0)
+        return key
+
+    def modify(self, fileobj, events, data=None):
+        key = super(QSelector, self).modify(fileobj, events, data)
+        self._update_notifiers(key.fd, events)
+        return key
+
+    def select(self, timeout=None):
+        # The Qt event loop does the waiting, so polling never blocks.
+        return super(QSelector, self).select(0)
+
+    def close(self):
+        for notifier in self._notifiers.values():
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+        self._notifiers.clear()
+        super(QSelector, self).close()
+
+
+class QAsyncioEventLoop(asyncio.SelectorEventLoop):
+    """ An asyncio event loop which runs on top of the Qt event loop.
+
+    Qt owns the waiting: ready file descriptors are reported by socket
+    notifiers and timed callbacks by a single shot timer, each of which
+    runs one iteration of the asyncio loop on the main gui thread.
+
+    While running, the loop is the running asyncio loop for the whole
+    duration of the Qt event loop, so coroutines can be started from
+    any Qt or Enaml callback.
+
+    """
+    def __init__(self):
+        """ Initialize a QAsyncioEventLoop.
+
+        A QApplication must exist before the loop is created, and the
+        loop must be created on the main gui thread.
+
+        """
+        self._qt_loop = None
+        self._gui_thread_id = threading.get_ident()
+        self._timer = timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(self._step)
+        super(QAsyncioEventLoop, self).__init__(QSelector(self._step))
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _step(self):
+        """ Run one iteration of the asyncio event loop.
+
+        A callback may start a nested Qt event loop (a modal dialog for
+        example) in which case the iterations run re-entrantly from the
+        nested loop, so that the other callbacks keep being processed.
+
+        """
+        if self.is_closed():
+            return
+        running = events._get_running_loop()
+        if running is None:
+            events._set_running_loop(self)
+        try:
+            self._run_once()
+        finally:
+            if running is None:
+                events._set_running_loop(None)
+            self._arm()
+
+    def _run_once(self):
+        """ Run one iteration of the loop, without blocking.
+
+        This is a re-entrant version of the base class method: the
+        ready callbacks are popped one at a time, so that an iteration
+        run from a nested event loop can consume the callbacks counted
+        by the iteration it was started from.
+
+        """
+        scheduled = self._scheduled
+        while scheduled and scheduled[0]._cancelled:
+            self._timer_cancelled_count -= 1
+            handle = heapq.heappop(scheduled)
+            handle._scheduled = False
+
+        self._process_events(self._selector.select(0))
+
+        end_time = self.time() + self._clock_resolution
+        while scheduled and scheduled[0]._when < end_time:
+            handle = heapq.heappop(scheduled)
+            handle._scheduled = False
+            self._ready.append(handle)
+
+        # Arm the timer before running the callbacks so that a nested
+        # event loop started by one of them runs the next iterations.
+        # The callbacks added by the callbacks run now are run on the
+        # next iteration, after another poll.
+        self._arm()
+        ready = self._ready
+        ntodo = len(ready)
+        while ntodo > 0 and ready:
+            ntodo -= 1
+            handle = ready.popleft()
+            if not handle._cancelled:
+                handle._run()
+
+    def _arm(self):
+        """ Start the timer for the next iteration of the loop.
+
+        """
+        if self.is_closed():
+            return
+        timer = self._timer
+        if self._ready:
+            if not timer.isActive() or timer.interval() != 0:
+                timer.start(0)
+        elif self._scheduled:
+            delay = self._scheduled[0]._when - self.time()
+            timer.start(max(0, int(ceil(delay * 1000))))
+        else:
+            timer.stop()
+
+    def _arm_soon(self):
+        """ Arm the timer after a callback was added to the loop.
+
+        Callbacks added from other threads wake up the loop through the
+        self-pipe.
+
+        """
+        if threading.get_ident() == self._gui_thread_id:
+            self._arm()
+
+    def _call_soon(self, *args):
+        handle = super(QAsyncioEventLoop, self)._call_soon(*args)
+        self._arm_soon()
+        return handle
+
+    #--------------------------------------------------------------------------
+    # AbstractEventLoop API
+    #--------------------------------------------------------------------------
+    def call_at(self, when, callback, *args, **kwargs):
+        handle = super(QAsyncioEventLoop, self).call_at(
+            when, callback, *args, **kwargs
+        )
+        self._arm_soon()
+        return handle
+
+    def run_forever(self):
+        """ Run the loop, and the Qt event loop, until stop() is called.
+
+        """
+        self._check_closed()
+        if self.is_running():
+            raise RuntimeError('This event loop is already running')
+        if events._get_running_loop() is not None:
+            raise RuntimeError(
+                'Cannot run the event loop while another loop is running'
+            )
+        self._thread_id = threading.get_ident()
+        old_agen_hooks = sys.get_asyncgen_hooks()
+        sys.set_asyncgen_hooks(firstiter=self._asyncgen_firstiter_hook,
+                               finalizer=self._asyncgen_finalizer_hook)
+        try:
+            events._set_running_loop(self)
+            if self._stopping:
+                self._step()
+            else:
+                # Run the main Qt event loop when it is not running yet,
+                # and a nested event loop otherwise.
+                if QThread.currentThread().loopLevel() == 0:
+                    self._qt_loop = QApplication.instance()
+                else:
+                    self._qt_loop = QEventLoop()
+                self._arm()
+                self._qt_loop.exec_()
+        finally:
+            self._qt_loop = None
+            self._stopping = False
+            self._thread_id = None
+            events._set_running_loop(None)
+            sys.set_asyncgen_hooks(*old_agen_hooks)
+
+    def stop(self):
+        """ Stop the loop after the current iteration.
+
+        """
+        if self._qt_loop is not None:
+            self._qt_loop.exit()
+        else:
+            self._stopping = True
+
+    def close(self):
+        """ Close the loop.
+
+        """
+        if self.is_running():
+            raise RuntimeError('Cannot close a running event loop')
+        self._timer.stop()
+        super(QAsyncioEventLoop, self).close()
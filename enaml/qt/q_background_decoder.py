@@ -0,0 +1,156 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from concurrent.futures import ThreadPoolExecutor
+
+from enaml.application import deferred_call
+
+
+class BackgroundDecoder(object):
+    """ An object which decodes resources on a pool of worker threads.
+
+    The decoding tasks are keyed by the content of the resource, so that
+    a resource requested several times is only decoded once. The
+    callbacks of a task are invoked on the main thread once the task is
+    complete.
+
+    """
+    def __init__(self, max_workers=None):
+        """ Initialize a BackgroundDecoder.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of worker threads. The default is chosen
+            by the ThreadPoolExecutor.
+
+        """
+        self._max_workers = max_workers
+        self._executor = None
+        self._pending = {}
+
+    def submit(self, key, function, *args):
+        """ Submit a decoding task unless one is pending for the key.
+
+        Parameters
+        ----------
+        key : hashable
+            The content key of the resource.
+
+        function : callable
+            The function which decodes the resource. It is called with
+            the given arguments on a worker thread.
+
+        Returns
+        -------
+        result : Future
+            The future of the pending task for the key.
+
+        """
+        entry = self._pending.get(key)
+        if entry is not None:
+            return entry[0]
+        executor = self._executor
+        if executor is None:
+            executor = self._executor = ThreadPoolExecutor(
+                self._max_workers, thread_name_prefix='enaml-decoder'
+            )
+        future = executor.submit(function, *args)
+        self._pending[key] = (future, [])
+        future.add_done_callback(
+            lambda future: deferred_call(self._finish, key, future)
+        )
+        return future
+
+    def pending(self, key):
+        """ Get the future of the pending task for a key.
+
+        Parameters
+        ----------
+        key : hashable
+            The content key of the resource.
+
+        Returns
+        -------
+        result : Future or None
+            The future of the pending task, or None if no task is
+            pending for the key.
+
+        """
+        entry = self._pending.get(key)
+        if entry is not None:
+            return entry[0]
+
+    def notify(self, key, callback):
+        """ Register a callback for the completion of a pending task.
+
+        Parameters
+        ----------
+        key : hashable
+            The content key of a resource with a pending task.
+
+        callback : callable
+            A callable which is invoked with the future of the task on
+            the main thread once the task is complete.
+
+        """
+        self._pending[key][1].append(callback)
+
+    def notify_all(self, keys, callback):
+        """ Register a callback for the completion of several tasks.
+
+        Parameters
+        ----------
+        keys : iterable
+            The content keys of resources with a pending task.
+
+        callback : callable
+            A callable which is invoked without arguments on the main
+            thread once all the tasks are complete.
+
+        """
+        remaining = set(keys)
+        if not remaining:
+            deferred_call(callback)
+            return
+
+        def done(key):
+            remaining.discard(key)
+            if not remaining:
+                callback()
+
+        for key in list(remaining):
+            self.notify(key, lambda future, key=key: done(key))
+
+    def shutdown(self, wait=True):
+        """ Shutdown the worker threads of the decoder.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to wait for the pending tasks to complete. The
+            default is True.
+
+        """
+        executor = self._executor
+        if executor is not None:
+            self._executor = None
+            executor.shutdown(wait)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _finish(self, key, future):
+        """ Invoke the callbacks of a completed task on the main thread.
+
+        """
+        entry = self._pending.get(key)
+        if entry is None or entry[0] is not future:
+            return
+        del self._pending[key]
+        for callback in entry[1]:
+            callback(future)
@@ -5,6 +5,9 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
+from collections import deque
+from threading import Lock
+
 from .QtCore import QObject, QTimer, QEvent, QThread
 from .QtWidgets import QApplication
 
@@ -12,34 +15,100 @@ from .QtWidgets import QApplication
 class DeferredCallEvent(QEvent):
     """ A custom event type for deferred call events.
 
+    A single event of this type is used to wake up the deferred caller,
+    which then drains all of the calls which are pending in its queue.
+
     """
     # Explicitly coerce to QEvent.Type for PySide compatibility.
     Type = QEvent.Type(QEvent.registerEventType())
 
-    def __init__(self, callback, args, kwargs):
+    def __init__(self):
         super(DeferredCallEvent, self).__init__(self.Type)
-        self.callback = callback
-        self.args = args
-        self.kwargs = kwargs
 
 
 class DeferredCaller(QObject):
     """ A QObject subclass which handles deferred call events.
 
+    Calls are stored in a thread-safe queue and at most one wake-up
+    event is posted to the Qt event queue per cycle of the event loop,
+    regardless of the number of calls which are enqueued.
+
     """
     def __init__(self):
         """ Initialize a DeferredCaller.
 
         """
         super(DeferredCaller, self).__init__()
+        self._lock = Lock()
+        self._pending = deque()
+        self._posted = False
         self.moveToThread(QApplication.instance().thread())
 
+    def enqueue(self, callback, args, kwargs):
+        """ Add a call to the queue of pending calls.
+
+        This method is thread-safe.
+
+        Parameters
+        ----------
+        callback : callable
+            The callable to invoke on the main gui thread.
+
+        args : tuple
+            The positional arguments to pass to the callback.
+
+        kwargs : dict
+            The keyword arguments to pass to the callback.
+
+        """
+        with self._lock:
+            self._pending.append((callback, args, kwargs))
+            if self._posted:
+                return
+            self._posted = True
+        QApplication.postEvent(self, DeferredCallEvent())
+
     def customEvent(self, event):
         """ Handle the custom deferred call events.
 
+        Only the calls which were pending when the event is handled are
+        executed. Calls added while draining the queue are deferred to
+        the next cycle of the event loop.
+
         """
         if event.type() == DeferredCallEvent.Type:
-            event.callback(*event.args, **event.kwargs)
+            pending = self._pending
+            with self._lock:
+                self._posted = False
+                count = len(pending)
+            try:
+                # Popping from the shared queue, rather than swapping it
+                # out, allows a nested event loop started by a callback
+                # to run the remaining calls in order. That loop needs a
+                # wake-up event of its own, posted before the callback.
+                for _ in range(count):
+                    try:
+                        callback, args, kwargs = pending.popleft()
+                    except IndexError:
+                        break
+                    if pending and not self._posted:
+                        self._post()
+                    callback(*args, **kwargs)
+            finally:
+                # Make sure the calls left behind by an exception (or
+                # added while draining) get a wake-up event of their own.
+                if pending and not self._posted:
+                    self._post()
+
+    def _post(self):
+        """ Post a wake-up event unless one is already posted.
+
+        """
+        with self._lock:
+            if self._posted:
+                return
+            self._posted = True
+        QApplication.postEvent(self, DeferredCallEvent())
 
 
 #: A globally available caller instance. This will be created on demand
@@ -57,8 +126,7 @@ def deferredCall(callback, *args, **kwargs):
     caller = __caller
     if caller is None:
         caller = __caller = DeferredCaller()
-    event = DeferredCallEvent(callback, args, kwargs)
-    QApplication.postEvent(caller, event)
+    caller.enqueue(callback, args, kwargs)
 
 
 def timedCall(ms, callback, *args, **kwargs):
@@ -6,6 +6,8 @@
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
 from abc import ABCMeta, abstractmethod
+from array import array
+from bisect import bisect_right
 
 from .QtCore import Qt, QSize, QRect
 from .QtWidgets import QLayout, QWidgetItem
@@ -45,11 +47,6 @@ class FlowLayoutData(object):
     for changes to have effect.
 
     """
-    #: Whether or not the computed info for the layout item is dirty.
-    #: This must be set to True before calling `updateGeometry` on
-    #: the owner widget.
-    dirty = True
-
     #: The flow stretch factor of the layout item. This value controls
     #: the amount of space that is taken up by an expandable item in the
     #: direction of the layout flow, relative to the other items in the
@@ -75,11 +72,33 @@ class FlowLayoutData(object):
     #: item in that direction will be used.
     preferred_size = QSize()
 
+    #: The layout item which owns the data, if any. It is notified when
+    #: the data becomes dirty, so that the layout does not need to scan
+    #: all of its items when it is invalidated.
+    _item = None
+
     def __init__(self):
         """ Initialize a FlowLayoutData.
 
         """
         self.preferred_size = QSize()
+        self._dirty = True
+
+    @property
+    def dirty(self):
+        """ Whether or not the computed info for the layout item is
+        dirty. This must be set to True before calling `updateGeometry`
+        on the owner widget.
+
+        """
+        return self._dirty
+
+    @dirty.setter
+    def dirty(self, dirty):
+        self._dirty = dirty
+        item = self._item
+        if dirty and item is not None:
+            item.markDirty()
 
 
 class QFlowWidgetItem(QWidgetItem):
@@ -90,6 +109,10 @@ class QFlowWidgetItem(QWidgetItem):
     #: publically accesible attribute for performance reasons.
     data = None
 
+    #: A callable invoked with the item when its layout data is marked
+    #: dirty. It is set by the layout which manages the item.
+    dirty_handler = None
+
     def __init__(self, widget, data):
         """ Initialize a QFlowWidgetItem.
 
@@ -104,9 +127,19 @@ class QFlowWidgetItem(QWidgetItem):
         """
         super(QFlowWidgetItem, self).__init__(widget)
         self.data = data
+        self.dirty_handler = None
         self._cached_hint = QSize()
         self._cached_max = QSize()
         self._cached_min = QSize()
+        data._item = self
+
+    def markDirty(self):
+        """ Notify the dirty handler that the layout data is dirty.
+
+        """
+        handler = self.dirty_handler
+        if handler is not None:
+            handler(self)
 
     def maximumSize(self):
         """ Reimplemented maximum size computation.
@@ -184,448 +217,81 @@ class QFlowWidgetItem(QWidgetItem):
             self.data.dirty = False
 
 
-class _LayoutRow(object):
+class _LinePacking(object):
     """ A private class used by QFlowLayout.
 
-    This class accumulates information about a row of items as the items
-    are added to the row. Instances of the this class are created by the
-    QFlowLayout during a layout pass. For performance reasons, there are
-    several publically accesible attributes. See their documentation for
-    restrictions on their use.
+    This class stores the packing of the layout items into lines for a
+    given extent in the direction of the layout flow. The metrics of
+    the lines are stored in compact arrays which are indexed by line.
+    A packing is extended lazily and truncated from the line holding
+    the first changed item, so that the lines before that item do not
+    need to be packed again.
 
     """
-    #: The height to use for laying out the row. This attribute is
-    #: modified directly by the layout as it distributes the vertical
-    #: space amongst the rows.
-    layout_height = 0
-
-    #: The minimum height required for the row. This is automatically
-    #: updated as items are added to the row. It should be considered
-    #: read-only to external users.
-    min_height = 0
-
-    #: The minimum width required for the row. This is automatically
-    #: updated as items are added to the row. It should be considered
-    #: read-only to external users.
-    min_width = 0
-
-    #: The desired height for the row. This is automatically updated as
-    #: items are added to the row. It should be considered read-only to
-    #: external users.
-    hint_height = 0
-
-    #: The desired width for the row. This is automatically updated as
-    #: items are added to the row. It should be considered read-only to
-    #: external users.
-    hint_width = 0
-
-    #: The vertical stretch factor for the row. This is automatically
-    #: updated as items are added to the row. It should be considered
-    #: read-only by external users.
-    stretch = 0
+    __slots__ = ('extent', 'count', 'starts', 'flow_min', 'flow_hint',
+                 'flow_stretch', 'ortho_min', 'ortho_hint', 'ortho_stretch')
 
-    def __init__(self, width, options):
-        """ Initialize a layout row.
+    def __init__(self, extent):
+        """ Initialize a line packing.
 
         Parameters
         ----------
-        width : int
-            The width of the layout area.
-
-        options : _LayoutOptions
-            The options in effect for the layout.
+        extent : int
+            The extent of the layout area in the flow direction.
 
         """
-        self._width = width
-        self._options = options
-        self._items_stretch = 0
-        self._items = []
+        self.extent = extent
 
-    @property
-    def diff_height(self):
-        """ A read-only property which computes the difference between
-        the desired height and the minimum height.
+        #: The number of items packed into the lines.
+        self.count = 0
 
-        """
-        return self.hint_height - self.min_height
+        #: The index of the first item of each line.
+        self.starts = array('l')
 
-    def add_item(self, item):
-        """ Add an item to the layout row.
+        #: The minimum and desired extents of the lines in the flow
+        #: direction and the sum of the flow stretch of their items.
+        self.flow_min = array('l')
+        self.flow_hint = array('l')
+        self.flow_stretch = array('l')
 
-        Parameters
-        ----------
-        item : QFlowWidgetItem
-            The flow widget item to add to the layout row.
+        #: The minimum and desired extents of the lines orthogonal to
+        #: the flow direction, and the max ortho stretch of their items.
+        self.ortho_min = array('l')
+        self.ortho_hint = array('l')
+        self.ortho_stretch = array('l')
 
-        Returns
-        -------
-        result : bool
-            True if the items was added. False if the item was not
-            added. An item will not be added if the row already
-            contains an item and adding another item would cause
-            it to overflow.
+    def lineEnd(self, line):
+        """ Get the index following the last item of a line.
 
         """
-        min_size = item.minimumSize()
-        hint_size = item.sizeHint()
-        n = len(self._items)
-        s = self._options.h_spacing
-        if n > 0 and (self.hint_width + s + hint_size.width()) > self._width:
-            return False
-        self.min_height = max(self.min_height, min_size.height())
-        self.hint_height = max(self.hint_height, hint_size.height())
-        self.stretch = max(self.stretch, item.data.ortho_stretch)
-        self.min_width += min_size.width()
-        self.hint_width += hint_size.width()
-        self._items_stretch += item.data.stretch
-        if n > 0:
-            self.min_width += s
-            self.hint_width += s
-        self._items.append(item)
-        return True
-
-    def layout(self, x, y):
-        """ Layout the row using the given starting coordinates.
+        starts = self.starts
+        if line + 1 < len(starts):
+            return starts[line + 1]
+        return self.count
 
-        Parameters
-        ----------
-        x : int
-            The x coordinate of the row origin.
-
-        y : int
-            The y coordinate of the row origin.
-
-        """
-        opts = self._options
-        layout_width = self._width
-        layout_height = self.layout_height
-        delta = self._width - self.hint_width
-        items = self._items
-
-        # Short circuit the case where there is negative extra space.
-        # This means that there must be only a single item in the row,
-        # in which case the width may shrink to the minimum if needed.
-        if delta < 0:
-            assert len(items) == 1
-            item = items[0]
-            w = max(layout_width, item.minimumSize().width())
-            if item.data.ortho_stretch > 0:
-                h = min(layout_height, item.maximumSize().height())
-            else:
-                h = min(layout_height, item.sizeHint().height())
-            delta_h = layout_height - h
-            if delta_h > 0:
-                align = item.data.alignment
-                if align == QFlowLayout.AlignTrailing:
-                    y += delta_h
-                elif align == QFlowLayout.AlignCenter:
-                    y += delta_h / 2
-            item.setGeometry(QRect(x, int(round(y)),
-                                   int(round(w)), int(round(h))))
-            return
-
-        # Reversing the items reverses the layout direction. All of the
-        # computation up to this point has be independent of direction.
-        if opts.direction == QFlowLayout.RightToLeft:
-            items.reverse()
-
-        # Precompute a map of starting widths for the items. These will
-        # be progressively modified as the delta space is distributed.
-        widths = {}
-        for item in items:
-            widths[item] = item.sizeHint().width()
-
-        # If the flow stretch for the row is greater than zero. Then
-        # there exists an item or items which have flow stretch. It's
-        # not sufficient to simply distribute the delta space according
-        # to relative stretch factors, because an item may have a max
-        # width which is less than the adjusted width. This causes the
-        # rest of the adjustments to be invalid, yielding a potential
-        # O(n^2) solution. Instead, the items which can stretch are
-        # sorted according to the differences between their desired
-        # width and max width. When distributing the delta space in this
-        # order, any unused space from an item is added back to the pool
-        # and its stretch factor removed from further computation. This
-        # gives an O(n log n) solution to the problem. This algorithm
-        # iteratively removes space from the delta, so that the alignment
-        # pass below operates on the adjusted free space amount.
-        items_stretch = self._items_stretch
-        if items_stretch > 0:
-            diffs = []
-            for item in items:
-                if item.data.stretch > 0:
-                    h = item.sizeHint().width()
-                    m = item.maximumSize().width()
-                    diffs.append((m - h, item))
-            diffs.sort()
-            for ignored, item in diffs:
-                item_stretch = item.data.stretch
-                max_width = item.maximumSize().width()
-                d = item_stretch * delta / items_stretch
-                items_stretch -= item_stretch
-                item_width = widths[item]
-                if item_width + d > max_width:
-                    widths[item] = max_width
-                    delta -= max_width - item_width
-                else:
-                    widths[item] = item_width + d
-                    delta -= d
-
-        # The widths of all items are now computed. Any leftover delta
-        # space is used for alignment purposes. This is accomplished by
-        # shifting the starting location and, in the case of justify,
-        # adding to the horizontal space value.
-        start_x = x
-        space = opts.h_spacing
-        if opts.alignment == QFlowLayout.AlignLeading:
-            if opts.direction == QFlowLayout.RightToLeft:
-                start_x += delta
-        elif opts.alignment == QFlowLayout.AlignTrailing:
-            if opts.direction == QFlowLayout.LeftToRight:
-                start_x += delta
-        elif opts.alignment == QFlowLayout.AlignCenter:
-            start_x += delta / 2
-        else:
-            d = delta / (len(items) + 1)
-            space += d
-            start_x += d
-
-        # Make a final pass over the items and perform the layout. This
-        # pass handles the orthogonal alignment of the item if there is
-        # any leftover vertical space for the item.
-        curr_x = start_x
-        for item in items:
-            w = widths[item]
-            if item.data.ortho_stretch > 0:
-                h = min(layout_height, item.maximumSize().height())
-            else:
-                h = min(layout_height, item.sizeHint().height())
-            delta = layout_height - h
-            this_y = y
-            if delta > 0:
-                align = item.data.alignment
-                if align == QFlowLayout.AlignTrailing:
-                    this_y = y + delta
-                elif align == QFlowLayout.AlignCenter:
-                    this_y = y + delta / 2
-            item.setGeometry(QRect(int(round(curr_x)), int(round(this_y)),
-                                   int(round(w)), int(round(h))))
-            curr_x += (w + space)
-
-
-class _LayoutColumn(object):
-    """ A private class used by QFlowLayout.
-
-    This class accumulates information about a column of items as the
-    items are added to the column. Instances of the this class are
-    created by the QFlowLayout during a layout pass. For performance
-    reasons, there are several publically accesible attributes. See
-    their documentation for restrictions on their use.
-
-    """
-    #: The width to use for laying out the column. This attribute is
-    #: modified directly by the layout as it distributes the horizontal
-    #: space amongst the columns.
-    layout_width = 0
-
-    #: The minimum height required for the column. This is automatically
-    #: updated as items are added to the column. It should be considered
-    #: read-only to external users.
-    min_height = 0
-
-    #: The minimum width required for the column. This is automatically
-    #: updated as items are added to the column. It should be considered
-    #: read-only to external users.
-    min_width = 0
-
-    #: The desired height for the column. This is automatically updated
-    #: as items are added to the column. It should be considered
-    #: read-only to external users.
-    hint_height = 0
-
-    #: The desired width for the column. This is automatically updated
-    #: as items are added to the column. It should be considered
-    #: read-only to external users.
-    hint_width = 0
-
-    #: The vertical stretch factor for the column. This is automatically
-    #: updated as items are added to the column. It should be considered
-    #: read-only by external users.
-    stretch = 0
-
-    def __init__(self, height, options):
-        """ Initialize a layout column.
-
-        Parameters
-        ----------
-        height : int
-            The height of the layout area.
-
-        options : _LayoutOptions
-            The options in effect for the layout.
-
-        """
-        self._height = height
-        self._options = options
-        self._items_stretch = 0
-        self._items = []
-
-    @property
-    def diff_width(self):
-        """ A read-only property which computes the difference between
-        the desired width and the minimum width.
-
-        """
-        return self.hint_width - self.min_width
-
-    def add_item(self, item):
-        """ Add an item to the layout column.
+    def truncate(self, index):
+        """ Discard the lines starting with the line of an item.
 
         Parameters
         ----------
-        item : QFlowWidgetItem
-            The flow widget item to add to the layout column.
-
-        Returns
-        -------
-        result : bool
-            True if the items was added. False if the item was not
-            added. An item will not be added if the column already
-            contains an item and adding another item would cause
-            it to overflow.
-
-        """
-        min_size = item.minimumSize()
-        hint_size = item.sizeHint()
-        n = len(self._items)
-        s = self._options.v_spacing
-        if n > 0 and self.hint_height + s + hint_size.height() > self._height:
-            return False
-        self.min_width = max(self.min_width, min_size.width())
-        self.hint_width = max(self.hint_width, hint_size.width())
-        self.stretch = max(self.stretch, item.data.ortho_stretch)
-        self.min_height += min_size.height()
-        self.hint_height += hint_size.height()
-        self._items_stretch += item.data.stretch
-        if n > 0:
-            self.min_height += s
-            self.hint_height += s
-        self._items.append(item)
-        return True
-
-    def layout(self, x, y):
-        """ Layout the row using the given starting coordinates.
-
-        Parameters
-        ----------
-        x : int
-            The x coordinate of the column origin.
-
-        y : int
-            The y coordinate of the column origin.
+        index : int
+            The index of the first item which has changed. The lines
+            holding the items from this index onward are discarded.
+            If the item starts a line, the preceding line is discarded
+            as well, since the item may now fit at its end.
 
         """
-        opts = self._options
-        layout_height = self._height
-        layout_width = self.layout_width
-        delta = self._height - self.hint_height
-        items = self._items
-
-        # Short circuit the case where there is negative extra space.
-        # This means that there must be only a single item in the column,
-        # in which case the height may shrink to the minimum if needed.
-        if delta < 0:
-            assert len(items) == 1
-            item = items[0]
-            h = max(layout_height, item.minimumSize().height())
-            if item.data.ortho_stretch > 0:
-                w = min(layout_width, item.maximumSize().width())
-            else:
-                w = min(layout_width, item.sizeHint().width())
-            delta_w = layout_width - w
-            if delta_w > 0:
-                align = item.data.alignment
-                if align == QFlowLayout.AlignTrailing:
-                    x += delta_w
-                elif align == QFlowLayout.AlignCenter:
-                    x += delta_w / 2
-            item.setGeometry(QRect(x, y, w, h))
-            return
-
-        # Reversing the items reverses the layout direction. All of the
-        # computation up to this point has be independent of direction.
-        if opts.direction == QFlowLayout.BottomToTop:
-            items.reverse()
-
-        # Precompute a map of starting heights for the items. These will
-        # be progressively modified as the delta space is distributed.
-        heights = {}
-        for item in items:
-            heights[item] = item.sizeHint().height()
-
-        # See the long comment in _LayoutRow for the explanation about
-        # this section of code. This section is simply the transpose.
-        items_stretch = self._items_stretch
-        if items_stretch > 0:
-            diffs = []
-            for item in items:
-                if item.data.stretch > 0:
-                    h = item.sizeHint().height()
-                    m = item.maximumSize().height()
-                    diffs.append((m - h, item))
-            diffs.sort()
-            for ignored, item in diffs:
-                item_stretch = item.data.stretch
-                max_height = item.maximumSize().height()
-                d = item_stretch * delta / items_stretch
-                items_stretch -= item_stretch
-                item_height = heights[item]
-                if item_height + d > max_height:
-                    heights[item] = max_height
-                    delta -= max_height - item_height
-                else:
-                    heights[item] = item_height + d
-                    delta -= d
-
-        # The heights of all items are now computed. Any leftover delta
-        # space is used for alignment purposes. This is accomplished by
-        # shifting the starting location and, in the case of justify,
-        # adding to the vertical space value.
-        start_y = y
-        space = opts.v_spacing
-        if opts.alignment == QFlowLayout.AlignLeading:
-            if opts.direction == QFlowLayout.BottomToTop:
-                start_y += delta
-        elif opts.alignment == QFlowLayout.AlignTrailing:
-            if opts.direction == QFlowLayout.TopToBottom:
-                start_y += delta
-        elif opts.alignment == QFlowLayout.AlignCenter:
-            start_y += delta / 2
-        else:
-            d = delta / (len(items) + 1)
-            space += d
-            start_y += d
-
-        # Make a final pass over the items and perform the layout. This
-        # pass handles the orthogonal alignment of the item if there is
-        # any leftover horizontal space for the item.
-        curr_y = start_y
-        for item in items:
-            h = heights[item]
-            if item.data.ortho_stretch > 0:
-                w = min(layout_width, item.maximumSize().width())
-            else:
-                w = min(layout_width, item.sizeHint().width())
-            delta = layout_width - w
-            this_x = x
-            if delta > 0:
-                align = item.data.alignment
-                if align == QFlowLayout.AlignTrailing:
-                    this_x = x + delta
-                elif align == QFlowLayout.AlignCenter:
-                    this_x = x + delta / 2
-            item.setGeometry(QRect(this_x, curr_y, w, h))
-            curr_y += (h + space)
+        starts = self.starts
+        line = bisect_right(starts, index) - 1
+        if line > 0 and starts[line] == index:
+            line -= 1
+        line = max(0, line)
+        if line < len(starts):
+            self.count = starts[line]
+            for values in (starts, self.flow_min, self.flow_hint,
+                           self.flow_stretch, self.ortho_min,
+                           self.ortho_hint, self.ortho_stretch):
+                del values[line:]
 
 
 class QFlowLayout(QLayout):
@@ -656,6 +322,10 @@ class QFlowLayout(QLayout):
     #: Lines are aligned justified within any extra space.
     AlignJustify = 7
 
+    #: The maximum number of line packings cached by the layout. Qt
+    #: queries the layout for several widths during a resize.
+    MaxPackings = 4
+
     def __init__(self):
         """ Initialize a QFlowLayout.
 
@@ -668,6 +338,18 @@ class QFlowLayout(QLayout):
         self._cached_min = None
         self._cached_hint = None
         self._wfh_size = None
+        # The size metrics of the items are stored in arrays indexed by
+        # item. A zero in the 'valid' array marks the metrics of an item
+        # which must be read again from the item.
+        self._valid = bytearray()
+        self._hint_w = array('l')
+        self._hint_h = array('l')
+        self._min_w = array('l')
+        self._min_h = array('l')
+        self._max_w = array('l')
+        self._max_h = array('l')
+        self._packings = {}
+        self._dirty_items = {}
 
     def addWidget(self, widget):
         """ Add a widget to the end of the flow layout.
@@ -695,7 +377,14 @@ class QFlowLayout(QLayout):
         assert isinstance(widget, AbstractFlowWidget), 'invalid widget type'
         self.addChildWidget(widget)
         item = QFlowWidgetItem(widget, widget.layoutData())
+        item.invalidate()
+        item.dirty_handler = self._onItemDirty
+        index = max(0, min(index, len(self._items)))
         self._items.insert(index, item)
+        self._valid.insert(index, 0)
+        for values in self._metricArrays():
+            values.insert(index, 0)
+        self._truncatePackings(index)
         widget.show()
         self.invalidate()
 
@@ -720,6 +409,7 @@ class QFlowLayout(QLayout):
 
         """
         self._options.direction = direction
+        self._packings.clear()
         self.invalidate()
 
     def alignment(self):
@@ -769,6 +459,7 @@ class QFlowLayout(QLayout):
 
         """
         self._options.h_spacing = spacing
+        self._packings.clear()
         self.invalidate()
 
     def verticalSpacing(self):
@@ -794,6 +485,7 @@ class QFlowLayout(QLayout):
 
         """
         self._options.v_spacing = spacing
+        self._packings.clear()
         self.invalidate()
 
     def hasHeightForWidth(self):
@@ -839,14 +531,28 @@ class QFlowLayout(QLayout):
     def invalidate(self):
         """ Invalidate the cached values of the layout.
 
+        Only the items whose layout data was marked dirty are invalidated,
+        and the line packings are kept up to the first of those items.
+
         """
         self._cached_w = -1
         self._cached_hfw = -1
         self._cached_wfh = -1
         self._cached_min = None
         self._cached_hint = None
-        for item in self._items:
-            item.invalidate()
+        dirty_items = self._dirty_items
+        if dirty_items:
+            items = self._items
+            valid = self._valid
+            first = len(items)
+            for item in dirty_items:
+                if item.data.dirty:
+                    item.invalidate()
+                    index = items.index(item)
+                    valid[index] = 0
+                    first = min(first, index)
+            dirty_items.clear()
+            self._truncatePackings(first)
         super(QFlowLayout, self).invalidate()
 
     def count(self):
@@ -874,6 +580,12 @@ class QFlowLayout(QLayout):
         if idx < len(items):
             item = items[idx]
             del items[idx]
+            item.dirty_handler = None
+            self._dirty_items.pop(item, None)
+            del self._valid[idx]
+            for values in self._metricArrays():
+                del values[idx]
+            self._truncatePackings(idx)
             item.widget().hide()
             # The creation path of the layout items bypasses the virtual
             # wrapper methods, this means that the ownership of the cpp
@@ -896,12 +608,11 @@ class QFlowLayout(QLayout):
 
         """
         if self._cached_hint is None:
-            size = QSize(0, 0)
-            for item in self._items:
-                size = size.expandedTo(item.sizeHint())
+            self._updateMetrics()
             left, top, right, bottom = self.getContentsMargins()
-            size.setWidth(size.width() + left + right)
-            size.setHeight(size.height() + top + bottom)
+            width = max(self._hint_w, default=0)
+            height = max(self._hint_h, default=0)
+            size = QSize(width + left + right, height + top + bottom)
             self._cached_hint = size
         return self._cached_hint
 
@@ -911,12 +622,11 @@ class QFlowLayout(QLayout):
 
         """
         if self._cached_min is None:
-            size = QSize(0, 0)
-            for item in self._items:
-                size = size.expandedTo(item.minimumSize())
+            self._updateMetrics()
             left, top, right, bottom = self.getContentsMargins()
-            size.setWidth(size.width() + left + right)
-            size.setHeight(size.height() + top + bottom)
+            width = max(self._min_w, default=0)
+            height = max(self._min_h, default=0)
+            size = QSize(width + left + right, height + top + bottom)
             self._cached_min = size
         # XXX hack! We really need hasWidthForHeight! This doesn't quite
         # work because a QScrollArea internally caches the min size.
@@ -931,6 +641,119 @@ class QFlowLayout(QLayout):
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _metricArrays(self):
+        """ Get the arrays holding the size metrics of the items.
+
+        """
+        return (self._hint_w, self._hint_h, self._min_w, self._min_h,
+                self._max_w, self._max_h)
+
+    def _updateMetrics(self):
+        """ Read the size metrics of the items which are not valid.
+
+        """
+        valid = self._valid
+        index = valid.find(0)
+        if index == -1:
+            return
+        items = self._items
+        hint_w, hint_h, min_w, min_h, max_w, max_h = self._metricArrays()
+        while index != -1:
+            item = items[index]
+            hint = item.sizeHint()
+            min_size = item.minimumSize()
+            max_size = item.maximumSize()
+            hint_w[index] = hint.width()
+            hint_h[index] = hint.height()
+            min_w[index] = min_size.width()
+            min_h[index] = min_size.height()
+            max_w[index] = max_size.width()
+            max_h[index] = max_size.height()
+            valid[index] = 1
+            index = valid.find(0, index + 1)
+
+    def _onItemDirty(self, item):
+        """ Record an item whose layout data was marked dirty.
+
+        """
+        self._dirty_items[item] = None
+
+    def _truncatePackings(self, index):
+        """ Discard the packed lines holding the items from an index.
+
+        """
+        for packing in self._packings.values():
+            packing.truncate(index)
+
+    def _getPacking(self, extent, horizontal):
+        """ Get the line packing of the items for the given extent.
+
+        The packing is taken from the cache and packed from the first
+        item which is not yet part of a line.
+
+        """
+        packings = self._packings
+        packing = packings.pop(extent, None)
+        if packing is None:
+            packing = _LinePacking(extent)
+            if len(packings) >= self.MaxPackings:
+                del packings[next(iter(packings))]
+        # Reinserting the packing keeps the dict in LRU order.
+        packings[extent] = packing
+        if packing.count < len(self._items):
+            self._updateMetrics()
+            self._packLines(packing, horizontal)
+        return packing
+
+    def _packLines(self, packing, horizontal):
+        """ Pack the items which are not yet part of a line.
+
+        """
+        if horizontal:
+            flow_hint, flow_min = self._hint_w, self._min_w
+            ortho_hint, ortho_min = self._hint_h, self._min_h
+            space = self._options.h_spacing
+        else:
+            flow_hint, flow_min = self._hint_h, self._min_h
+            ortho_hint, ortho_min = self._hint_w, self._min_w
+            space = self._options.v_spacing
+        extent = packing.extent
+        items = self._items
+        count = len(items)
+        index = packing.count
+        while index < count:
+            # A line always holds at least one item.
+            start = index
+            data = items[index].data
+            line_flow_min = flow_min[index]
+            line_flow_hint = flow_hint[index]
+            line_flow_stretch = data.stretch
+            line_ortho_min = ortho_min[index]
+            line_ortho_hint = ortho_hint[index]
+            line_ortho_stretch = data.ortho_stretch
+            index += 1
+            while index < count:
+                hint = line_flow_hint + space + flow_hint[index]
+                if hint > extent:
+                    break
+                data = items[index].data
+                line_flow_hint = hint
+                line_flow_min += space + flow_min[index]
+                line_flow_stretch += data.stretch
+                line_ortho_min = max(line_ortho_min, ortho_min[index])
+                line_ortho_hint = max(line_ortho_hint, ortho_hint[index])
+                line_ortho_stretch = max(line_ortho_stretch,
+                                         data.ortho_stretch)
+                index += 1
+            packing.starts.append(start)
+            packing.flow_min.append(line_flow_min)
+            packing.flow_hint.append(line_flow_hint)
+            packing.flow_stretch.append(line_flow_stretch)
+            packing.ortho_min.append(line_ortho_min)
+            packing.ortho_hint.append(line_ortho_hint)
+            packing.ortho_stretch.append(line_ortho_stretch)
+        packing.count = count
+
     def _doLayout(self, rect, test=False):
         """ Perform the layout for the given rect.
 
@@ -959,77 +782,85 @@ class QFlowLayout(QLayout):
             self._cached_wfh = res + rect.x()
         return res
 
+    def _distributeLines(self, packing, extent):
+        """ Distribute the space orthogonal to the flow amongst lines.
+
+        Parameters
+        ----------
+        packing : _LinePacking
+            The packing of the lines.
+
+        extent : int
+            The extent of the layout area orthogonal to the flow.
+
+        Returns
+        -------
+        result : list
+            The extent of each line orthogonal to the flow.
+
+        """
+        ortho_min = packing.ortho_min
+        ortho_hint = packing.ortho_hint
+        ortho_stretch = packing.ortho_stretch
+        n_lines = len(ortho_min)
+        if self._options.direction in (self.LeftToRight, self.RightToLeft):
+            space = self._options.v_spacing * (n_lines - 1)
+        else:
+            space = self._options.h_spacing * (n_lines - 1)
+        min_extent = sum(ortho_min) + space
+        total_diff = sum(ortho_hint) - sum(ortho_min)
+        stretch = sum(ortho_stretch)
+
+        # Make an initial pass to distribute extra space to lines which
+        # lie between their minimum extent and desired extent.
+        play_space = max(0, extent - min_extent)
+        diff_space = max(total_diff, 1)  # Guard against divide by zero
+        extents = []
+        layout_extent = space
+        for line in range(n_lines):
+            line_min = ortho_min[line]
+            d = play_space * (ortho_hint[line] - line_min) / diff_space
+            line_extent = min(line_min + d, ortho_hint[line])
+            extents.append(line_extent)
+            layout_extent += line_extent
+
+        # Make a second pass to distribute remaining space to lines
+        # which with a stretch factor greater than zero.
+        remaining = extent - layout_extent
+        if remaining > 0 and stretch > 0:
+            for line in range(n_lines):
+                if ortho_stretch[line] > 0:
+                    extents[line] += remaining * ortho_stretch[line] / stretch
+
+        return extents
+
     def _doHorizontalLayout(self, rect, test):
         """ Perform the layout for a horizontal flow direction.
 
         The method signature is identical to the `_doLayout` method.
 
         """
-        # Walk over the items and create the layout rows.
-        rows = []
-        width = rect.width()
-        opts = self._options
-        for item in self._items:
-            if len(rows) == 0:
-                row = _LayoutRow(width, opts)
-                row.add_item(item)
-                rows.append(row)
-            else:
-                row = rows[-1]
-                if not row.add_item(item):
-                    row = _LayoutRow(width, opts)
-                    row.add_item(item)
-                    rows.append(row)
-
-        # After collecting rows all of the rows, compute the metrics. If
-        # this is a test run, only the minimum height is required.
-        space = opts.v_spacing * (len(rows) - 1)
+        packing = self._getPacking(rect.width(), True)
+
+        # If this is a test run, only the minimum height is required.
+        v_space = self._options.v_spacing
         if test:
-            return sum(row.min_height for row in rows) + space
-
-        min_height = space
-        hint_height = space
-        total_diff = 0
-        stretch = 0
-        for row in rows:
-            min_height += row.min_height
-            hint_height += row.hint_height
-            total_diff += row.diff_height
-            stretch += row.stretch
-
-        # Make an initial pass to distribute extra space to rows which
-        # lie between their minimum height and desired height.
-        height = rect.height()
-        play_space = max(0, height - min_height)
-        diff_space = max(total_diff, 1)  # Guard against divide by zero
-        layout_height = 0
-        for row in rows:
-            d = play_space * row.diff_height / diff_space
-            row.layout_height = min(row.min_height + d, row.hint_height)
-            layout_height += row.layout_height
-        layout_height += space
-
-        # Make a second pass to distribute remaining space to rows
-        # which with a stretch factor greater than zero.
-        remaining = height - layout_height
-        if remaining > 0 and stretch > 0:
-            for row in rows:
-                if row.stretch > 0:
-                    row.layout_height += remaining * row.stretch / stretch
+            return sum(packing.ortho_min) + v_space * (len(packing.starts) - 1)
 
-        # Make a final pass to layout the rows, computing the overall
-        # final layout height along the way.
+        # Layout the rows, computing the overall final layout height
+        # along the way.
         final_height = 0
         x = rect.x()
         curr_y = rect.y()
-        v_space = opts.v_spacing
-        for row in rows:
-            row.layout(x, curr_y)
-            d = row.layout_height + v_space
+        heights = self._distributeLines(packing, rect.height())
+        for line, height in enumerate(heights):
+            self._layoutRow(packing, line, x, curr_y, height)
+            d = height + v_space
             final_height += d
             curr_y += d
 
-        return final_height
+        # The line extents are fractional when space is distributed.
+        return int(round(final_height))
 
     def _doVerticalLayout(self, rect, test):
         """ Perform the layout for a vertical flow direction.
@@ -1037,71 +868,297 @@ class QFlowLayout(QLayout):
         The method signature is identical to the `_doLayout` method.
 
         """
-        # Walk over the items and create the layout columns.
-        cols = []
-        height = rect.height()
-        opts = self._options
-        for item in self._items:
-            if len(cols) == 0:
-                col = _LayoutColumn(height, opts)
-                col.add_item(item)
-                cols.append(col)
-            else:
-                col = cols[-1]
-                if not col.add_item(item):
-                    col = _LayoutColumn(height, opts)
-                    col.add_item(item)
-                    cols.append(col)
+        packing = self._getPacking(rect.height(), False)
 
-        # After collecting rows all of the columns, compute the metrics.
         # If this is a test run, only the minimum width is required.
-        space = opts.h_spacing * (len(cols) - 1)
+        h_space = self._options.h_spacing
         if test:
-            return sum(col.min_width for col in cols) + space
-
-        min_width = space
-        hint_width = space
-        total_diff = 0
-        stretch = 0
-        for col in cols:
-            min_width += col.min_width
-            hint_width += col.hint_width
-            total_diff += col.diff_width
-            stretch += col.stretch
-
-        # Make an initial pass to distribute extra space to columns
-        # which lie between their minimum width and desired width.
-        width = rect.width()
-        play_space = max(0, width - min_width)
-        diff_space = max(total_diff, 1)  # Guard against divide by zero
-        layout_width = 0
-        for col in cols:
-            d = play_space * col.diff_width / diff_space
-            col.layout_width = min(col.min_width + d, col.hint_width)
-            layout_width += col.layout_width
-        layout_width += space
-
-        # Make a second pass to distribute remaining space to columns
-        # which with a stretch factor greater than zero.
-        remaining = width - layout_width
-        if remaining > 0 and stretch > 0:
-            for col in cols:
-                if col.stretch > 0:
-                    col.layout_width += remaining * col.stretch / stretch
+            return sum(packing.ortho_min) + h_space * (len(packing.starts) - 1)
 
-        # Make a final pass to layout the columns, computing the overall
-        # final layout width along the way.
+        # Layout the columns, computing the overall final layout width
+        # along the way.
         final_width = 0
         y = rect.y()
         curr_x = rect.x()
-        h_space = opts.h_spacing
-        for col in cols:
-            col.layout(curr_x, y)
-            d = col.layout_width + h_space
+        widths = self._distributeLines(packing, rect.width())
+        for line, width in enumerate(widths):
+            self._layoutColumn(packing, line, curr_x, y, width)
+            d = width + h_space
             final_width += d
             curr_x += d
 
-        return final_width
+        # The line extents are fractional when space is distributed.
+        return int(round(final_width))
+
+    def _distributeFlow(self, indices, hints, maxes, delta, stretch):
+        """ Distribute the extra space of a line amongst its items.
+
+        Parameters
+        ----------
+        indices : list
+            The indices of the items of the line.
+
+        hints : array
+            The desired extents of the items in the flow direction.
+
+        maxes : array
+            The maximum extents of the items in the flow direction.
+
+        delta : int
+            The extra space available in the line.
+
+        stretch : int
+            The sum of the flow stretch factors of the items.
+
+        Returns
+        -------
+        result : tuple
+            A 2-tuple of the dict of item extents in the flow direction
+            and the leftover extra space.
+
+        """
+        # Precompute a map of starting extents for the items. These will
+        # be progressively modified as the delta space is distributed.
+        extents = {}
+        for index in indices:
+            extents[index] = hints[index]
+
+        # If the flow stretch for the line is greater than zero. Then
+        # there exists an item or items which have flow stretch. It's
+        # not sufficient to simply distribute the delta space according
+        # to relative stretch factors, because an item may have a max
+        # extent which is less than the adjusted extent. This causes the
+        # rest of the adjustments to be invalid, yielding a potential
+        # O(n^2) solution. Instead, the items which can stretch are
+        # sorted according to the differences between their desired
+        # extent and max extent. When distributing the delta space in
+        # this order, any unused space from an item is added back to the
+        # pool and its stretch factor removed from further computation.
+        # This gives an O(n log n) solution to the problem. This
+        # algorithm iteratively removes space from the delta, so that
+        # the alignment pass operates on the adjusted free space amount.
+        if stretch > 0:
+            items = self._items
+            diffs = []
+            for index in indices:
+                if items[index].data.stretch > 0:
+                    diffs.append((maxes[index] - hints[index], index))
+            diffs.sort()
+            for ignored, index in diffs:
+                item_stretch = items[index].data.stretch
+                max_extent = maxes[index]
+                d = item_stretch * delta / stretch
+                stretch -= item_stretch
+                item_extent = extents[index]
+                if item_extent + d > max_extent:
+                    extents[index] = max_extent
+                    delta -= max_extent - item_extent
+                else:
+                    extents[index] = item_extent + d
+                    delta -= d
+
+        return extents, delta
+
+    def _alignFlow(self, start, space, delta, n_items, reverse):
+        """ Compute the start position and spacing of a line.
+
+        The leftover delta space of the line is used for alignment by
+        shifting the starting location and, in the case of justify,
+        adding to the space between the items.
+
+        """
+        align = self._options.alignment
+        if align == QFlowLayout.AlignLeading:
+            if reverse:
+                start += delta
+        elif align == QFlowLayout.AlignTrailing:
+            if not reverse:
+                start += delta
+        elif align == QFlowLayout.AlignCenter:
+            start += delta / 2
+        else:
+            d = delta / (n_items + 1)
+            space += d
+            start += d
+        return start, space
+
+    def _layoutRow(self, packing, line, x, y, layout_height):
+        """ Layout a row of items using the given starting coordinates.
+
+        Parameters
+        ----------
+        packing : _LinePacking
+            The packing holding the row.
+
+        line : int
+            The index of the row in the packing.
+
+        x : int
+            The x coordinate of the row origin.
+
+        y : int
+            The y coordinate of the row origin.
+
+        layout_height : float
+            The height to use for laying out the row.
+
+        """
+        items = self._items
+        hint_h = self._hint_h
+        max_h = self._max_h
+        layout_width = packing.extent
+        start = packing.starts[line]
+        end = packing.lineEnd(line)
+        delta = layout_width - packing.flow_hint[line]
+
+        # Short circuit the case where there is negative extra space.
+        # This means that there must be only a single item in the row,
+        # in which case the width may shrink to the minimum if needed.
+        if delta < 0:
+            assert end - start == 1
+            item = items[start]
+            w = max(layout_width, self._min_w[start])
+            if item.data.ortho_stretch > 0:
+                h = min(layout_height, max_h[start])
+            else:
+                h = min(layout_height, hint_h[start])
+            delta_h = layout_height - h
+            if delta_h > 0:
+                align = item.data.alignment
+                if align == QFlowLayout.AlignTrailing:
+                    y += delta_h
+                elif align == QFlowLayout.AlignCenter:
+                    y += delta_h / 2
+            item.setGeometry(QRect(x, int(round(y)),
+                                   int(round(w)), int(round(h))))
+            return
+
+        # Reversing the items reverses the layout direction. All of the
+        # computation up to this point has be independent of direction.
+        indices = list(range(start, end))
+        reverse = self._options.direction == QFlowLayout.RightToLeft
+        if reverse:
+            indices.reverse()
+
+        widths, delta = self._distributeFlow(
+            indices, self._hint_w, self._max_w, delta,
+            packing.flow_stretch[line]
+        )
+        curr_x, space = self._alignFlow(
+            x, self._options.h_spacing, delta, len(indices), reverse
+        )
+
+        # Make a final pass over the items and perform the layout. This
+        # pass handles the orthogonal alignment of the item if there is
+        # any leftover vertical space for the item.
+        for index in indices:
+            item = items[index]
+            w = widths[index]
+            if item.data.ortho_stretch > 0:
+                h = min(layout_height, max_h[index])
+            else:
+                h = min(layout_height, hint_h[index])
+            delta = layout_height - h
+            this_y = y
+            if delta > 0:
+                align = item.data.alignment
+                if align == QFlowLayout.AlignTrailing:
+                    this_y = y + delta
+                elif align == QFlowLayout.AlignCenter:
+                    this_y = y + delta / 2
+            item.setGeometry(QRect(int(round(curr_x)), int(round(this_y)),
+                                   int(round(w)), int(round(h))))
+            curr_x += (w + space)
+
+    def _layoutColumn(self, packing, line, x, y, layout_width):
+        """ Layout a column of items using the given starting coordinates.
+
+        This is the transpose of the `_layoutRow` method.
+
+        Parameters
+        ----------
+        packing : _LinePacking
+            The packing holding the column.
+
+        line : int
+            The index of the column in the packing.
+
+        x : int
+            The x coordinate of the column origin.
+
+        y : int
+            The y coordinate of the column origin.
+
+        layout_width : float
+            The width to use for laying out the column.
+
+        """
+        items = self._items
+        hint_w = self._hint_w
+        max_w = self._max_w
+        layout_height = packing.extent
+        start = packing.starts[line]
+        end = packing.lineEnd(line)
+        delta = layout_height - packing.flow_hint[line]
+
+        # Short circuit the case where there is negative extra space.
+        # This means that there must be only a single item in the column,
+        # in which case the height may shrink to the minimum if needed.
+        if delta < 0:
+            assert end - start == 1
+            item = items[start]
+            h = max(layout_height, self._min_h[start])
+            if item.data.ortho_stretch > 0:
+                w = min(layout_width, max_w[start])
+            else:
+                w = min(layout_width, hint_w[start])
+            delta_w = layout_width - w
+            if delta_w > 0:
+                align = item.data.alignment
+                if align == QFlowLayout.AlignTrailing:
+                    x += delta_w
+                elif align == QFlowLayout.AlignCenter:
+                    x += delta_w / 2
+            item.setGeometry(QRect(int(round(x)), y,
+                                   int(round(w)), int(round(h))))
+            return
+
+        # Reversing the items reverses the layout direction. All of the
+        # computation up to this point has be independent of direction.
+        indices = list(range(start, end))
+        reverse = self._options.direction == QFlowLayout.BottomToTop
+        if reverse:
+            indices.reverse()
+
+        heights, delta = self._distributeFlow(
+            indices, self._hint_h, self._max_h, delta,
+            packing.flow_stretch[line]
+        )
+        curr_y, space = self._alignFlow(
+            y, self._options.v_spacing, delta, len(indices), reverse
+        )
+
+        # Make a final pass over the items and perform the layout. This
+        # pass handles the orthogonal alignment of the item if there is
+        # any leftover horizontal space for the item.
+        for index in indices:
+            item = items[index]
+            h = heights[index]
+            if item.data.ortho_stretch > 0:
+                w = min(layout_width, max_w[index])
+            else:
+                w = min(layout_width, hint_w[index])
+            delta = layout_width - w
+            this_x = x
+            if delta > 0:
+                align = item.data.alignment
+                if align == QFlowLayout.AlignTrailing:
+                    this_x = x + delta
+                elif align == QFlowLayout.AlignCenter:
+                    this_x = x + delta / 2
+            item.setGeometry(QRect(int(round(this_x)), int(round(curr_y)),
+                                   int(round(w)), int(round(h))))
+            curr_y += (h + space)
 
 
 class _LayoutOptions(object):
@@ -0,0 +1,215 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from .QtCore import Qt, QAbstractListModel, QModelIndex
+
+from .q_resource_helpers import get_cached_qicon, request_qicon
+
+
+#: A sentinel marking the text or icon of a row as not yet computed.
+UNSET = object()
+
+
+#: The item data roles as plain integers, which compare faster than the
+#: enum values when the views query the data of every row.
+DISPLAY_ROLE = int(Qt.DisplayRole)
+EDIT_ROLE = int(Qt.EditRole)
+DECORATION_ROLE = int(Qt.DecorationRole)
+
+
+class PendingIcon(object):
+    """ A placeholder for an icon whose images are being decoded.
+
+    """
+    __slots__ = ('icon',)
+
+    def __init__(self, icon):
+        self.icon = icon
+
+
+class QItemListModel(QAbstractListModel):
+    """ A list model which displays a list of arbitrary items.
+
+    The text and the icon of an item are computed by converter functions
+    the first time the row of the item is displayed and cached until the
+    item changes. A new list of items is diffed against the current one
+    by identity so that only the rows which were actually inserted,
+    removed or replaced are notified to the views.
+
+    """
+    def __init__(self, parent=None):
+        """ Initialize a QItemListModel.
+
+        Parameters
+        ----------
+        parent : QObject, optional
+            The parent object of the model.
+
+        """
+        super(QItemListModel, self).__init__(parent)
+        self._items = []
+        self._texts = []
+        self._icons = []
+        self._to_string = str
+        self._to_icon = None
+
+    #--------------------------------------------------------------------------
+    # QAbstractListModel API
+    #--------------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        """ Get the number of rows of the model.
+
+        """
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=DISPLAY_ROLE):
+        """ Get the data of a row for the given role.
+
+        """
+        if role == DISPLAY_ROLE or role == EDIT_ROLE:
+            row = index.row()
+            text = self._texts[row]
+            if text is UNSET:
+                text = self._texts[row] = self._to_string(self._items[row])
+            return text
+        if role == DECORATION_ROLE and self._to_icon is not None:
+            row = index.row()
+            qicon = self._icons[row]
+            if qicon is UNSET:
+                qicon = self._icons[row] = self._iconFor(self._items[row])
+            if isinstance(qicon, PendingIcon):
+                return None
+            return qicon
+        return None
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def items(self):
+        """ Get the list of items displayed by the model.
+
+        """
+        return self._items
+
+    def setItems(self, items, refresh=False):
+        """ Set the list of items displayed by the model.
+
+        The rows of the common prefix and suffix of the current and new
+        lists, whose items are the same objects, are kept along with
+        their cached text and icon. The rows in between are notified as
+        changed, then inserted or removed.
+
+        Parameters
+        ----------
+        items : sequence
+            The new items to display in the model.
+
+        refresh : bool, optional
+            Whether the cached text and icon of the kept rows are
+            discarded as well, for items which may have been modified
+            in place. The default is False.
+
+        """
+        old = self._items
+        new = list(items)
+        n_old = len(old)
+        n_new = len(new)
+        limit = min(n_old, n_new)
+        start = 0
+        while start < limit and old[start] is new[start]:
+            start += 1
+        limit -= start
+        end = 0
+        while end < limit and old[-1 - end] is new[-1 - end]:
+            end += 1
+        old_stop = n_old - end
+        new_stop = n_new - end
+        n_changed = min(old_stop, new_stop) - start
+        if n_changed > 0:
+            old[start:start + n_changed] = new[start:start + n_changed]
+            self._resetRows(start, start + n_changed)
+            first = self.index(start, 0)
+            last = self.index(start + n_changed - 1, 0)
+            self.dataChanged.emit(first, last)
+        start += n_changed
+        if old_stop > start:
+            self.beginRemoveRows(QModelIndex(), start, old_stop - 1)
+            del old[start:old_stop]
+            del self._texts[start:old_stop]
+            del self._icons[start:old_stop]
+            self.endRemoveRows()
+        elif new_stop > start:
+            self.beginInsertRows(QModelIndex(), start, new_stop - 1)
+            old[start:start] = new[start:new_stop]
+            count = new_stop - start
+            self._texts[start:start] = [UNSET] * count
+            self._icons[start:start] = [UNSET] * count
+            self.endInsertRows()
+        count = len(old)
+        if refresh and count > 0:
+            self._resetRows(0, count)
+            self.dataChanged.emit(self.index(0, 0), self.index(count - 1, 0))
+
+    def setConverters(self, to_string, to_icon=None):
+        """ Set the functions which compute the text and icon of an item.
+
+        The cached texts and icons are discarded if the functions change.
+
+        Parameters
+        ----------
+        to_string : callable
+            A callable which returns the text of an item.
+
+        to_icon : callable, optional
+            A callable which returns the Enaml Icon of an item, or None.
+            By default, the items have no icon.
+
+        """
+        if to_string is self._to_string and to_icon is self._to_icon:
+            return
+        self._to_string = to_string
+        self._to_icon = to_icon
+        count = len(self._items)
+        if count > 0:
+            self._resetRows(0, count)
+            self.dataChanged.emit(self.index(0, 0), self.index(count - 1, 0))
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _resetRows(self, start, stop):
+        """ Discard the cached text and icon of a range of rows.
+
+        """
+        count = stop - start
+        self._texts[start:stop] = [UNSET] * count
+        self._icons[start:stop] = [UNSET] * count
+
+    def _iconFor(self, item):
+        """ Compute the QIcon of an item.
+
+        """
+        icon = self._to_icon(item)
+        if icon is None:
+            return None
+        pending = PendingIcon(icon)
+        qicon = request_qicon(icon, lambda: self._onIconDecoded(pending))
+        if qicon is None:
+            return pending
+        return qicon
+
+    def _onIconDecoded(self, pending):
+        """ Handle the decoding of the images of an icon.
+
+        """
+        try:
+            row = self._icons.index(pending)
+        except ValueError:
+            return
+        self._icons[row] = get_cached_qicon(pending.icon)
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
@@ -0,0 +1,177 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from .QtCore import QObject, QEvent, QSize
+from .QtWidgets import QSizePolicy
+
+
+#: The page events which can change the size hints of a page.
+HINT_EVENTS = (
+    QEvent.LayoutRequest, QEvent.Show, QEvent.StyleChange,
+    QEvent.FontChange,
+)
+
+
+def smart_minimum_size(hint, min_hint, widget):
+    """ Compute the effective minimum size of a widget.
+
+    This mirrors the computation performed by Qt when a layout, such
+    as the QStackedLayout, queries the minimum size of a widget.
+
+    Parameters
+    ----------
+    hint : QSize
+        The size hint of the widget.
+
+    min_hint : QSize
+        The minimum size hint of the widget.
+
+    widget : QWidget
+        The widget of interest.
+
+    Returns
+    -------
+    result : QSize
+        The effective minimum size of the widget.
+
+    """
+    policy = widget.sizePolicy()
+    width = height = 0
+    h_policy = policy.horizontalPolicy()
+    if h_policy != QSizePolicy.Ignored:
+        if h_policy & QSizePolicy.ShrinkFlag:
+            width = min_hint.width()
+        else:
+            width = max(hint.width(), min_hint.width())
+    v_policy = policy.verticalPolicy()
+    if v_policy != QSizePolicy.Ignored:
+        if v_policy & QSizePolicy.ShrinkFlag:
+            height = min_hint.height()
+        else:
+            height = max(hint.height(), min_hint.height())
+    size = QSize(width, height).boundedTo(widget.maximumSize())
+    min_size = widget.minimumSize()
+    if min_size.width() > 0:
+        size.setWidth(min_size.width())
+    if min_size.height() > 0:
+        size.setHeight(min_size.height())
+    return size.expandedTo(QSize(0, 0))
+
+
+class QPageHintCache(QObject):
+    """ A cache of the size hints of the pages of a stacked widget.
+
+    The size hints of a page are computed on demand and kept until the
+    page receives an event which can change them, or until the stacked
+    widget receives a layout request for a page without a layout, so
+    that the size hint of a stacked widget can be computed without
+    querying every page.
+
+    """
+    def __init__(self, parent=None):
+        """ Initialize a QPageHintCache.
+
+        Parameters
+        ----------
+        parent : QObject, optional
+            The parent object of the cache.
+
+        """
+        super(QPageHintCache, self).__init__(parent)
+        self._hints = {}
+
+    def hints(self, page):
+        """ Get the size hints of a page.
+
+        Parameters
+        ----------
+        page : QWidget
+            The page of interest.
+
+        Returns
+        -------
+        result : tuple
+            A 2-tuple of the size hint and minimum size hint of the
+            page.
+
+        """
+        hints = self._hints.get(page)
+        if hints is None:
+            if page not in self._hints:
+                page.installEventFilter(self)
+            hints = (page.sizeHint(), page.minimumSizeHint())
+            self._hints[page] = hints
+        return hints
+
+    def invalidate(self, page):
+        """ Invalidate the cached size hints of a page.
+
+        Parameters
+        ----------
+        page : QWidget
+            The page of interest.
+
+        """
+        if page in self._hints:
+            self._hints[page] = None
+
+    def invalidateUnmanaged(self):
+        """ Invalidate the cached size hints of the pages without a
+        layout.
+
+        The size hints of such a page are computed by the page itself,
+        and a change of them is posted as a LayoutRequest to the parent
+        of the page rather than to the page. This should be called when
+        the stacked widget receives a LayoutRequest event.
+
+        Returns
+        -------
+        result : bool
+            Whether the hints of any page were invalidated.
+
+        """
+        hints = self._hints
+        invalidated = False
+        for page in hints:
+            if page.layout() is None:
+                hints[page] = None
+                invalidated = True
+        return invalidated
+
+    def release(self, page):
+        """ Release the cached size hints of a page.
+
+        Parameters
+        ----------
+        page : QWidget
+            The page which is no longer managed by the stacked widget.
+
+        """
+        if page in self._hints:
+            del self._hints[page]
+            page.removeEventFilter(self)
+
+    def retain(self, pages):
+        """ Release the cached size hints of the pages not given.
+
+        Parameters
+        ----------
+        pages : iterable
+            The pages which are still managed by the stacked widget.
+
+        """
+        pages = set(pages)
+        for page in [p for p in self._hints if p not in pages]:
+            self.release(page)
+
+    def eventFilter(self, obj, event):
+        """ Invalidate the hints of a page on the relevant events.
+
+        """
+        if event.type() in HINT_EVENTS:
+            self.invalidate(obj)
+        return False
@@ -5,7 +5,7 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from .QtCore import QPoint, QPointF, QRect, QVariantAnimation, Signal
+from .QtCore import Qt, QPoint, QPointF, QRect, QVariantAnimation, Signal
 from .QtGui import QPainter, QPixmap, QPainterPath
 
 
@@ -227,6 +227,18 @@ class QSlideTransition(QDirectedTransition):
         super(QSlideTransition, self).__init__()
         self._slide_pixmap = None
 
+    def _slidePixmap(self, width, height):
+        """ Get a pixmap of the given size for the slide.
+
+        The pixmap of the previous slide is reused when possible.
+
+        """
+        pm = self._slide_pixmap
+        if pm is None or pm.width() != width or pm.height() != height:
+            pm = QPixmap(width, height)
+        pm.fill(Qt.transparent)
+        return pm
+
     def preparePixmap(self):
         """ Prepare the pixmap(s) for the transition.
 
@@ -242,28 +254,28 @@ class QSlideTransition(QDirectedTransition):
         height = size.height()
         direction = self.direction()
         if direction == self.LeftToRight:
-            pm = QPixmap(width * 2, height)
+            pm = self._slidePixmap(width * 2, height)
             painter = QPainter(pm)
             painter.drawPixmap(0, 0, end)
             painter.drawPixmap(width, 0, start)
             start_rect = QRect(width, 0, width * 2, height)
             end_rect = QRect(0, 0, width, height)
         elif direction == self.RightToLeft:
-            pm = QPixmap(width * 2, height)
+            pm = self._slidePixmap(width * 2, height)
             painter = QPainter(pm)
             painter.drawPixmap(0, 0, start)
             painter.drawPixmap(width, 0, end)
             start_rect = QRect(0, 0, width, height)
             end_rect = QRect(width, 0, width * 2, height)
         elif direction == self.TopToBottom:
-            pm = QPixmap(width, height * 2)
+            pm = self._slidePixmap(width, height * 2)
             painter = QPainter(pm)
             painter.drawPixmap(0, 0, end)
             painter.drawPixmap(0, height, start)
             start_rect = QRect(0, height, width, height * 2)
             end_rect = QRect(0, 0, width, height)
         elif direction == self.BottomToTop:
-            pm = QPixmap(width, height * 2)
+            pm = self._slidePixmap(width, height * 2)
             painter = QPainter(pm)
             painter.drawPixmap(0, 0, start)
             painter.drawPixmap(0, height, end)
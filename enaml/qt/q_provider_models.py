@@ -0,0 +1,550 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from collections import OrderedDict
+
+from .QtCore import Qt, QAbstractItemModel, QAbstractTableModel, QModelIndex
+
+
+#: The display role as a plain integer, which compares faster than the
+#: enum value when the views query the data of every visible cell.
+DISPLAY_ROLE = int(Qt.DisplayRole)
+
+#: The types of the values which are handed to Qt as is.
+PLAIN_TYPES = (str, int, float)
+
+#: The number of rows and columns of a block of cells fetched at once
+#: from a table provider, as powers of two.
+ROW_SHIFT = 6
+COLUMN_SHIFT = 4
+
+#: The maximum number of blocks of cells cached by a table model.
+MAX_BLOCKS = 256
+
+#: The number of children of a tree node fetched at once.
+CHILD_BLOCK = 256
+
+
+def display_value(value):
+    """ Convert a value of a provider to a value Qt can display.
+
+    """
+    if value is None or isinstance(value, PLAIN_TYPES):
+        return value
+    return str(value)
+
+
+class QTableProviderModel(QAbstractTableModel):
+    """ A table model which displays the data of a TableProvider.
+
+    The cells are fetched from the provider by blocks, which are kept in
+    a bounded LRU cache, so the cost of the model is proportional to the
+    number of displayed cells and not to the size of the table.
+
+    """
+    def __init__(self, parent=None):
+        """ Initialize a QTableProviderModel.
+
+        Parameters
+        ----------
+        parent : QObject, optional
+            The parent object of the model.
+
+        """
+        super(QTableProviderModel, self).__init__(parent)
+        self._provider = None
+        self._rows = 0
+        self._columns = 0
+        self._blocks = OrderedDict()
+
+    #--------------------------------------------------------------------------
+    # QAbstractTableModel API
+    #--------------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        """ Get the number of rows of the table.
+
+        """
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        """ Get the number of columns of the table.
+
+        """
+        return 0 if parent.isValid() else self._columns
+
+    def data(self, index, role=DISPLAY_ROLE):
+        """ Get the value of a cell for the display role.
+
+        """
+        if role != DISPLAY_ROLE:
+            return None
+        row = index.row()
+        column = index.column()
+        key = (row >> ROW_SHIFT, column >> COLUMN_SHIFT)
+        blocks = self._blocks
+        block = blocks.get(key)
+        if block is None:
+            block = self._fetchBlock(key)
+        else:
+            blocks.move_to_end(key)
+        row -= key[0] << ROW_SHIFT
+        column -= key[1] << COLUMN_SHIFT
+        return display_value(block[row][column])
+
+    def headerData(self, section, orientation, role=DISPLAY_ROLE):
+        """ Get the header of a row or a column.
+
+        """
+        if role != DISPLAY_ROLE or self._provider is None:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._provider.column_header(section)
+        return self._provider.row_header(section)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def provider(self):
+        """ Get the provider of the data of the model.
+
+        """
+        return self._provider
+
+    def setProvider(self, provider):
+        """ Set the provider of the data of the model.
+
+        Parameters
+        ----------
+        provider : TableProvider or None
+            The provider of the data of the table.
+
+        """
+        old = self._provider
+        if old is not None:
+            old.unobserve('cells_changed', self._onCellsChanged)
+            old.unobserve('rows_inserted', self._onRowsInserted)
+            old.unobserve('rows_removed', self._onRowsRemoved)
+            old.unobserve('reset', self._onReset)
+        self._provider = provider
+        if provider is not None:
+            provider.observe('cells_changed', self._onCellsChanged)
+            provider.observe('rows_inserted', self._onRowsInserted)
+            provider.observe('rows_removed', self._onRowsRemoved)
+            provider.observe('reset', self._onReset)
+        self._onReset(None)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _fetchBlock(self, key):
+        """ Fetch a block of cells from the provider and cache it.
+
+        """
+        first_row = key[0] << ROW_SHIFT
+        first_column = key[1] << COLUMN_SHIFT
+        last_row = min(first_row + (1 << ROW_SHIFT), self._rows)
+        last_column = min(first_column + (1 << COLUMN_SHIFT), self._columns)
+        block = self._provider.fetch(
+            first_row, last_row, first_column, last_column
+        )
+        blocks = self._blocks
+        blocks[key] = block
+        if len(blocks) > MAX_BLOCKS:
+            blocks.popitem(last=False)
+        return block
+
+    def _discardBlocks(self, first_row, last_row, first_column, last_column):
+        """ Discard the cached blocks intersecting a range of cells.
+
+        """
+        if first_row >= last_row or first_column >= last_column:
+            return
+        row_range = (first_row >> ROW_SHIFT, (last_row - 1) >> ROW_SHIFT)
+        column_range = (
+            first_column >> COLUMN_SHIFT, (last_column - 1) >> COLUMN_SHIFT
+        )
+        blocks = self._blocks
+        for key in list(blocks):
+            if (row_range[0] <= key[0] <= row_range[1] and
+                    column_range[0] <= key[1] <= column_range[1]):
+                del blocks[key]
+
+    def _onCellsChanged(self, change):
+        """ Handle the change of the values of a range of cells.
+
+        """
+        first_row, last_row, first_column, last_column = change['value']
+        first_row = max(first_row, 0)
+        first_column = max(first_column, 0)
+        last_row = min(last_row, self._rows)
+        last_column = min(last_column, self._columns)
+        if first_row >= last_row or first_column >= last_column:
+            return
+        self._discardBlocks(first_row, last_row, first_column, last_column)
+        self.dataChanged.emit(
+            self.index(first_row, first_column),
+            self.index(last_row - 1, last_column - 1)
+        )
+
+    def _onRowsInserted(self, change):
+        """ Handle the insertion of rows in the table.
+
+        """
+        start, count = change['value']
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), start, start + count - 1)
+        self._discardBlocks(start, self._rows + count, 0, self._columns)
+        self._rows += count
+        self.endInsertRows()
+
+    def _onRowsRemoved(self, change):
+        """ Handle the removal of rows from the table.
+
+        """
+        start, count = change['value']
+        if count <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), start, start + count - 1)
+        self._discardBlocks(start, self._rows, 0, self._columns)
+        self._rows -= count
+        self.endRemoveRows()
+
+    def _onReset(self, change):
+        """ Handle the change of the whole table.
+
+        """
+        self.beginResetModel()
+        self._blocks.clear()
+        provider = self._provider
+        if provider is None:
+            self._rows = self._columns = 0
+        else:
+            self._rows = provider.row_count()
+            self._columns = provider.column_count()
+        self.endResetModel()
+
+
+class TreeNode(object):
+    """ The record of a node of a tree model.
+
+    """
+    __slots__ = ('node', 'parent', 'row', 'count', 'children', 'values')
+
+    def __init__(self, node, parent, row):
+        self.node = node
+        self.parent = parent
+        self.row = row
+        self.count = None
+        self.children = None
+        self.values = None
+
+
+class QTreeProviderModel(QAbstractItemModel):
+    """ A tree model which displays the data of a TreeProvider.
+
+    The internal pointer of an index is the record of the parent node,
+    so that indexes can be created without fetching the nodes from the
+    provider. The records of the children of a node are created by
+    blocks, the first time one of them is displayed, and the values of
+    a node are fetched when it is displayed.
+
+    """
+    def __init__(self, parent=None):
+        """ Initialize a QTreeProviderModel.
+
+        Parameters
+        ----------
+        parent : QObject, optional
+            The parent object of the model.
+
+        """
+        super(QTreeProviderModel, self).__init__(parent)
+        self._provider = None
+        self._columns = 0
+        self._root = TreeNode(None, None, 0)
+        self._records = {}
+
+    #--------------------------------------------------------------------------
+    # QAbstractItemModel API
+    #--------------------------------------------------------------------------
+    def index(self, row, column, parent=QModelIndex()):
+        """ Get the index of a child of a node.
+
+        """
+        # The views call this for every row of the expanded nodes, so
+        # the common cases are kept free of extra calls.
+        if parent.isValid():
+            if parent.column() > 0:
+                return QModelIndex()
+            record = self._recordAt(parent)
+        else:
+            record = self._root
+        count = record.count
+        if count is None:
+            count = self._childCount(record)
+        if 0 <= row < count and 0 <= column < self._columns:
+            return self.createIndex(row, column, record)
+        return QModelIndex()
+
+    def parent(self, index=None):
+        """ Get the index of the parent of a node.
+
+        """
+        # The QObject.parent overload is called without argument.
+        if index is None:
+            return super(QTreeProviderModel, self).parent()
+        if not index.isValid():
+            return QModelIndex()
+        record = index.internalPointer()
+        if record is self._root:
+            return QModelIndex()
+        return self.createIndex(record.row, 0, record.parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        """ Get the number of children of a node.
+
+        """
+        if parent.column() > 0:
+            return 0
+        return self._childCount(self._recordAt(parent))
+
+    def columnCount(self, parent=QModelIndex()):
+        """ Get the number of columns of the tree.
+
+        """
+        return self._columns
+
+    def hasChildren(self, parent=QModelIndex()):
+        """ Get whether a node has children.
+
+        """
+        if parent.isValid():
+            if parent.column() > 0:
+                return False
+            record = self._recordAt(parent)
+        else:
+            record = self._root
+        count = record.count
+        if count is not None:
+            return count > 0
+        if self._provider is None:
+            return False
+        return self._provider.has_children(record.node)
+
+    def data(self, index, role=DISPLAY_ROLE):
+        """ Get the value of a node in a column for the display role.
+
+        """
+        if role != DISPLAY_ROLE:
+            return None
+        record = self._recordAt(index)
+        values = record.values
+        if values is None:
+            values = record.values = self._provider.fetch(record.node)
+        return display_value(values[index.column()])
+
+    def headerData(self, section, orientation, role=DISPLAY_ROLE):
+        """ Get the header of a column.
+
+        """
+        if (role != DISPLAY_ROLE or orientation != Qt.Horizontal or
+                self._provider is None):
+            return None
+        return self._provider.column_header(section)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def provider(self):
+        """ Get the provider of the data of the model.
+
+        """
+        return self._provider
+
+    def setProvider(self, provider):
+        """ Set the provider of the data of the model.
+
+        Parameters
+        ----------
+        provider : TreeProvider or None
+            The provider of the data of the tree.
+
+        """
+        old = self._provider
+        if old is not None:
+            old.unobserve('children_changed', self._onChildrenChanged)
+            old.unobserve('node_changed', self._onNodeChanged)
+            old.unobserve('reset', self._onReset)
+        self._provider = provider
+        if provider is not None:
+            provider.observe('children_changed', self._onChildrenChanged)
+            provider.observe('node_changed', self._onNodeChanged)
+            provider.observe('reset', self._onReset)
+        self._onReset(None)
+
+    def nodeAt(self, index):
+        """ Get the node displayed at an index.
+
+        Parameters
+        ----------
+        index : QModelIndex
+            An index of the model.
+
+        Returns
+        -------
+        result : object
+            The node displayed at the index, or None if the index is
+            invalid.
+
+        """
+        if not index.isValid():
+            return None
+        return self._child(index.internalPointer(), index.row()).node
+
+    def indexOf(self, node):
+        """ Get the index of a node whose parent has been expanded.
+
+        Parameters
+        ----------
+        node : object
+            A node of the tree.
+
+        Returns
+        -------
+        result : QModelIndex
+            The index of the node in the first column, which is invalid
+            if the node is not known to the model.
+
+        """
+        record = self._records.get(node)
+        if record is None:
+            return QModelIndex()
+        return self.createIndex(record.row, 0, record.parent)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _recordAt(self, index):
+        """ Get the record of the node displayed at an index.
+
+        """
+        if not index.isValid():
+            return self._root
+        parent = index.internalPointer()
+        row = index.row()
+        children = parent.children
+        if children is not None:
+            child = children[row]
+            if child is not None:
+                return child
+        return self._child(parent, row)
+
+    def _childCount(self, record):
+        """ Get the number of children of a node record.
+
+        """
+        count = record.count
+        if count is None:
+            if self._provider is None:
+                return 0
+            count = record.count = self._provider.child_count(record.node)
+        return count
+
+    def _child(self, record, row):
+        """ Get the record of a child of a node record.
+
+        The children are fetched from the provider by blocks.
+
+        """
+        children = record.children
+        if children is None:
+            children = record.children = [None] * record.count
+        child = children[row]
+        if child is None:
+            start = row - row % CHILD_BLOCK
+            stop = min(start + CHILD_BLOCK, record.count)
+            nodes = self._provider.children(record.node, start, stop)
+            records = self._records
+            for offset, node in enumerate(nodes):
+                child = TreeNode(node, record, start + offset)
+                children[start + offset] = records[node] = child
+            child = children[row]
+        return child
+
+    def _forget(self, record):
+        """ Forget the records of the descendants of a node record.
+
+        """
+        children = record.children
+        if children is None:
+            return
+        records = self._records
+        for child in children:
+            if child is not None:
+                records.pop(child.node, None)
+                self._forget(child)
+
+    def _onChildrenChanged(self, change):
+        """ Handle the change of the children of a node.
+
+        """
+        node = change['value']
+        if node is None:
+            record = self._root
+            parent = QModelIndex()
+        else:
+            record = self._records.get(node)
+            if record is None:
+                return
+            parent = self.createIndex(record.row, 0, record.parent)
+        old = record.count
+        if old is None:
+            # The children were never counted, only the expansion
+            # indicator of the node needs to be refreshed.
+            if node is not None:
+                self.dataChanged.emit(parent, parent)
+            return
+        if old > 0:
+            self.beginRemoveRows(parent, 0, old - 1)
+            self._forget(record)
+            record.children = None
+            record.count = 0
+            self.endRemoveRows()
+        count = self._provider.child_count(node)
+        if count > 0:
+            self.beginInsertRows(parent, 0, count - 1)
+            record.children = None
+            record.count = count
+            self.endInsertRows()
+        elif node is not None:
+            self.dataChanged.emit(parent, parent)
+
+    def _onNodeChanged(self, change):
+        """ Handle the change of the values of a node.
+
+        """
+        record = self._records.get(change['value'])
+        if record is None:
+            return
+        record.values = None
+        last = max(self._columns - 1, 0)
+        self.dataChanged.emit(
+            self.createIndex(record.row, 0, record.parent),
+            self.createIndex(record.row, last, record.parent)
+        )
+
+    def _onReset(self, change):
+        """ Handle the change of the whole tree.
+
+        """
+        self.beginResetModel()
+        self._root = TreeNode(None, None, 0)
+        self._records = {}
+        provider = self._provider
+        self._columns = 0 if provider is None else provider.column_count()
+        self.endResetModel()
@@ -0,0 +1,151 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from collections import OrderedDict, namedtuple
+
+
+#: A namedtuple of the statistics of a resource cache.
+CacheStats = namedtuple(
+    'CacheStats', 'hits misses evictions count nbytes max_bytes'
+)
+
+
+class ResourceCache(object):
+    """ A size bounded LRU cache of toolkit resources.
+
+    The resources are keyed by their content, so that equal resources
+    share the same toolkit object. Each resource is added with its size
+    in bytes and the least recently used resources are evicted when the
+    total size exceeds the maximum size of the cache.
+
+    """
+    def __init__(self, max_bytes):
+        """ Initialize a ResourceCache.
+
+        Parameters
+        ----------
+        max_bytes : int
+            The maximum total size of the cached resources, in bytes.
+
+        """
+        self._entries = OrderedDict()
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key):
+        """ Get the resource cached for a key.
+
+        Parameters
+        ----------
+        key : hashable
+            The content key of the resource.
+
+        Returns
+        -------
+        result : object or None
+            The cached resource, or None if the key is not cached.
+
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def add(self, key, resource, nbytes):
+        """ Add a resource to the cache.
+
+        A resource larger than the maximum size of the cache is not
+        cached.
+
+        Parameters
+        ----------
+        key : hashable
+            The content key of the resource.
+
+        resource : object
+            The toolkit resource to cache.
+
+        nbytes : int
+            The approximate size of the resource, in bytes.
+
+        """
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._nbytes -= old[1]
+        if nbytes > self._max_bytes:
+            return
+        self._entries[key] = (resource, nbytes)
+        self._nbytes += nbytes
+        self._evict(self._max_bytes)
+
+    def clear(self):
+        """ Remove all the resources from the cache.
+
+        The statistics of the cache are reset.
+
+        """
+        self._entries.clear()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def max_bytes(self):
+        """ Get the maximum total size of the cached resources.
+
+        """
+        return self._max_bytes
+
+    def set_max_bytes(self, max_bytes):
+        """ Set the maximum total size of the cached resources.
+
+        The least recently used resources are evicted if the cache is
+        larger than the new maximum size.
+
+        Parameters
+        ----------
+        max_bytes : int
+            The maximum total size of the cached resources, in bytes.
+
+        """
+        self._max_bytes = max_bytes
+        self._evict(max_bytes)
+
+    def stats(self):
+        """ Get the statistics of the cache.
+
+        Returns
+        -------
+        result : CacheStats
+            The number of hits, misses and evictions since the cache
+            was created or cleared, along with the number of cached
+            resources, their total size and the maximum size.
+
+        """
+        return CacheStats(
+            self._hits, self._misses, self._evictions, len(self._entries),
+            self._nbytes, self._max_bytes
+        )
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _evict(self, max_bytes):
+        """ Evict the least recently used resources down to a size.
+
+        """
+        entries = self._entries
+        while self._nbytes > max_bytes and entries:
+            _, (_, nbytes) = entries.popitem(last=False)
+            self._nbytes -= nbytes
+            self._evictions += 1
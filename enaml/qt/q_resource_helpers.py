@@ -10,6 +10,25 @@ from enaml.fontext import FontStyle, FontCaps, FontStretch
 from .QtCore import Qt, QSize
 from .QtGui import QColor, QFont, QImage, QIcon, QPixmap
 
+from .q_background_decoder import BackgroundDecoder
+from .q_resource_cache import ResourceCache
+
+
+#: The cache of the toolkit resources, shared by the equal Enaml images,
+#: icons, colors and fonts. Its statistics can be read with 'stats()'
+#: and its size bounded with 'set_max_bytes()'.
+RESOURCE_CACHE = ResourceCache(32 * 1024 * 1024)
+
+
+#: The decoder of the images which are decoded on worker threads.
+IMAGE_DECODER = BackgroundDecoder()
+
+
+#: The approximate size in bytes of a QColor and of a QFont, for the
+#: accounting of the resource cache.
+QCOLOR_NBYTES = 16
+QFONT_NBYTES = 128
+
 FONT_STYLES = {
     FontStyle.Normal: QFont.StyleNormal,
     FontStyle.Italic: QFont.StyleItalic,
@@ -51,6 +70,16 @@ TRANSFORM_MODE = {
 }
 
 
+#: The QImage format and the number of bytes per pixel of the raw image
+#: formats. Grayscale16 images are supported starting with Qt 5.13.
+RAW_FORMATS = {
+    'argb32': (QImage.Format_ARGB32, 4),
+    'rgb888': (QImage.Format_RGB888, 3),
+    'grayscale8': (QImage.Format_Grayscale8, 1),
+    'grayscale16': (getattr(QImage, 'Format_Grayscale16', None), 2),
+}
+
+
 ICON_MODE = {
     'normal': QIcon.Normal,
     'disabled': QIcon.Disabled,
@@ -65,6 +94,55 @@ ICON_STATE = {
 }
 
 
+def QImage_from_buffer(data, format, size):
+    """ Create a QImage over the buffer of a raw image.
+
+    The pixels are not copied: the QImage uses the buffer in place and
+    keeps a reference to it. A buffer which is not contiguous is copied,
+    in which case the QImage does not reflect later writes to it.
+
+    Parameters
+    ----------
+    data : bytes or memoryview
+        The buffer holding the pixels of the image.
+
+    format : str
+        The raw format of the image.
+
+    size : Size
+        The (width, height) size of the image.
+
+    Returns
+    -------
+    result : QImage
+        The QImage instance for the given buffer.
+
+    """
+    qformat, depth = RAW_FORMATS[format]
+    if qformat is None:
+        msg = "the '%s' image format is not supported by this version of Qt"
+        raise ValueError(msg % format)
+    w, h = size
+    view = memoryview(data)
+    in_place = view.c_contiguous
+    if not in_place:
+        # Qt requires a single block of memory.
+        view = memoryview(view.tobytes())
+    if view.ndim > 1:
+        stride = view.strides[0]
+    else:
+        stride = w * depth
+    if stride < w * depth or view.nbytes < stride * h:
+        msg = "the buffer is too small for a %dx%d '%s' image"
+        raise ValueError(msg % (w, h, format))
+    qimage = QImage(view, w, h, stride, qformat)
+    # The QImage does not own the memory, which must be kept alive. The
+    # buffer is only exposed when it is shared with the data.
+    qimage._enaml_data = view
+    qimage._enaml_buffer = view if in_place else None
+    return qimage
+
+
 def QImage_from_Image(image):
     """ Convert an Enaml Image into a QImage.
 
@@ -80,9 +158,8 @@ def QImage_from_Image(image):
 
     """
     format = image.format
-    if format == 'argb32':
-        w, h = image.raw_size
-        qimage = QImage(image.data, w, h, QImage.Format_ARGB32)
+    if format in RAW_FORMATS:
+        qimage = QImage_from_buffer(image.data, format, image.raw_size)
     else:
         if format == 'auto':
             format = ''
@@ -96,9 +173,42 @@ def QImage_from_Image(image):
     return qimage
 
 
+def image_cache_key(image):
+    """ Get the key of an Enaml Image in the resource cache.
+
+    Parameters
+    ----------
+    image : Image
+        The Enaml Image object.
+
+    Returns
+    -------
+    result : tuple or None
+        The content key of the image, or None if the image is a view
+        over a buffer which may be modified in place.
+
+    """
+    data = image.data
+    if isinstance(data, memoryview):
+        return None
+    return ('image', image.format, tuple(image.raw_size), tuple(image.size),
+            image.aspect_ratio_mode, image.transform_mode, data)
+
+
+def qimage_nbytes(qimage):
+    """ Get the size of the pixels of a QImage in bytes.
+
+    """
+    return qimage.bytesPerLine() * qimage.height()
+
+
 def get_cached_qimage(image):
     """ Get the cached QImage for the Enaml Image.
 
+    The QImage is shared by the equal images through the resource
+    cache. The QImage of an image whose data is a buffer is instead
+    stored on the image.
+
     Parameters
     ----------
     image : Image
@@ -112,11 +222,132 @@ def get_cached_qimage(image):
 
     """
     qimage = image._tkdata
-    if not isinstance(qimage, QImage):
+    key = image_cache_key(image)
+    if isinstance(qimage, QImage):
+        if key is not None:
+            # The image decoded on a worker thread for a request is
+            # handed over once, after which the cache owns it.
+            image._tkdata = None
+        return qimage
+    if key is None:
         qimage = image._tkdata = QImage_from_Image(image)
+        return qimage
+    qimage = RESOURCE_CACHE.get(key)
+    if qimage is None:
+        # Wait for the image if it is being decoded on a worker thread.
+        future = IMAGE_DECODER.pending(key)
+        if future is not None:
+            qimage = future.result()
+        else:
+            qimage = QImage_from_Image(image)
+        RESOURCE_CACHE.add(key, qimage, qimage_nbytes(qimage))
     return qimage
 
 
+def decode_qimage_async(image, pin=False):
+    """ Start decoding an Enaml Image on a worker thread.
+
+    The decoded image is added to the resource cache on the main thread.
+
+    Parameters
+    ----------
+    image : Image
+        The Enaml Image object.
+
+    pin : bool, optional
+        Whether to also store the decoded image on the Enaml image until
+        it is retrieved with 'get_cached_qimage', so that it is not
+        decoded again if it does not fit in, or was evicted from, the
+        resource cache in the meantime. The default is False.
+
+    Returns
+    -------
+    result : tuple or None
+        The content key of the image if it is being decoded, or None if
+        the image is already available or is a view over a buffer.
+
+    """
+    if isinstance(image._tkdata, QImage):
+        return None
+    key = image_cache_key(image)
+    if key is None:
+        return None
+    if IMAGE_DECODER.pending(key) is None:
+        if RESOURCE_CACHE.get(key) is not None:
+            return None
+
+        def add(future):
+            if future.exception() is None:
+                qimage = future.result()
+                RESOURCE_CACHE.add(key, qimage, qimage_nbytes(qimage))
+
+        IMAGE_DECODER.submit(key, QImage_from_Image, image)
+        IMAGE_DECODER.notify(key, add)
+    if pin:
+        def hand_over(future):
+            if (future.exception() is None and
+                    not isinstance(image._tkdata, QImage)):
+                image._tkdata = future.result()
+
+        IMAGE_DECODER.notify(key, hand_over)
+    return key
+
+
+def request_qimage(image, callback):
+    """ Get the QImage for an Enaml Image without waiting for it.
+
+    If the image is decoded asynchronously and is not available yet, it
+    is decoded on a worker thread. The callback is then invoked without
+    arguments on the main thread once the image is decoded and should
+    retrieve it with 'get_cached_qimage'.
+
+    Parameters
+    ----------
+    image : Image
+        The Enaml Image object.
+
+    callback : callable
+        The callable to invoke once the image is decoded.
+
+    Returns
+    -------
+    result : QImage or None
+        The QImage for the image, or None if it is being decoded.
+
+    """
+    if image.decode_async:
+        key = decode_qimage_async(image, pin=True)
+        if key is not None:
+            IMAGE_DECODER.notify(key, lambda future: callback())
+            return None
+    return get_cached_qimage(image)
+
+
+def warm_up_images(images, callback=None):
+    """ Decode a batch of Enaml Images on worker threads.
+
+    The decoded images are added to the resource cache, from which they
+    are retrieved when the images are first used.
+
+    Parameters
+    ----------
+    images : iterable
+        The Enaml Image objects to decode.
+
+    callback : callable, optional
+        A callable invoked without arguments on the main thread once all
+        the images are decoded.
+
+    """
+    keys = set()
+    for image in images:
+        key = decode_qimage_async(image)
+        if key is not None:
+            keys.add(key)
+    if callback is not None:
+        IMAGE_DECODER.notify_all(keys, callback)
+
+
 def QIcon_from_Icon(icon):
     """ Convert the given Enaml Icon into a QIcon.
 
@@ -144,9 +375,31 @@ def QIcon_from_Icon(icon):
     return qicon
 
 
+def qicon_nbytes(qicon, keys):
+    """ Estimate the size of the pixmaps of a QIcon in bytes.
+
+    Parameters
+    ----------
+    qicon : QIcon
+        The QIcon of interest.
+
+    keys : list
+        The (mode, state, image key) tuples of the images of the icon.
+
+    """
+    nbytes = 0
+    for mode, state in set(key[:2] for key in keys):
+        sizes = qicon.availableSizes(ICON_MODE[mode], ICON_STATE[state])
+        nbytes += sum(4 * size.width() * size.height() for size in sizes)
+    return nbytes
+
+
 def get_cached_qicon(icon):
     """ Get the cached QIcon for the Enaml Icon.
 
+    The QIcon is shared by the equal icons through the resource cache,
+    unless one of their images is a buffer.
+
     Parameters
     ----------
     icon : Icon
@@ -160,11 +413,62 @@ def get_cached_qicon(icon):
 
     """
     qicon = icon._tkdata
-    if not isinstance(qicon, QIcon):
-        qicon = icon._tkdata = QIcon_from_Icon(icon)
+    if isinstance(qicon, QIcon):
+        return qicon
+    keys = []
+    for icon_image in icon.images:
+        image = icon_image.image
+        if image:
+            keys.append((icon_image.mode, icon_image.state,
+                         image_cache_key(image)))
+    if any(key[2] is None for key in keys):
+        qicon = QIcon_from_Icon(icon)
+    else:
+        key = ('icon', tuple(keys))
+        qicon = RESOURCE_CACHE.get(key)
+        if qicon is None:
+            qicon = QIcon_from_Icon(icon)
+            RESOURCE_CACHE.add(key, qicon, qicon_nbytes(qicon, keys))
+    icon._tkdata = qicon
     return qicon
 
 
+def request_qicon(icon, callback):
+    """ Get the QIcon for an Enaml Icon without waiting for its images.
+
+    The images of the icon which are decoded asynchronously and are not
+    available yet are decoded on worker threads. The callback is then
+    invoked without arguments on the main thread once they are all
+    decoded and should retrieve the icon with 'get_cached_qicon'.
+
+    Parameters
+    ----------
+    icon : Icon
+        The Enaml Icon object.
+
+    callback : callable
+        The callable to invoke once the images of the icon are decoded.
+
+    Returns
+    -------
+    result : QIcon or None
+        The QIcon for the icon, or None if its images are being decoded.
+
+    """
+    if not isinstance(icon._tkdata, QIcon):
+        keys = set()
+        for icon_image in icon.images:
+            image = icon_image.image
+            if image and image.decode_async:
+                key = decode_qimage_async(image, pin=True)
+                if key is not None:
+                    keys.add(key)
+        if keys:
+            IMAGE_DECODER.notify_all(keys, callback)
+            return None
+    return get_cached_qicon(icon)
+
+
 def QColor_from_Color(color):
     """ Convert the given Enaml Color into a QColor.
 
@@ -199,7 +503,12 @@ def get_cached_qcolor(color):
     """
     qcolor = color._tkdata
     if not isinstance(qcolor, QColor):
-        qcolor = color._tkdata = QColor_from_Color(color)
+        key = ('color', color.argb)
+        qcolor = RESOURCE_CACHE.get(key)
+        if qcolor is None:
+            qcolor = QColor_from_Color(color)
+            RESOURCE_CACHE.add(key, qcolor, QCOLOR_NBYTES)
+        color._tkdata = qcolor
     return qcolor
 
 
@@ -241,5 +550,11 @@ def get_cached_qfont(font):
     """
     qfont = font._tkdata
     if not isinstance(qfont, QFont):
-        qfont = font._tkdata = QFont_from_Font(font)
+        key = ('font', font.family, font.pointsize, font.weight, font.style,
+               font.caps, font.stretch)
+        qfont = RESOURCE_CACHE.get(key)
+        if qfont is None:
+            qfont = QFont_from_Font(font)
+            RESOURCE_CACHE.add(key, qfont, QFONT_NBYTES)
+        font._tkdata = qfont
     return qfont
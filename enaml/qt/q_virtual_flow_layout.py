@@ -0,0 +1,491 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+from .QtCore import QSize, QRect, Signal
+from .QtWidgets import QLayout, QWidgetItem
+
+from .q_flow_layout import QFlowLayout, _LayoutOptions, _LinePacking
+
+
+class QVirtualFlowLayout(QLayout):
+    """ A flow layout which lays out items from their declared sizes.
+
+    The layout manages a number of virtual items, each having a fixed
+    size. The items are packed into lines in the same way as for the
+    QFlowLayout, with no stretch and a leading alignment of the items
+    within their line. Only a subset of the items is associated with a
+    widget at any time, which allows the layout to handle a very large
+    number of items. The layout options have the same meaning as those
+    of the QFlowLayout.
+
+    """
+    #: A signal emitted after the geometry of the layout has been set.
+    geometryChanged = Signal()
+
+    def __init__(self):
+        """ Initialize a QVirtualFlowLayout.
+
+        """
+        super(QVirtualFlowLayout, self).__init__()
+        self._options = _LayoutOptions()
+        self._widths = array('l')
+        self._heights = array('l')
+        self._max_size = QSize(0, 0)
+        self._packings = {}
+        self._packing = None
+        self._offsets = None
+        self._ends = None
+        self._cached_w = -1
+        self._cached_hfw = -1
+        self._cached_wfh = -1
+        self._rect = QRect()
+        self._slots = []
+        self._indices = {}
+        self._placed = {}
+
+    #--------------------------------------------------------------------------
+    # Layout Options
+    #--------------------------------------------------------------------------
+    def direction(self):
+        """ Get the direction of the flow layout.
+
+        """
+        return self._options.direction
+
+    def setDirection(self, direction):
+        """ Set the direction of the flow layout.
+
+        """
+        self._options.direction = direction
+        self._invalidatePacking()
+
+    def alignment(self):
+        """ Get the alignment for the lines in the layout.
+
+        """
+        return self._options.alignment
+
+    def setAlignment(self, alignment):
+        """ Set the alignment for the lines in the layout.
+
+        """
+        self._options.alignment = alignment
+        self._placed.clear()
+        self.invalidate()
+
+    def horizontalSpacing(self):
+        """ Get the horizontal spacing for the layout.
+
+        """
+        return self._options.h_spacing
+
+    def setHorizontalSpacing(self, spacing):
+        """ Set the horizontal spacing for the layout.
+
+        """
+        self._options.h_spacing = spacing
+        self._invalidatePacking()
+
+    def verticalSpacing(self):
+        """ Get the vertical spacing for the layout.
+
+        """
+        return self._options.v_spacing
+
+    def setVerticalSpacing(self, spacing):
+        """ Set the vertical spacing for the layout.
+
+        """
+        self._options.v_spacing = spacing
+        self._invalidatePacking()
+
+    #--------------------------------------------------------------------------
+    # Virtual Items
+    #--------------------------------------------------------------------------
+    def itemCount(self):
+        """ Get the number of virtual items in the layout.
+
+        """
+        return len(self._widths)
+
+    def setItemSizes(self, sizes):
+        """ Set the sizes of the virtual items of the layout.
+
+        Parameters
+        ----------
+        sizes : iterable
+            An iterable of (width, height) tuples, one for each virtual
+            item of the layout.
+
+        """
+        widths = self._widths = array('l')
+        heights = self._heights = array('l')
+        for width, height in sizes:
+            widths.append(width)
+            heights.append(height)
+        self._max_size = QSize(max(widths, default=0),
+                               max(heights, default=0))
+        self._invalidatePacking()
+
+    def itemRect(self, index):
+        """ Get the rectangle of a virtual item.
+
+        The layout must have been given a geometry.
+
+        Parameters
+        ----------
+        index : int
+            The index of the virtual item.
+
+        Returns
+        -------
+        result : QRect
+            The rectangle of the item, in the coordinates of the parent
+            widget of the layout.
+
+        """
+        packing = self._getPacking()
+        line = bisect_right(packing.starts, index) - 1
+        start = packing.starts[line]
+        end = packing.lineEnd(line)
+        opts = self._options
+        horizontal = self._isHorizontal()
+        if horizontal:
+            flow_sizes = self._widths
+            space = opts.h_spacing
+            reverse = opts.direction == QFlowLayout.RightToLeft
+        else:
+            flow_sizes = self._heights
+            space = opts.v_spacing
+            reverse = opts.direction == QFlowLayout.BottomToTop
+
+        # Align the line within the extra space, as done by QFlowLayout
+        # for items without stretch.
+        delta = packing.extent - packing.flow_hint[line]
+        pos = 0
+        if delta > 0:
+            align = opts.alignment
+            if align == QFlowLayout.AlignLeading:
+                if reverse:
+                    pos += delta
+            elif align == QFlowLayout.AlignTrailing:
+                if not reverse:
+                    pos += delta
+            elif align == QFlowLayout.AlignCenter:
+                pos += delta / 2
+            else:
+                d = delta / (end - start + 1)
+                space += d
+                pos += d
+        if reverse:
+            before = range(index + 1, end)
+        else:
+            before = range(start, index)
+        for i in before:
+            pos += flow_sizes[i] + space
+        pos = int(round(pos))
+
+        rect = self._rect
+        ortho = self._offsets[line]
+        width = self._widths[index]
+        height = self._heights[index]
+        if horizontal:
+            return QRect(rect.x() + pos, rect.y() + ortho, width, height)
+        return QRect(rect.x() + ortho, rect.y() + pos, width, height)
+
+    def itemRange(self, rect):
+        """ Get the range of the virtual items intersecting a rect.
+
+        Parameters
+        ----------
+        rect : QRect
+            The rectangle of interest, in the coordinates of the parent
+            widget of the layout.
+
+        Returns
+        -------
+        result : tuple
+            A 2-tuple of the index of the first item and the index
+            following the last item of the lines intersecting the
+            rectangle.
+
+        """
+        if not self._rect.isValid():
+            return (0, 0)
+        packing = self._getPacking()
+        if packing.count == 0:
+            return (0, 0)
+        if self._isHorizontal():
+            low = rect.top() - self._rect.y()
+            high = rect.bottom() - self._rect.y()
+        else:
+            low = rect.left() - self._rect.x()
+            high = rect.right() - self._rect.x()
+        ends = self._ends
+        offsets = self._offsets
+        first = bisect_right(ends, low)
+        last = bisect_left(offsets, high + 1)
+        if first >= last:
+            return (0, 0)
+        return (packing.starts[first], packing.lineEnd(last - 1))
+
+    def setItemWidgets(self, widgets):
+        """ Set the widgets associated with the virtual items.
+
+        The widgets are positioned at the rectangle of their item and
+        shown. The widgets which were previously managed and are not
+        given are hidden.
+
+        Parameters
+        ----------
+        widgets : dict
+            A dict mapping the index of a virtual item to the widget to
+            associate with the item.
+
+        """
+        indices = self._indices
+        current = dict((item.widget(), item) for item in self._slots)
+        slots = []
+        for index, widget in widgets.items():
+            item = current.pop(widget, None)
+            if item is None:
+                self.addChildWidget(widget)
+                item = QWidgetItem(widget)
+            indices[item] = index
+            slots.append(item)
+        for item in current.values():
+            item.widget().hide()
+            slots.append(item)
+            indices[item] = -1
+            self._placed.pop(item, None)
+        self._slots = slots
+        self._placeWidgets()
+
+    #--------------------------------------------------------------------------
+    # QLayout API
+    #--------------------------------------------------------------------------
+    def addItem(self, item):
+        """ A required virtual method implementation.
+
+        This method should not be used. The method `setItemWidgets`
+        should be used instead.
+
+        """
+        msg = 'Use `setItemWidgets` instead.'
+        raise NotImplementedError(msg)
+
+    def count(self):
+        """ A virtual method implementation which returns the number of
+        widget items in the layout.
+
+        """
+        return len(self._slots)
+
+    def itemAt(self, idx):
+        """ A virtual method implementation which returns the widget item
+        for the given index or None if one does not exist.
+
+        """
+        slots = self._slots
+        if idx < len(slots):
+            return slots[idx]
+
+    def takeAt(self, idx):
+        """ A virtual method implementation which removes the widget item
+        at the given index.
+
+        """
+        slots = self._slots
+        if idx < len(slots):
+            item = slots.pop(idx)
+            self._indices.pop(item, None)
+            self._placed.pop(item, None)
+            # See the comment in QFlowLayout.takeAt for why None is
+            # always returned.
+
+    def hasHeightForWidth(self):
+        """ Whether the height of the layout depends on its width.
+
+        """
+        return self._isHorizontal()
+
+    def heightForWidth(self, width):
+        """ Get the height of the layout for the given width.
+
+        """
+        if self._cached_w != width:
+            left, top, right, bottom = self.getContentsMargins()
+            packing = self._pack(width - (left + right))
+            self._cached_hfw = self._orthoExtent(packing) + top + bottom
+            self._cached_w = width
+        return self._cached_hfw
+
+    def sizeHint(self):
+        """ A virtual method implementation which returns the size hint
+        for the layout.
+
+        """
+        return self._marginSize(self._max_size)
+
+    def minimumSize(self):
+        """ A reimplemented method which returns the minimum size of the
+        layout.
+
+        """
+        size = self._marginSize(self._max_size)
+        # See the comment in QFlowLayout.minimumSize.
+        if not self._isHorizontal() and size.width() < self._cached_wfh:
+            size.setWidth(self._cached_wfh)
+        return size
+
+    def setGeometry(self, rect):
+        """ Set the geometry of the layout and place the widgets.
+
+        """
+        super(QVirtualFlowLayout, self).setGeometry(rect)
+        rect = self.contentsRect()
+        if rect != self._rect:
+            self._rect = rect
+            self._placed.clear()
+        self._placeWidgets()
+        self.geometryChanged.emit()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _isHorizontal(self):
+        """ Get whether the flow direction is horizontal.
+
+        """
+        d = self._options.direction
+        return d == QFlowLayout.LeftToRight or d == QFlowLayout.RightToLeft
+
+    def _marginSize(self, size):
+        """ Add the contents margins of the layout to a size.
+
+        """
+        left, top, right, bottom = self.getContentsMargins()
+        return QSize(size.width() + left + right, size.height() + top + bottom)
+
+    def _invalidatePacking(self):
+        """ Discard the packing of the items and invalidate the layout.
+
+        """
+        self._packings.clear()
+        self._placed.clear()
+        self._packing = None
+        self._offsets = None
+        self._ends = None
+        self._cached_w = -1
+        self._cached_hfw = -1
+        self.invalidate()
+
+    def _getPacking(self):
+        """ Get the packing of the items for the current geometry.
+
+        """
+        rect = self._rect
+        if self._isHorizontal():
+            extent = rect.width()
+        else:
+            extent = rect.height()
+        packing = self._packing
+        if packing is None or packing.extent != extent:
+            packing = self._packing = self._pack(extent)
+            space = self._orthoSpacing()
+            ends = array('l', accumulate(
+                extent + space for extent in packing.ortho_hint
+            ))
+            self._offsets = array('l', (end - extent - space for end, extent
+                                        in zip(ends, packing.ortho_hint)))
+            self._ends = array('l', (end - space for end in ends))
+            if not self._isHorizontal():
+                self._cached_wfh = self._orthoExtent(packing) + rect.x()
+        return packing
+
+    def _orthoSpacing(self):
+        """ Get the spacing between the lines of the layout.
+
+        """
+        if self._isHorizontal():
+            return self._options.v_spacing
+        return self._options.h_spacing
+
+    def _orthoExtent(self, packing):
+        """ Get the extent of the lines of a packing.
+
+        """
+        space = self._orthoSpacing()
+        return sum(packing.ortho_hint) + space * (len(packing.starts) - 1)
+
+    def _pack(self, extent):
+        """ Pack the items into lines for the given flow extent.
+
+        """
+        packings = self._packings
+        packing = packings.pop(extent, None)
+        if packing is not None:
+            packings[extent] = packing
+            return packing
+        if self._isHorizontal():
+            flow, ortho = self._widths, self._heights
+            space = self._options.h_spacing
+        else:
+            flow, ortho = self._heights, self._widths
+            space = self._options.v_spacing
+        packing = _LinePacking(extent)
+        count = len(flow)
+        index = 0
+        while index < count:
+            start = index
+            line_flow = flow[index]
+            line_ortho = ortho[index]
+            index += 1
+            while index < count:
+                hint = line_flow + space + flow[index]
+                if hint > extent:
+                    break
+                line_flow = hint
+                line_ortho = max(line_ortho, ortho[index])
+                index += 1
+            packing.starts.append(start)
+            packing.flow_min.append(line_flow)
+            packing.flow_hint.append(line_flow)
+            packing.flow_stretch.append(0)
+            packing.ortho_min.append(line_ortho)
+            packing.ortho_hint.append(line_ortho)
+            packing.ortho_stretch.append(0)
+        packing.count = count
+        packings[extent] = packing
+        while len(packings) > QFlowLayout.MaxPackings:
+            del packings[next(iter(packings))]
+        return packing
+
+    def _placeWidgets(self):
+        """ Place the widgets at the rectangles of their items.
+
+        Only the widgets which have not been placed at the rectangle of
+        their current item are updated.
+
+        """
+        if not self._rect.isValid():
+            return
+        count = len(self._widths)
+        indices = self._indices
+        placed = self._placed
+        for item in self._slots:
+            index = indices.get(item, -1)
+            if 0 <= index < count and placed.get(item) != index:
+                widget = item.widget()
+                widget.setGeometry(self.itemRect(index))
+                if widget.isHidden():
+                    widget.show()
+                placed[item] = index
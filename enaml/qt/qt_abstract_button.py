@@ -14,7 +14,7 @@ from .QtCore import QSize
 from .QtGui import QIcon
 from .QtWidgets import QAbstractButton
 
-from .q_resource_helpers import get_cached_qicon
+from .q_resource_helpers import get_cached_qicon, request_qicon
 from .qt_control import QtControl
 
 
@@ -82,6 +82,15 @@ class QtAbstractButton(QtControl, ProxyAbstractButton):
             self.declaration.checked = checked
             self.declaration.clicked(checked)
 
+    def on_icon_decoded(self, icon):
+        """ Handle the decoding of the images of an icon.
+
+        """
+        d = self.declaration
+        if self.widget is not None and d is not None and d.icon is icon:
+            with self.geometry_guard():
+                self.widget.setIcon(get_cached_qicon(icon))
+
     def on_toggled(self, checked):
         """ The signal handler for the 'toggled' signal.
 
@@ -103,10 +112,14 @@ class QtAbstractButton(QtControl, ProxyAbstractButton):
     def set_icon(self, icon):
         """ Set the icon on the widget.
 
+        An icon whose images are decoded asynchronously is replaced by
+        an empty icon until they are decoded.
+
         """
+        qicon = None
         if icon:
-            qicon = get_cached_qicon(icon)
-        else:
+            qicon = request_qicon(icon, lambda: self.on_icon_decoded(icon))
+        if qicon is None:
             qicon = QIcon()
         with self.geometry_guard():
             self.widget.setIcon(qicon)
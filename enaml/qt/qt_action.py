@@ -12,7 +12,7 @@ from enaml.widgets.action import ProxyAction
 from .QtGui import QIcon, QKeySequence
 from .QtWidgets import QAction
 
-from .q_resource_helpers import get_cached_qicon
+from .q_resource_helpers import get_cached_qicon, request_qicon
 from .qt_toolkit_object import QtToolkitObject
 
 
@@ -78,6 +78,14 @@ class QtAction(QtToolkitObject, ProxyAction):
             self.declaration.checked = checked
             self.declaration.triggered(checked)
 
+    def on_icon_decoded(self, icon):
+        """ Handle the decoding of the images of an icon.
+
+        """
+        d = self.declaration
+        if self.widget is not None and d is not None and d.icon is icon:
+            self.widget.setIcon(get_cached_qicon(icon))
+
     def on_toggled(self, checked):
         """ The signal handler for the 'toggled' signal.
 
@@ -115,10 +123,14 @@ class QtAction(QtToolkitObject, ProxyAction):
     def set_icon(self, icon):
         """ Set the icon for the action.
 
+        An icon whose images are decoded asynchronously is replaced by
+        an empty icon until they are decoded.
+
         """
+        qicon = None
         if icon:
-            qicon = get_cached_qicon(icon)
-        else:
+            qicon = request_qicon(icon, lambda: self.on_icon_decoded(icon))
+        if qicon is None:
             qicon = QIcon()
         self.widget.setIcon(qicon)
 
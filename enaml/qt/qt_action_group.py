@@ -151,6 +151,19 @@ class QtActionGroup(QtToolkitObject, ProxyActionGroup):
                 before = self.find_next_action(child)
                 parent.widget.insertAction(before, child.widget)
 
+    def child_moved(self, child):
+        """ Handle the child moved event for a QtActionGroup.
+
+        This handler will also move the widget in the parent widget.
+
+        """
+        super(QtActionGroup, self).child_moved(child)
+        if isinstance(child, QtAction):
+            parent = self.parent()
+            if parent is not None:
+                before = self.find_next_action(child)
+                parent.widget.insertAction(before, child.widget)
+
     def child_removed(self, child):
         """ Handle the child removed event for a QtActionGroup.
 
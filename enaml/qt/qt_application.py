@@ -13,6 +13,7 @@ from .QtCore import QThread
 from .QtWidgets import QApplication
 
 from .q_deferred_caller import deferredCall, timedCall
+from .q_resource_helpers import warm_up_images
 from .qt_factories import QT_FACTORIES
 from .qt_mime_data import QtMimeData
 
@@ -123,3 +124,20 @@ class QtApplication(Application):
 
         """
         return QtMimeData()
+
+    def warm_up_images(self, images, callback=None):
+        """ Decode a batch of images in the background.
+
+        The decoded QImages are added to the resource cache.
+
+        Parameters
+        ----------
+        images : iterable
+            The Image objects to decode.
+
+        callback : callable, optional
+            A callable invoked without arguments on the main gui thread
+            once all the images are decoded.
+
+        """
+        warm_up_images(images, callback)
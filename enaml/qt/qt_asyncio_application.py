@@ -0,0 +1,181 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import asyncio
+from inspect import isawaitable
+
+from atom.api import Typed
+
+from .q_asyncio_event_loop import QAsyncioEventLoop
+from .qt_application import QtApplication
+
+
+class QtAsyncioApplication(QtApplication):
+    """ A Qt application whose event loop is driven by asyncio.
+
+    The application installs a QAsyncioEventLoop as the current asyncio
+    event loop. Deferred and timed calls are dispatched by this loop, so
+    coroutines and futures can be used directly from Enaml handlers.
+    Callbacks passed to `deferred_call`, `timed_call` and `schedule`
+    may return an awaitable, in which case it is run as an asyncio task.
+
+    """
+    #: The asyncio event loop integrated with the Qt event loop.
+    loop = Typed(QAsyncioEventLoop)
+
+    def __init__(self, appname=None):
+        """ Initialize a QtAsyncioApplication.
+
+        Parameters
+        ----------
+        appname : str, optional
+            Explicit application name to use for setting the WM_CLASS attribute
+            on Linux.
+
+        """
+        super(QtAsyncioApplication, self).__init__(appname)
+        self.loop = QAsyncioEventLoop()
+        asyncio.set_event_loop(self.loop)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _invoke(self, callback, args, kwargs):
+        """ Invoke a callback and run the awaitable it may return.
+
+        """
+        result = callback(*args, **kwargs)
+        if isawaitable(result):
+            future = asyncio.ensure_future(result, loop=self.loop)
+            future.add_done_callback(self._report)
+
+    def _report(self, future):
+        """ Report the exception raised by the awaitable of a callback.
+
+        Returns
+        -------
+        result : bool
+            True if the awaitable completed without an exception.
+
+        """
+        if future.cancelled():
+            return False
+        exc = future.exception()
+        if exc is not None:
+            self.loop.call_exception_handler({
+                'message': 'Exception in the awaitable of a callback',
+                'exception': exc,
+                'future': future,
+            })
+            return False
+        return True
+
+    def _await_task(self, task, awaitable):
+        """ Run the awaitable returned by a task as an asyncio task.
+
+        The task is completed with the result of the awaitable. If the
+        awaitable raises, the exception is reported to the exception
+        handler of the loop and the task result is left undefined.
+
+        """
+        def done(future):
+            try:
+                if self._report(future):
+                    task._complete(future.result())
+            finally:
+                task._finish()
+
+        future = asyncio.ensure_future(awaitable, loop=self.loop)
+        future.add_done_callback(done)
+        return True
+
+    #--------------------------------------------------------------------------
+    # Abstract API Implementation
+    #--------------------------------------------------------------------------
+    def start(self):
+        """ Start the application's main event loop.
+
+        """
+        app = self._qapp
+        loop = self.loop
+        if not loop.is_running() and not getattr(app, '_in_event_loop', False):
+            app._in_event_loop = True
+            try:
+                loop.run_forever()
+            finally:
+                app._in_event_loop = False
+
+    def stop(self):
+        """ Stop the application's main event loop.
+
+        """
+        loop = self.loop
+        if loop.is_running():
+            loop.stop()
+        else:
+            super(QtAsyncioApplication, self).stop()
+
+    def deferred_call(self, callback, *args, **kwargs):
+        """ Invoke a callable on the next cycle of the main event loop
+        thread.
+
+        Parameters
+        ----------
+        callback : callable
+            The callable object to execute at some point in the future.
+            If it returns an awaitable, the awaitable is run as a task.
+
+        args, kwargs
+            Any additional positional and keyword arguments to pass to
+            the callback.
+
+        """
+        loop = self.loop
+        if self.is_main_thread():
+            loop.call_soon(self._invoke, callback, args, kwargs)
+        else:
+            loop.call_soon_threadsafe(self._invoke, callback, args, kwargs)
+
+    def timed_call(self, ms, callback, *args, **kwargs):
+        """ Invoke a callable on the main event loop thread at a
+        specified time in the future.
+
+        Parameters
+        ----------
+        ms : int
+            The time to delay, in milliseconds, before executing the
+            callable.
+
+        callback : callable
+            The callable object to execute at some point in the future.
+            If it returns an awaitable, the awaitable is run as a task.
+
+        args, kwargs
+            Any additional positional and keyword arguments to pass to
+            the callback.
+
+        """
+        loop = self.loop
+        delay = ms / 1000.0
+        if self.is_main_thread():
+            loop.call_later(delay, self._invoke, callback, args, kwargs)
+        else:
+            loop.call_soon_threadsafe(
+                loop.call_later, delay, self._invoke, callback, args, kwargs
+            )
+
+    def destroy(self):
+        """ Destroy this application instance.
+
+        The asyncio event loop is closed along with the application.
+
+        """
+        super(QtAsyncioApplication, self).destroy()
+        loop = self.loop
+        if not loop.is_running() and not loop.is_closed():
+            loop.close()
+        asyncio.set_event_loop(None)
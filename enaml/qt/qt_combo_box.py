@@ -9,8 +9,9 @@ from atom.api import Int, Typed
 
 from enaml.widgets.combo_box import ProxyComboBox
 
-from .QtWidgets import QComboBox
+from .QtWidgets import QComboBox, QListView
 
+from .q_item_list_model import QItemListModel
 from .qt_control import QtControl
 
 
@@ -25,6 +26,9 @@ class QtComboBox(QtControl, ProxyComboBox):
     #: A reference to the widget created by the proxy.
     widget = Typed(QComboBox)
 
+    #: The model holding the items displayed by the combo box.
+    model = Typed(QItemListModel)
+
     #: Cyclic notification guard. This a bitfield of multiple guards.
     _guard = Int(0)
 
@@ -37,6 +41,11 @@ class QtComboBox(QtControl, ProxyComboBox):
         """
         box = QComboBox(self.parent_widget())
         box.setInsertPolicy(QComboBox.NoInsert)
+        self.model = QItemListModel(box)
+        box.setModel(self.model)
+        view = box.view()
+        if isinstance(view, QListView):
+            view.setUniformItemSizes(True)
         self.widget = box
 
     def init_widget(self):
@@ -66,18 +75,11 @@ class QtComboBox(QtControl, ProxyComboBox):
     def set_items(self, items):
         """ Set the items of the ComboBox.
 
+        The items are diffed against the items of the model, so that
+        only the changed rows are updated.
+
         """
-        widget = self.widget
-        count = widget.count()
-        nitems = len(items)
-        for idx, item in enumerate(items[:count]):
-            widget.setItemText(idx, item)
-        if nitems > count:
-            for item in items[count:]:
-                widget.addItem(item)
-        elif nitems < count:
-            for idx in reversed(range(nitems, count)):
-                widget.removeItem(idx)
+        self.model.setItems(items)
 
     def set_index(self, index):
         """ Set the current index of the ComboBox.
@@ -270,6 +270,11 @@ def status_item_factory():
     return QtStatusItem
 
 
+def table_view_factory():
+    from .qt_table_view import QtTableView
+    return QtTableView
+
+
 def time_selector_factory():
     from .qt_time_selector import QtTimeSelector
     return QtTimeSelector
@@ -290,6 +295,11 @@ def tool_button_factory():
     return QtToolButton
 
 
+def tree_view_factory():
+    from .qt_tree_view import QtTreeView
+    return QtTreeView
+
+
 def vtk_canvas_factory():
     from .qt_vtk_canvas import QtVTKCanvas
     return QtVTKCanvas
@@ -358,10 +368,12 @@ QT_FACTORIES = {
     'StackItem': stack_item_factory,
     'StatusBar': status_bar_factory,
     'StatusItem': status_item_factory,
+    'TableView': table_view_factory,
     'TimeSelector': time_selector_factory,
     'Timer': timer_factory,
     'ToolBar': tool_bar_factory,
     'ToolButton': tool_button_factory,
+    'TreeView': tree_view_factory,
     'VTKCanvas': vtk_canvas_factory,
     'WebView': web_view_factory,
     'Window': window_factory,
@@ -5,17 +5,22 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Typed
+from itertools import repeat
+
+from atom.api import Bool, Typed
 
 from enaml.widgets.flow_area import ProxyFlowArea
+from enaml.widgets.flow_item import FlowItem
+from enaml.widgets.virtual_looper import VirtualLooper
 
-from .QtCore import QEvent, QPoint, QRect
+from .QtCore import QEvent, QPoint, QRect, Signal
 from .QtGui import QPainter, QPalette
 from .QtWidgets import QScrollArea, QWidget, QApplication
 
 from .qt_frame import QtFrame
 from .qt_flow_item import QtFlowItem
 from .q_flow_layout import QFlowLayout
+from .q_virtual_flow_layout import QVirtualFlowLayout
 
 
 _DIRECTION_MAP = {
@@ -38,7 +43,11 @@ class QFlowArea(QScrollArea):
     """ A custom QScrollArea which implements a flowing layout.
 
     """
-    def __init__(self, parent=None):
+    #: A signal emitted when the visible part of the content of a
+    #: virtual flow area may have changed.
+    visibleRectChanged = Signal()
+
+    def __init__(self, parent=None, virtual=False):
         """ Initialize a QFlowArea.
 
         Parameters
@@ -46,10 +55,18 @@ class QFlowArea(QScrollArea):
         parent : QWidget, optional
             The parent widget of this widget.
 
+        virtual : bool, optional
+            Whether to use a QVirtualFlowLayout instead of a QFlowLayout.
+            The default is False.
+
         """
         super(QFlowArea, self).__init__(parent)
         self._widget = QWidget(self)
-        self._layout = QFlowLayout()
+        if virtual:
+            self._layout = QVirtualFlowLayout()
+            self._layout.geometryChanged.connect(self.visibleRectChanged)
+        else:
+            self._layout = QFlowLayout()
         self._widget.setLayout(self._layout)
         self.setWidgetResizable(True)
         self.setWidget(self._widget)
@@ -72,6 +89,28 @@ class QFlowArea(QScrollArea):
             QPainter(self).fillRect(QRect(tl, br), color)
         return res
 
+    def scrollContentsBy(self, dx, dy):
+        """ A reimplemented scrolling method.
+
+        This method notifies the change of the visible rect.
+
+        """
+        super(QFlowArea, self).scrollContentsBy(dx, dy)
+        if isinstance(self._layout, QVirtualFlowLayout):
+            self.visibleRectChanged.emit()
+
+    def visibleRect(self):
+        """ Get the visible part of the content of the flow area.
+
+        Returns
+        -------
+        result : QRect
+            The visible rect, in the coordinates of the widget holding
+            the layout.
+
+        """
+        return QRect(-self._widget.pos(), self.viewport().size())
+
     def layout(self):
         """ Get the layout for this flow area.
 
@@ -80,7 +119,7 @@ class QFlowArea(QScrollArea):
 
         Returns
         -------
-        result : QFlowLayout
+        result : QFlowLayout or QVirtualFlowLayout
             The flow layout for this flow area.
 
         """
@@ -101,6 +140,9 @@ class QtFlowArea(QtFrame, ProxyFlowArea):
     #: A reference to the widget created by the proxy.
     widget = Typed(QFlowArea)
 
+    #: The virtual looper which provides the items of a virtual area.
+    looper = Typed(VirtualLooper)
+
     #--------------------------------------------------------------------------
     # Initialization API
     #--------------------------------------------------------------------------
@@ -108,7 +150,12 @@ class QtFlowArea(QtFrame, ProxyFlowArea):
         """ Create the underlying widget.
 
         """
-        self.widget = QFlowArea(self.parent_widget())
+        for child in self.declaration.children:
+            if isinstance(child, VirtualLooper):
+                self.looper = child
+                break
+        virtual = self.looper is not None
+        self.widget = QFlowArea(self.parent_widget(), virtual)
 
     def init_widget(self):
         """ Initialize the underlying control.
@@ -127,11 +174,31 @@ class QtFlowArea(QtFrame, ProxyFlowArea):
 
         """
         super(QtFlowArea, self).init_layout()
+        looper = self.looper
+        if looper is not None:
+            self._update_item_sizes()
+            looper.observe('sizes_changed', self._on_sizes_changed)
+            looper.observe('overscan', self._on_overscan_changed)
+            self.widget.visibleRectChanged.connect(self._update_items)
+            return
         layout = self.widget.layout()
         for child in self.children():
             if isinstance(child, QtFlowItem):
                 layout.addWidget(child.widget)
 
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        This destructor stops observing the virtual looper.
+
+        """
+        looper = self.looper
+        if looper is not None:
+            looper.unobserve('sizes_changed', self._on_sizes_changed)
+            looper.unobserve('overscan', self._on_overscan_changed)
+            del self.looper
+        super(QtFlowArea, self).destroy()
+
     #--------------------------------------------------------------------------
     # Child Events
     #--------------------------------------------------------------------------
@@ -140,7 +207,8 @@ class QtFlowArea(QtFrame, ProxyFlowArea):
 
         """
         super(QtFlowArea, self).child_added(child)
-        if isinstance(child, QtFlowItem):
+        # The items of a virtual area are handled by `_update_items`.
+        if isinstance(child, QtFlowItem) and self.looper is None:
             for index, dchild in enumerate(self.children()):
                 if dchild is child:
                     self.widget.layout().insertWidget(index, child.widget)
@@ -187,6 +255,89 @@ class QtFlowArea(QtFrame, ProxyFlowArea):
         top, right, bottom, left = margins
         self.widget.layout().setContentsMargins(left, top, right, bottom)
 
+    #--------------------------------------------------------------------------
+    # Virtual Items
+    #--------------------------------------------------------------------------
+    #: Whether the virtual items are being updated.
+    _updating = Bool(False)
+
+    #: Whether another update of the virtual items has been requested
+    #: during the current update.
+    _update_pending = Bool(False)
+
+    def _update_item_sizes(self):
+        """ Update the sizes of the items of the virtual layout.
+
+        """
+        looper = self.looper
+        count = len(looper.iterable)
+        if looper.item_sizes:
+            sizes = looper.item_sizes[:count]
+        else:
+            sizes = repeat(tuple(looper.item_size), count)
+        self.widget.layout().setItemSizes(sizes)
+
+    def _update_items(self):
+        """ Create and place the items in the visible part of the area.
+
+        The visible rect is expanded by the overscan of the looper in
+        the direction orthogonal to the flow and the looper is asked to
+        provide the items which intersect it.
+
+        """
+        # Creating the items can trigger a relayout of the area, which
+        # is handled once the current update is done.
+        if self._updating:
+            self._update_pending = True
+            return
+        self._updating = True
+        try:
+            self._update_pending = True
+            while self._update_pending:
+                self._update_pending = False
+                self._update_range()
+        finally:
+            self._updating = False
+
+    def _update_range(self):
+        """ Update the range of the virtual items for the visible rect.
+
+        """
+        looper = self.looper
+        widget = self.widget
+        layout = widget.layout()
+        rect = widget.visibleRect()
+        if layout.hasHeightForWidth():
+            margin = int(rect.height() * looper.overscan)
+            rect.adjust(0, -margin, 0, margin)
+        else:
+            margin = int(rect.width() * looper.overscan)
+            rect.adjust(-margin, 0, margin, 0)
+        first, last = layout.itemRange(rect)
+        looper.set_range(first, last)
+        widgets = {}
+        for iteration in looper.iterations():
+            for item in iteration.nodes:
+                proxy = item.proxy if isinstance(item, FlowItem) else None
+                if isinstance(proxy, QtFlowItem) and proxy.widget is not None:
+                    widgets[iteration.index] = proxy.widget
+                    break
+        layout.setItemWidgets(widgets)
+
+    def _on_sizes_changed(self, change):
+        """ Handle a change of the sizes of the virtual items.
+
+        """
+        self._update_item_sizes()
+        self._update_items()
+
+    def _on_overscan_changed(self, change):
+        """ Handle a change of the overscan of the virtual looper.
+
+        """
+        if change['type'] == 'update':
+            self._update_items()
+
     #--------------------------------------------------------------------------
     # Overrides
     #--------------------------------------------------------------------------
@@ -9,10 +9,13 @@ from atom.api import Typed
 
 from enaml.widgets.image_view import ProxyImageView
 
-from .QtGui import QPainter, QPixmap
+from .QtCore import Qt, QTimer
+from .QtGui import QGuiApplication, QPainter, QPixmap
 from .QtWidgets import QFrame
 
-from .q_resource_helpers import get_cached_qimage
+from .q_resource_helpers import (
+    QImage_from_Image, get_cached_qimage, request_qimage
+)
 from .qt_control import QtControl
 
 
@@ -33,6 +36,10 @@ class QImageView(QFrame):
         """
         super(QImageView, self).__init__(parent)
         self._pixmap = None
+        self._image = None
+        self._scaled_pixmap = None
+        self._frame_timer = None
+        self._frame_pending = False
         self._scaled_contents = False
         self._allow_upscaling = False
         self._preserve_aspect_ratio = False
@@ -40,6 +47,58 @@ class QImageView(QFrame):
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _refreshImage(self):
+        """ Convert the current pixels of the image into the pixmap.
+
+        The storage of the pixmap is reused when the size and format of
+        the image are unchanged.
+
+        """
+        self._frame_pending = False
+        self._pixmap.convertFromImage(self._image)
+        self._scaled_pixmap = None
+        self.update()
+
+    def _onFrameTimer(self):
+        """ Handle the timeout of the frame timer.
+
+        If the image was updated since the last refresh, the pixmap is
+        refreshed and the timer is restarted.
+
+        """
+        if self._frame_pending:
+            self._refreshImage()
+            self._frame_timer.start()
+
+    def _scaledPixmap(self, width, height):
+        """ Get the pixmap scaled to the given size.
+
+        The scaled pixmap is cached until the pixmap or the size change,
+        so that a repaint without new data does not rescale the pixmap.
+
+        """
+        pixmap = self._pixmap
+        ratio = self.devicePixelRatioF()
+        width = int(width * ratio)
+        height = int(height * ratio)
+        if (ratio == pixmap.devicePixelRatioF() and
+                width == pixmap.width() and height == pixmap.height()):
+            return pixmap
+        scaled = self._scaled_pixmap
+        if (scaled is None or scaled.devicePixelRatioF() != ratio or
+                scaled.width() != width or scaled.height() != height):
+            # Painting the pixmap is much faster than 'QPixmap.scaled'
+            # and gives the same result as painting it on the widget.
+            scaled = QPixmap(width, height)
+            scaled.fill(Qt.transparent)
+            painter = QPainter(scaled)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.drawPixmap(0, 0, width, height, pixmap)
+            painter.end()
+            scaled.setDevicePixelRatio(ratio)
+            self._scaled_pixmap = scaled
+        return scaled
+
     def paintEvent(self, event):
         """ A custom paint event handler which draws the image according
         to the current size constraints.
@@ -102,8 +161,9 @@ class QImageView(QFrame):
 
         # Finally, draw the pixmap into the calculated rect.
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        painter.drawPixmap(paint_x, paint_y, paint_width, paint_height, pixmap)
+        painter.drawPixmap(
+            paint_x, paint_y, self._scaledPixmap(paint_width, paint_height)
+        )
 
     #--------------------------------------------------------------------------
     # Public API
@@ -134,8 +194,59 @@ class QImageView(QFrame):
 
         """
         self._pixmap = pixmap
+        self._image = None
+        self._scaled_pixmap = None
+        self.update()
+
+    def image(self):
+        """ Returns the image displayed by the image view, if any.
+
+        """
+        return self._image
+
+    def setImage(self, image):
+        """ Set the image to display in the widget.
+
+        The image is kept by the widget so that its pixels can be
+        updated in place with 'updateImage'.
+
+        Parameters
+        ----------
+        image : QImage
+            The QImage to display in the widget.
+
+        """
+        self._pixmap = QPixmap.fromImage(image)
+        self._image = image
+        self._scaled_pixmap = None
+        self._frame_pending = False
         self.update()
 
+    def updateImage(self):
+        """ Refresh the widget after the pixels of the image changed.
+
+        The refreshes are throttled to the refresh rate of the screen:
+        the first update is displayed immediately and the updates which
+        follow it during the next frame interval are coalesced into a
+        single refresh at the end of the interval.
+
+        """
+        if self._image is None:
+            return
+        timer = self._frame_timer
+        if timer is None:
+            screen = QGuiApplication.primaryScreen()
+            rate = screen.refreshRate() if screen is not None else 0
+            timer = self._frame_timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(int(1000 / rate) if rate > 0 else 16)
+            timer.timeout.connect(self._onFrameTimer)
+        if timer.isActive():
+            self._frame_pending = True
+        else:
+            self._refreshImage()
+            timer.start()
+
     def scaledContents(self):
         """ Returns whether or not the contents scale with the widget
         size.
@@ -229,19 +340,53 @@ class QtImageView(QtControl, ProxyImageView):
         self.set_allow_upscaling(d.allow_upscaling)
         self.set_preserve_aspect_ratio(d.preserve_aspect_ratio)
 
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def on_image_decoded(self, image):
+        """ Handle the decoding of an image on a worker thread.
+
+        """
+        d = self.declaration
+        if self.widget is not None and d is not None and d.image is image:
+            with self.geometry_guard():
+                self.widget.setImage(get_cached_qimage(image))
+
     #--------------------------------------------------------------------------
     # Widget Update Methods
     #--------------------------------------------------------------------------
     def set_image(self, image):
         """ Set the image on the underlying widget.
 
+        An image decoded asynchronously is replaced by an empty view
+        until it is decoded.
+
         """
-        qpixmap = None
+        qimage = None
         if image:
-            qimage = get_cached_qimage(image)
-            qpixmap = QPixmap.fromImage(qimage)
+            qimage = request_qimage(
+                image, lambda: self.on_image_decoded(image)
+            )
         with self.geometry_guard():
-            self.widget.setPixmap(qpixmap)
+            if qimage is not None:
+                self.widget.setImage(qimage)
+            else:
+                self.widget.setPixmap(None)
+
+    def update_image(self):
+        """ Refresh the widget after the data of the image changed.
+
+        """
+        image = self.declaration.image
+        if not image:
+            return
+        qimage = get_cached_qimage(image)
+        if getattr(qimage, '_enaml_buffer', None) is not None:
+            self.widget.updateImage()
+        else:
+            # The image is not a view of the data, it is rebuilt.
+            image._tkdata = QImage_from_Image(image)
+            self.set_image(image)
 
     def set_scale_to_fit(self, scale):
         """ Sets whether or not the image scales with the underlying
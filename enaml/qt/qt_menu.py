@@ -19,6 +19,37 @@ from .qt_toolkit_object import QtToolkitObject
 from .qt_widget import QtWidget
 
 
+def move_actions(widget, actions, before):
+    """ Move actions of a widget so that they are followed by an action.
+
+    Nothing is done if the actions are already in place.
+
+    Parameters
+    ----------
+    widget : QWidget
+        The widget which holds the actions.
+
+    actions : list
+        The list of QAction objects to move.
+
+    before : QAction or None
+        The QAction which should follow the moved actions, or None if
+        they should be moved to the end.
+
+    """
+    if not actions:
+        return
+    current = widget.actions()
+    if actions[0] in current:
+        start = current.index(actions[0])
+        end = start + len(actions)
+        if current[start:end] == actions:
+            following = current[end] if end < len(current) else None
+            if following == before:
+                return
+    widget.insertActions(before, actions)
+
+
 class QCustomMenu(QMenu):
     """ A custom subclass of QMenu which adds some convenience apis.
 
@@ -200,6 +231,65 @@ class QtMenu(QtToolkitObject, ProxyMenu):
             before = self.find_next_action(child)
             self.widget.insertAction(before, child.get_action(True))
 
+    def children_added(self, children):
+        """ Handle the children added event for a QtMenu.
+
+        The actions of the new children are inserted in a single pass
+        over the children in reverse order, which tracks the action
+        following each child instead of searching for it.
+
+        """
+        added = set(children)
+        for child in children:
+            super(QtMenu, self).child_added(child)
+        widget = self.widget
+        before = None
+        for dchild in reversed(list(self.children())):
+            if dchild in added:
+                if isinstance(dchild, QtMenu):
+                    actions = [dchild.widget.menuAction()]
+                elif isinstance(dchild, QtAction):
+                    actions = [dchild.widget]
+                elif isinstance(dchild, QtActionGroup):
+                    actions = dchild.actions()
+                elif isinstance(dchild, QtWidget):
+                    actions = [dchild.get_action(True)]
+                else:
+                    continue
+                widget.insertActions(before, actions)
+                if actions:
+                    before = actions[0]
+            elif isinstance(dchild, QtMenu):
+                before = dchild.widget.menuAction()
+            elif isinstance(dchild, QtAction):
+                before = dchild.widget
+            elif isinstance(dchild, QtActionGroup):
+                acts = dchild.actions()
+                if len(acts) > 0:
+                    before = acts[0]
+            elif isinstance(dchild, QtWidget):
+                action = dchild.get_action(False)
+                if action is not None:
+                    before = action
+
+    def child_moved(self, child):
+        """ Handle the child moved event for a QtMenu.
+
+        """
+        super(QtMenu, self).child_moved(child)
+        if isinstance(child, QtMenu):
+            actions = [child.widget.menuAction()]
+        elif isinstance(child, QtAction):
+            actions = [child.widget]
+        elif isinstance(child, QtActionGroup):
+            actions = child.actions()
+        elif isinstance(child, QtWidget):
+            actions = [child.get_action(True)]
+        else:
+            return
+        before = self.find_next_action(child)
+        move_actions(self.widget, actions, before)
+
     def child_removed(self, child):
         """  Handle the child removed event for a QtMenu.
 
@@ -13,7 +13,7 @@ from enaml.widgets.menu_bar import ProxyMenuBar
 
 from .QtWidgets import QMainWindow, QMenuBar
 
-from .qt_menu import QtMenu
+from .qt_menu import QtMenu, move_actions
 from .qt_toolkit_object import QtToolkitObject
 
 
@@ -89,6 +89,15 @@ class QtMenuBar(QtToolkitObject, ProxyMenuBar):
             before = self.find_next_action(child)
             self.widget.insertMenu(before, child.widget)
 
+    def child_moved(self, child):
+        """ Handle the child moved event for a QtMenuBar.
+
+        """
+        super(QtMenuBar, self).child_moved(child)
+        if isinstance(child, QtMenu):
+            before = self.find_next_action(child)
+            move_actions(self.widget, [child.widget.menuAction()], before)
+
     def child_removed(self, child):
         """ Handle the child removed event for a QtMenuBar.
 
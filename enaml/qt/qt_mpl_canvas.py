@@ -5,15 +5,18 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Typed
+from atom.api import Bool, List, Typed, Value
 
 from enaml.widgets.mpl_canvas import ProxyMPLCanvas
 
-from .QtCore import Qt, __version__ as QT_VERSION
+from .QtCore import Qt, QTimer, __version__ as QT_VERSION
+from .QtGui import QResizeEvent
 from .QtWidgets import QFrame, QVBoxLayout
 
 from .qt_control import QtControl
 
+from matplotlib.backend_bases import FigureCanvasBase
+
 if QT_VERSION[0] == '4':
     from matplotlib.backends.backend_qt4agg import FigureCanvasQTAgg
     try:
@@ -37,6 +40,22 @@ class QtMPLCanvas(QtControl, ProxyMPLCanvas):
     #: A reference to the widget created by the proxy.
     widget = Typed(QFrame)
 
+    #: The timer throttling the redraws requested by the declaration.
+    _frame_timer = Typed(QTimer)
+
+    #: Whether a redraw was requested while the frame timer was active.
+    _draw_pending = Bool(False)
+
+    #: The background of the figure without its animated artists, which
+    #: is restored before blitting the artists.
+    _background = Value()
+
+    #: The artists currently marked as animated by the canvas.
+    _animated = List()
+
+    #: The ids of the matplotlib callbacks connected to the canvas.
+    _mpl_cids = List()
+
     #--------------------------------------------------------------------------
     # Initialization API
     #--------------------------------------------------------------------------
@@ -51,6 +70,20 @@ class QtMPLCanvas(QtControl, ProxyMPLCanvas):
         widget.setLayout(layout)
         self.widget = widget
 
+    def init_widget(self):
+        """ Initialize the underlying widget.
+
+        """
+        super(QtMPLCanvas, self).init_widget()
+        d = self.declaration
+        timer = self._frame_timer = QTimer(self.widget)
+        timer.setSingleShot(True)
+        timer.timeout.connect(self.on_frame_timer)
+        self.set_max_frame_rate(d.max_frame_rate)
+        self._animated = list(d.animated_artists)
+        for artist in self._animated:
+            artist.set_animated(True)
+
     def init_layout(self):
         """ Initialize the layout of the underlying widget.
 
@@ -58,6 +91,52 @@ class QtMPLCanvas(QtControl, ProxyMPLCanvas):
         super(QtMPLCanvas, self).init_layout()
         self._refresh_mpl_widget()
 
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        This disconnects the callbacks from the figure, which may
+        outlive the widget.
+
+        """
+        self._frame_timer.stop()
+        canvas = self._get_canvas()
+        if canvas is not None:
+            self._disconnect_canvas(canvas)
+        super(QtMPLCanvas, self).destroy()
+
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def on_frame_timer(self):
+        """ Handle the timeout of the frame timer.
+
+        If a redraw was requested since the last one, the figure is
+        redrawn and the timer is restarted.
+
+        """
+        if self._draw_pending:
+            self._draw_frame()
+            self._frame_timer.start()
+
+    def on_mpl_draw(self, event):
+        """ Handle the 'draw_event' of the canvas.
+
+        The background of the figure is cached for blitting, then the
+        animated artists, which are left out of the full redraws, are
+        drawn over it.
+
+        """
+        canvas = event.canvas
+        if self._animated:
+            self._background = canvas.copy_from_bbox(canvas.figure.bbox)
+            self._draw_animated(canvas)
+
+    def on_mpl_resize(self, event):
+        """ Handle the 'resize_event' of the canvas.
+
+        """
+        self._background = None
+
     #--------------------------------------------------------------------------
     # ProxyMPLCanvas API
     #--------------------------------------------------------------------------
@@ -78,17 +157,165 @@ class QtMPLCanvas(QtControl, ProxyMPLCanvas):
                 toolbar = layout.itemAt(0).widget()
                 toolbar.setVisible(visible)
 
+    def set_live_update(self, live):
+        """ Set whether the canvas widget is reused for new figures.
+
+        The mode is used the next time the figure changes.
+
+        """
+        pass
+
+    def set_max_frame_rate(self, rate):
+        """ Set the maximum rate of the requested redraws.
+
+        """
+        self._frame_timer.setInterval(int(1000 / rate) if rate > 0 else 0)
+
+    def set_animated_artists(self, artists):
+        """ Set the artists redrawn by blitting.
+
+        The figure is fully redrawn to cache its background without the
+        animated artists.
+
+        """
+        for artist in self._animated:
+            if artist not in artists:
+                artist.set_animated(False)
+        for artist in artists:
+            artist.set_animated(True)
+        self._animated = list(artists)
+        self._background = None
+        canvas = self._get_canvas()
+        if canvas is not None:
+            canvas.draw_idle()
+
+    def request_draw(self):
+        """ Request a throttled redraw of the figure.
+
+        """
+        if self._frame_timer.isActive():
+            self._draw_pending = True
+        else:
+            self._draw_frame()
+            self._frame_timer.start()
+
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _get_canvas(self):
+        """ Get the canvas widget displaying the figure, if any.
+
+        """
+        layout = self.widget.layout()
+        if layout.count() == 2:
+            return layout.itemAt(1).widget()
+        return None
+
+    def _connect_canvas(self, canvas):
+        """ Connect the matplotlib callbacks of the canvas.
+
+        """
+        self._mpl_cids = [
+            canvas.mpl_connect('draw_event', self.on_mpl_draw),
+            canvas.mpl_connect('resize_event', self.on_mpl_resize),
+        ]
+
+    def _disconnect_canvas(self, canvas):
+        """ Disconnect the matplotlib callbacks of the canvas.
+
+        This must be called while the canvas holds the figure to which
+        the callbacks were connected.
+
+        """
+        for cid in self._mpl_cids:
+            canvas.mpl_disconnect(cid)
+        self._mpl_cids = []
+
+    def _draw_animated(self, canvas):
+        """ Draw the animated artists on the canvas.
+
+        """
+        figure = canvas.figure
+        for artist in self._animated:
+            if artist.figure is figure:
+                figure.draw_artist(artist)
+
+    def _draw_frame(self):
+        """ Redraw the figure for a request of the declaration.
+
+        """
+        self._draw_pending = False
+        canvas = self._get_canvas()
+        if canvas is None:
+            return
+        if self._animated and self._background is not None:
+            canvas.restore_region(self._background)
+            self._draw_animated(canvas)
+            canvas.blit(canvas.figure.bbox)
+        else:
+            canvas.draw_idle()
+
+    def _swap_figure(self, canvas, figure):
+        """ Give a new figure to an existing canvas.
+
+        This does for the new figure what creating the canvas did for
+        the old one, and gives the old figure a canvas of its own, so
+        that its later redraws do not repaint the new figure.
+
+        """
+        old_figure = canvas.figure
+        ratio = getattr(canvas, '_device_pixel_ratio', 1)
+        if ratio != 1 and hasattr(old_figure, '_original_dpi'):
+            old_figure._set_dpi(old_figure._original_dpi, forward=False)
+        FigureCanvasBase(old_figure)
+
+        figure.set_canvas(canvas)
+        canvas.figure = figure
+        figure._original_dpi = figure.dpi
+        # Scale the dpi of the new figure by the device pixel ratio.
+        if hasattr(canvas, '_set_device_pixel_ratio'):
+            canvas._device_pixel_ratio = 1
+            canvas._set_device_pixel_ratio(canvas.devicePixelRatioF() or 1)
+
+        # Let the canvas size the new figure to the widget.
+        size = canvas.size()
+        canvas.resizeEvent(QResizeEvent(size, size))
+
+    def _make_toolbar(self, canvas):
+        """ Create a toolbar for the canvas.
+
+        """
+        toolbar = NavigationToolbar2QT(canvas, self.widget)
+        toolbar.setVisible(self.declaration.toolbar_visible)
+        return toolbar
+
     def _refresh_mpl_widget(self):
         """ Create the mpl widget and update the underlying control.
 
         """
-        # Delete the old widgets in the layout, it's just shenanigans
-        # to try to reuse the old widgets when the figure changes.
+        self._background = None
         widget = self.widget
         layout = widget.layout()
+        figure = self.declaration.figure
+        canvas = self._get_canvas()
+        if canvas is not None:
+            self._disconnect_canvas(canvas)
+
+        # In live update mode, the canvas is given the new figure. The
+        # toolbar is created anew since it keeps the views of the old
+        # figure and, depending on the matplotlib version, its callbacks
+        # are registered on the old figure.
+        if canvas is not None and figure and self.declaration.live_update:
+            self._swap_figure(canvas, figure)
+            old = layout.takeAt(0).widget()
+            old.deleteLater()
+            layout.insertWidget(0, self._make_toolbar(canvas))
+            self._connect_canvas(canvas)
+            canvas.draw_idle()
+            return
+
+        # Delete the old widgets in the layout, it's just shenanigans
+        # to try to reuse the old widgets when the figure changes.
         while layout.count():
             layout_item = layout.takeAt(0)
             layout_item.widget().deleteLater()
@@ -99,13 +326,11 @@ class QtMPLCanvas(QtControl, ProxyMPLCanvas):
         # which is certainly not desired in this case. This appears to
         # be a limitation of matplotlib. The canvas is manually set to
         # visible, or QVBoxLayout will ignore it for size hinting.
-        figure = self.declaration.figure
         if figure:
             canvas = FigureCanvasQTAgg(figure)
             canvas.setParent(widget)
             canvas.setFocusPolicy(Qt.ClickFocus)
             canvas.setVisible(True)
-            toolbar = NavigationToolbar2QT(canvas, widget)
-            toolbar.setVisible(self.declaration.toolbar_visible)
-            layout.addWidget(toolbar)
+            layout.addWidget(self._make_toolbar(canvas))
             layout.addWidget(canvas)
+            self._connect_canvas(canvas)
@@ -5,11 +5,15 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Int, Typed
+import re
+
+from atom.api import Int, Typed, Value
 
 from enaml.widgets.multiline_field import ProxyMultilineField
+from enaml.widgets.text_delta import TextDelta
 
-from .QtCore import QTimer, Signal
+from .QtCore import Qt, QTimer, Signal
+from .QtGui import QKeyEvent, QTextCursor, QTextDocument, QTextDocumentFragment
 from .QtWidgets import QTextEdit
 
 from .qt_control import QtControl
@@ -49,11 +53,94 @@ class QMultilineEdit(QTextEdit):
                 self._dtimer.timeout.disconnect(self.delayedTextChanged)
                 self._dtimer = None
 
+    #--------------------------------------------------------------------------
+    # Reimplementations
+    #--------------------------------------------------------------------------
+    def keyPressEvent(self, event):
+        """ Handle the key press events of the widget.
+
+        Shift+Return inserts a paragraph break like Return, instead of
+        a line separator which the plain text of the field would turn
+        into a new line inside of the same block.
+
+        """
+        key = event.key()
+        modifiers = event.modifiers()
+        if (key in (Qt.Key_Return, Qt.Key_Enter) and
+                modifiers & Qt.ShiftModifier):
+            plain = QKeyEvent(event.type(), key,
+                              modifiers & ~Qt.ShiftModifier, event.text(),
+                              event.isAutoRepeat(), event.count())
+            super(QMultilineEdit, self).keyPressEvent(plain)
+            event.setAccepted(plain.isAccepted())
+        else:
+            super(QMultilineEdit, self).keyPressEvent(event)
+
+    def insertFromMimeData(self, source):
+        """ Insert the data pasted or dropped on the widget.
+
+        The line separators of the data are turned into paragraph
+        breaks, for the same reason as in 'keyPressEvent'.
+
+        """
+        if self.acceptRichText() and source.hasHtml():
+            fragment = QTextDocumentFragment.fromHtml(source.html(),
+                                                      self.document())
+        elif source.hasText():
+            fragment = QTextDocumentFragment.fromPlainText(source.text())
+        else:
+            fragment = None
+        if fragment is not None:
+            document = QTextDocument()
+            QTextCursor(document).insertFragment(fragment)
+            found = document.find(u'\u2028')
+            if not found.isNull():
+                while not found.isNull():
+                    found.removeSelectedText()
+                    found.insertBlock()
+                    found = document.find(u'\u2028', found)
+                self.textCursor().insertFragment(
+                    QTextDocumentFragment(document)
+                )
+                self.ensureCursorVisible()
+                return
+        super(QMultilineEdit, self).insertFromMimeData(source)
+
 
 #: cyclic notification guard flag
 TEXT_GUARD = 0x1
 
 
+def plain_text(text):
+    """ Convert the text of a document selection to plain text.
+
+    The separators are replaced as in QTextDocument.toPlainText.
+
+    """
+    return text.replace(
+        u'\u2029', u'\n').replace(u'\u2028', u'\n').replace(u'\xa0', u' ')
+
+
+#: A pattern matching the characters outside of the basic multilingual
+#: plane, which Qt stores as two UTF-16 code units.
+ASTRAL = re.compile(u'[\U00010000-\U0010ffff]')
+
+
+def utf16_length(text):
+    """ Get the number of UTF-16 code units of a text.
+
+    """
+    return len(text) + len(ASTRAL.findall(text))
+
+
+def from_utf16(text, units):
+    """ Get the number of characters of a text spanned by a number of
+    UTF-16 code units from its start.
+
+    """
+    return len(text.encode('utf-16-le')[:2 * units].decode('utf-16-le'))
+
+
 class QtMultilineField(QtControl, ProxyMultilineField):
     """ A Qt4 implementation of an Enaml ProxyMultilineField.
 
@@ -64,6 +151,17 @@ class QtMultilineField(QtControl, ProxyMultilineField):
     #: A bitfield of guard flags.
     _guard = Int(0)
 
+    #: The length of the plain text of the document in UTF-16 code
+    #: units, used to compute the length of the text removed by an edit.
+    _length = Int(0)
+
+    #: The lines of the text of the document, kept once it contains a
+    #: character outside of the basic multilingual plane. Qt counts the
+    #: positions in UTF-16 code units, which are then converted into
+    #: characters over the text of the edit. This is None as long as
+    #: the characters and the code units of the document match.
+    _lines = Value()
+
     #--------------------------------------------------------------------------
     # Initialization API
     #--------------------------------------------------------------------------
@@ -83,6 +181,12 @@ class QtMultilineField(QtControl, ProxyMultilineField):
         self.set_read_only(d.read_only)
         self.set_auto_sync_text(d.auto_sync_text)
         self.widget.delayedTextChanged.connect(self.on_delayed_text_changed)
+        document = self.widget.document()
+        self._length = document.characterCount() - 1
+        text = self.widget.toPlainText()
+        if ASTRAL.search(text):
+            self._lines = text.split('\n')
+        document.contentsChange.connect(self.on_contents_change)
 
     #--------------------------------------------------------------------------
     # Signal Handlers
@@ -96,6 +200,72 @@ class QtMultilineField(QtControl, ProxyMultilineField):
         """
         self.sync_text()
 
+    def on_contents_change(self, position, removed, added):
+        """ The signal handler for the 'contentsChange' signal.
+
+        The counts reported by the document may include the implicit
+        last block separator, so the removed length is computed from
+        the length of the text before and after the edit instead.
+
+        """
+        document = self.widget.document()
+        old_length = self._length
+        length = self._length = document.characterCount() - 1
+        added = max(0, min(added, length - position))
+        removed = old_length - length + added
+        if removed <= 0 and added == 0:
+            return
+        inserted = u''
+        if added > 0:
+            cursor = QTextCursor(document)
+            cursor.setPosition(position)
+            cursor.setPosition(position + added, QTextCursor.KeepAnchor)
+            inserted = plain_text(cursor.selectedText())
+        block = document.findBlock(position)
+        line = block.blockNumber()
+        column = position - block.position()
+        removed = max(removed, 0)
+        lines = self._lines
+        if lines is not None:
+            column, removed = self._to_characters(line, column, removed)
+        delta = TextDelta(
+            line=line, column=column, removed=removed, inserted=inserted
+        )
+        if lines is not None:
+            delta.apply_lines(lines)
+        elif ASTRAL.search(inserted):
+            self._lines = self.widget.toPlainText().split('\n')
+        self.declaration.text_edited(delta)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _to_characters(self, line, column, removed):
+        """ Convert the column and the removed length of an edit from
+        UTF-16 code units into characters.
+
+        The conversion uses the lines of the text before the edit.
+
+        Returns
+        -------
+        result : tuple
+            The column and the removed length in characters.
+
+        """
+        lines = self._lines
+        column = from_utf16(lines[line], column)
+        text = lines[line][column:]
+        units = utf16_length(text)
+        count = 0
+        while removed > units and line + 1 < len(lines):
+            # The line break counts as one character and one code unit.
+            count += len(text) + 1
+            removed -= units + 1
+            line += 1
+            text = lines[line]
+            units = utf16_length(text)
+        return column, count + from_utf16(text, removed)
+
     #--------------------------------------------------------------------------
     # ProxyMultilineField API
     #--------------------------------------------------------------------------
@@ -15,9 +15,11 @@ from enaml.widgets.notebook import ProxyNotebook
 from .QtCore import Qt, QEvent, QSize, Signal
 from .QtGui import QResizeEvent
 from .QtWidgets import (
-    QTabWidget, QTabBar, QApplication, QStackedWidget
+    QTabWidget, QTabBar, QApplication, QStackedWidget, QStyle,
+    QStyleOptionTabWidgetFrame
 )
 
+from .q_page_hint_cache import QPageHintCache, smart_minimum_size
 from .qt_constraints_widget import QtConstraintsWidget
 from .qt_page import QtPage
 
@@ -75,6 +77,12 @@ class QNotebook(QTabWidget):
         self._size_hint = QSize()
         self._min_size_hint = QSize()
         self._size_hint_mode = QNotebook.Union
+        self._page_hints = QPageHintCache(self)
+        self.currentChanged.connect(self._onCurrentChanged)
+        # The pages are children of the internal stacked widget, which
+        # receives the layout requests of the pages without a layout.
+        self._stack = self.findChild(QStackedWidget)
+        self._stack.installEventFilter(self)
 
     #--------------------------------------------------------------------------
     # Private API
@@ -99,9 +107,106 @@ class QNotebook(QTabWidget):
             event = QResizeEvent(size, size)
             app.sendEvent(self, event)
 
+    def _contentsHint(self, minimum):
+        """ Compute the size hint of the pages of the notebook.
+
+        The hints of the pages are taken from the page hint cache. In
+        'Current' mode, only the current page is considered.
+
+        """
+        cache = self._page_hints
+        if self._size_hint_mode == QNotebook.Current:
+            curr = self.currentWidget()
+            if curr is None:
+                return QSize(0, 0) if minimum else QSize()
+            return cache.hints(curr)[1 if minimum else 0]
+        if minimum:
+            # QStackedLayout computes the minimum size of the stack.
+            size = QSize(0, 0)
+            for index in range(self.count()):
+                page = self.widget(index)
+                hint, min_hint = cache.hints(page)
+                size = size.expandedTo(
+                    smart_minimum_size(hint, min_hint, page)
+                )
+            margins = self._stack.contentsMargins()
+            size += QSize(margins.left() + margins.right(),
+                          margins.top() + margins.bottom())
+            return size
+        # Hidden tabs only exist from Qt 5.15.
+        is_visible = getattr(self, 'isTabVisible', lambda index: True)
+        size = QSize()
+        for index in range(self.count()):
+            if is_visible(index):
+                size = size.expandedTo(cache.hints(self.widget(index))[0])
+        return size
+
+    def _computeHint(self, minimum):
+        """ Compute the size hint of the notebook.
+
+        This mirrors the computation of QTabWidget, using the size hint
+        of the pages computed by '_contentsHint'.
+
+        """
+        corner = self.cornerWidget(Qt.TopLeftCorner)
+        lc = QSize(0, 0)
+        if corner is not None:
+            lc = corner.minimumSizeHint() if minimum else corner.sizeHint()
+        corner = self.cornerWidget(Qt.TopRightCorner)
+        rc = QSize(0, 0)
+        if corner is not None:
+            rc = corner.minimumSizeHint() if minimum else corner.sizeHint()
+        s = self._contentsHint(minimum)
+        t = QSize()
+        bar = self.tabBar()
+        if not (self.tabBarAutoHide() and bar.count() <= 1):
+            if minimum:
+                t = bar.minimumSizeHint()
+            else:
+                t = bar.sizeHint()
+                if self.usesScrollButtons():
+                    t = t.boundedTo(QSize(200, 200))
+                else:
+                    screen = QApplication.primaryScreen()
+                    if screen is not None:
+                        t = t.boundedTo(screen.virtualSize())
+        if self.tabPosition() in (QTabWidget.North, QTabWidget.South):
+            sz = QSize(
+                max(s.width(), t.width() + rc.width() + lc.width()),
+                s.height() + max(rc.height(), lc.height(), t.height())
+            )
+        else:
+            sz = QSize(
+                s.width() + max(rc.width(), lc.width(), t.width()),
+                max(s.height(), t.height() + rc.height() + lc.height())
+            )
+        opt = QStyleOptionTabWidgetFrame()
+        self.initStyleOption(opt)
+        if minimum:
+            opt.palette = self.palette()
+        opt.state = QStyle.State_None
+        hint = self.style().sizeFromContents(
+            QStyle.CT_TabWidget, opt, sz, self
+        )
+        return hint.expandedTo(QApplication.globalStrut())
+
+    def _invalidateHints(self):
+        """ Invalidate the cached size hints of the notebook.
+
+        """
+        self._size_hint = QSize()
+        self._min_size_hint = QSize()
+
     #--------------------------------------------------------------------------
     # Signal Handlers
     #--------------------------------------------------------------------------
+    def _onCurrentChanged(self):
+        """ The handler for the 'currentChanged' signal.
+
+        """
+        if self._size_hint_mode == QNotebook.Current:
+            self._invalidateHints()
+
     def onTabCloseRequested(self, index):
         """ The handler for the 'tabCloseRequested' signal.
 
@@ -121,55 +226,66 @@ class QNotebook(QTabWidget):
         """
         res = super(QNotebook, self).event(event)
         if event.type() == QEvent.LayoutRequest:
-            self._size_hint = QSize()
-            self._min_size_hint = QSize()
+            self._invalidateHints()
             self.layoutRequested.emit()
         return res
 
+    def eventFilter(self, obj, event):
+        """ A reimplemented event filter for the internal stacked widget.
+
+        A page without a layout posts the change of its size hints to
+        the stacked widget, which does not forward it to the notebook.
+        The cached hints are invalidated and the `layoutRequested`
+        signal is emitted as if the notebook had received it.
+
+        """
+        if (obj is self._stack and event.type() == QEvent.LayoutRequest and
+                self._page_hints.invalidateUnmanaged()):
+            self._invalidateHints()
+            self.updateGeometry()
+            self.layoutRequested.emit()
+        return super(QNotebook, self).eventFilter(obj, event)
+
+    def tabRemoved(self, index):
+        """ A reimplemented handler for the removal of a tab.
+
+        The cached size hints of the pages which are no longer in the
+        notebook are released.
+
+        """
+        super(QNotebook, self).tabRemoved(index)
+        pages = [self.widget(i) for i in range(self.count())]
+        self._page_hints.retain(pages)
+        self._invalidateHints()
+
+    def tabInserted(self, index):
+        """ A reimplemented handler for the insertion of a tab.
+
+        """
+        super(QNotebook, self).tabInserted(index)
+        self._invalidateHints()
+
     def sizeHint(self):
         """ A reimplemented size hint handler.
 
         """
-        # Cached for performance. Invalidated on a layout request.
+        # Cached for performance. Invalidated on a layout request. The
+        # size hints of the pages are cached separately and only those
+        # of the pages which changed are computed again.
         hint = self._size_hint
-        if hint.isValid():
-            return hint
-        # QTabWidget does not allow assigning a custom QStackedWidget,
-        # so the default sizeHint is computed, and the effects of the
-        # stack size hint are replaced by the current tab's size hint.
-        hint = super(QNotebook, self).sizeHint()
-        if self._size_hint_mode == QNotebook.Current:
-            stack = self.findChild(QStackedWidget)
-            if stack is not None:
-                curr = stack.currentWidget()
-                if curr is not None:
-                    hint -= stack.sizeHint()
-                    hint += curr.sizeHint()
-        self._size_hint = hint
-        return hint
+        if not hint.isValid():
+            hint = self._size_hint = self._computeHint(False)
+        return QSize(hint)
 
     def minimumSizeHint(self):
         """ A reimplemented minimum size hint handler.
 
         """
         # Cached for performance. Invalidated on a layout request.
-        hint = self._size_hint
-        if hint.isValid():
-            return hint
-        # QTabWidget does not allow assigning a custom QStackedWidget,
-        # so the default minimumSizeHint is computed, and the effects
-        # of the stack size hint are replaced by the current tab's
-        # minimum size hint.
-        hint = super(QNotebook, self).minimumSizeHint()
-        if self._size_hint_mode == QNotebook.Current:
-            stack = self.findChild(QStackedWidget)
-            if stack is not None:
-                curr = stack.currentWidget()
-                if curr is not None:
-                    hint -= stack.minimumSizeHint()
-                    hint += curr.minimumSizeHint()
-        self._size_hint = hint
-        return hint
+        hint = self._min_size_hint
+        if not hint.isValid():
+            hint = self._min_size_hint = self._computeHint(True)
+        return QSize(hint)
 
     def sizeHintMode(self):
         """ Get the size hint mode of the notebook.
@@ -192,8 +308,7 @@ class QNotebook(QTabWidget):
 
         """
         assert isinstance(mode, QNotebook.SizeHintMode)
-        self._size_hint = QSize()
-        self._min_size_hint = QSize()
+        self._invalidateHints()
         self._size_hint_mode = mode
 
     def showPage(self, page):
@@ -243,7 +358,7 @@ class QNotebook(QTabWidget):
         """
         self.insertPage(self.count(), page)
 
-    def insertPage(self, index, page):
+    def insertPage(self, index, page, refresh=True):
         """ Insert a QPage instance into the notebook.
 
         This should be used in favor of the 'insertTab' method.
@@ -256,18 +371,43 @@ class QNotebook(QTabWidget):
         page : QPage
             The QPage instance to add to the notebook.
 
+        refresh : bool, optional
+            Whether or not to refresh the tab bar at the end of the
+            operation. The default is True.
+
         """
         if page.isOpen():
             index = min(index, self.count())
             self.insertTab(index, page, page.title())
-            self.setTabIcon(index, page.icon())
+            # Setting an icon relays out the tabs, and a new tab has
+            # no icon.
+            icon = page.icon()
+            if not icon.isNull():
+                self.setTabIcon(index, icon)
             self.setTabToolTip(index, page.toolTip())
             self.setTabEnabled(index, page.isTabEnabled())
-            self.setTabCloseButtonVisible(index, page.isClosable())
+            self.setTabCloseButtonVisible(index, page.isClosable(), refresh)
         else:
             page.hide()
             self._hidden_pages[page] = index
 
+    def insertPages(self, pages):
+        """ Insert several QPage instances into the notebook.
+
+        The tab bar is refreshed once after all of the pages have been
+        inserted.
+
+        Parameters
+        ----------
+        pages : iterable
+            An iterable of (index, page) tuples for the pages to insert,
+            in order.
+
+        """
+        for index, page in pages:
+            self.insertPage(index, page, False)
+        self._refreshTabBar()
+
     def removePage(self, page):
         """ Remove a QPage instance from the notebook.
 
@@ -475,6 +615,26 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
                 if child is dchild:
                     self.widget.insertPage(index, child.widget)
 
+    def children_added(self, children):
+        """ Handle the children added event for a QtNotebook.
+
+        The new pages are inserted in a single pass over the
+        children, with the updates of the widget disabled.
+
+        """
+        items = set(c for c in children if isinstance(c, QtPage))
+        with self.updates_disabled():
+            super(QtNotebook, self).children_added(
+                [c for c in children if c not in items]
+            )
+            if items:
+                pages = []
+                for index, dchild in enumerate(self.children()):
+                    if dchild in items:
+                        super(QtNotebook, self).child_added(dchild)
+                        pages.append((index, dchild.widget))
+                self.widget.insertPages(pages)
+
     def child_removed(self, child):
         """ Handle the child removed event for a QtNotebook.
 
@@ -10,9 +10,9 @@ from atom.api import Int, Typed
 from enaml.widgets.object_combo import ProxyObjectCombo
 
 from .QtCore import QTimer
-from .QtWidgets import QComboBox
+from .QtWidgets import QComboBox, QListView
 
-from .q_resource_helpers import get_cached_qicon
+from .q_item_list_model import QItemListModel
 from .qt_control import QtControl
 
 
@@ -65,6 +65,9 @@ class QtObjectCombo(QtControl, ProxyObjectCombo):
     #: A single shot refresh timer for queing combo refreshes.
     refresh_timer = Typed(ComboRefreshTimer)
 
+    #: The model holding the items displayed by the combo box.
+    model = Typed(QItemListModel)
+
     #: Cyclic notification guard. This a bitfield of multiple guards.
     _guard = Int(0)
 
@@ -86,6 +89,11 @@ class QtObjectCombo(QtControl, ProxyObjectCombo):
         """
         self.widget = QComboBox(self.parent_widget())
         self.widget.setInsertPolicy(QComboBox.NoInsert)
+        self.model = QItemListModel(self.widget)
+        self.widget.setModel(self.model)
+        view = self.widget.view()
+        if isinstance(view, QListView):
+            view.setUniformItemSizes(True)
 
     def init_widget(self):
         """ Create and initialize the underlying widget.
@@ -124,30 +132,23 @@ class QtObjectCombo(QtControl, ProxyObjectCombo):
     def refresh_items(self):
         """ Refresh the items in the combo box.
 
+        The items are diffed against the items of the model, so that
+        only the inserted and removed rows are notified. The text and
+        icon of every item are computed again, since the items may have
+        been modified in place.
+
         """
         d = self.declaration
         selected = d.selected
-        to_string = d.to_string
-        to_icon = d.to_icon
-        widget = self.widget
         self._guard |= SELECTED_GUARD
         try:
-            widget.clear()
+            self.model.setConverters(d.to_string, d.to_icon)
+            self.model.setItems(d.items, refresh=True)
             target_index = -1
             for index, item in enumerate(d.items):
-                text = to_string(item)
-                icon = to_icon(item)
-                if icon is None:
-                    qicon = None
-                else:
-                    qicon = get_cached_qicon(icon)
-                if qicon is None:
-                    widget.addItem(text)
-                else:
-                    widget.addItem(qicon, text)
                 if item == selected:
                     target_index = index
-            widget.setCurrentIndex(target_index)
+            self.widget.setCurrentIndex(target_index)
         finally:
             self._guard &= ~SELECTED_GUARD
 
@@ -10,15 +10,18 @@ if QT_API in PYSIDE2_API:
     msg = 'the Qt Scintilla widget is only available when using PyQt'
     raise ImportError(msg)
 
+import hashlib
 import logging
+import os
 import sys
 import weakref
 
-from atom.api import Typed
+from atom.api import Str, Typed
 
 from enaml.colors import parse_color
 from enaml.fonts import parse_font
 from enaml.scintilla.scintilla import ProxyScintilla
+from enaml.widgets.text_delta import TextDelta
 
 if QT_API in PYQT5_API:
     from PyQt5 import Qsci
@@ -31,6 +34,7 @@ from .q_resource_helpers import (QColor_from_Color, QFont_from_Font,
                                  get_cached_qimage)
 from .qt_control import QtControl
 from .scintilla_lexers import LEXERS, LEXERS_INV
+from .scintilla_ranges import merge_ranges
 from .scintilla_tokens import TOKENS
 
 
@@ -115,6 +119,11 @@ INDICATOR_STYLE = {
 
 NUMBER_MARGIN = 0
 
+#: The modification types which change the text of a document.
+TEXT_MODIFICATIONS = (
+    Base.SC_MOD_INSERTTEXT | Base.SC_MOD_DELETETEXT | Base.SC_MOD_BEFOREDELETE
+)
+
 
 def _make_color(color_str):
     """ A function which converts a color string into a QColor.
@@ -149,6 +158,13 @@ class QtScintilla(QtControl, ProxyScintilla):
     #: A reference to the autocomplete API
     qsci_api = Typed(Qsci.QsciAPIs)
 
+    #: The autocomplete API being prepared in the background. It
+    #: replaces the active API when its preparation finishes.
+    pending_api = Typed(Qsci.QsciAPIs)
+
+    #: The file to which the pending API is saved once prepared.
+    _pending_path = Str()
+
     #: A strong reference to the QsciDocument handle.
     qsci_doc = Typed(Qsci.QsciDocument)
 
@@ -158,6 +174,10 @@ class QtScintilla(QtControl, ProxyScintilla):
     #: Marker image to marker ID mapping
     _marker_images = Typed(dict, ())
 
+    #: The (position, length) in bytes and number of characters of the
+    #: text about to be deleted from the document.
+    _deleting = Typed(tuple)
+
     #--------------------------------------------------------------------------
     # Initialization API
     #--------------------------------------------------------------------------
@@ -186,6 +206,7 @@ class QtScintilla(QtControl, ProxyScintilla):
         self.widget.textChanged.connect(self.on_text_changed)
         self.widget.cursorPositionChanged.connect(
             self.on_cursor_position_changed)
+        self.widget.SCN_MODIFIED.connect(self.on_modified)
 
     def destroy(self):
         """ A reimplemented destructor.
@@ -197,6 +218,7 @@ class QtScintilla(QtControl, ProxyScintilla):
         # Clear the strong reference to the document. It must be freed
         # *before* the last widget using it is freed or PyQt segfaults.
         del self.qsci_doc
+        self.cancel_pending_api()
         if self.qsci_api:
             del self.qsci_api
         super(QtScintilla, self).destroy()
@@ -214,6 +236,56 @@ class QtScintilla(QtControl, ProxyScintilla):
 
             self.refresh_line_number_width()
 
+    def on_modified(self, position, mtype, text, length, *args):
+        """ Handle the 'SCN_MODIFIED' notification of the widget.
+
+        The positions of Scintilla are byte offsets in the encoded
+        document, which are converted to character counts over the
+        line of the edit and the edited text only.
+
+        """
+        if not mtype & TEXT_MODIFICATIONS:
+            return
+        d = self.declaration
+        if d is None:
+            return
+        send = self.widget.SendScintilla
+        if mtype & Base.SC_MOD_BEFOREDELETE:
+            removed = send(
+                Base.SCI_COUNTCHARACTERS, position, position + length
+            )
+            self._deleting = (position, length, removed)
+            return
+        if mtype & Base.SC_MOD_INSERTTEXT:
+            removed = 0
+            inserted = self.widget.text(position, position + length)
+        else:
+            deleting = self._deleting
+            self._deleting = None
+            if deleting is not None and deleting[:2] == (position, length):
+                removed = deleting[2]
+            else:
+                removed = length
+            inserted = u''
+        line = send(Base.SCI_LINEFROMPOSITION, position)
+        start = send(Base.SCI_POSITIONFROMLINE, line)
+        column = send(Base.SCI_COUNTCHARACTERS, start, position)
+        d.text_edited(TextDelta(
+            line=line, column=column, removed=removed, inserted=inserted
+        ))
+
+    def on_api_prepared(self):
+        """ Handle the 'apiPreparationFinished' signal of the pending API.
+
+        """
+        api = self.pending_api
+        self.pending_api = None
+        if self._pending_path:
+            if not api.savePrepared(self._pending_path):
+                msg = 'failed to save the prepared autocompletions to "%s"'
+                logger.warn(msg % self._pending_path)
+        self.install_api(api)
+
     def on_cursor_position_changed(self):
         """ Handle the 'cursorPositionChanged' signal on the widget.
 
@@ -323,7 +395,7 @@ class QtScintilla(QtControl, ProxyScintilla):
 
         """
         d = self.declaration
-        if d.autocomplete in ['api', 'all'] and d.autocompletions:
+        if d.autocomplete in ('apis', 'all') and d.autocompletions:
             self.set_autocompletions(d.autocompletions)
 
     def refresh_line_number_width(self):
@@ -336,6 +408,55 @@ class QtScintilla(QtControl, ProxyScintilla):
         if w.marginWidth(NUMBER_MARGIN) > 0:
             w.setMarginWidth(NUMBER_MARGIN, "0"+str(max(10, w.lines())))
 
+    def prepared_api_path(self, options):
+        """ Get the file caching the prepared API of the options.
+
+        The name of the file is a hash of the options, the lexer and
+        the version of QScintilla, which may change the format of the
+        prepared data.
+
+        Returns
+        -------
+        result : str
+            The path of the file, or an empty string if the prepared
+            data is not cached.
+
+        """
+        directory = self.declaration.autocompletions_cache
+        if not directory:
+            return ''
+        lexer = self.widget.lexer()
+        key = hashlib.sha1()
+        key.update(Qsci.QSCINTILLA_VERSION_STR.encode('utf-8'))
+        key.update(b'\0')
+        key.update(type(lexer).__name__.encode('utf-8'))
+        for option in options:
+            key.update(b'\0')
+            key.update(option.encode('utf-8'))
+        return os.path.join(directory, key.hexdigest() + '.pap')
+
+    def install_api(self, api):
+        """ Make an API the active autocomplete API of the widget.
+
+        """
+        lexer = self.widget.lexer()
+        if lexer is not None:
+            lexer.setAPIs(api)
+        if self.qsci_api:
+            self.qsci_api.deleteLater()
+        self.qsci_api = api
+
+    def cancel_pending_api(self):
+        """ Cancel the preparation of the pending API, if any.
+
+        """
+        api = self.pending_api
+        if api:
+            self.pending_api = None
+            api.apiPreparationFinished.disconnect(self.on_api_prepared)
+            api.cancelPreparation()
+            api.deleteLater()
+
     def get_indicator_style_id(self, indicator):
         """ Get the indicator style id for this indicator. The key
         is simply the style and fg color.
@@ -352,6 +473,44 @@ class QtScintilla(QtControl, ProxyScintilla):
             self._indicator_styles[style] = style_id
         return self._indicator_styles[style]
 
+    def get_indicator_runs(self, style_id):
+        """ Get the runs of an indicator style in the document.
+
+        The runs are walked from one end to the next, so the cost does
+        not depend on the length of the document.
+
+        Returns
+        -------
+        result : list
+            The sorted (start, stop) positions of the runs.
+
+        """
+        send = self.widget.SendScintilla
+        length = send(Base.SCI_GETLENGTH)
+        runs = []
+        position = 0
+        while position < length:
+            end = send(Base.SCI_INDICATOREND, style_id, position)
+            if end <= position:
+                break
+            if send(Base.SCI_INDICATORVALUEAT, style_id, position):
+                runs.append((position, end))
+            position = end
+        return runs
+
+    def get_marker_lines(self, marker_id):
+        """ Get the lines holding a marker in the document.
+
+        """
+        send = self.widget.SendScintilla
+        mask = 1 << marker_id
+        lines = []
+        line = send(Base.SCI_MARKERNEXT, 0, mask)
+        while line >= 0:
+            lines.append(line)
+            line = send(Base.SCI_MARKERNEXT, line + 1, mask)
+        return lines
+
     #--------------------------------------------------------------------------
     # ProxyScintilla API
     #--------------------------------------------------------------------------
@@ -369,9 +528,12 @@ class QtScintilla(QtControl, ProxyScintilla):
         """ Set the syntax on the underlying widget.
 
         """
-        # The old lexer will remain as a child unless deleted.
+        # The old lexer will remain as a child unless deleted. The
+        # autocomplete APIs are its children and are deleted with it.
         old = self.widget.lexer()
         if old is not None:
+            self.cancel_pending_api()
+            self.qsci_api = None
             old.deleteLater()
         lexer_cls = LEXERS.get(syntax) or (lambda w: None)
         self.widget.setLexer(lexer_cls(self.widget))
@@ -487,19 +649,44 @@ class QtScintilla(QtControl, ProxyScintilla):
         """ Set the autocompletion options for when the autocompletion mode
         is in 'all' or 'apis'.
 
+        The options are prepared in the background while the previous
+        options remain active. When a cache directory is given, the
+        prepared options are saved to it and loaded from it the next
+        time the same options are used with the same syntax.
+
         """
-        # Delete the old if one exists
-        if self.qsci_api:
-            # Please note that it is not possible to add or remove entries
-            # once you’ve “prepared” so we have to destroy and create
-            # a new provider every time.
-            self.qsci_api.deleteLater()
+        # Please note that it is not possible to add or remove entries
+        # once you’ve “prepared” so we have to create a new provider
+        # every time.
+        self.cancel_pending_api()
+        lexer = self.widget.lexer()
+        # The APIs belong to a lexer, and there are none without one.
+        if lexer is None:
             self.qsci_api = None
+            return
+        api = Qsci.QsciAPIs(lexer)
+        # The new API installs itself on the lexer, so restore the
+        # active one until the new one is ready.
+        if self.qsci_api:
+            lexer.setAPIs(self.qsci_api)
+
+        path = self.prepared_api_path(options)
+        if path and api.isPrepared(path) and api.loadPrepared(path):
+            self.install_api(api)
+            return
 
-        # Add the new options
-        api = self.qsci_api = Qsci.QsciAPIs(self.widget.lexer())
+        if path and not os.path.isdir(os.path.dirname(path)):
+            try:
+                os.makedirs(os.path.dirname(path))
+            except OSError:
+                msg = 'cannot create the autocompletions cache "%s"'
+                logger.warn(msg % os.path.dirname(path))
+                path = ''
         for option in options:
             api.add(option)
+        self.pending_api = api
+        self._pending_path = path
+        api.apiPreparationFinished.connect(self.on_api_prepared)
         api.prepare()
 
     def set_autocompletion_images(self, images):
@@ -524,24 +711,32 @@ class QtScintilla(QtControl, ProxyScintilla):
     def set_markers(self, markers):
         """ Set the markers on the left margin of the widget.
 
-        If the image is not a defined marker, one will be created.
+        If the image is not a defined marker, one will be created. The
+        markers are compared with the ones in the document, which follow
+        their lines as the text is edited, and only the markers which
+        were added or removed are updated.
 
         """
         w = self.widget
+        send = w.SendScintilla
 
-        # Clear markers
-        w.markerDeleteAll()
-
-        # Add the new markers
+        # Define a new marker for each image which has not been seen.
+        wanted = set()
         for m in markers:
-            # Define a new marker with the given image if one has not already
-            # been created.
             if m.image not in self._marker_images:
                 self._marker_images[m.image] = w.markerDefine(
                     get_cached_qimage(m.image))
+            wanted.add((m.line, self._marker_images[m.image]))
+
+        current = set()
+        for marker_id in self._marker_images.values():
+            for line in self.get_marker_lines(marker_id):
+                current.add((line, marker_id))
 
-            # Add the marker
-            w.markerAdd(m.line, self._marker_images[m.image])
+        for line, marker_id in current - wanted:
+            send(Base.SCI_MARKERDELETE, line, marker_id)
+        for line, marker_id in wanted - current:
+            send(Base.SCI_MARKERADD, line, marker_id)
 
     def set_indicators(self, indicators):
         """ Set the indicators of the widget.
@@ -549,23 +744,36 @@ class QtScintilla(QtControl, ProxyScintilla):
         This lets certain text be highlighted or underlined with a given
         style to indicate something (errors) within the editor.
 
+        The ranges of each style are compared with the runs of the style
+        in the document, which follow the text as it is edited, and only
+        the runs which were added or removed are filled or cleared.
+
         """
         w = self.widget
+        send = w.SendScintilla
 
-        # Cleanup old indicators by clearing all indicators in the document
-        # There's no api to do this so clear the entire document range
-        # for each style to ensure a clean state.
-        lines = w.lines()
-        column = w.lineLength(lines)
-        for style_id in self._indicator_styles.values():
-            w.clearIndicatorRange(0, 0, lines, column, style_id)
-
-        # Add new indicators
+        # Collect the wanted ranges of each style as document positions.
+        wanted = {}
         for ind in indicators:
-            l0, c0 = ind.start
-            l1, c1 = ind.stop
-            w.fillIndicatorRange(l0, c0, l1, c1,
-                                 self.get_indicator_style_id(ind))
+            style_id = self.get_indicator_style_id(ind)
+            start = w.positionFromLineIndex(*ind.start)
+            stop = w.positionFromLineIndex(*ind.stop)
+            if stop > start:
+                wanted.setdefault(style_id, []).append((start, stop))
+
+        for style_id in self._indicator_styles.values():
+            runs = merge_ranges(wanted.get(style_id, []))
+            current = self.get_indicator_runs(style_id)
+            if runs == current:
+                continue
+            runs = set(runs)
+            current = set(current)
+            send(Base.SCI_SETINDICATORCURRENT, style_id)
+            # Clear before filling since the runs of a style can overlap.
+            for start, stop in current - runs:
+                send(Base.SCI_INDICATORCLEARRANGE, start, stop - start)
+            for start, stop in runs - current:
+                send(Base.SCI_INDICATORFILLRANGE, start, stop - start)
 
     #--------------------------------------------------------------------------
     # Reimplementations
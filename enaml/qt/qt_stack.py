@@ -9,10 +9,11 @@ from atom.api import Int, IntEnum, Typed
 
 from enaml.widgets.stack import ProxyStack
 
-from .QtCore import QTimer, QEvent, Signal
+from .QtCore import Qt, QTimer, QEvent, QSize, Signal
 from .QtGui import QPixmap
 from .QtWidgets import QStackedWidget
 
+from .q_page_hint_cache import QPageHintCache, smart_minimum_size
 from .q_pixmap_painter import QPixmapPainter
 from .q_pixmap_transition import (
     QDirectedTransition, QSlideTransition, QWipeTransition, QIrisTransition,
@@ -94,14 +95,102 @@ class QStack(QStackedWidget):
 
         """
         super(QStack, self).__init__(*args, **kwargs)
-        self._painter = None
+        self._painter = QPixmapPainter()
         self._transition = None
         self._transition_index = 0
+        self._running_index = 0
         self._size_hint_mode = QStack.Union
+        self._pixmaps = []
+        self._page_hints = QPageHintCache(self)
 
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _takePixmap(self, size):
+        """ Take a pixmap of the given size from the pool.
+
+        Pooled pixmaps of a different size are discarded, since they
+        were made for a previous size of the stack.
+
+        """
+        pixmaps = self._pixmaps
+        while pixmaps:
+            pixmap = pixmaps.pop()
+            if pixmap.size() == size:
+                pixmap.fill(Qt.transparent)
+                return pixmap
+        pixmap = QPixmap(size)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+
+    def _grabPage(self, widget, size):
+        """ Render a page of the stack into a pixmap from the pool.
+
+        A page is always rendered again since the widgets of a hidden
+        page are not notified when their content changes.
+
+        """
+        pixmap = self._takePixmap(size)
+        widget.render(pixmap)
+        return pixmap
+
+    def _pagesHint(self, minimum):
+        """ Compute the size hint of the stack from the cached hints of
+        the pages.
+
+        This mirrors the computation of the QStackedLayout. None is
+        returned if the hint must be computed by the layout.
+
+        """
+        if self.layout().hasHeightForWidth():
+            return None
+        cache = self._page_hints
+        size = QSize(0, 0)
+        for index in range(self.count()):
+            page = self.widget(index)
+            hint, min_hint = cache.hints(page)
+            if minimum:
+                size = size.expandedTo(
+                    smart_minimum_size(hint, min_hint, page)
+                )
+            else:
+                hint = QSize(hint)
+                policy = page.sizePolicy()
+                if policy.horizontalPolicy() == policy.Ignored:
+                    hint.setWidth(0)
+                if policy.verticalPolicy() == policy.Ignored:
+                    hint.setHeight(0)
+                size = size.expandedTo(hint)
+        margins = self.contentsMargins()
+        size += QSize(margins.left() + margins.right(),
+                      margins.top() + margins.bottom())
+        return size
+
+    def _onPixmapUpdated(self):
+        """ A signal handler for the `pixmapUpdated` signal of the
+        transition.
+
+        The output pixmap is handed to the painter directly instead of
+        the copy carried by the signal. A copy kept alive by the painter
+        would force the next frame to detach the output pixmap.
+
+        """
+        transition = self._transition
+        if transition is not None:
+            self._painter.drawPixmap(transition.outPixmap())
+
+    def _resetTransition(self):
+        """ Reset the painter and return the pixmaps to the pool.
+
+        """
+        self._painter.setTargetWidget(None)
+        transition = self._transition
+        if transition is not None:
+            pixmaps = (transition.startPixmap(), transition.endPixmap(),
+                       transition.outPixmap())
+            transition.setPixmaps(None, None, None)
+            self._pixmaps.extend(p for p in pixmaps if p is not None)
+
     def _onTransitionFinished(self):
         """ A signal handler for the `finished` signal of the transition.
 
@@ -109,10 +198,7 @@ class QStack(QStackedWidget):
         index change for the stacked widget.
 
         """
-        painter = self._painter
-        if painter is not None:
-            painter.setTargetWidget(None)
-        self._painter = None
+        self._resetTransition()
         self.setCurrentIndex(self._transition_index)
         # This final show() makes sure the underlyling widget is visible.
         # If transitions are being fired rapidly, it's possible that the
@@ -144,6 +230,18 @@ class QStack(QStackedWidget):
             self.setCurrentIndex(to_index)
             return
 
+        # A transition requested while another one is running completes
+        # the running one at once, so its pixmaps can be reused.
+        if transition.state() == transition.Running:
+            transition.stop()
+            self._resetTransition()
+            self.setCurrentIndex(self._running_index)
+            self.currentWidget().show()
+            from_index = self.currentIndex()
+            if from_index == to_index:
+                return
+        self._running_index = to_index
+
         # Otherwise, grab the pixmaps for the start and ending states
         # and set them on the transtion. The widgets are resized to the
         # current size so that the pixmaps are grabbed in a good state.
@@ -152,9 +250,9 @@ class QStack(QStackedWidget):
         size = self.size()
         src_widget.resize(size)
         dst_widget.resize(size)
-        src_pixmap = QPixmap.grabWidget(src_widget)
-        dst_pixmap = QPixmap.grabWidget(dst_widget)
-        out_pixmap = QPixmap(size)
+        src_pixmap = self._grabPage(src_widget, size)
+        dst_pixmap = self._grabPage(dst_widget, size)
+        out_pixmap = self._takePixmap(size)
         transition.setPixmaps(src_pixmap, dst_pixmap, out_pixmap)
 
         # Hide both of the constituent widgets so that the painter has
@@ -163,9 +261,7 @@ class QStack(QStackedWidget):
         dst_widget.setVisible(False)
 
         # Hookup the pixmap painter and start the transition.
-        painter = self._painter = QPixmapPainter()
-        painter.setTargetWidget(self)
-        transition.pixmapUpdated.connect(painter.drawPixmap)
+        self._painter.setTargetWidget(self)
         transition.start()
 
     #--------------------------------------------------------------------------
@@ -179,23 +275,38 @@ class QStack(QStackedWidget):
         consumer of this widget to update their external layout.
 
         """
+        if event.type() == QEvent.LayoutRequest:
+            self._page_hints.invalidateUnmanaged()
         res = super(QStack, self).event(event)
         if event.type() == QEvent.LayoutRequest:
             self.layoutRequested.emit()
+        elif event.type() == QEvent.ChildRemoved:
+            self._page_hints.release(event.child())
         return res
 
+    def clearPixmaps(self):
+        """ Clear the pooled pixmaps of the transitions.
+
+        """
+        del self._pixmaps[:]
+
     def sizeHint(self):
         """ A reimplemented size hint handler.
 
         This method will compute the size hint based on the size hint
         of the current tab, instead of the default behavior which is
-        the maximum of all the size hints of the tabs.
+        the maximum of all the size hints of the tabs. The size hints
+        of the pages are cached until a page is relaid out.
 
         """
         if self._size_hint_mode == QStack.Current:
             curr = self.currentWidget()
             if curr is not None:
-                return curr.sizeHint()
+                return QSize(self._page_hints.hints(curr)[0])
+        else:
+            hint = self._pagesHint(False)
+            if hint is not None:
+                return hint
         return super(QStack, self).sizeHint()
 
     def minimumSizeHint(self):
@@ -203,13 +314,18 @@ class QStack(QStackedWidget):
 
         This method will compute the size hint based on the size hint
         of the current tab, instead of the default behavior which is
-        the maximum of all the minimum size hints of the tabs.
+        the maximum of all the minimum size hints of the tabs. The size
+        hints of the pages are cached until a page is relaid out.
 
         """
         if self._size_hint_mode == QStack.Current:
             curr = self.currentWidget()
             if curr is not None:
-                return curr.minimumSizeHint()
+                return QSize(self._page_hints.hints(curr)[1])
+        else:
+            hint = self._pagesHint(True)
+            if hint is not None:
+                return hint
         return super(QStack, self).minimumSizeHint()
 
     def sizeHintMode(self):
@@ -260,9 +376,11 @@ class QStack(QStackedWidget):
         old = self._transition
         if old is not None:
             old.finished.disconnect(self._onTransitionFinished)
+            old.pixmapUpdated.disconnect(self._onPixmapUpdated)
         self._transition = transition
         if transition is not None:
             transition.finished.connect(self._onTransitionFinished)
+            transition.pixmapUpdated.connect(self._onPixmapUpdated)
 
     def transitionTo(self, index):
         """ Transition the stack widget to the given index.
@@ -363,6 +481,25 @@ class QtStack(QtConstraintsWidget, ProxyStack):
                 if child is dchild:
                     self.widget.insertWidget(index, child.widget)
 
+    def children_added(self, children):
+        """ Handle the children added event for a QtStack.
+
+        The new stack items are inserted in a single pass over the
+        children, with the updates of the widget disabled.
+
+        """
+        items = set(c for c in children if isinstance(c, QtStackItem))
+        with self.updates_disabled():
+            super(QtStack, self).children_added(
+                [c for c in children if c not in items]
+            )
+            if items:
+                widget = self.widget
+                for index, dchild in enumerate(self.children()):
+                    if dchild in items:
+                        super(QtStack, self).child_added(dchild)
+                        widget.insertWidget(index, dchild.widget)
+
     def child_removed(self, child):
         """ Handle the child removed event for a QtStack.
 
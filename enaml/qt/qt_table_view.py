@@ -0,0 +1,145 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Typed
+
+from enaml.widgets.table_view import ProxyTableView
+
+from .QtWidgets import QAbstractItemView, QHeaderView, QTableView
+
+from .q_provider_models import QTableProviderModel
+from .qt_control import QtControl
+
+
+class QtTableView(QtControl, ProxyTableView):
+    """ A Qt implementation of an Enaml ProxyTableView.
+
+    """
+    #: A reference to the widget created by the proxy.
+    widget = Typed(QTableView)
+
+    #: The model displaying the data of the provider.
+    model = Typed(QTableProviderModel)
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def create_widget(self):
+        """ Create the underlying table view widget.
+
+        """
+        widget = QTableView(self.parent_widget())
+        widget.setSelectionBehavior(QAbstractItemView.SelectRows)
+        widget.setWordWrap(False)
+        # Fixed row heights spare the header from measuring the rows.
+        widget.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.model = QTableProviderModel(widget)
+        widget.setModel(self.model)
+        self.widget = widget
+
+    def init_widget(self):
+        """ Initialize the underlying widget.
+
+        """
+        super(QtTableView, self).init_widget()
+        d = self.declaration
+        self.set_provider(d.provider)
+        self.set_show_grid(d.show_grid)
+        self.set_alternating_row_colors(d.alternating_row_colors)
+        self.set_show_horizontal_header(d.show_horizontal_header)
+        self.set_show_vertical_header(d.show_vertical_header)
+        self.set_row_height(d.row_height)
+        widget = self.widget
+        widget.selectionModel().currentChanged.connect(self.on_current_changed)
+        widget.activated.connect(self.on_activated)
+        # The current index is silently moved when rows are inserted or
+        # removed, and reset when its row is removed.
+        self.model.rowsInserted.connect(self.on_rows_changed)
+        self.model.rowsRemoved.connect(self.on_rows_changed)
+        self.model.modelReset.connect(self.on_rows_changed)
+
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        This stops the model from observing the provider.
+
+        """
+        self.model.setProvider(None)
+        super(QtTableView, self).destroy()
+
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def on_current_changed(self, current, previous):
+        """ The signal handler for the current changed signal.
+
+        """
+        d = self.declaration
+        d.current_row = current.row()
+        d.current_column = current.column()
+
+    def on_rows_changed(self, *args):
+        """ The signal handler for the insertion, removal and reset of
+        the rows.
+
+        """
+        self.on_current_changed(self.widget.currentIndex(), None)
+
+    def on_activated(self, index):
+        """ The signal handler for the activated signal.
+
+        """
+        self.declaration.activated((index.row(), index.column()))
+
+    #--------------------------------------------------------------------------
+    # ProxyTableView API
+    #--------------------------------------------------------------------------
+    def set_provider(self, provider):
+        """ Set the provider of the data of the table.
+
+        """
+        self.model.setProvider(provider)
+
+    def set_show_grid(self, show):
+        """ Set whether the grid lines are shown.
+
+        """
+        self.widget.setShowGrid(show)
+
+    def set_alternating_row_colors(self, alternate):
+        """ Set whether the background of the rows alternates.
+
+        """
+        self.widget.setAlternatingRowColors(alternate)
+
+    def set_show_horizontal_header(self, show):
+        """ Set whether the header of the columns is shown.
+
+        """
+        self.widget.horizontalHeader().setVisible(show)
+
+    def set_show_vertical_header(self, show):
+        """ Set whether the header of the rows is shown.
+
+        """
+        self.widget.verticalHeader().setVisible(show)
+
+    def set_row_height(self, height):
+        """ Set the height of the rows.
+
+        """
+        header = self.widget.verticalHeader()
+        if height < 0:
+            header.resetDefaultSectionSize()
+        else:
+            header.setDefaultSectionSize(height)
+
+    def scroll_to(self, row, column):
+        """ Scroll the view so that a cell is visible.
+
+        """
+        self.widget.scrollTo(self.model.index(row, column))
@@ -0,0 +1,114 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Typed
+
+from enaml.widgets.tree_view import ProxyTreeView
+
+from .QtWidgets import QTreeView
+
+from .q_provider_models import QTreeProviderModel
+from .qt_control import QtControl
+
+
+class QtTreeView(QtControl, ProxyTreeView):
+    """ A Qt implementation of an Enaml ProxyTreeView.
+
+    """
+    #: A reference to the widget created by the proxy.
+    widget = Typed(QTreeView)
+
+    #: The model displaying the data of the provider.
+    model = Typed(QTreeProviderModel)
+
+    #--------------------------------------------------------------------------
+    # Initialization API
+    #--------------------------------------------------------------------------
+    def create_widget(self):
+        """ Create the underlying tree view widget.
+
+        """
+        widget = QTreeView(self.parent_widget())
+        widget.setWordWrap(False)
+        self.model = QTreeProviderModel(widget)
+        widget.setModel(self.model)
+        self.widget = widget
+
+    def init_widget(self):
+        """ Initialize the underlying widget.
+
+        """
+        super(QtTreeView, self).init_widget()
+        d = self.declaration
+        self.set_provider(d.provider)
+        self.set_alternating_row_colors(d.alternating_row_colors)
+        self.set_show_header(d.show_header)
+        self.set_uniform_row_heights(d.uniform_row_heights)
+        widget = self.widget
+        widget.selectionModel().currentChanged.connect(self.on_current_changed)
+        widget.activated.connect(self.on_activated)
+        # The current index is silently reset when its row is removed.
+        self.model.rowsRemoved.connect(self.on_rows_changed)
+        self.model.modelReset.connect(self.on_rows_changed)
+
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        This stops the model from observing the provider.
+
+        """
+        self.model.setProvider(None)
+        super(QtTreeView, self).destroy()
+
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def on_current_changed(self, current, previous):
+        """ The signal handler for the current changed signal.
+
+        """
+        self.declaration.current_node = self.model.nodeAt(current)
+
+    def on_rows_changed(self, *args):
+        """ The signal handler for the removal and reset of the rows.
+
+        """
+        self.on_current_changed(self.widget.currentIndex(), None)
+
+    def on_activated(self, index):
+        """ The signal handler for the activated signal.
+
+        """
+        node = self.model.nodeAt(index)
+        self.declaration.activated((node, index.column()))
+
+    #--------------------------------------------------------------------------
+    # ProxyTreeView API
+    #--------------------------------------------------------------------------
+    def set_provider(self, provider):
+        """ Set the provider of the data of the tree.
+
+        """
+        self.model.setProvider(provider)
+
+    def set_alternating_row_colors(self, alternate):
+        """ Set whether the background of the rows alternates.
+
+        """
+        self.widget.setAlternatingRowColors(alternate)
+
+    def set_show_header(self, show):
+        """ Set whether the header of the columns is shown.
+
+        """
+        self.widget.setHeaderHidden(not show)
+
+    def set_uniform_row_heights(self, uniform):
+        """ Set whether all the rows have the same height.
+
+        """
+        self.widget.setUniformRowHeights(uniform)
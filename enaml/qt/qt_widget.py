@@ -5,6 +5,8 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
+from contextlib import contextmanager
+
 from atom.api import Typed, Coerced
 
 from enaml.drag_drop import DropAction
@@ -100,6 +102,19 @@ class QtWidget(QtToolkitObject, ProxyWidget):
         # the QWidgetAction is dropped.
         del self._widget_action
 
+    #--------------------------------------------------------------------------
+    # Child Events
+    #--------------------------------------------------------------------------
+    def children_added(self, children):
+        """ Handle the children added event.
+
+        The updates of the widget are disabled while the children are
+        added, so that the widget is repainted once for the batch.
+
+        """
+        with self.updates_disabled():
+            super(QtWidget, self).children_added(children)
+
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
@@ -118,6 +133,8 @@ class QtWidget(QtToolkitObject, ProxyWidget):
             self.hook_drag()
         if features & Feature.DropEnabled:
             self.hook_drop()
+        if features & Feature.VisibilityEvents:
+            self.hook_visibility_events()
 
     def _teardown_features(self):
         """ Teardowns the advanced widget feature handlers.
@@ -134,10 +151,30 @@ class QtWidget(QtToolkitObject, ProxyWidget):
             self.unhook_drag()
         if features & Feature.DropEnabled:
             self.unhook_drop()
+        if features & Feature.VisibilityEvents:
+            self.unhook_visibility_events()
 
     #--------------------------------------------------------------------------
     # Protected API
     #--------------------------------------------------------------------------
+    @contextmanager
+    def updates_disabled(self):
+        """ A context manager which disables the updates of the widget.
+
+        The updates are enabled again on exit, unless they were already
+        disabled on entry, such as by a pending relayout.
+
+        """
+        widget = self.widget
+        if widget is None or not widget.updatesEnabled():
+            yield
+            return
+        widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            widget.setUpdatesEnabled(True)
+
     def refresh_style_sheet(self):
         """ Refresh the widget style sheet with the current style data.
 
@@ -227,6 +264,26 @@ class QtWidget(QtToolkitObject, ProxyWidget):
         del widget.focusInEvent
         del widget.focusOutEvent
 
+    def hook_visibility_events(self):
+        """ Install the hooks for visibility events.
+
+        This method may be overridden by subclasses as needed.
+
+        """
+        widget = self.widget
+        widget.showEvent = self.showEvent
+        widget.hideEvent = self.hideEvent
+
+    def unhook_visibility_events(self):
+        """ Remove the hooks for the visibility events.
+
+        This method may be overridden by subclasses as needed.
+
+        """
+        widget = self.widget
+        del widget.showEvent
+        del widget.hideEvent
+
     def focusNextPrevChild(self, next_child):
         """ The default 'focusNextPrevChild' implementation.
 
@@ -259,6 +316,26 @@ class QtWidget(QtToolkitObject, ProxyWidget):
         type(widget).focusOutEvent(widget, event)
         self.declaration.focus_lost()
 
+    def showEvent(self, event):
+        """ The default 'showEvent' implementation.
+
+        """
+        widget = self.widget
+        type(widget).showEvent(widget, event)
+        # Spontaneous events are sent by the window system when a
+        # toplevel window is restored, and are not a visibility change.
+        if not event.spontaneous():
+            self.declaration.visibility_changed(True)
+
+    def hideEvent(self, event):
+        """ The default 'hideEvent' implementation.
+
+        """
+        widget = self.widget
+        type(widget).hideEvent(widget, event)
+        if not event.spontaneous():
+            self.declaration.visibility_changed(False)
+
     def hook_drag(self):
         """ Install the hooks for drag operations.
 
@@ -0,0 +1,33 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+
+
+def merge_ranges(ranges):
+    """ Merge overlapping and adjacent ranges into sorted runs.
+
+    This gives the runs an indicator has once the ranges are filled.
+
+    Parameters
+    ----------
+    ranges : iterable
+        The (start, stop) ranges, in any order.
+
+    Returns
+    -------
+    result : list
+        The sorted (start, stop) runs covering the ranges.
+
+    """
+    runs = []
+    for start, stop in sorted(ranges):
+        if runs and start <= runs[-1][1]:
+            if stop > runs[-1][1]:
+                runs[-1] = (runs[-1][0], stop)
+        else:
+            runs.append((start, stop))
+    return runs
@@ -14,6 +14,7 @@ from atom.api import (
 from enaml.image import Image
 from enaml.core.declarative import d_
 from enaml.widgets.control import Control, ProxyControl
+from enaml.widgets.text_delta import TextDelta
 
 
 #: The available syntaxes for the Scintilla widget.
@@ -158,6 +159,14 @@ class Scintilla(Control):
     #: "autocompletion_images" settings key.
     autocompletions = d_(List(str))
 
+    #: A directory in which the prepared autocompletions are cached.
+    #: Preparing many autocompletions takes a while, so the prepared
+    #: data is saved to a file named after a hash of the options and
+    #: the syntax, and loaded from it the next time they are used. The
+    #: prepared data is not cached when the directory is empty. The
+    #: directory is read the next time the autocompletions are set.
+    autocompletions_cache = d_(Str())
+
     #: Position of the cursor within the editor in the format (line, column)
     #: This is needed for autocompletion engines to determine the current text
     cursor_position = d_(Tuple(int, default=(0, 0)), writable=False)
@@ -186,6 +195,12 @@ class Scintilla(Control):
     #: An event emitted when the text is changed.
     text_changed = d_(Event(), writable=False)
 
+    #: An event emitted with a TextDelta for each edit of the document,
+    #: so that a model of the text can be updated without copying the
+    #: whole document on every change. The event is not emitted when
+    #: the document is swapped.
+    text_edited = d_(Event(TextDelta), writable=False)
+
     #: Text Editors expand freely in height and width by default.
     hug_width = set_default('ignore')
     hug_height = set_default('ignore')
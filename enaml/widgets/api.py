@@ -13,6 +13,7 @@ from .check_box import CheckBox
 from .color_dialog import ColorDialog
 from .combo_box import ComboBox
 from .container import Container
+from .data_providers import ColumnTableProvider, TableProvider, TreeProvider
 from .date_selector import DateSelector
 from .datetime_selector import DatetimeSelector
 from .dialog import Dialog
@@ -34,6 +35,7 @@ from .html import Html
 from .image_view import ImageView
 from .ipython_console import IPythonConsole
 from .label import Label
+from .lazy_content import LazyContent
 from .main_window import MainWindow
 from .mdi_area import MdiArea
 from .mdi_window import MdiWindow
@@ -59,11 +61,14 @@ from .stack import Stack, Transition
 from .stack_item import StackItem
 from .status_bar import StatusBar
 from .status_item import StatusItem
+from .table_view import TableView
 from .time_selector import TimeSelector
 from .timer import Timer
 from .tool_bar import ToolBar
 from .tool_button import ToolButton
+from .tree_view import TreeView
 from .v_group import VGroup
+from .virtual_looper import VirtualLooper
 from .vtk_canvas import VTKCanvas
 from .web_view import WebView
 from .widget import Feature
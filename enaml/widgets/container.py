@@ -93,11 +93,23 @@ class Container(Frame, ContentsConstrainableMixin):
 
         """
         # Request the relayout first so that the widget's updates are
-        # disabled before the child is actually added.
-        if isinstance(child, ConstraintsWidget):
+        # disabled before the child is actually added. A batch of
+        # children requests a single relayout in `children_added`.
+        if isinstance(child, ConstraintsWidget) and self._proxy_batch is None:
             self.request_relayout()
         super(Container, self).child_added(child)
 
+    def children_added(self, children):
+        """ Handle the children added event on the container.
+
+        This event handler will request a single relayout if any of the
+        added children is an instance of 'ConstraintsWidget'.
+
+        """
+        if any(isinstance(child, ConstraintsWidget) for child in children):
+            self.request_relayout()
+        super(Container, self).children_added(children)
+
     def child_moved(self, child):
         """ Handle the child moved event on the container.
 
@@ -0,0 +1,323 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Atom, Event, List, Str
+
+
+def to_list(values):
+    """ Convert a slice of a column to a list of Python values.
+
+    NumPy arrays are converted with their `tolist` method, so that the
+    values are Python scalars.
+
+    """
+    tolist = getattr(values, 'tolist', None)
+    if tolist is not None:
+        return tolist()
+    return list(values)
+
+
+class TableProvider(Atom):
+    """ The base class of the providers of the data of a TableView.
+
+    A provider gives access to the cells of a table by ranges, so that
+    a view only fetches the cells it displays, whatever the size of the
+    table. Subclasses must implement `row_count`, `column_count` and
+    `fetch`, and call the `notify_*` methods when their data changes.
+    The methods are called and the notifications must be emitted on the
+    main thread.
+
+    """
+    #: An event emitted with a (first_row, last_row, first_column,
+    #: last_column) tuple when the values of a range of cells changed.
+    #: The last row and last column are excluded from the range.
+    cells_changed = Event(tuple)
+
+    #: An event emitted with a (start, count) tuple when rows have been
+    #: inserted in the table.
+    rows_inserted = Event(tuple)
+
+    #: An event emitted with a (start, count) tuple when rows have been
+    #: removed from the table.
+    rows_removed = Event(tuple)
+
+    #: An event emitted when the whole table changed, including its
+    #: number of columns.
+    reset = Event()
+
+    def row_count(self):
+        """ Get the number of rows of the table.
+
+        """
+        raise NotImplementedError
+
+    def column_count(self):
+        """ Get the number of columns of the table.
+
+        """
+        raise NotImplementedError
+
+    def fetch(self, first_row, last_row, first_column, last_column):
+        """ Get the values of a range of cells.
+
+        Parameters
+        ----------
+        first_row : int
+            The index of the first row of the range.
+
+        last_row : int
+            The index following the last row of the range.
+
+        first_column : int
+            The index of the first column of the range.
+
+        last_column : int
+            The index following the last column of the range.
+
+        Returns
+        -------
+        result : sequence
+            A sequence with a sequence of values for each row of the
+            range. Strings and numbers are displayed as is, and other
+            values are converted to strings.
+
+        """
+        raise NotImplementedError
+
+    def column_header(self, column):
+        """ Get the header of a column.
+
+        The default implementation returns the index of the column.
+
+        """
+        return str(column)
+
+    def row_header(self, row):
+        """ Get the header of a row.
+
+        The default implementation returns the index of the row.
+
+        """
+        return str(row)
+
+    def notify_changed(self, first_row, last_row, first_column=0,
+                       last_column=None):
+        """ Notify the views that the values of a range of cells changed.
+
+        Parameters
+        ----------
+        first_row : int
+            The index of the first changed row.
+
+        last_row : int
+            The index following the last changed row.
+
+        first_column : int, optional
+            The index of the first changed column. The default is 0.
+
+        last_column : int, optional
+            The index following the last changed column. The default is
+            the number of columns.
+
+        """
+        if last_column is None:
+            last_column = self.column_count()
+        self.cells_changed((first_row, last_row, first_column, last_column))
+
+    def notify_inserted(self, start, count):
+        """ Notify the views that rows have been inserted.
+
+        """
+        self.rows_inserted((start, count))
+
+    def notify_removed(self, start, count):
+        """ Notify the views that rows have been removed.
+
+        """
+        self.rows_removed((start, count))
+
+    def notify_reset(self):
+        """ Notify the views that the whole table changed.
+
+        """
+        self.reset()
+
+
+class ColumnTableProvider(TableProvider):
+    """ A table provider which displays a list of columns.
+
+    Each column is a sequence which supports slicing, such as a list or
+    a one dimensional NumPy array, and the number of rows is the length
+    of the shortest column. A range of cells is fetched by slicing the
+    columns, so that the cost of displaying a table does not depend on
+    its number of rows.
+
+    The table is reset when the list of columns is replaced. The values
+    of the columns can be changed in place as long as the views are
+    notified with `notify_changed`.
+
+    """
+    #: The columns of the table.
+    columns = List()
+
+    #: The headers of the columns. The index of a column is used when
+    #: it has no header.
+    headers = List(Str())
+
+    def row_count(self):
+        """ Get the length of the shortest column.
+
+        """
+        columns = self.columns
+        if not columns:
+            return 0
+        return min(len(column) for column in columns)
+
+    def column_count(self):
+        """ Get the number of columns.
+
+        """
+        return len(self.columns)
+
+    def fetch(self, first_row, last_row, first_column, last_column):
+        """ Get the values of a range of cells from the columns.
+
+        """
+        columns = self.columns[first_column:last_column]
+        values = [to_list(column[first_row:last_row]) for column in columns]
+        return list(zip(*values))
+
+    def column_header(self, column):
+        """ Get the header of a column.
+
+        """
+        headers = self.headers
+        if column < len(headers):
+            return headers[column]
+        return str(column)
+
+    def _observe_columns(self, change):
+        """ Reset the table when the columns are replaced.
+
+        """
+        if change['type'] == 'update':
+            self.notify_reset()
+
+    _observe_headers = _observe_columns
+
+
+class TreeProvider(Atom):
+    """ The base class of the providers of the data of a TreeView.
+
+    The nodes of the tree are arbitrary hashable objects, which must be
+    unique in the tree. The root of the tree is represented by None. A
+    view fetches the children of a node by ranges, and only when the
+    node is expanded. Subclasses must implement `column_count`,
+    `child_count`, `children` and `fetch`, and call the `notify_*`
+    methods when their data changes. The methods are called and the
+    notifications must be emitted on the main thread.
+
+    """
+    #: An event emitted with a node, or None for the root, when the
+    #: children of the node changed.
+    children_changed = Event()
+
+    #: An event emitted with a node when its values changed.
+    node_changed = Event()
+
+    #: An event emitted when the whole tree changed, including its
+    #: number of columns.
+    reset = Event()
+
+    def column_count(self):
+        """ Get the number of columns of the tree.
+
+        """
+        raise NotImplementedError
+
+    def child_count(self, node):
+        """ Get the number of children of a node.
+
+        Parameters
+        ----------
+        node : object
+            The parent node, or None for the root of the tree.
+
+        """
+        raise NotImplementedError
+
+    def has_children(self, node):
+        """ Get whether a node has children.
+
+        This is called for every displayed node to decide whether it
+        can be expanded. The default implementation counts the children
+        of the node and should be reimplemented when counting them is
+        expensive.
+
+        """
+        return self.child_count(node) > 0
+
+    def children(self, node, start, stop):
+        """ Get a range of the children of a node.
+
+        Parameters
+        ----------
+        node : object
+            The parent node, or None for the root of the tree.
+
+        start : int
+            The index of the first child of the range.
+
+        stop : int
+            The index following the last child of the range.
+
+        Returns
+        -------
+        result : sequence
+            The children of the node in the range.
+
+        """
+        raise NotImplementedError
+
+    def fetch(self, node):
+        """ Get the values of a node.
+
+        Returns
+        -------
+        result : sequence
+            The value of the node for each column. Strings and numbers
+            are displayed as is, and other values are converted to
+            strings.
+
+        """
+        raise NotImplementedError
+
+    def column_header(self, column):
+        """ Get the header of a column.
+
+        The default implementation returns the index of the column.
+
+        """
+        return str(column)
+
+    def notify_children_changed(self, node=None):
+        """ Notify the views that the children of a node changed.
+
+        """
+        self.children_changed(node)
+
+    def notify_node_changed(self, node):
+        """ Notify the views that the values of a node changed.
+
+        """
+        self.node_changed(node)
+
+    def notify_reset(self):
+        """ Notify the views that the whole tree changed.
+
+        """
+        self.reset()
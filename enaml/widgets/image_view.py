@@ -23,6 +23,9 @@ class ProxyImageView(ProxyControl):
     def set_image(self, image):
         raise NotImplementedError
 
+    def update_image(self):
+        raise NotImplementedError
+
     def set_scale_to_fit(self, scale):
         raise NotImplementedError
 
@@ -61,6 +64,19 @@ class ImageView(Control):
     #: A reference to the ProxyImageView object.
     proxy = Typed(ProxyImageView)
 
+    def update_image(self):
+        """ Refresh the view after the data of the image was modified.
+
+        This allows displaying live frames without creating an Image per
+        frame: the pixels are written in place into the buffer given as
+        the data of a raw image, and this method is called afterwards.
+        The refreshes of the view are throttled to the refresh rate of
+        the display. This method must be called from the gui thread.
+
+        """
+        if self.proxy_is_active:
+            self.proxy.update_image()
+
     def layout_constraints(self):
         """Add constraints to preserve the aspect ratio.
 
@@ -0,0 +1,186 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Bool, Coerced, Float, Int, List, Typed
+
+from enaml.application import timed_call
+from enaml.core.compiler_nodes import new_scope
+from enaml.core.declarative import d_
+from enaml.core.pattern import Pattern
+from enaml.layout.geometry import Size
+
+from .container import Container
+from .widget import Feature, Widget
+
+
+class LazyContent(Pattern):
+    """ A pattern which creates its children when its parent is shown.
+
+    A LazyContent is used as the child of a widget which displays a
+    single Container, such as a DockItem or a Page, to wrap the content
+    of the widget. The content is created, initialized and activated
+    the first time the parent widget is shown on the screen. Until then
+    an empty placeholder Container is used in its place.
+
+    The content can optionally be destroyed once the parent widget has
+    been hidden for some time, in which case it is created again the
+    next time the parent widget is shown.
+
+    The VisibilityEvents feature is enabled on the parent widget when
+    the pattern is initialized, so the pattern must be a child of the
+    widget before the widget is activated.
+
+    """
+    #: The minimum size of the placeholder Container used in place of
+    #: the content until it is loaded. A negative value leaves the
+    #: corresponding dimension unconstrained.
+    placeholder_size = d_(Coerced(Size, (-1, -1)))
+
+    #: The delay, in seconds, after which the content is destroyed once
+    #: the parent widget has been hidden. A negative value means that
+    #: the content is never destroyed.
+    unload_delay = d_(Float(-1.0))
+
+    #: Whether or not the content is currently loaded.
+    loaded = d_(Bool(False), writable=False)
+
+    #: The list of items created by the pattern. This list should not
+    #: be manipulated directly by user code.
+    items = List()
+
+    #: The placeholder Container used while the content is not loaded.
+    placeholder = Typed(Container)
+
+    #--------------------------------------------------------------------------
+    # Lifetime API
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ A reimplemented initialization method.
+
+        """
+        parent = self.parent
+        if not isinstance(parent, Widget):
+            msg = "the parent of a LazyContent must be a Widget, not '%s'"
+            raise TypeError(msg % type(parent).__name__)
+        parent.features |= Feature.VisibilityEvents
+        super(LazyContent, self).initialize()
+        parent.observe('visibility_changed', self._on_visibility_changed)
+
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        The pattern will release the owned items on destruction.
+
+        """
+        parent = self.parent
+        if parent is not None:
+            parent.unobserve('visibility_changed',
+                             self._on_visibility_changed)
+        super(LazyContent, self).destroy()
+        del self.items
+        del self.placeholder
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def load(self):
+        """ Create the content, if it is not already loaded.
+
+        """
+        self._unload_token += 1
+        if not self.loaded and self.is_initialized:
+            self.loaded = True
+            self.refresh_items()
+
+    def unload(self):
+        """ Destroy the content and restore the placeholder.
+
+        """
+        self._unload_token += 1
+        if self.loaded:
+            self.loaded = False
+            self.refresh_items()
+
+    #--------------------------------------------------------------------------
+    # Pattern API
+    #--------------------------------------------------------------------------
+    def pattern_items(self):
+        """ Get a list of items created by the pattern.
+
+        """
+        items = self.items[:]
+        if self.placeholder is not None:
+            items.append(self.placeholder)
+        return items
+
+    def refresh_items(self):
+        """ Refresh the items of the pattern.
+
+        This method destroys the old items and creates either the
+        content or the placeholder, depending on the loaded state.
+
+        """
+        items = []
+        placeholder = None
+        if self.loaded:
+            for nodes, key, f_locals in self.pattern_nodes:
+                with new_scope(key, f_locals):
+                    for node in nodes:
+                        child = node(None)
+                        if isinstance(child, list):
+                            items.extend(child)
+                        else:
+                            items.append(child)
+        else:
+            placeholder = self._create_placeholder()
+
+        for old in self.pattern_items():
+            if not old.is_destroyed:
+                old.destroy()
+
+        self.items = items
+        self.placeholder = placeholder
+        self.parent.insert_children(self, self.pattern_items())
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    #: A counter used to invalidate the pending unload requests.
+    _unload_token = Int()
+
+    def _create_placeholder(self):
+        """ Create the placeholder Container for the content.
+
+        """
+        placeholder = Container()
+        width, height = self.placeholder_size
+        constraints = []
+        if width >= 0:
+            constraints.append(placeholder.width >= width)
+        if height >= 0:
+            constraints.append(placeholder.height >= height)
+        placeholder.constraints = constraints
+        return placeholder
+
+    def _on_visibility_changed(self, change):
+        """ Handle the visibility changes of the parent widget.
+
+        """
+        if change['value']:
+            self.load()
+        elif self.loaded and self.unload_delay >= 0:
+            self._unload_token += 1
+            ms = int(self.unload_delay * 1000)
+            timed_call(ms, self._unload_hidden, self._unload_token)
+
+    def _unload_hidden(self, token):
+        """ Unload the content if it has stayed hidden since the given
+        unload request.
+
+        """
+        if token == self._unload_token and not self.is_destroyed:
+            self.unload()
@@ -5,7 +5,9 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Typed, ForwardTyped, Bool, observe, set_default
+from atom.api import (
+    Typed, ForwardTyped, Bool, Float, List, observe, set_default
+)
 
 from enaml.core.declarative import d_
 
@@ -32,6 +34,18 @@ class ProxyMPLCanvas(ProxyControl):
     def set_toolbar_visible(self, visible):
         raise NotImplementedError
 
+    def set_live_update(self, live):
+        raise NotImplementedError
+
+    def set_max_frame_rate(self, rate):
+        raise NotImplementedError
+
+    def set_animated_artists(self, artists):
+        raise NotImplementedError
+
+    def request_draw(self):
+        raise NotImplementedError
+
 
 class MPLCanvas(Control):
     """ A control which can be used to embded a matplotlib figure.
@@ -43,6 +57,22 @@ class MPLCanvas(Control):
     #: Whether or not the matplotlib figure toolbar is visible.
     toolbar_visible = d_(Bool(False))
 
+    #: Whether the canvas is in live update mode. In this mode the
+    #: canvas widget is reused when the figure changes, instead of
+    #: being created anew, which suits figures replaced at a high rate.
+    live_update = d_(Bool(False))
+
+    #: The maximum number of redraws per second performed for the
+    #: calls to `request_draw`. The requests made in between are
+    #: coalesced into a single redraw.
+    max_frame_rate = d_(Float(30.0))
+
+    #: The artists redrawn by blitting. They are marked as animated, so
+    #: that they are left out of the full redraws of the figure, and a
+    #: request to draw only redraws them over a cached background of
+    #: the figure. The artists must belong to the displayed figure.
+    animated_artists = d_(List())
+
     #: Matplotlib figures expand freely in height and width by default.
     hug_width = set_default('ignore')
     hug_height = set_default('ignore')
@@ -50,10 +80,29 @@ class MPLCanvas(Control):
     #: A reference to the ProxyMPLCanvas object.
     proxy = Typed(ProxyMPLCanvas)
 
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def request_draw(self):
+        """ Request a redraw of the figure after its artists changed.
+
+        The first request is drawn immediately and the requests which
+        follow it during the next frame interval, as given by the
+        `max_frame_rate`, are coalesced into a single redraw at the end
+        of the interval. When animated artists are registered, only
+        they are redrawn, over the cached background of the figure.
+        Otherwise the whole figure is redrawn when the event loop is
+        idle. This method must be called from the gui thread.
+
+        """
+        if self.proxy_is_active:
+            self.proxy.request_draw()
+
     #--------------------------------------------------------------------------
     # Observers
     #--------------------------------------------------------------------------
-    @observe('figure', 'toolbar_visible')
+    @observe('figure', 'toolbar_visible', 'live_update', 'max_frame_rate',
+             'animated_artists')
     def _update_proxy(self, change):
         """ An observer which sends state change to the proxy.
 
@@ -5,11 +5,14 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Bool, Typed, ForwardTyped, Str, observe, set_default
+from atom.api import (
+    Bool, Event, Typed, ForwardTyped, Str, observe, set_default
+)
 
 from enaml.core.declarative import d_
 
 from .control import Control, ProxyControl
+from .text_delta import TextDelta
 
 
 class ProxyMultilineField(ProxyControl):
@@ -51,6 +54,12 @@ class MultilineField(Control):
     #: efficient, the toolkit will batch updates on a collapsing timer.
     auto_sync_text = d_(Bool(True))
 
+    #: An event emitted with a TextDelta for each edit of the text in
+    #: the control, including the edits made by setting the text. A
+    #: model of the text can apply the deltas instead of reading the
+    #: whole text, in which case 'auto_sync_text' can be disabled.
+    text_edited = d_(Event(TextDelta), writable=False)
+
     #: Multiline fields expand freely in width and height by default.
     hug_width = set_default('ignore')
     hug_height = set_default('ignore')
@@ -0,0 +1,121 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import (
+    Bool, Event, ForwardTyped, Int, Typed, observe, set_default
+)
+
+from enaml.core.declarative import d_
+
+from .control import Control, ProxyControl
+from .data_providers import TableProvider
+
+
+class ProxyTableView(ProxyControl):
+    """ The abstract definition of a proxy TableView object.
+
+    """
+    #: A reference to the TableView declaration.
+    declaration = ForwardTyped(lambda: TableView)
+
+    def set_provider(self, provider):
+        raise NotImplementedError
+
+    def set_show_grid(self, show):
+        raise NotImplementedError
+
+    def set_alternating_row_colors(self, alternate):
+        raise NotImplementedError
+
+    def set_show_horizontal_header(self, show):
+        raise NotImplementedError
+
+    def set_show_vertical_header(self, show):
+        raise NotImplementedError
+
+    def set_row_height(self, height):
+        raise NotImplementedError
+
+    def scroll_to(self, row, column):
+        raise NotImplementedError
+
+
+class TableView(Control):
+    """ A control which displays the cells of a table.
+
+    The data of the table is given by a TableProvider, which is queried
+    only for the cells being displayed. The rows have a fixed height so
+    that the view can display tables with millions of rows.
+
+    """
+    #: The provider of the data of the table.
+    provider = d_(Typed(TableProvider))
+
+    #: Whether the grid lines between the cells are shown.
+    show_grid = d_(Bool(True))
+
+    #: Whether the background of the rows alternates between two colors.
+    alternating_row_colors = d_(Bool(False))
+
+    #: Whether the header of the columns is shown.
+    show_horizontal_header = d_(Bool(True))
+
+    #: Whether the header of the rows is shown.
+    show_vertical_header = d_(Bool(True))
+
+    #: The height of the rows, in pixels. A negative value uses the
+    #: default height of the toolkit.
+    row_height = d_(Int(-1))
+
+    #: The row of the current cell, or -1. This is updated by the
+    #: toolkit when the user moves the current cell.
+    current_row = d_(Int(-1), writable=False)
+
+    #: The column of the current cell, or -1. This is updated by the
+    #: toolkit when the user moves the current cell.
+    current_column = d_(Int(-1), writable=False)
+
+    #: An event emitted with a (row, column) tuple when the user
+    #: activates a cell, typically by double clicking on it.
+    activated = d_(Event(tuple), writable=False)
+
+    #: A table view expands freely in width and height by default.
+    hug_width = set_default('ignore')
+    hug_height = set_default('ignore')
+
+    #: A reference to the ProxyTableView object.
+    proxy = Typed(ProxyTableView)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def scroll_to(self, row, column=0):
+        """ Scroll the view so that a cell is visible.
+
+        Parameters
+        ----------
+        row : int
+            The row of the cell.
+
+        column : int, optional
+            The column of the cell. The default is 0.
+
+        """
+        if self.proxy_is_active:
+            self.proxy.scroll_to(row, column)
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    @observe('provider', 'show_grid', 'alternating_row_colors',
+             'show_horizontal_header', 'show_vertical_header', 'row_height')
+    def _update_proxy(self, change):
+        """ An observer which sends state change to the proxy.
+
+        """
+        # The superclass handler implementation is sufficient.
+        super(TableView, self)._update_proxy(change)
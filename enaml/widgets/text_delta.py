@@ -0,0 +1,81 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Atom, Int, Str
+
+
+class TextDelta(Atom):
+    """ A payload object describing an edit of the text of a widget.
+
+    An edit removes a number of characters at a location of the text and
+    inserts new text in their place. The location is given as a line
+    and a column, which the toolkits compute without walking the text
+    from its start. Line breaks count as characters in the removed
+    length and are part of the inserted text, so that a model of the
+    text can apply the edits in order to stay synchronized with the
+    widget.
+
+    """
+    #: The zero-based line of the edit, where the lines are separated
+    #: by newline characters.
+    line = Int()
+
+    #: The zero-based column of the edit in its line, in characters.
+    column = Int()
+
+    #: The number of characters removed at the location of the edit.
+    removed = Int()
+
+    #: The text inserted at the location of the edit.
+    inserted = Str()
+
+    def apply(self, text):
+        """ Apply the edit to a string.
+
+        Parameters
+        ----------
+        text : unicode
+            The text before the edit.
+
+        Returns
+        -------
+        result : unicode
+            The text after the edit.
+
+        """
+        start = 0
+        for _ in range(self.line):
+            start = text.index('\n', start) + 1
+        start += self.column
+        return text[:start] + self.inserted + text[start + self.removed:]
+
+    def apply_lines(self, lines):
+        """ Apply the edit in place to a list of lines.
+
+        Only the lines touched by the edit are replaced, so that the
+        cost of an edit does not depend on the length of the text.
+
+        Parameters
+        ----------
+        lines : list
+            The text before the edit split on newline characters, as
+            returned by `text.split('\\n')`. The list is modified in
+            place.
+
+        """
+        first = self.line
+        column = self.column
+        last = first
+        # Skip the removed characters, including the line breaks.
+        remaining = self.removed + column
+        while remaining > len(lines[last]):
+            remaining -= len(lines[last]) + 1
+            last += 1
+        head = lines[first][:column]
+        tail = lines[last][remaining:]
+        new = (head + self.inserted + tail).split('\n')
+        lines[first:last + 1] = new
@@ -5,7 +5,7 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Atom, Event, Typed, ForwardTyped
+from atom.api import Atom, Event, Typed, ForwardTyped, Value
 
 from enaml.application import Application
 from enaml.core.declarative import Declarative, d_
@@ -105,6 +105,39 @@ class ProxyToolkitObject(Atom):
         """
         pass
 
+    def children_added(self, children):
+        """ Handle children being added to the object.
+
+        This method is called instead of `child_added` when several
+        children are inserted at once, which allows the proxy to add
+        them as a batch. It will only be called after the proxy tree
+        is active and the UI is running. The default implementation
+        calls `child_added` for each child, in order.
+
+        Parameters
+        ----------
+        children : list
+            The toolkit proxy children added to the object.
+
+        """
+        child_added = self.child_added
+        for child in children:
+            child_added(child)
+
+    def child_moved(self, child):
+        """ Handle a child being moved in the object.
+
+        This method will only be called after the proxy tree is active
+        and the UI is running. The default implementation is a no-op.
+
+        Parameters
+        ----------
+        child : ProxyToolkitObject
+            The toolkit proxy child moved in the object.
+
+        """
+        pass
+
     def child_removed(self, child):
         """ Handle a child being removed from the object.
 
@@ -144,6 +177,11 @@ class ToolkitObject(Declarative):
     #: True by external code after the proxy widget hierarchy is setup.
     proxy_is_active = flag_property(ACTIVE_PROXY_FLAG)
 
+    #: The proxies of the children being added by `children_added`,
+    #: which are collected to notify the proxy once. This should not
+    #: be manipulated directly by user code.
+    _proxy_batch = Value()
+
     def initialize(self):
         """ A reimplemented initializer.
 
@@ -183,7 +221,45 @@ class ToolkitObject(Declarative):
         if isinstance(child, ToolkitObject) and self.proxy_is_active:
             if not child.proxy_is_active:
                 child.activate_proxy()
-            self.proxy.child_added(child.proxy)
+            batch = self._proxy_batch
+            if batch is not None:
+                batch.append(child.proxy)
+            else:
+                self.proxy.child_added(child.proxy)
+
+    def children_added(self, children):
+        """ A reimplemented children added event handler.
+
+        This handler will invoke the superclass handler, which calls
+        `child_added` for each child, and then invoke the
+        'children_added()' method on an active proxy once for all of
+        the toolkit children.
+
+        """
+        # A nested insertion, such as the one of a pattern initialized
+        # by the batch, is collected in the current batch.
+        if not self.proxy_is_active or self._proxy_batch is not None:
+            super(ToolkitObject, self).children_added(children)
+            return
+        batch = self._proxy_batch = []
+        try:
+            super(ToolkitObject, self).children_added(children)
+        finally:
+            del self._proxy_batch
+        if batch:
+            self.proxy.children_added(batch)
+
+    def child_moved(self, child):
+        """ A reimplemented child moved event handler.
+
+        This handler will invoke the superclass handler and then invoke
+        the 'child_moved()' method on an active proxy.
+
+        """
+        super(ToolkitObject, self).child_moved(child)
+        if isinstance(child, ToolkitObject) and self.proxy_is_active:
+            if child.proxy_is_active:
+                self.proxy.child_moved(child.proxy)
 
     def child_removed(self, child):
         """ A reimplemented child removed event handler.
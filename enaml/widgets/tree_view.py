@@ -0,0 +1,87 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import (
+    Bool, Event, ForwardTyped, Typed, Value, observe, set_default
+)
+
+from enaml.core.declarative import d_
+
+from .control import Control, ProxyControl
+from .data_providers import TreeProvider
+
+
+class ProxyTreeView(ProxyControl):
+    """ The abstract definition of a proxy TreeView object.
+
+    """
+    #: A reference to the TreeView declaration.
+    declaration = ForwardTyped(lambda: TreeView)
+
+    def set_provider(self, provider):
+        raise NotImplementedError
+
+    def set_alternating_row_colors(self, alternate):
+        raise NotImplementedError
+
+    def set_show_header(self, show):
+        raise NotImplementedError
+
+    def set_uniform_row_heights(self, uniform):
+        raise NotImplementedError
+
+
+class TreeView(Control):
+    """ A control which displays the nodes of a tree.
+
+    The data of the tree is given by a TreeProvider. The children of a
+    node are fetched from the provider when the node is expanded, and
+    the values of a node when it is displayed. The view still lays out
+    every child of the expanded nodes, so a single node should not have
+    more than a few hundred thousand children.
+
+    """
+    #: The provider of the data of the tree.
+    provider = d_(Typed(TreeProvider))
+
+    #: Whether the background of the rows alternates between two colors.
+    alternating_row_colors = d_(Bool(False))
+
+    #: Whether the header of the columns is shown.
+    show_header = d_(Bool(True))
+
+    #: Whether all the rows have the same height. This lets the view
+    #: skip measuring the rows and should be left enabled for large
+    #: trees.
+    uniform_row_heights = d_(Bool(True))
+
+    #: The node of the current row, or None. This is updated by the
+    #: toolkit when the user moves the current row.
+    current_node = d_(Value(), writable=False)
+
+    #: An event emitted with a (node, column) tuple when the user
+    #: activates a node, typically by double clicking on it.
+    activated = d_(Event(tuple), writable=False)
+
+    #: A tree view expands freely in width and height by default.
+    hug_width = set_default('ignore')
+    hug_height = set_default('ignore')
+
+    #: A reference to the ProxyTreeView object.
+    proxy = Typed(ProxyTreeView)
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    @observe('provider', 'alternating_row_colors', 'show_header',
+             'uniform_row_heights')
+    def _update_proxy(self, change):
+        """ An observer which sends state change to the proxy.
+
+        """
+        # The superclass handler implementation is sufficient.
+        super(TreeView, self)._update_proxy(change)
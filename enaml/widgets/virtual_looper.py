@@ -0,0 +1,247 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+from collections.abc import Sequence
+
+from atom.api import Coerced, Event, FloatRange, Int, List
+
+from enaml.core.compiler_nodes import new_scope
+from enaml.core.declarative import d_
+from enaml.core.looper import Iteration
+from enaml.core.pattern import Pattern
+from enaml.layout.geometry import Size
+
+from .flow_area import FlowArea
+
+
+def coerce_sequence(iterable):
+    """ Coerce an iterable which is not a sequence to a tuple.
+
+    """
+    if isinstance(iterable, Sequence):
+        return iterable
+    return tuple(iterable)
+
+
+class VirtualLooper(Pattern):
+    """ A pattern which repeats its children over a range of a sequence.
+
+    A VirtualLooper is used as the child of a FlowArea to lay out a
+    large number of FlowItems. The flow area packs the items from their
+    declared sizes only and the children of the looper are created only
+    for the items which lie in the visible part of the area, plus an
+    extra margin defined by the `overscan`.
+
+    The children created for an item are reused for another item when
+    the area is scrolled. The `loop` scope variable of the children has
+    `index` and `item` members which are updated when this happens, so
+    the children should subscribe to them, using the `<<` operator,
+    instead of reading them once.
+
+    The parent of a VirtualLooper must be a FlowArea, which should not
+    have other FlowItem children.
+
+    """
+    #: The sequence to use when creating the items for the looper. An
+    #: iterable which is not a sequence is first coerced to a tuple.
+    iterable = d_(Coerced(Sequence, factory=tuple, coercer=coerce_sequence))
+
+    #: The size of the FlowItems created by the looper. The size is
+    #: used to pack the items in the flow area, in place of the size
+    #: hints of the items. An item is still bounded by its minimum and
+    #: maximum sizes when it is given the declared size.
+    item_size = d_(Coerced(Size, (100, 100)))
+
+    #: An optional sequence of sizes, one for each item of the iterable,
+    #: which is used in place of the `item_size` when given.
+    item_sizes = d_(List())
+
+    #: The extra space which is populated with items before and after
+    #: the visible part of the area, as a fraction of its visible size.
+    overscan = d_(FloatRange(low=0.0, value=0.5))
+
+    #: The index of the first item for which children are created.
+    first = d_(Int(), writable=False)
+
+    #: The index following the last item for which children are
+    #: created.
+    last = d_(Int(), writable=False)
+
+    #: An event emitted when the sizes of the items have changed.
+    sizes_changed = Event()
+
+    #: The list of items created by the looper. Each item in the list
+    #: is the list of children created for an iteration. This list
+    #: should not be manipulated directly by user code.
+    items = List()
+
+    #--------------------------------------------------------------------------
+    # Lifetime API
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ A reimplemented initialization method.
+
+        """
+        parent = self.parent
+        if not isinstance(parent, FlowArea):
+            msg = "the parent of a VirtualLooper must be a FlowArea, not '%s'"
+            raise TypeError(msg % type(parent).__name__)
+        super(VirtualLooper, self).initialize()
+
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        The looper will release the owned items on destruction.
+
+        """
+        super(VirtualLooper, self).destroy()
+        del self.iterable
+        del self.items
+        del self._slots
+        del self._pool
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def iterations(self):
+        """ Get the iterations for the items in the current range.
+
+        Returns
+        -------
+        result : list
+            The list of Iteration objects for the items in the range
+            defined by `first` and `last`, in order.
+
+        """
+        return self._slots[:]
+
+    def set_range(self, first, last):
+        """ Set the range of the items for which children are created.
+
+        The children of the items leaving the range are reused for the
+        items entering the range. New children are only created when
+        there are not enough children to reuse.
+
+        Parameters
+        ----------
+        first : int
+            The index of the first item of the range.
+
+        last : int
+            The index following the last item of the range.
+
+        """
+        count = len(self.iterable)
+        first = max(0, min(first, count))
+        last = max(first, min(last, count))
+        if first == self.first and last == self.last:
+            return
+        pool = self._pool
+        slots = []
+        kept = {}
+        for iteration in self._slots:
+            if first <= iteration.index < last:
+                kept[iteration.index] = iteration
+            else:
+                pool.append(iteration)
+        iterable = self.iterable
+        for index in range(first, last):
+            iteration = kept.get(index)
+            if iteration is None:
+                if pool:
+                    iteration = pool.pop()
+                    iteration.index = index
+                    iteration.item = iterable[index]
+                else:
+                    iteration = self._create_iteration(index, iterable[index])
+            slots.append(iteration)
+        self._slots = slots
+        self.first = first
+        self.last = last
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    def _observe_iterable(self, change):
+        """ A private observer for the `iterable` attribute.
+
+        If the iterable changes while the looper is active, the loop
+        items will be refreshed.
+
+        """
+        if change['type'] == 'update' and self.is_initialized:
+            self.refresh_items()
+
+    def _observe_item_size(self, change):
+        """ A private observer for the sizes of the items.
+
+        """
+        if change['type'] == 'update':
+            self.sizes_changed()
+
+    _observe_item_sizes = _observe_item_size
+
+    #--------------------------------------------------------------------------
+    # Pattern API
+    #--------------------------------------------------------------------------
+    def pattern_items(self):
+        """ Get a list of items created by the pattern.
+
+        """
+        return sum(self.items, [])
+
+    def refresh_items(self):
+        """ Refresh the items of the pattern.
+
+        The children of the items in the current range are updated for
+        the new content of the iterable. The range is clipped to the new
+        length of the iterable and the sizes of the items are assumed to
+        have changed, so that the flow area computes a new range.
+
+        """
+        iterable = self.iterable
+        count = len(iterable)
+        slots = []
+        for iteration in self._slots:
+            if iteration.index < count:
+                iteration.item = iterable[iteration.index]
+                slots.append(iteration)
+            else:
+                self._pool.append(iteration)
+        self._slots = slots
+        self.first = min(self.first, count)
+        self.last = min(self.last, count)
+        self.sizes_changed()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    #: The iterations for the items in the current range.
+    _slots = List()
+
+    #: The iterations which are not currently used. Their children are
+    #: kept around to be reused.
+    _pool = List()
+
+    def _create_iteration(self, index, item):
+        """ Create the children for a new iteration.
+
+        """
+        iteration = Iteration(index=index, item=item)
+        nodes = iteration.nodes
+        for pattern_nodes, key, f_locals in self.pattern_nodes:
+            with new_scope(key, f_locals) as f_locals:
+                f_locals['loop'] = iteration
+                for node in pattern_nodes:
+                    child = node(None)
+                    if isinstance(child, list):
+                        nodes.extend(child)
+                    else:
+                        nodes.append(child)
+        self.items.append(nodes)
+        self.parent.insert_children(self, nodes)
+        return iteration
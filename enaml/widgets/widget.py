@@ -6,7 +6,7 @@
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
 from atom.api import (
-    Bool, IntEnum, Str, Coerced, Typed, ForwardTyped, observe
+    Bool, Event, IntEnum, Str, Coerced, Typed, ForwardTyped, observe
 )
 
 from enaml.colors import ColorMember
@@ -93,6 +93,9 @@ class Feature(IntEnum):
     #: Enables support for drop operations.
     DropEnabled = 0x8
 
+    #: Enables support for visibility events.
+    VisibilityEvents = 0x10
+
 
 class Widget(ToolkitObject, Stylable):
     """ The base class of visible widgets in Enaml.
@@ -132,6 +135,15 @@ class Widget(ToolkitObject, Stylable):
     #: this value are ignored.
     features = d_(Coerced(Feature.Flags))
 
+    #: An event fired with a boolean when the toolkit widget is shown
+    #: or hidden on the screen. This tracks the effective visibility of
+    #: the widget, which also changes when an ancestor such as a tab
+    #: page is shown or hidden.
+    #:
+    #: ** The VisibilityEvents feature must be enabled for the widget in
+    #: order for this event to be fired. **
+    visibility_changed = d_(Event(bool), writable=False)
+
     #: A reference to the ProxyWidget object.
     proxy = Typed(ProxyWidget)
 
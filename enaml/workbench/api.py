@@ -7,6 +7,7 @@
 #------------------------------------------------------------------------------
 from .extension import Extension
 from .extension_point import ExtensionPoint
+from .manifest_index import ManifestIndex
 from .plugin import Plugin
 from .plugin_manifest import PluginManifest
 from .workbench import Workbench
@@ -0,0 +1,377 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import importlib
+import io
+import json
+from functools import partial
+
+from atom.api import Atom, Bool, List, Str, Typed
+
+import enaml
+
+from .core.command import Command
+from .extension import Extension
+from .extension_point import ExtensionPoint
+from .plugin_manifest import PluginManifest
+
+
+#: The version of the serialized manifest index format.
+INDEX_VERSION = 1
+
+
+def load_manifest_class(path):
+    """ Import a plugin manifest class from its import path.
+
+    Parameters
+    ----------
+    path : unicode
+        The import path of the manifest class, in the form
+        'package.module:ClassName'. Enaml modules are supported.
+
+    Returns
+    -------
+    result : type
+        The PluginManifest subclass.
+
+    """
+    module_name, _, class_name = path.partition(u':')
+    if not module_name or not class_name:
+        msg = "invalid manifest path '%s', expected 'module:ClassName'"
+        raise ValueError(msg % path)
+    with enaml.imports():
+        module = importlib.import_module(module_name)
+    cls = getattr(module, class_name)
+    if not (isinstance(cls, type) and issubclass(cls, PluginManifest)):
+        msg = "'%s' is not a PluginManifest subclass"
+        raise TypeError(msg % path)
+    return cls
+
+
+class LazyExtension(Extension):
+    """ An extension registered from a manifest index.
+
+    The extension is a stand-in for the extension declared by the real
+    manifest. Its id, point and rank are known from the index, and its
+    factory and children are taken from the real extension, which is
+    materialized on first access. The commands declared by the
+    extension are indexed, so they can be listed and registered without
+    materializing the manifest.
+
+    """
+    #: Whether the real extension declares a factory.
+    has_factory = Bool(False)
+
+    #: The ids of the commands declared as children of the extension,
+    #: or None if they are not indexed.
+    command_ids = Typed(list)
+
+    def materialize(self):
+        """ Get the real extension, materializing its manifest.
+
+        Returns
+        -------
+        result : Extension
+            The extension declared by the real manifest.
+
+        """
+        return self.parent.get_real_extension(self.qualified_id)
+
+    def get_child(self, kind, reverse=False):
+        """ Find a child of the real extension by the given type.
+
+        """
+        return self.materialize().get_child(kind, reverse)
+
+    def get_children(self, kind):
+        """ Get the children of the real extension of the given type.
+
+        The indexed commands are returned as stand-in commands which
+        materialize the manifest when they are invoked.
+
+        """
+        if kind is Command and self.command_ids is not None:
+            if self._commands is None:
+                self._commands = [
+                    Command(id=command_id,
+                            handler=partial(self._invoke, command_id))
+                    for command_id in self.command_ids
+                ]
+            return list(self._commands)
+        return self.materialize().get_children(kind)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    #: The cached list of stand-in commands.
+    _commands = Typed(list)
+
+    def _default_factory(self):
+        if self.has_factory:
+            return self._create
+        return None
+
+    def _create(self, *args, **kwargs):
+        """ Invoke the factory of the real extension.
+
+        """
+        return self.materialize().factory(*args, **kwargs)
+
+    def _invoke(self, command_id, event):
+        """ Invoke the handler of a command of the real extension.
+
+        """
+        for command in self.materialize().get_children(Command):
+            if command.id == command_id:
+                event.command = command
+                return command.handler(event)
+        msg = "command '%s' is not declared by extension '%s'"
+        raise ValueError(msg % (command_id, self.qualified_id))
+
+
+class LazyPluginManifest(PluginManifest):
+    """ A plugin manifest registered from a manifest index.
+
+    The manifest declares the extension points and extensions recorded
+    in the index. The real manifest is imported and instantiated when
+    the plugin is created or when the content of an extension is used.
+
+    """
+    #: The import path of the real manifest class.
+    manifest_path = Str()
+
+    #: The real manifest, once it has been materialized.
+    real_manifest = Typed(PluginManifest)
+
+    def materialize(self):
+        """ Get the real manifest, importing and creating it if needed.
+
+        Returns
+        -------
+        result : PluginManifest
+            The initialized real manifest.
+
+        """
+        manifest = self.real_manifest
+        if manifest is None:
+            manifest = load_manifest_class(self.manifest_path)()
+            if manifest.id != self.id:
+                msg = "manifest '%s' has id '%s', but was indexed as '%s'"
+                raise ValueError(msg % (self.manifest_path, manifest.id,
+                                        self.id))
+            manifest.workbench = self.workbench
+            manifest.initialize()
+            self.real_manifest = manifest
+        return manifest
+
+    def get_real_extension(self, extension_id):
+        """ Get an extension declared by the real manifest.
+
+        Parameters
+        ----------
+        extension_id : unicode
+            The fully qualified id of the extension of interest.
+
+        Returns
+        -------
+        result : Extension
+            The extension declared by the real manifest.
+
+        """
+        for extension in self.materialize().extensions:
+            if extension.qualified_id == extension_id:
+                return extension
+        msg = "extension '%s' is not declared by manifest '%s'"
+        raise ValueError(msg % (extension_id, self.manifest_path))
+
+    def destroy(self):
+        """ A reimplemented destructor.
+
+        The real manifest is destroyed along with the lazy manifest.
+
+        """
+        manifest = self.real_manifest
+        super(LazyPluginManifest, self).destroy()
+        if manifest is not None:
+            manifest.workbench = None
+            if not manifest.is_destroyed:
+                manifest.destroy()
+        self.real_manifest = None
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _default_factory(self):
+        return self._create_plugin
+
+    def _create_plugin(self):
+        """ Create the plugin using the factory of the real manifest.
+
+        """
+        return self.materialize().factory()
+
+
+class ManifestIndex(Atom):
+    """ A serializable description of a set of plugin manifests.
+
+    The index records, for each plugin, the import path of its manifest
+    class along with its extension points, its extensions and their
+    ranks, and the ids of the commands they declare. Registering the
+    index with a workbench makes all of this available without
+    importing the manifest modules, which are only loaded when a plugin
+    is created or when the factory or content of an extension is used.
+
+    The index must be rebuilt whenever one of the indexed manifests is
+    modified.
+
+    """
+    #: The list of plugin entries. Each entry is a dict as produced by
+    #: the 'describe' method.
+    plugins = List(dict)
+
+    @classmethod
+    def build(cls, manifest_paths):
+        """ Build an index by importing the given manifests.
+
+        Parameters
+        ----------
+        manifest_paths : iterable
+            The import paths of the manifest classes, in the form
+            'package.module:ClassName'.
+
+        Returns
+        -------
+        result : ManifestIndex
+            The index describing the manifests.
+
+        """
+        plugins = []
+        for path in manifest_paths:
+            manifest = load_manifest_class(path)()
+            manifest.initialize()
+            try:
+                plugins.append(cls.describe(manifest, path))
+            finally:
+                manifest.destroy()
+        return cls(plugins=plugins)
+
+    @staticmethod
+    def describe(manifest, path):
+        """ Create the index entry for an initialized manifest.
+
+        Parameters
+        ----------
+        manifest : PluginManifest
+            The manifest to describe.
+
+        path : unicode
+            The import path of the manifest class.
+
+        Returns
+        -------
+        result : dict
+            The JSON serializable entry for the manifest.
+
+        """
+        points = []
+        for point in manifest.extension_points:
+            points.append({
+                u'id': point.id,
+                u'description': point.description,
+            })
+        extensions = []
+        for extension in manifest.extensions:
+            data = {
+                u'id': extension.id,
+                u'point': extension.point,
+                u'rank': extension.rank,
+                u'factory': extension.factory is not None,
+                u'description': extension.description,
+            }
+            # Commands created by a factory can only be known by calling
+            # the factory, so only static commands are indexed.
+            if extension.factory is None:
+                commands = extension.get_children(Command)
+                if commands:
+                    data[u'commands'] = [c.id for c in commands]
+            extensions.append(data)
+        return {
+            u'id': manifest.id,
+            u'manifest': path,
+            u'description': manifest.description,
+            u'extension_points': points,
+            u'extensions': extensions,
+        }
+
+    @classmethod
+    def load(cls, path):
+        """ Load an index from a file written by 'save'.
+
+        """
+        with io.open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path):
+        """ Save the index to a JSON file.
+
+        """
+        text = json.dumps(self.to_dict(), indent=1, sort_keys=True)
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    @classmethod
+    def from_dict(cls, data):
+        """ Create an index from its serialized dict form.
+
+        """
+        version = data.get(u'version')
+        if version != INDEX_VERSION:
+            msg = "unsupported manifest index version '%s'"
+            raise ValueError(msg % version)
+        return cls(plugins=list(data[u'plugins']))
+
+    def to_dict(self):
+        """ Get the JSON serializable dict form of the index.
+
+        """
+        return {u'version': INDEX_VERSION, u'plugins': list(self.plugins)}
+
+    def create_manifests(self):
+        """ Create the lazy manifests for the indexed plugins.
+
+        Returns
+        -------
+        result : list
+            The list of LazyPluginManifest objects which can be
+            registered with a workbench.
+
+        """
+        manifests = []
+        for entry in self.plugins:
+            manifest = LazyPluginManifest(
+                id=entry[u'id'],
+                manifest_path=entry[u'manifest'],
+                description=entry.get(u'description', u''),
+            )
+            for data in entry.get(u'extension_points', ()):
+                ExtensionPoint(
+                    parent=manifest,
+                    id=data[u'id'],
+                    description=data.get(u'description', u''),
+                )
+            for data in entry.get(u'extensions', ()):
+                LazyExtension(
+                    parent=manifest,
+                    id=data[u'id'],
+                    point=data[u'point'],
+                    rank=data.get(u'rank', 0),
+                    description=data.get(u'description', u''),
+                    has_factory=data.get(u'factory', False),
+                    command_ids=data.get(u'commands'),
+                )
+            manifests.append(manifest)
+        return manifests
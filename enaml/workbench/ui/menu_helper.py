@@ -9,8 +9,6 @@ from collections import defaultdict
 
 from atom.api import Atom, Instance, List, Typed
 
-import kiwisolver as kiwi
-
 from enaml.widgets.action import Action
 from enaml.workbench.workbench import Workbench
 
@@ -31,6 +29,12 @@ def solve_ordering(nodes):
     This function is an implementation detail and should not be
     consumed by code outside of this module.
 
+    The nodes are topologically sorted according to their 'before'
+    and 'after' constraints, in time linear in the number of nodes.
+    Each node is placed directly after the nodes which must precede
+    it, which preserves the relative order of unconstrained nodes.
+    Constraints which form a cycle are ignored as needed.
+
     Parameters
     ----------
     nodes : list
@@ -44,39 +48,148 @@ def solve_ordering(nodes):
         specified by the 'before' and 'after' items attributes.
 
     """
-    variables = {}
+    node_map = {}
     for node in nodes:
-        variables[node.id] = kiwi.Variable(str(node.id))
+        node_map[node.id] = node
 
-    prev_var = None
-    constraints = []
-    for node in nodes:
-        this_var = variables[node.id]
-        constraints.append(this_var >= 0)
-        if prev_var is not None:  # weakly preserve relative order
-            constraints.append((prev_var + 0.1 <= this_var) | 'weak')
+    # Build the mapping of node id to the nodes which must precede it.
+    # The predecessors are visited in definition order.
+    predecessors = defaultdict(list)
+    for index, node in enumerate(nodes):
         before = node.item.before
         if before:
-            if before not in variables:
+            if before not in node_map:
                 msg = "item '%s' has invalid `before` reference '%s'"
                 raise ValueError(msg % (node.path, before))
-            target_var = variables[before]
-            constraints.append((this_var + 0.1 <= target_var) | 'strong')
+            predecessors[before].append((index, node))
         after = node.item.after
         if after:
-            if after not in variables:
+            if after not in node_map:
                 msg = "item '%s' has invalid `after` reference '%s'"
                 raise ValueError(msg % (node.path, after))
-            target_var = variables[after]
-            constraints.append((target_var + 0.1 <= this_var) | 'strong')
-        prev_var = this_var
+            predecessors[node.id].append((index, node_map[after]))
+    for preds in predecessors.values():
+        preds.sort(key=lambda pair: pair[0])
+
+    # Emit the nodes with an iterative depth first traversal of their
+    # predecessors. An edge to a node on the stack closes a cycle.
+    result = []
+    placed = set()
+    visiting = set()
+    for node in nodes:
+        if node.id in placed:
+            continue
+        visiting.add(node.id)
+        stack = [(node, iter(predecessors.get(node.id, ())))]
+        while stack:
+            current, preds = stack[-1]
+            for _, pred in preds:
+                pred_id = pred.id
+                if pred_id not in placed and pred_id not in visiting:
+                    visiting.add(pred_id)
+                    stack.append((pred, iter(predecessors.get(pred_id, ()))))
+                    break
+            else:
+                stack.pop()
+                visiting.discard(current.id)
+                placed.add(current.id)
+                result.append(current)
+
+    return result
 
-    solver = kiwi.Solver()
-    for cn in constraints:
-        solver.addConstraint(cn)
-    solver.updateVariables()
 
-    return sorted(nodes, key=lambda node: (variables[node.id].value(), id(node)))
+class AssemblyCache(Atom):
+    """ A cache of the objects assembled by a previous menu build.
+
+    This class is an implementation detail and should not be consumed
+    by code outside of this module.
+
+    """
+    #: The mapping of MenuItem or ActionItem to the WorkbenchMenu or
+    #: WorkbenchAction which was assembled for the item.
+    items = Typed(dict, ())
+
+    #: The mapping of (parent item, group id) to the list of the
+    #: WorkbenchActionGroup objects assembled for the group.
+    groups = Typed(defaultdict, (list,))
+
+    #: The mapping of parent item to the list of separator actions
+    #: assembled for the menu.
+    separators = Typed(defaultdict, (list,))
+
+    def collect(self, parent_item, objects):
+        """ Add the assembled objects and their children to the cache.
+
+        Parameters
+        ----------
+        parent_item : MenuItem or None
+            The item of the menu which holds the objects, or None for
+            the root menus.
+
+        objects : iterable
+            The objects assembled for the children of the menu.
+
+        """
+        for obj in objects:
+            if obj.is_destroyed:
+                continue
+            if isinstance(obj, WorkbenchMenu):
+                self.items[obj.item] = obj
+                self.collect(obj.item, obj.children)
+            elif isinstance(obj, WorkbenchAction):
+                self.items[obj.item] = obj
+            elif isinstance(obj, WorkbenchActionGroup):
+                self.groups[(parent_item, obj.group.id)].append(obj)
+                self.collect(parent_item, obj.children)
+            elif isinstance(obj, Action) and obj.separator:
+                self.separators[parent_item].append(obj)
+
+    def take_item(self, item):
+        """ Take the object assembled for an item, or None.
+
+        """
+        return self.items.pop(item, None)
+
+    def take_group(self, parent_item, group):
+        """ Take an action group assembled for an item group, or None.
+
+        """
+        groups = self.groups.get((parent_item, group.id))
+        if groups:
+            wag = groups.pop(0)
+            wag.group = group
+            return wag
+
+    def take_separator(self, parent_item):
+        """ Take a separator assembled for a menu, or None.
+
+        """
+        separators = self.separators.get(parent_item)
+        if separators:
+            return separators.pop(0)
+
+    def unused(self):
+        """ Get the list of the objects which were not taken.
+
+        """
+        unused = list(self.items.values())
+        for groups in self.groups.values():
+            unused.extend(groups)
+        for separators in self.separators.values():
+            unused.extend(separators)
+        return unused
+
+
+def update_children(parent, children):
+    """ Update the children of an assembled object.
+
+    The children are inserted in order at the end of the children of
+    the parent. Stale children are left in place, and are expected to
+    be reused elsewhere or destroyed by the caller.
+
+    """
+    if parent.children != children:
+        parent.insert_children(None, children)
 
 
 class PathNode(Atom):
@@ -116,9 +229,20 @@ class PathNode(Atom):
         """
         return self.path.rsplit(u'/', 1)[1]
 
-    def assemble(self):
+    def prepare(self):
+        """ Validate and order the node before it is assembled.
+
+        """
+        pass
+
+    def assemble(self, cache):
         """ Assemble the menu or action object for the node.
 
+        Parameters
+        ----------
+        cache : AssemblyCache
+            The cache of the objects which may be reused.
+
         """
         raise NotImplementedError
 
@@ -133,11 +257,14 @@ class ActionNode(PathNode):
     #: The workbench instance to associate with action.
     workbench = Typed(Workbench)
 
-    def assemble(self):
+    def assemble(self, cache):
         """ Assemble and return a WorkbenchAction for the node.
 
         """
-        return WorkbenchAction(workbench=self.workbench, item=self.item)
+        action = cache.take_item(self.item)
+        if action is None:
+            action = WorkbenchAction(workbench=self.workbench, item=self.item)
+        return action
 
 
 class MenuNode(PathNode):
@@ -150,6 +277,9 @@ class MenuNode(PathNode):
     #: The child objects defined for this menu node.
     children = List(PathNode)
 
+    #: The ordered list of (group, nodes) computed by 'prepare'.
+    child_groups = List()
+
     def group_data(self):
         """ The group map and list of group items for the node.
 
@@ -195,7 +325,18 @@ class MenuNode(PathNode):
                 nodes = grouped.pop(group.id)
                 yield group, solve_ordering(nodes)
 
-    def create_children(self, group, nodes):
+    def prepare(self):
+        """ Validate and order the children of the node recursively.
+
+        This is done before any object is assembled so that an invalid
+        menu definition leaves the previously assembled objects intact.
+
+        """
+        self.child_groups = list(self.collect_child_groups())
+        for child in self.children:
+            child.prepare()
+
+    def create_children(self, group, nodes, cache):
         """ Create the child widgets for the given group of nodes.
 
         This will assemble the nodes and setup the action groups.
@@ -203,12 +344,14 @@ class MenuNode(PathNode):
         """
         result = []
         actions = []
-        children = [node.assemble() for node in nodes]
+        children = [node.assemble(cache) for node in nodes]
 
         def process_actions():
             if actions:
-                wag = WorkbenchActionGroup(group=group)
-                wag.insert_children(None, actions)
+                wag = cache.take_group(self.item, group)
+                if wag is None:
+                    wag = WorkbenchActionGroup(group=group)
+                update_children(wag, actions[:])
                 result.append(wag)
                 del actions[:]
 
@@ -224,24 +367,28 @@ class MenuNode(PathNode):
 
         return result
 
-    def assemble_children(self):
+    def assemble_children(self, cache):
         """ Assemble the list of child objects for the menu.
 
         """
         children = []
-        for group, nodes in self.collect_child_groups():
-            children.extend(self.create_children(group, nodes))
-            children.append(Action(separator=True))
-        if children:
-            children.pop()
+        for index, (group, nodes) in enumerate(self.child_groups):
+            if index > 0:
+                separator = cache.take_separator(self.item)
+                if separator is None:
+                    separator = Action(separator=True)
+                children.append(separator)
+            children.extend(self.create_children(group, nodes, cache))
         return children
 
-    def assemble(self):
+    def assemble(self, cache):
         """ Assemble and return a WorkbenchMenu for the node.
 
         """
-        menu = WorkbenchMenu(item=self.item)
-        menu.insert_children(None, self.assemble_children())
+        menu = cache.take_item(self.item)
+        if menu is None:
+            menu = WorkbenchMenu(item=self.item)
+        update_children(menu, self.assemble_children(cache))
         return menu
 
 
@@ -259,14 +406,14 @@ class RootMenuNode(MenuNode):
         group = ItemGroup()
         return {u'': group}, [group]
 
-    def assemble(self):
+    def assemble(self, cache):
         """ Assemble and return the list of root menu bar menus.
 
         """
-        return self.assemble_children()
+        return self.assemble_children(cache)
 
 
-def create_menus(workbench, menu_items, action_items):
+def create_menus(workbench, menu_items, action_items, menus=None):
     """ Create the WorkbenchMenu objects for the menu bar.
 
     This is the only external public API of this module.
@@ -284,6 +431,13 @@ def create_menus(workbench, menu_items, action_items):
         The list of all ActionItem objects to include in the menus.
         The order of the items in this list is irrelevant.
 
+    menus : list, optional
+        The list of objects returned by a previous call. The menus and
+        actions of the items which are still present are reused, along
+        with their action groups and separators, and updated in place.
+        The other objects are destroyed, except for the top-level ones
+        which remain the responsibility of the caller.
+
     Returns
     -------
     result : list
@@ -335,5 +489,28 @@ def create_menus(workbench, menu_items, action_items):
         parent.children.append(node)
         node_map[path] = node
 
-    # generate the menus for the root nodes
-    return root.assemble()
+    # validate and order the tree before touching the old objects
+    root.prepare()
+
+    # generate the menus for the root nodes, reusing the old objects
+    cache = AssemblyCache()
+    if menus:
+        cache.collect(None, menus)
+    result = root.assemble(cache)
+
+    # destroy the old objects which were not reused, unless they will
+    # be destroyed along with their parent. The reused objects moved to
+    # the top-level are first detached from the objects to destroy.
+    unused = cache.unused()
+    unused_set = set(unused)
+    for obj in result:
+        if obj.parent in unused_set:
+            obj.set_parent(None)
+    roots = set(menus or ())
+    for obj in unused:
+        if obj in roots or obj.parent in unused_set:
+            continue
+        if not obj.is_destroyed:
+            obj.destroy()
+
+    return result
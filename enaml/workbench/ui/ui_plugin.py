@@ -370,9 +370,11 @@ class UIPlugin(Plugin):
             menu_items.extend(m_items)
             action_items.extend(a_items)
 
-        menus = create_menus(workbench, menu_items, action_items)
+        model = self._model
+        menus = create_menus(workbench, menu_items, action_items, model.menus)
         self._action_extensions = new_extensions
-        self._model.menus = menus
+        if menus != model.menus:
+            model.menus = menus
 
     def _get_autostarts(self):
         """ Get the autostart extension objects.
@@ -34,8 +34,7 @@ class UIWorkbench(Workbench):
             from enaml.workbench.core.core_manifest import CoreManifest
             from enaml.workbench.ui.ui_manifest import UIManifest
 
-        self.register(CoreManifest())
-        self.register(UIManifest())
+        self.register_many([CoreManifest(), UIManifest()])
 
         ui = self.get_plugin(UI_PLUGIN)
         ui.show_window()
@@ -6,8 +6,9 @@
 # The full license is in the file LICENSE, distributed with this software.
 #------------------------------------------------------------------------------
 from collections import defaultdict
+from contextlib import contextmanager
 
-from atom.api import Atom, Event, Typed
+from atom.api import Atom, Event, Int, Typed
 
 from .plugin import Plugin
 
@@ -62,6 +63,58 @@ class Workbench(Atom):
 
         self.plugin_added(plugin_id)
 
+    def register_many(self, manifests):
+        """ Register several plugins with the workbench.
+
+        The extension points affected by the new plugins are updated
+        once, after all of the plugins have been registered.
+
+        Parameters
+        ----------
+        manifests : iterable
+            The plugin manifests to register with the workbench.
+
+        """
+        with self.batch_update():
+            for manifest in manifests:
+                self.register(manifest)
+
+    def register_index(self, index):
+        """ Register the plugins described by a manifest index.
+
+        The plugins are registered with lazy manifests which declare
+        the indexed extension points and extensions. The real manifest
+        of a plugin is only imported when the plugin is created, or
+        when the factory, commands or content of one of its extensions
+        is used.
+
+        Parameters
+        ----------
+        index : ManifestIndex
+            The index describing the plugins to register.
+
+        """
+        self.register_many(index.create_manifests())
+
+    @contextmanager
+    def batch_update(self):
+        """ A context manager which batches extension point updates.
+
+        While the context is active, the registration and removal of
+        plugins does not update the extensions of the extension points.
+        Each affected extension point is updated once, when the
+        outermost context exits. The plugin and extension point events
+        are still emitted immediately.
+
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_extension_points()
+
     def unregister(self, plugin_id):
         """ Remove a plugin from the workbench.
 
@@ -196,6 +249,13 @@ class Workbench(Atom):
     #: A mapping of extension point id to set of Extensions.
     _contributions = Typed(defaultdict, (set,))
 
+    #: The nesting depth of the active batch updates.
+    _batch_depth = Int()
+
+    #: A mapping of ExtensionPoint to qualified id for the extension
+    #: points which must be updated at the end of the batch update.
+    _pending_points = Typed(dict, ())
+
     def _add_extension_points(self, extension_points):
         """ Add extension points to the workbench.
 
@@ -325,9 +385,33 @@ class Workbench(Atom):
             The Extension objects to add to the point.
 
         """
+        if self._batch_depth > 0:
+            if to_remove or to_add:
+                self._pending_points[point] = point.qualified_id
+            return
         if to_remove or to_add:
             extensions = set(point.extensions)
             extensions.difference_update(to_remove)
             extensions.update(to_add)
             key = lambda ext: ext.rank
             point.extensions = tuple(sorted(extensions, key=key))
+
+    def _flush_extension_points(self):
+        """ Update the extension points modified during a batch update.
+
+        The extensions of each point are recomputed from the current
+        contributions, and the point is only updated if they changed.
+
+        """
+        pending = self._pending_points
+        self._pending_points = {}
+        registered = self._extension_points
+        contributions = self._contributions
+        for point, point_id in pending.items():
+            if registered.get(point_id) is point:
+                extensions = contributions.get(point_id, ())
+            else:
+                extensions = ()
+            if set(point.extensions) != set(extensions):
+                key = lambda ext: ext.rank
+                point.extensions = tuple(sorted(extensions, key=key))
@@ -237,3 +237,182 @@ def test_handling_nested_dock_area(enaml_qtbot, enaml_sleep):
     win.inner.update_layout(op)
     enaml_qtbot.wait(enaml_sleep)
     assert dock_item.parent is win.inner
+
+
+def test_layout_hit_index(enaml_qtbot, enaml_sleep):
+    """Test that the hit index finds the same targets as a full hit test.
+
+    """
+    from enaml.layout.api import TabLayout, VSplitLayout
+    from enaml.qt.QtCore import QPoint
+    from enaml.qt.docking.layout_handling import (LayoutHitIndex,
+                                                  layout_hit_test)
+
+    win = compile_source(DOCK_AREA_TEMPLATE, 'Main')()
+    for i in range(3, 6):
+        DockItem(win.area, name='item%d' % i)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    win.area.layout = HSplitLayout('item1',
+                                   VSplitLayout('item2', 'item3'),
+                                   TabLayout('item4', 'item5'))
+    enaml_qtbot.wait(enaml_sleep)
+
+    area = win.area.proxy.widget
+    index = LayoutHitIndex(area)
+    assert index.is_valid()
+    hits = set()
+    for x in range(-10, area.width() + 10, 3):
+        for y in range(-10, area.height() + 10, 3):
+            pos = QPoint(x, y)
+            expected = layout_hit_test(area, pos)
+            assert index.hit_test(pos) is expected
+            hits.add(type(expected).__name__)
+    assert hits == {'NoneType', 'QDockSplitterHandle', 'QDockTabWidget',
+                    'QDockContainer'}
+
+    area.resize(area.width() + 50, area.height())
+    assert not index.is_valid()
+
+    def check(index):
+        for x in range(0, area.width(), 7):
+            for y in range(0, area.height(), 7):
+                pos = QPoint(x, y)
+                assert index.hit_test(pos) is layout_hit_test(area, pos)
+
+    # Switching tabs, hiding items and moving splitters change the
+    # targets without resizing the area.
+    from enaml.qt.docking.layout_handling import iter_containers, iter_tabs
+    tab_widget = next(iter_tabs(area))
+    container = next(c for c in iter_containers(area)
+                     if c.objectName() == 'item3')
+    changes = [
+        lambda: tab_widget.setCurrentIndex(1 - tab_widget.currentIndex()),
+        container.hide,
+        container.show,
+        lambda: tab_widget.parent().moveSplitter(100, 1),
+    ]
+    for change in changes:
+        index = LayoutHitIndex(area)
+        check(index)
+        assert index.is_valid()
+        change()
+        enaml_qtbot.wait(enaml_sleep)
+        assert not index.is_valid()
+        check(LayoutHitIndex(area))
+
+
+def test_proximity_handler_index(enaml_qtbot, enaml_sleep):
+    """Test that the proximity index follows the floating frames.
+
+    """
+    from enaml.layout.api import DockLayout, ItemLayout
+    from enaml.qt.QtCore import QPoint, QRect
+
+    win = compile_source(DOCK_AREA_TEMPLATE, 'Main')()
+    for i in range(3, 7):
+        DockItem(win.area, name='item%d' % i)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    win.area.layout = DockLayout(
+        HSplitLayout('item1', 'item2'),
+        *[ItemLayout('item%d' % i, floating=True,
+                     geometry=(100 + 220 * (i - 3), 100, 200, 150))
+          for i in range(3, 7)]
+    )
+    enaml_qtbot.wait(enaml_sleep)
+
+    manager = win.area.proxy.manager
+    handler = manager._proximity_handler
+    frames = list(handler._nodes)
+    assert len(frames) == 4
+
+    def check(distance):
+        for x in range(-100, 1200, 37):
+            for y in range(-100, 500, 37):
+                rect = QRect(x, y, 120, 80)
+                d = max(0, distance)
+                expected = [
+                    f for f in frames if rect.intersects(
+                        f.frameGeometry().adjusted(-d, -d, d, d))
+                ]
+                assert list(handler.proximalFrames(rect, distance)) == \
+                    expected
+
+    check(0)
+    check(20)
+
+    # Moving and resizing the frames updates the index.
+    frames[0].move(frames[0].pos() + QPoint(500, 250))
+    frames[1].resize(600, 400)
+    frames[2].move(-300, -300)
+    check(10)
+    assert list(handler.proximalFrames(QRect(-250, -250, 5, 5), 0)) == \
+        [frames[2]]
+
+    handler.removeFrame(frames[3])
+    frames.pop()
+    check(10)
+
+
+def test_apply_layout_reuses_widgets(enaml_qtbot, enaml_sleep):
+    """Test that applying a layout reuses the unchanged layout widgets.
+
+    """
+    from enaml.layout.api import TabLayout, VSplitLayout
+    from enaml.qt.docking.q_dock_splitter import QDockSplitter
+    from enaml.qt.docking.q_dock_tab_widget import QDockTabWidget
+
+    win = compile_source(DOCK_AREA_TEMPLATE, 'Main')()
+    for i in range(3, 6):
+        DockItem(win.area, name='item%d' % i)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    win.area.layout = HSplitLayout('item1',
+                                   VSplitLayout('item2', 'item3'),
+                                   TabLayout('item4', 'item5'))
+    enaml_qtbot.wait(enaml_sleep)
+
+    area = win.area.proxy.widget
+    root = area.centralWidget()
+    assert isinstance(root, QDockSplitter)
+    vsplit = root.widget(1)
+    tabs = root.widget(2)
+    assert isinstance(tabs, QDockTabWidget)
+    item2 = vsplit.widget(0)
+
+    def names(node):
+        from enaml.layout.api import ItemLayout
+        if isinstance(node, ItemLayout):
+            return [node.name]
+        return [name for child in node.children() for name in names(child)]
+
+    # Moving a tab only reorders the tabs of the existing tab widget.
+    win.area.layout = HSplitLayout('item1',
+                                   VSplitLayout('item2', 'item3'),
+                                   TabLayout('item5', 'item4', index=1))
+    enaml_qtbot.wait(enaml_sleep)
+    assert area.centralWidget() is root
+    assert root.widget(1) is vsplit and root.widget(2) is tabs
+    assert vsplit.widget(0) is item2
+    assert [tabs.widget(i).objectName() for i in range(2)] == \
+        ['item5', 'item4']
+    assert tabs.currentIndex() == 1
+
+    # Moving an item between subtrees keeps the other subtrees.
+    win.area.layout = HSplitLayout('item1',
+                                   VSplitLayout('item2', 'item3', 'item4'),
+                                   'item5')
+    enaml_qtbot.wait(enaml_sleep)
+    assert area.centralWidget() is root
+    assert root.widget(1) is vsplit
+    assert vsplit.count() == 3 and vsplit.widget(0) is item2
+    assert not tabs.isVisible()
+    layout = win.area.save_layout()
+    assert names(layout) == ['item1', 'item2', 'item3', 'item4', 'item5']
+
+    # A different structure is still applied correctly.
+    win.area.layout = TabLayout('item3', 'item1')
+    enaml_qtbot.wait(enaml_sleep)
+    assert isinstance(area.centralWidget(), QDockTabWidget)
+    assert names(win.area.save_layout()) == ['item3', 'item1']
@@ -0,0 +1,251 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+import json
+import warnings
+
+import pytest
+
+from enaml.layout.api import (
+    AreaLayout, DockBarLayout, DockLayout, DockLayoutWarning, HSplitLayout,
+    ItemLayout, TabLayout, VSplitLayout
+)
+from enaml.layout.dock_layout import DockLayoutValidator
+from enaml.layout.dock_layout_codec import (
+    DockLayoutDataValidator, decode_bytes, decode_json, layout_from_bytes,
+    layout_from_data, layout_from_json, layout_to_bytes, layout_to_data,
+    layout_to_json
+)
+
+
+def make_layout():
+    """ Create a layout using every node type and attribute.
+
+    """
+    return DockLayout(
+        AreaLayout(
+            HSplitLayout(
+                VSplitLayout('item1', 'item2', sizes=[100, 250]),
+                TabLayout('item3', ItemLayout('item4'), index=1,
+                          tab_position='left'),
+                'item5',
+            ),
+            dock_bars=[
+                DockBarLayout('item6', position='left'),
+                DockBarLayout('item7', 'item8', position='bottom'),
+            ],
+        ),
+        AreaLayout(
+            TabLayout(u'itém9', 'item10'),
+            floating=True, linked=True, geometry=(-20, 30, 400, 300),
+        ),
+        ItemLayout('item11', floating=True, maximized=True,
+                   geometry=(10, 20, 300, 200)),
+        AreaLayout(floating=True),
+    )
+
+
+def layout_state(node):
+    """ Get a comparable representation of a layout node.
+
+    """
+    state = {'type': type(node).__name__}
+    for name in node.members():
+        value = getattr(node, name)
+        if isinstance(value, list):
+            value = [layout_state(v) if hasattr(v, 'members') else v
+                     for v in value]
+        elif hasattr(value, 'members'):
+            value = layout_state(value)
+        elif name == 'geometry':
+            value = tuple(value)
+        state[name] = value
+    return state
+
+
+@pytest.mark.parametrize('encode, decode', [
+    (layout_to_data, layout_from_data),
+    (layout_to_json, layout_from_json),
+    (layout_to_bytes, layout_from_bytes),
+])
+def test_layout_round_trip(encode, decode):
+    """ Test that a layout is preserved by its serialized forms.
+
+    """
+    layout = make_layout()
+    decoded = decode(encode(layout))
+    assert isinstance(decoded, DockLayout)
+    assert layout_state(decoded) == layout_state(layout)
+
+
+def test_layout_decoded_forms():
+    """ Test that the JSON and binary forms decode to the layout data.
+
+    """
+    layout = make_layout()
+    data = layout_to_data(layout)
+    assert decode_json(layout_to_json(layout)) == data
+    assert decode_bytes(layout_to_bytes(layout)) == data
+    assert len(layout_to_bytes(layout)) < len(layout_to_json(layout))
+
+
+def test_layout_version_checks():
+    """ Test that unsupported and corrupted layouts are rejected.
+
+    """
+    layout = DockLayout('item1')
+    state = json.loads(layout_to_json(layout))
+    state['version'] = 0
+    with pytest.raises(ValueError):
+        decode_json(json.dumps(state))
+
+    data = layout_to_bytes(layout)
+    with pytest.raises(ValueError):
+        decode_bytes(data[:3] + b'\x00' + data[4:])
+    with pytest.raises(ValueError):
+        decode_bytes(data[:-2])
+    with pytest.raises(ValueError):
+        decode_bytes(data + b'\x00')
+    with pytest.raises(ValueError):
+        decode_bytes(b'XYZ' + data[3:])
+
+
+@pytest.mark.parametrize('layout, available', [
+    (make_layout(), ['item%d' % i for i in range(1, 12) if i != 9]),
+    (DockLayout(HSplitLayout('item1', HSplitLayout('item2', 'item1'),
+                             sizes=[1])), ['item1', 'item3']),
+    (DockLayout(AreaLayout(TabLayout(ItemLayout('item1', maximized=True)),
+                           linked=True, maximized=True,
+                           geometry=(1, 2, 3, 4)),
+                AreaLayout(ItemLayout('item2', linked=True,
+                                      geometry=(1, 2, 3, 4))),
+                'item3'), ['item1', 'item2', 'item3']),
+    (DockLayout(AreaLayout(dock_bars=[
+        DockBarLayout(ItemLayout('item1', maximized=True)),
+        DockBarLayout('item2')])), ['item1', 'item2']),
+])
+def test_layout_data_validation(layout, available):
+    """ Test that the data validator emits the same warnings as the
+    layout validator.
+
+    """
+    def warnings_of(validator, node):
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+            validator(available)(node)
+        for record in records:
+            assert record.category is DockLayoutWarning
+        return sorted(str(record.message) for record in records)
+
+    expected = warnings_of(DockLayoutValidator, layout)
+    data = decode_bytes(layout_to_bytes(layout))
+    assert warnings_of(DockLayoutDataValidator, data) == expected
+
+
+def test_layout_from_json_validation():
+    """ Test the validation performed when loading a layout.
+
+    """
+    text = layout_to_json(DockLayout(AreaLayout('item1')))
+    with pytest.warns(DockLayoutWarning):
+        layout_from_json(text, available=['item2'])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        layout_from_json(text, available=['item1'])
+
+
+def test_truncated_binary_layout():
+    """ Test that every truncation of a binary layout is rejected.
+
+    """
+    data = layout_to_bytes(make_layout())
+    for size in range(len(data)):
+        with pytest.raises(ValueError):
+            decode_bytes(data[:size])
+
+
+def test_corrupted_binary_layout():
+    """ Test that a corrupted binary layout is either rejected with a
+    ValueError or decoded to data from which a layout can be created.
+
+    """
+    data = layout_to_bytes(make_layout())
+    values = set(b'itsbadx') | {0, 4, 0x7f, 0x80, 0xff}
+    for pos in range(4, len(data)):
+        for value in values:
+            corrupted = data[:pos] + bytes([value]) + data[pos + 1:]
+            try:
+                layout_data = decode_bytes(corrupted)
+            except ValueError:
+                continue
+            layout_from_data(layout_data)
+
+
+@pytest.mark.parametrize('data', [
+    b'EDL\x01x\x00',
+    b'EDL\x01d\x01d\x00',
+    b'EDL\x01t\x07\x00\x00',
+    b'EDL\x01s\x02\x00\x00',
+    b'EDL\x01b\x04\x00',
+    b'EDL\x01d\x01b\x00\x00',
+    b'EDL\x01t\x00\x00\x01s\x00\x00\x00',
+    b'EDL\x01i\x02\xff\xfe\x00',
+])
+def test_invalid_binary_layout(data):
+    """ Test that binary layouts with wrong tags or values are rejected.
+
+    """
+    with pytest.raises(ValueError):
+        decode_bytes(data)
+
+
+@pytest.mark.parametrize('layout', [
+    None,
+    [],
+    ['x'],
+    [['d', []]],
+    ['d'],
+    ['d', [], []],
+    ['d', None],
+    ['d', [['t', [], 'top', 0]]],
+    ['d', [['b', [], 'top']]],
+    ['d', [['i', 1, 0, None]]],
+    ['d', [['i', 'item1', None, None]]],
+    ['d', [['i', 'item1', 0, [1, 2, 3]]]],
+    ['d', [['i', 'item1', 0, 'geometry']]],
+    ['t', [['s', [], 'h', []]], 'top', 0],
+    ['t', [], 'middle', 0],
+    ['t', [], 'top', 1.5],
+    ['s', [], 'x', []],
+    ['s', [], 'h', ['1']],
+    ['s', [['d', []]], 'h', []],
+    ['b', ['item1'], 'top'],
+    ['a', ['b', [], 'top'], [], 0, None],
+    ['a', None, [['i', 'item1', 0, None]], 0, None],
+    ['a', None, [], True, None],
+])
+def test_invalid_layout_text(layout):
+    """ Test that layout texts with malformed layout data are rejected.
+
+    """
+    text = json.dumps({'version': 1, 'layout': layout})
+    with pytest.raises(ValueError):
+        decode_json(text)
+    with pytest.raises(ValueError):
+        layout_from_json(text, available=['item1'])
+
+
+def test_malformed_layout_text():
+    """ Test that malformed layout texts are rejected.
+
+    """
+    for text in ['', '{', '[]', '{"version": 1}', '[' * 100000]:
+        with pytest.raises(ValueError):
+            decode_json(text)
+    with pytest.raises(ValueError):
+        decode_bytes(b'EDL\x01' + b'a\x10' * 100000 + b'i\x00\x00\x00' +
+                     b'\x00' * 100000)
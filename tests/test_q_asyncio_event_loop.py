@@ -0,0 +1,196 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the asyncio event loop running on top of the Qt event loop.
+
+"""
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+from utils import is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+@pytest.yield_fixture
+def qt_event_loop(qt_app):
+    from enaml.qt.q_asyncio_event_loop import QAsyncioEventLoop
+    loop = QAsyncioEventLoop()
+    yield loop
+    loop.close()
+
+
+def test_run_until_complete(qt_event_loop):
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        return asyncio.get_event_loop()
+
+    assert qt_event_loop.run_until_complete(compute()) is qt_event_loop
+    assert not qt_event_loop.is_running()
+
+
+def test_call_order(qt_event_loop):
+    results = []
+
+    def stop():
+        results.append('stop')
+        qt_event_loop.stop()
+
+    qt_event_loop.call_later(0.02, stop)
+    qt_event_loop.call_later(0.01, results.append, 'later')
+    qt_event_loop.call_soon(results.append, 'soon')
+    qt_event_loop.run_forever()
+    assert results == ['soon', 'later', 'stop']
+
+
+def test_call_soon_threadsafe(qt_event_loop):
+    main_thread = threading.current_thread()
+    future = qt_event_loop.create_future()
+
+    def resolve():
+        future.set_result(threading.current_thread())
+
+    def worker():
+        qt_event_loop.call_soon_threadsafe(resolve)
+
+    qt_event_loop.call_soon(threading.Thread(target=worker).start)
+    assert qt_event_loop.run_until_complete(future) is main_thread
+
+
+def test_socket_readers(qt_event_loop):
+    rsock, wsock = socket.socketpair()
+
+    async def exchange():
+        reader, writer = await asyncio.open_connection(sock=rsock)
+        qt_event_loop.call_later(0.01, wsock.send, b'enaml')
+        data = await reader.readexactly(5)
+        writer.close()
+        return data
+
+    try:
+        assert qt_event_loop.run_until_complete(exchange()) == b'enaml'
+    finally:
+        wsock.close()
+
+
+@pytest.yield_fixture
+def asyncio_app(qt_app):
+    from enaml.application import Application
+    from enaml.qt.qt_asyncio_application import QtAsyncioApplication
+    Application._instance = None
+    app = QtAsyncioApplication()
+    try:
+        yield app
+    finally:
+        # Destroying the application would also exit the QApplication
+        # shared by the other tests.
+        app.loop.close()
+        asyncio.set_event_loop(None)
+        Application._instance = qt_app
+
+
+def run_until(loop, condition, timeout=5.0):
+    """Run the loop until the condition is true.
+
+    """
+    async def wait():
+        end = loop.time() + timeout
+        while not condition():
+            assert loop.time() < end, 'condition not met in time'
+            await asyncio.sleep(0.005)
+
+    loop.run_until_complete(wait())
+
+
+def test_application_calls(asyncio_app):
+    loop = asyncio_app.loop
+    results = []
+    asyncio_app.timed_call(20, results.append, 'timed')
+    asyncio_app.deferred_call(results.append, 'deferred')
+    threading.Thread(
+        target=asyncio_app.deferred_call, args=(results.append, 'thread')
+    ).start()
+    run_until(loop, lambda: len(results) == 3)
+    assert results[0] == 'deferred'
+    assert results[-1] == 'timed'
+
+
+def test_application_awaitables(asyncio_app):
+    loop = asyncio_app.loop
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+    async def compute(value):
+        await asyncio.sleep(0.01)
+        if value is None:
+            raise ValueError()
+        return value * 2
+
+    # The result of the coroutine of a task reaches the task.
+    notified = []
+    task = asyncio_app.schedule(compute, (21,))
+    task.notify(notified.append)
+    run_until(loop, lambda: not task.pending())
+    assert task.result() == 42
+    assert notified == [42]
+
+    # So does its exception, which is reported to the loop.
+    task = asyncio_app.schedule(compute, (None,))
+    task.notify(notified.append)
+    run_until(loop, lambda: not task.pending())
+    assert task.result() is None
+    assert notified == [42]
+    assert isinstance(errors[0]['exception'], ValueError)
+
+    # The coroutines returned to deferred_call are run as tasks.
+    results = []
+
+    async def record(value):
+        results.append(await compute(value))
+
+    asyncio_app.deferred_call(record, 1)
+    asyncio_app.deferred_call(record, None)
+    run_until(loop, lambda: results and len(errors) == 2)
+    assert results == [2]
+    assert isinstance(errors[1]['exception'], ValueError)
+
+
+def test_application_nested_event_loop(asyncio_app):
+    from enaml.qt.QtCore import QEventLoop, QTimer
+
+    loop = asyncio_app.loop
+    results = []
+    times = []
+
+    def modal():
+        nested = QEventLoop()
+        QTimer.singleShot(300, nested.quit)
+        start = time.perf_counter(), time.process_time()
+        nested.exec_()
+        times.append((time.perf_counter() - start[0],
+                      time.process_time() - start[1]))
+        results.append('modal')
+
+    # The calls keep being processed while a callback runs a nested
+    # event loop, without spinning the cpu.
+    asyncio_app.deferred_call(modal)
+    asyncio_app.deferred_call(results.append, 'deferred')
+    asyncio_app.timed_call(20, results.append, 'timed')
+    asyncio_app.deferred_call(
+        lambda: threading.Thread(target=asyncio_app.deferred_call,
+                                 args=(results.append, 'thread')).start()
+    )
+    run_until(loop, lambda: 'modal' in results)
+    assert results[-1] == 'modal'
+    assert sorted(results[:-1]) == ['deferred', 'thread', 'timed']
+    wall, cpu = times[0]
+    assert cpu < wall / 2
@@ -0,0 +1,119 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the batched delivery of deferred calls.
+
+"""
+import threading
+
+import pytest
+from utils import is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+def test_deferred_calls_run_in_order(enaml_qtbot):
+    from enaml.qt.q_deferred_caller import deferredCall
+
+    results = []
+    for i in range(100):
+        deferredCall(results.append, i)
+
+    def check():
+        assert len(results) == 100
+    enaml_qtbot.wait_until(check)
+    assert results == list(range(100))
+
+
+def test_deferred_calls_from_threads(enaml_qtbot):
+    from enaml.qt.q_deferred_caller import deferredCall
+
+    results = []
+    main_thread = threading.current_thread()
+
+    def record(value):
+        assert threading.current_thread() is main_thread
+        results.append(value)
+
+    def worker(offset):
+        for i in range(500):
+            deferredCall(record, offset + i)
+
+    threads = [threading.Thread(target=worker, args=(i * 500,))
+               for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    def check():
+        assert len(results) == 2000
+    enaml_qtbot.wait_until(check)
+    assert sorted(results) == list(range(2000))
+
+
+def test_deferred_calls_added_while_draining(enaml_qtbot):
+    from enaml.qt.q_deferred_caller import deferredCall
+
+    results = []
+
+    def reschedule(count):
+        results.append(count)
+        if count < 10:
+            deferredCall(reschedule, count + 1)
+
+    deferredCall(reschedule, 0)
+
+    def check():
+        assert len(results) == 11
+    enaml_qtbot.wait_until(check)
+    assert results == list(range(11))
+
+
+def test_deferred_calls_survive_exception(enaml_qtbot):
+    from enaml.qt.q_deferred_caller import DeferredCaller, DeferredCallEvent
+
+    results = []
+
+    def fail():
+        raise ValueError()
+
+    caller = DeferredCaller()
+    caller.enqueue(fail, (), {})
+    caller.enqueue(results.append, (1,), {})
+    with pytest.raises(ValueError):
+        caller.customEvent(DeferredCallEvent())
+
+    def check():
+        assert results == [1]
+    enaml_qtbot.wait_until(check)
+
+
+
+def test_deferred_calls_run_in_nested_event_loop(enaml_qtbot):
+    from enaml.qt.QtCore import QEventLoop, QTimer
+    from enaml.qt.q_deferred_caller import deferredCall
+
+    results = []
+
+    def modal():
+        nested = QEventLoop()
+        QTimer.singleShot(200, nested.quit)
+        nested.exec_()
+        results.append('modal')
+
+    # The calls following a callback which runs a nested event loop
+    # are run by that loop.
+    deferredCall(modal)
+    for i in range(3):
+        deferredCall(results.append, i)
+
+    def check():
+        assert 'modal' in results
+    enaml_qtbot.wait_until(check)
+    assert results == [0, 1, 2, 'modal']
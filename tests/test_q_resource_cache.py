@@ -0,0 +1,50 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the LRU cache of the toolkit resources.
+
+"""
+import pytest
+
+from utils import is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+def test_resource_cache_lru():
+    """Test the eviction of the least recently used resources.
+
+    """
+    from enaml.qt.q_resource_cache import ResourceCache
+    cache = ResourceCache(100)
+    cache.add('a', 'A', 40)
+    cache.add('b', 'B', 40)
+    assert cache.get('a') == 'A'
+    cache.add('c', 'C', 40)
+    assert cache.get('b') is None
+    assert cache.get('a') == 'A'
+    assert cache.get('c') == 'C'
+    assert cache.stats() == (3, 1, 1, 2, 80, 100)
+
+    # A resource larger than the cache is not cached.
+    cache.add('d', 'D', 200)
+    assert cache.get('d') is None
+    assert cache.stats().nbytes == 80
+
+    # Replacing a resource updates the size of the cache.
+    cache.add('a', 'A2', 10)
+    assert cache.stats().nbytes == 50
+
+    cache.set_max_bytes(30)
+    assert cache.get('c') is None
+    assert cache.get('a') == 'A2'
+    assert cache.stats().evictions == 2
+    assert cache.stats().count == 1
+
+    cache.clear()
+    assert cache.stats() == (0, 0, 0, 0, 0, 30)
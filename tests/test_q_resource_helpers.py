@@ -21,3 +21,232 @@ def test_QFont_from_Font():
     from enaml.qt.q_resource_helpers import QFont_from_Font
     f = Font(family="bold")
     qf = QFont_from_Font(f)
+
+
+def test_image_buffer_data():
+    """Test that the buffers given to an Image are not copied.
+
+    """
+    from enaml.image import Image
+    buffer = bytearray(16)
+    image = Image(format='argb32', raw_size=(2, 2), data=buffer)
+    assert isinstance(image.data, memoryview)
+    assert image.data.obj is buffer
+    assert Image(data='abc').data == b'abc'
+    with pytest.raises(TypeError):
+        Image(data=1)
+
+
+def expected_pixel(format, data):
+    """Compute the ARGB value of a pixel from its raw bytes.
+
+    """
+    if format == 'argb32':
+        return int.from_bytes(data, 'little')
+    elif format == 'rgb888':
+        r, g, b = data
+    else:
+        r = g = b = data[0]
+    return 0xff000000 | r << 16 | g << 8 | b
+
+
+@pytest.mark.parametrize('format, depth',
+                         [('argb32', 4), ('rgb888', 3), ('grayscale8', 1)])
+def test_QImage_from_Image_buffer(qt_app, format, depth):
+    """Test that a raw QImage is built over the buffer of an Image.
+
+    """
+    from enaml.image import Image
+    from enaml.qt.q_resource_helpers import QImage_from_Image
+    w, h = 5, 3
+    buffer = bytearray(range(w * h * depth))
+    qimage = QImage_from_Image(Image(format=format, raw_size=(w, h),
+                                     data=buffer))
+    assert (qimage.width(), qimage.height()) == (w, h)
+    assert qimage.bytesPerLine() == w * depth
+    for x, y in [(0, 0), (3, 1), (4, 2)]:
+        offset = (y * w + x) * depth
+        data = buffer[offset:offset + depth]
+        assert qimage.pixel(x, y) == expected_pixel(format, data)
+
+    # The QImage uses the buffer in place.
+    buffer[w * depth:(w + 1) * depth] = b'\xff' * depth
+    assert qimage.pixel(0, 1) == 0xffffffff
+
+    with pytest.raises(ValueError):
+        QImage_from_Image(Image(format=format, raw_size=(w, h + 1),
+                                data=buffer))
+
+
+def test_QImage_from_Image_array(qt_app):
+    """Test that the row stride of an array is used for the image.
+
+    """
+    np = pytest.importorskip('numpy')
+    from enaml.image import Image
+    from enaml.qt.q_resource_helpers import QImage_from_Image
+    array = np.arange(8 * 6, dtype=np.uint8).reshape(6, 8)
+    qimage = QImage_from_Image(Image(format='grayscale8', raw_size=(8, 6),
+                                     data=array))
+    assert qimage.pixel(3, 2) == expected_pixel('grayscale8', [19])
+    array[2, 3] = 255
+    assert qimage.pixel(3, 2) == 0xffffffff
+
+    # A sliced array is copied into a contiguous buffer.
+    qimage = QImage_from_Image(Image(format='grayscale8', raw_size=(6, 6),
+                                     data=array[:, 2:]))
+    assert qimage.pixel(1, 2) == 0xffffffff
+    assert qimage.pixel(0, 3) == expected_pixel('grayscale8', [26])
+
+
+def test_shared_resources(qt_app, monkeypatch):
+    """Test that equal resources share the same toolkit object.
+
+    """
+    from enaml.colors import Color
+    from enaml.icon import Icon, IconImage
+    from enaml.image import Image
+    from enaml.qt import q_resource_helpers as helpers
+    from enaml.qt.q_resource_cache import ResourceCache
+    cache = ResourceCache(1024)
+    monkeypatch.setattr(helpers, 'RESOURCE_CACHE', cache)
+
+    assert (helpers.get_cached_qcolor(Color(1, 2, 3)) is
+            helpers.get_cached_qcolor(Color(1, 2, 3)))
+    assert (helpers.get_cached_qfont(Font(family='bold')) is
+            helpers.get_cached_qfont(Font(family='bold')))
+    assert cache.stats()[:2] == (2, 2)
+
+    def make_icon():
+        image = Image(format='argb32', raw_size=(4, 4), data=bytes(64))
+        return Icon(images=[IconImage(image=image)])
+
+    qicon = helpers.get_cached_qicon(make_icon())
+    assert helpers.get_cached_qicon(make_icon()) is qicon
+    # A color, a font, an image and an icon are cached.
+    assert cache.stats().nbytes == 16 + 128 + 64 + 64
+
+    # The images over a buffer are not shared.
+    buffer = bytearray(64)
+    image = Image(format='argb32', raw_size=(4, 4), data=buffer)
+    other = Image(format='argb32', raw_size=(4, 4), data=buffer)
+    assert helpers.get_cached_qimage(image) is image._tkdata
+    assert helpers.get_cached_qimage(other) is not image._tkdata
+
+    # Evicted resources are rebuilt.
+    cache.set_max_bytes(0)
+    assert cache.stats().count == 0
+    assert helpers.get_cached_qicon(make_icon()) is not qicon
+
+
+def make_png(value):
+    """Encode a small PNG image filled with the given gray value.
+
+    """
+    from enaml.qt.QtCore import QBuffer, QByteArray, QIODevice
+    from enaml.qt.QtGui import QColor, QImage
+    qimage = QImage(8, 8, QImage.Format_ARGB32)
+    qimage.fill(QColor(value, value, value))
+    array = QByteArray()
+    buffer = QBuffer(array)
+    buffer.open(QIODevice.WriteOnly)
+    qimage.save(buffer, 'PNG')
+    return bytes(array)
+
+
+def test_background_decoding(enaml_qtbot, monkeypatch):
+    """Test decoding images on worker threads.
+
+    """
+    from enaml.image import Image
+    from enaml.icon import Icon, IconImage
+    from enaml.qt import q_resource_helpers as helpers
+    from enaml.qt.q_background_decoder import BackgroundDecoder
+    from enaml.qt.q_resource_cache import ResourceCache
+    cache = ResourceCache(1024 * 1024)
+    decoder = BackgroundDecoder()
+    monkeypatch.setattr(helpers, 'RESOURCE_CACHE', cache)
+    monkeypatch.setattr(helpers, 'IMAGE_DECODER', decoder)
+
+    # The images which are not decoded asynchronously are available.
+    image = Image(data=make_png(10))
+    assert helpers.request_qimage(image, None).pixel(0, 0) == 0xff0a0a0a
+
+    # The other ones are decoded in the background.
+    called = []
+    image = Image(data=make_png(20), decode_async=True)
+    assert helpers.request_qimage(image, lambda: called.append(1)) is None
+    enaml_qtbot.wait_until(lambda: called == [1])
+    assert cache.stats().count == 2
+    assert helpers.request_qimage(image, None).pixel(0, 0) == 0xff141414
+
+    icon = Icon(images=[
+        IconImage(image=Image(data=make_png(v),
+                              decode_async=True))
+        for v in (30, 40)
+    ])
+    assert helpers.request_qicon(icon, lambda: called.append(2)) is None
+    enaml_qtbot.wait_until(lambda: called == [1, 2])
+    assert not helpers.get_cached_qicon(icon).isNull()
+
+    # The images are warmed up in a batch.
+    images = [Image(data=make_png(v)) for v in range(50, 60)]
+    helpers.warm_up_images(images, lambda: called.append(3))
+    enaml_qtbot.wait_until(lambda: called == [1, 2, 3])
+    hits = cache.stats().hits
+    for value, image in zip(range(50, 60), images):
+        qimage = helpers.get_cached_qimage(image)
+        assert qimage.pixel(0, 0) == 0xff000000 | value * 0x010101
+    assert cache.stats().hits == hits + 10
+
+    # An image requested while it is decoded waits for the decoding.
+    image = Image(data=make_png(70))
+    helpers.warm_up_images([image])
+    assert helpers.get_cached_qimage(image).pixel(0, 0) == 0xff464646
+    decoder.shutdown()
+
+
+def test_background_decoding_uncached(enaml_qtbot, monkeypatch):
+    """Test that the images decoded in the background which do not fit
+    in the cache are not decoded again on the main thread.
+
+    """
+    import threading
+    from enaml.image import Image
+    from enaml.icon import Icon, IconImage
+    from enaml.qt import q_resource_helpers as helpers
+    from enaml.qt.q_background_decoder import BackgroundDecoder
+    from enaml.qt.q_resource_cache import ResourceCache
+    decoder = BackgroundDecoder()
+    monkeypatch.setattr(helpers, 'RESOURCE_CACHE', ResourceCache(16))
+    monkeypatch.setattr(helpers, 'IMAGE_DECODER', decoder)
+
+    threads = []
+    decode = helpers.QImage_from_Image
+
+    def record(image):
+        threads.append(threading.current_thread())
+        return decode(image)
+
+    monkeypatch.setattr(helpers, 'QImage_from_Image', record)
+
+    results = []
+    image = Image(data=make_png(20), decode_async=True)
+    icon = Icon(images=[IconImage(image=Image(data=make_png(30),
+                                              decode_async=True))])
+    helpers.request_qimage(
+        image, lambda: results.append(helpers.get_cached_qimage(image))
+    )
+    helpers.request_qicon(
+        icon, lambda: results.append(helpers.get_cached_qicon(icon))
+    )
+    enaml_qtbot.wait_until(lambda: len(results) == 2)
+    assert results[0].pixel(0, 0) == 0xff141414
+    assert not results[1].isNull()
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+    # The decoded images are only kept until they are retrieved.
+    assert image._tkdata is None
+    assert icon.images[0].image._tkdata is None
+    decoder.shutdown()
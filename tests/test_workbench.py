@@ -40,3 +40,219 @@ def test_workbench(enaml_run, qtbot):
         # Now run from cache
         mod = importlib.import_module('sample')
         mod.main()
+
+
+def make_manifest(plugin_id, point_ids=(), contributions=()):
+    """Create a plugin manifest declaring extension points and extensions.
+
+    """
+    from enaml.workbench.api import PluginManifest, ExtensionPoint, Extension
+
+    manifest = PluginManifest(id=plugin_id)
+    for point_id in point_ids:
+        ExtensionPoint(parent=manifest, id=point_id)
+    for i, (point, rank) in enumerate(contributions):
+        Extension(parent=manifest, id='ext%d' % i, point=point, rank=rank)
+    return manifest
+
+
+def test_workbench_register_many():
+    from enaml.workbench.api import Workbench
+
+    workbench = Workbench()
+    workbench.register(make_manifest('host', ['point']))
+    point = workbench.get_extension_point('host.point')
+    assert point.extensions == ()
+
+    updates = []
+    point.observe('extensions', updates.append)
+
+    manifests = [make_manifest('plugin%d' % i, (), [('host.point', 10 - i)])
+                 for i in range(10)]
+    workbench.register_many(manifests)
+
+    assert len(updates) == 1
+    assert [e.rank for e in point.extensions] == list(range(1, 11))
+
+
+def test_workbench_batch_update():
+    from enaml.workbench.api import Workbench
+
+    workbench = Workbench()
+    with workbench.batch_update():
+        workbench.register(make_manifest('plugin', (), [('host.point', 0)]))
+        workbench.register(make_manifest('host', ['point']))
+        point = workbench.get_extension_point('host.point')
+        assert point.extensions == ()
+    assert len(point.extensions) == 1
+
+    updates = []
+    point.observe('extensions', updates.append)
+    with workbench.batch_update():
+        workbench.register(make_manifest('other', (), [('host.point', 1)]))
+        workbench.unregister('other')
+        workbench.unregister('plugin')
+    assert point.extensions == ()
+    assert len(updates) == 1
+
+    # Removing an extension point in a batch clears its extensions.
+    workbench.register(make_manifest('plugin', (), [('host.point', 0)]))
+    assert len(point.extensions) == 1
+    with workbench.batch_update():
+        workbench.unregister('host')
+    assert point.extensions == ()
+
+
+def test_menu_helper_solve_ordering():
+    from enaml.workbench.ui.action_item import ActionItem
+    from enaml.workbench.ui.menu_helper import ActionNode, solve_ordering
+
+    def make_nodes(*specs):
+        nodes = []
+        for name, before, after in specs:
+            item = ActionItem(path='/%s' % name, before=before, after=after)
+            nodes.append(ActionNode(item=item))
+        return nodes
+
+    def ordered(*specs):
+        return [node.id for node in solve_ordering(make_nodes(*specs))]
+
+    assert ordered(('a', '', ''), ('b', '', ''), ('c', '', '')) == \
+        ['a', 'b', 'c']
+    assert ordered(('a', '', 'c'), ('b', '', ''), ('c', '', '')) == \
+        ['c', 'a', 'b']
+    assert ordered(('a', '', ''), ('b', '', ''), ('c', 'a', '')) == \
+        ['c', 'a', 'b']
+    # Cyclic constraints do not prevent the nodes from being ordered.
+    assert sorted(ordered(('a', 'b', ''), ('b', 'a', ''))) == ['a', 'b']
+
+    with pytest.raises(ValueError):
+        ordered(('a', 'missing', ''))
+    with pytest.raises(ValueError):
+        ordered(('a', '', 'missing'))
+
+
+def test_menu_helper_reuses_menus(qt_app):
+    from enaml.workbench.api import Workbench
+    from enaml.workbench.ui.action_item import ActionItem
+    from enaml.workbench.ui.item_group import ItemGroup
+    from enaml.workbench.ui.menu_item import MenuItem
+    from enaml.workbench.ui.menu_helper import create_menus
+
+    workbench = Workbench()
+    file_menu = MenuItem(path='/file', label='File')
+    ItemGroup(parent=file_menu, id='open')
+    ItemGroup(parent=file_menu, id='exit')
+    edit_menu = MenuItem(path='/edit', label='Edit', after='file')
+    open_item = ActionItem(path='/file/open', group='open', label='Open')
+    exit_item = ActionItem(path='/file/exit', group='exit', label='Exit')
+    copy_item = ActionItem(path='/edit/copy', label='Copy')
+
+    menus = create_menus(workbench, [file_menu, edit_menu],
+                         [open_item, exit_item, copy_item])
+    assert [m.item for m in menus] == [file_menu, edit_menu]
+    file_children = list(menus[0].children)
+    assert [type(c).__name__ for c in file_children] == \
+        ['WorkbenchActionGroup', 'Action', 'WorkbenchActionGroup']
+
+    # Rebuilding an unchanged menu tree reuses every object.
+    new_menus = create_menus(workbench, [file_menu, edit_menu],
+                             [open_item, exit_item, copy_item], menus)
+    assert new_menus == menus
+    assert list(menus[0].children) == file_children
+    copy_action = menus[1].children[0].children[0]
+
+    # Only the objects of the removed items are destroyed.
+    new_menus = create_menus(workbench, [file_menu, edit_menu],
+                             [open_item, copy_item], menus)
+    assert new_menus == menus
+    assert file_children[1].is_destroyed
+    assert file_children[2].is_destroyed
+    assert not file_children[0].is_destroyed
+    assert menus[1].children[0].children[0] is copy_action
+
+    # Invalid definitions leave the previous objects untouched.
+    bad_item = ActionItem(path='/edit/paste', before='missing')
+    with pytest.raises(ValueError):
+        create_menus(workbench, [file_menu, edit_menu],
+                     [open_item, copy_item, bad_item], menus)
+    assert not copy_action.is_destroyed
+
+    for menu in menus:
+        menu.destroy()
+
+
+LAZY_MANIFEST_SOURCE = """\
+from enaml.workbench.api import PluginManifest, Extension, ExtensionPoint
+from enaml.workbench.core.api import Command
+
+def make_plugin():
+    from enaml.workbench.api import Plugin
+    return Plugin()
+
+enamldef LazyTestManifest(PluginManifest):
+    id = 'lazy_test'
+    factory = make_plugin
+    ExtensionPoint:
+        id = 'things'
+    Extension:
+        id = 'commands'
+        point = 'enaml.workbench.core.commands'
+        Command:
+            id = 'lazy_test.hello'
+            handler = lambda event: 'hello %s' % event.parameters['name']
+    Extension:
+        id = 'thing'
+        point = 'lazy_test.things'
+        rank = 3
+        factory = lambda: 'thing'
+"""
+
+
+def test_workbench_manifest_index(tmpdir):
+    import enaml
+    from enaml.workbench.api import ManifestIndex, Workbench
+    from enaml.workbench.core.core_plugin import COMMANDS_POINT
+    with enaml.imports():
+        from enaml.workbench.core.core_manifest import CoreManifest
+
+    module_name = 'lazy_test_manifest'
+    tmpdir.join(module_name + '.enaml').write(LAZY_MANIFEST_SOURCE)
+    path = module_name + ':LazyTestManifest'
+    with cd(str(tmpdir), add_to_sys_path=True):
+        index = ManifestIndex.build([path])
+        sys.modules.pop(module_name)
+
+        index_path = str(tmpdir.join('index.json'))
+        index.save(index_path)
+        index = ManifestIndex.load(index_path)
+
+        workbench = Workbench()
+        workbench.register(CoreManifest())
+        workbench.register_index(index)
+        assert module_name not in sys.modules
+
+        point = workbench.get_extension_point('lazy_test.things')
+        assert [e.rank for e in point.extensions] == [3]
+        core = workbench.get_plugin('enaml.workbench.core')
+        assert module_name not in sys.modules
+
+        # Invoking an indexed command materializes the manifest.
+        result = core.invoke_command('lazy_test.hello', {'name': 'lazy'})
+        assert result == 'hello lazy'
+        assert module_name in sys.modules
+        manifest = workbench.get_manifest('lazy_test')
+        assert manifest.real_manifest is not None
+        assert point.extensions[0].factory() == 'thing'
+        assert workbench.get_plugin('lazy_test').manifest is manifest
+
+        real_manifest = manifest.real_manifest
+        workbench.unregister('lazy_test')
+        assert real_manifest.is_destroyed
+        assert workbench.get_extension_point('lazy_test.things') is None
+        commands = workbench.get_extension_point(COMMANDS_POINT).extensions
+        assert not [e for e in commands if e.plugin_id == 'lazy_test']
+        sys.modules.pop(module_name)
+
+    with pytest.raises(ValueError):
+        ManifestIndex.from_dict({'version': 0, 'plugins': []})
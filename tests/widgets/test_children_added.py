@@ -0,0 +1,112 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the batch insertion of children in the Qt proxies.
+
+"""
+import pytest
+
+from utils import is_qt_available, compile_source, wait_for_window_displayed
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+SOURCE = """
+from enaml.core.api import Looper
+from enaml.widgets.api import (
+    Action, Container, Label, MainWindow, Menu, MenuBar, Notebook, Page
+)
+
+enamldef Main(MainWindow):
+
+    attr data = []
+    alias container
+    alias nb
+    alias menu
+
+    MenuBar:
+        Menu: menu:
+            title = 'Menu'
+            Action:
+                text = 'first'
+            Looper:
+                iterable << data
+                Action:
+                    text = loop.item
+            Action:
+                text = 'last'
+    Container: container:
+        Label:
+            text = 'first'
+        Looper:
+            iterable << data
+            Label:
+                text = loop.item
+        Label:
+            text = 'last'
+        Notebook: nb:
+            Page:
+                title = 'first'
+            Looper:
+                iterable << data
+                Page:
+                    title = loop.item
+            Page:
+                title = 'last'
+
+"""
+
+
+def test_children_added_batch(enaml_qtbot, enaml_sleep, monkeypatch):
+    """Test that the proxies are notified once for a batch of children.
+
+    """
+    from enaml.widgets.api import Label
+
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    batches = []
+
+    def record(cls):
+        original = cls.children_added
+
+        def children_added(self, children):
+            batches.append((self.declaration, len(children)))
+            original(self, children)
+        monkeypatch.setattr(cls, 'children_added', children_added)
+
+    for obj in (win.container, win.nb, win.menu):
+        record(type(obj.proxy))
+
+    relayouts = []
+    container = win.container.proxy
+    original_relayout = type(container).request_relayout
+    monkeypatch.setattr(type(container), 'request_relayout',
+                        lambda self: (relayouts.append(self),
+                                      original_relayout(self)))
+
+    win.data = ['a', 'b', 'c', 'd', 'e', 'f']
+    expected = ['first', 'a', 'b', 'c', 'd', 'e', 'f', 'last']
+    assert (win.container, 6) in batches
+    assert (win.nb, 6) in batches
+    assert (win.menu, 6) in batches
+    assert relayouts.count(container) == 1
+
+    labels = [c for c in win.container.children if isinstance(c, Label)]
+    assert [label.text for label in labels] == expected
+    for label in labels:
+        assert label.proxy.widget.parent() is container.widget
+    nb = win.nb.proxy.widget
+    assert [nb.tabText(i) for i in range(nb.count())] == expected
+    menu = win.menu.proxy.widget
+    assert [a.text() for a in menu.actions()] == expected
+
+    enaml_qtbot.wait(enaml_sleep)
+    win.close()
@@ -0,0 +1,242 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the incremental item model of the combo boxes.
+
+"""
+import random
+
+import pytest
+
+from utils import is_qt_available, compile_source, wait_for_window_displayed
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+def record_changes(model):
+    """ Record the rows notified by a model.
+
+    """
+    changes = []
+    model.dataChanged.connect(
+        lambda first, last: changes.append(('changed', first.row(),
+                                            last.row()))
+    )
+    model.rowsInserted.connect(
+        lambda parent, first, last: changes.append(('inserted', first, last))
+    )
+    model.rowsRemoved.connect(
+        lambda parent, first, last: changes.append(('removed', first, last))
+    )
+    return changes
+
+
+def test_item_list_model_diff(qt_app):
+    """Test that the model applies the differences between lists.
+
+    """
+    from enaml.qt.q_item_list_model import QItemListModel
+    model = QItemListModel()
+    changes = record_changes(model)
+    model.setItems(list(range(10)))
+    assert changes == [('inserted', 0, 9)]
+
+    del changes[:]
+    model.setItems(list(range(10)) + [10])
+    assert changes == [('inserted', 10, 10)]
+
+    del changes[:]
+    model.setItems([0, 1, 2, 30, 40, 5, 6, 7, 8, 9, 10])
+    assert changes == [('changed', 3, 4)]
+
+    del changes[:]
+    model.setItems([0, 1, 2, 5, 6, 7, 8, 9, 10])
+    assert changes == [('removed', 3, 4)]
+
+    del changes[:]
+    model.setItems([0, 1, 20, 30, 40, 6, 7, 8, 9, 10])
+    assert changes == [('changed', 2, 3), ('inserted', 4, 4)]
+
+    rand = random.Random(0)
+    items = list(range(20))
+    for _ in range(50):
+        items = list(items)
+        start = rand.randrange(len(items) + 1)
+        stop = rand.randrange(start, min(start + 4, len(items)) + 1)
+        items[start:stop] = [rand.randrange(100)
+                             for _ in range(rand.randrange(4))]
+        model.setItems(items)
+        assert model.rowCount() == len(items)
+        texts = [model.data(model.index(i, 0)) for i in range(len(items))]
+        assert texts == [str(item) for item in items]
+
+
+def test_item_list_model_lazy_data(qt_app):
+    """Test that the texts are computed for the displayed rows only.
+
+    """
+    from enaml.qt.q_item_list_model import QItemListModel
+    calls = []
+
+    def to_string(item):
+        calls.append(item)
+        return 'item %d' % item
+
+    model = QItemListModel()
+    model.setConverters(to_string)
+    items = list(range(1000))
+    model.setItems(items)
+    assert not calls
+    assert model.data(model.index(10, 0)) == 'item 10'
+    assert model.data(model.index(10, 0)) == 'item 10'
+    assert calls == [10]
+
+    # The cached texts of the unchanged rows are kept.
+    model.setItems([-1] + items)
+    assert model.data(model.index(11, 0)) == 'item 10'
+    assert calls == [10]
+
+    # A new converter discards the cached texts.
+    model.setConverters(str)
+    assert model.data(model.index(11, 0)) == '10'
+
+
+def test_item_list_model_identity(qt_app):
+    """Test that the rows are kept for the same objects only.
+
+    """
+    from enaml.qt.q_item_list_model import QItemListModel
+
+    class Named(object):
+        def __init__(self, name):
+            self.name = name
+
+        def __eq__(self, other):
+            return isinstance(other, Named) and self.name == other.name
+
+    model = QItemListModel()
+    model.setConverters(lambda item: str(item.name))
+    a, b = Named('a'), Named('b')
+    model.setItems([a, b])
+    assert model.data(model.index(0, 0)) == 'a'
+
+    # An equal but different item replaces the row.
+    model.setItems([Named(1), b])
+    assert model.data(model.index(0, 0)) == '1'
+    model.setItems([Named(True), b])
+    assert model.data(model.index(0, 0)) == 'True'
+
+    # An item modified in place is displayed again when refreshed.
+    items = model.items()
+    assert model.data(model.index(1, 0)) == 'b'
+    items[1].name = 'renamed'
+    model.setItems(list(items))
+    assert model.data(model.index(1, 0)) == 'b'
+    changes = record_changes(model)
+    model.setItems(list(items), refresh=True)
+    assert changes == [('changed', 0, 1)]
+    assert model.data(model.index(1, 0)) == 'renamed'
+
+    # Items whose comparison does not return a bool can be displayed.
+    np = pytest.importorskip('numpy')
+    model.setConverters(str)
+    arrays = [np.arange(3), np.arange(4)]
+    model.setItems(arrays)
+    model.setItems([np.arange(3)] + arrays[1:])
+    assert model.rowCount() == 2
+
+
+SOURCE = """
+from enaml.widgets.api import Window, Container, ComboBox, ObjectCombo
+
+enamldef Main(Window):
+
+    attr values
+    attr calls = []
+    alias combo
+    alias obj_combo
+
+    Container:
+        ComboBox: combo:
+            items << [str(v) for v in values]
+            index = 0
+        ObjectCombo: obj_combo:
+            items << values
+            to_string = lambda item: calls.append(item) or 'value %d' % item
+
+"""
+
+
+def test_combo_boxes_incremental_updates(enaml_qtbot, enaml_sleep):
+    """Test that appending an item does not rebuild the combo boxes.
+
+    """
+    win = compile_source(SOURCE, 'Main')(values=list(range(20000)))
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    combo = win.combo.proxy.widget
+    obj_combo = win.obj_combo.proxy.widget
+    assert combo.count() == obj_combo.count() == 20000
+    assert obj_combo.currentText() == 'value 0'
+
+    changes = record_changes(win.obj_combo.proxy.model)
+    del win.calls[:]
+    win.obj_combo.selected = 10
+    win.values = win.values + [20000]
+    enaml_qtbot.wait_until(lambda: obj_combo.count() == 20001)
+    assert changes[0] == ('inserted', 20000, 20000)
+    assert len(win.calls) <= 2
+    assert obj_combo.currentText() == 'value 10'
+    assert combo.count() == 20001
+    assert combo.itemText(20000) == '20000'
+
+    # The selection follows the selected item.
+    win.values = win.values[5:]
+    enaml_qtbot.wait_until(lambda: obj_combo.count() == 19996)
+    assert obj_combo.currentIndex() == 5
+    assert win.obj_combo.selected == 10
+
+    win.close()
+
+
+OBJECT_SOURCE = """
+from enaml.widgets.api import Window, Container, ObjectCombo
+
+enamldef Main(Window):
+
+    attr values
+    alias obj_combo
+
+    Container:
+        ObjectCombo: obj_combo:
+            items << values
+            to_string = lambda item: item['name']
+
+"""
+
+
+def test_object_combo_refresh_modified_items(enaml_qtbot, enaml_sleep):
+    """Test that reassigning the items displays the modified items.
+
+    """
+    values = [{'name': 'a'}, {'name': 'b'}, {'name': 'b'}]
+    win = compile_source(OBJECT_SOURCE, 'Main')(values=values)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    obj_combo = win.obj_combo.proxy.widget
+
+    # The last item equal to the selected one is selected.
+    win.obj_combo.selected = {'name': 'b'}
+    assert obj_combo.itemText(0) == 'a'
+    values[0]['name'] = 'renamed'
+    win.values = values + [{'name': 'c'}]
+    enaml_qtbot.wait_until(lambda: obj_combo.count() == 4)
+    assert obj_combo.itemText(0) == 'renamed'
+    assert obj_combo.currentIndex() == 2
+
+    win.close()
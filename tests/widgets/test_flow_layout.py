@@ -0,0 +1,142 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the incremental packing of the flow layout.
+
+"""
+import random
+from bisect import bisect_right
+
+import pytest
+
+from utils import is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+def make_item(rand):
+    """ Create a flow item with a random preferred size.
+
+    """
+    from enaml.qt.QtCore import QSize
+    from enaml.qt.qt_flow_item import QFlowItem
+    item = QFlowItem()
+    item.setPreferredSize(
+        QSize(rand.randrange(20, 120), rand.randrange(20, 80))
+    )
+    item.setStretch(rand.choice([0, 0, 1]))
+    return item
+
+
+def geometries(layout, rect):
+    """ Layout the items for the given rect and get their geometries.
+
+    """
+    layout.setGeometry(rect)
+    height = layout.heightForWidth(rect.width())
+    items = [layout.itemAt(i).widget() for i in range(layout.count())]
+    return height, [item.geometry().getRect() for item in items]
+
+
+@pytest.mark.parametrize('direction', [0, 1, 2, 3])
+def test_flow_layout_incremental_packing(qt_app, direction):
+    """Test that the cached packings match a full relayout.
+
+    """
+    from enaml.qt.QtCore import QRect, QSize
+    from enaml.qt.QtWidgets import QWidget
+    from enaml.qt.q_flow_layout import QFlowLayout
+
+    rand = random.Random(direction)
+    host = QWidget()
+    layout = QFlowLayout()
+    layout.setDirection(direction)
+    layout.setAlignment(QFlowLayout.AlignJustify)
+    host.setLayout(layout)
+    for _ in range(60):
+        layout.addWidget(make_item(rand))
+
+    rects = [QRect(0, 0, 300, 500), QRect(0, 0, 450, 600)]
+    for step in range(20):
+        # Warm the cache of packings for several extents.
+        for rect in rects:
+            geometries(layout, rect)
+        action = step % 3
+        if action == 0:
+            index = rand.randrange(layout.count())
+            item = layout.itemAt(index).widget()
+            item.setPreferredSize(QSize(rand.randrange(20, 200), 30))
+        elif action == 1:
+            layout.insertWidget(rand.randrange(layout.count()),
+                                make_item(rand))
+        else:
+            index = rand.randrange(layout.count())
+            item = layout.itemAt(index).widget()
+            layout.takeAt(index)
+            item.setParent(None)
+        assert not layout._dirty_items
+        for rect in rects:
+            cached = geometries(layout, rect)
+            layout._packings.clear()
+            assert geometries(layout, rect) == cached
+
+
+def test_flow_layout_truncated_packing(qt_app):
+    """Test that the lines before a changed item are kept.
+
+    """
+    from enaml.qt.QtCore import QRect, QSize
+    from enaml.qt.QtWidgets import QWidget
+    from enaml.qt.q_flow_layout import QFlowLayout
+
+    rand = random.Random(0)
+    host = QWidget()
+    layout = QFlowLayout()
+    layout.setContentsMargins(0, 0, 0, 0)
+    host.setLayout(layout)
+    for _ in range(100):
+        layout.addWidget(make_item(rand))
+    layout.setGeometry(QRect(0, 0, 400, 400))
+    packing = layout._packings[400]
+    assert packing.count == 100
+    line = bisect_right(packing.starts, 80) - 1
+
+    item = layout.itemAt(80).widget()
+    item.setPreferredSize(QSize(50, 50))
+    assert packing.count <= 80
+    assert len(packing.starts) in (line - 1, line)
+    assert layout._valid.count(0) == 1
+
+
+@pytest.mark.parametrize('direction', [2, 3])
+def test_flow_layout_vertical_minimum_size(qt_app, direction):
+    """Test the minimum size of a vertical flow with stretch items.
+
+    The space distributed to the columns is fractional, while Qt only
+    accepts integer sizes.
+
+    """
+    from enaml.qt.QtCore import QRect
+    from enaml.qt.QtWidgets import QWidget
+    from enaml.qt.q_flow_layout import QFlowLayout
+
+    rand = random.Random(97)
+    host = QWidget()
+    layout = QFlowLayout()
+    layout.setDirection(direction)
+    host.setLayout(layout)
+    for _ in range(7):
+        item = make_item(rand)
+        item.setStretch(1)
+        item.setOrthoStretch(1)
+        layout.addWidget(item)
+    layout.setGeometry(QRect(0, 0, 333, 100))
+    assert isinstance(layout._cached_wfh, int)
+    size = layout.minimumSize()
+    assert size.width() == layout._cached_wfh
+    assert isinstance(layout.heightForWidth(333), int)
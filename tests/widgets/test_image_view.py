@@ -53,6 +53,157 @@ def test_displaying_no_image(enaml_qtbot, enaml_sleep):
     enaml_qtbot.wait(enaml_sleep)
 
 
+
+LIVE_SOURCE = """
+from enaml.image import Image
+from enaml.widgets.api import Window, Container, ImageView
+
+enamldef Main(Window):
+
+    attr buffer
+    alias view: img
+
+    Container:
+        ImageView: img:
+            scale_to_fit = True
+            image = Image(format='argb32', raw_size=(4, 4), data=buffer)
+
+"""
+
+
+@pytest.mark.skipif(not is_qt_available(), reason='Requires a Qt binding')
+def test_live_image_updates(enaml_qtbot, enaml_sleep, monkeypatch):
+    """Test updating the pixels of the image in place.
+
+    """
+    from enaml.qt.qt_image_view import QImageView
+
+    buffer = bytearray(b'\x00\x00\x00\xff' * 16)
+    win = compile_source(LIVE_SOURCE, 'Main')(buffer=buffer)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    widget = win.view.proxy.widget
+    assert widget.image() is win.view.image._tkdata
+
+    refreshes = []
+    refresh = QImageView._refreshImage
+    monkeypatch.setattr(QImageView, '_refreshImage',
+                        lambda self: refreshes.append(1) or refresh(self))
+
+    def pixel():
+        return widget.pixmap().toImage().pixel(1, 1)
+
+    # The first update is displayed immediately and the following ones
+    # are coalesced until the end of the frame interval.
+    for value in range(1, 11):
+        buffer[20:23] = bytes([value] * 3)
+        win.view.update_image()
+    assert len(refreshes) == 1
+    assert pixel() == 0xff010101
+    enaml_qtbot.wait_until(lambda: len(refreshes) == 2)
+    assert pixel() == 0xff0a0a0a
+    enaml_qtbot.wait_until(lambda: not widget._frame_timer.isActive())
+    assert len(refreshes) == 2
+
+    # A repaint without new data reuses the scaled pixmap.
+    widget.repaint()
+    scaled = widget._scaled_pixmap
+    assert scaled is not None
+    widget.repaint()
+    assert widget._scaled_pixmap is scaled
+
+    win.view.update_image()
+    assert widget._scaled_pixmap is None
+    widget.repaint()
+    assert widget._scaled_pixmap is not scaled
+
+
+@pytest.mark.skipif(not is_qt_available(), reason='Requires a Qt binding')
+def test_live_image_updates_non_contiguous(enaml_qtbot, enaml_sleep):
+    """Test updating an image whose buffer has to be copied by Qt.
+
+    """
+    storage = bytearray(128)
+    storage[::2] = b'\x00\x00\x00\xff' * 16
+    buffer = memoryview(storage)[::2]
+    win = compile_source(LIVE_SOURCE, 'Main')(buffer=buffer)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    widget = win.view.proxy.widget
+
+    # The bytes of the pixel (1, 1) are every other byte of the storage.
+    storage[40:46:2] = bytes([7] * 3)
+    win.view.update_image()
+    assert widget.pixmap().toImage().pixel(1, 1) == 0xff070707
+
+
+
+ASYNC_SOURCE = """
+from enaml.icon import Icon, IconImage
+from enaml.image import Image
+from enaml.widgets.api import (
+    Window, Container, ImageView, ObjectCombo, PushButton
+)
+
+def make_image(data):
+    return Image(data=data, decode_async=True)
+
+def make_icon(data):
+    return Icon(images=[IconImage(image=make_image(data))])
+
+enamldef Main(Window):
+
+    attr images
+    alias view
+    alias button
+    alias combo
+
+    Container:
+        ImageView: view:
+            image = make_image(images[0])
+        PushButton: button:
+            icon = make_icon(images[1])
+        ObjectCombo: combo:
+            items = images[2:]
+            to_icon = make_icon
+
+"""
+
+
+@pytest.mark.skipif(not is_qt_available(), reason='Requires a Qt binding')
+def test_background_decoding(enaml_qtbot, enaml_sleep):
+    """Test that the images decoded in the background are displayed.
+
+    """
+    from enaml.qt.QtCore import QBuffer, QByteArray, QIODevice
+    from enaml.qt.QtGui import QColor, QImage
+
+    def make_png(value):
+        qimage = QImage(16, 16, QImage.Format_ARGB32)
+        qimage.fill(QColor(value, 0, 0))
+        array = QByteArray()
+        buffer = QBuffer(array)
+        buffer.open(QIODevice.WriteOnly)
+        qimage.save(buffer, 'PNG')
+        return bytes(array)
+
+    win = compile_source(ASYNC_SOURCE, 'Main')(
+        images=[make_png(v) for v in range(201, 206)]
+    )
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    view = win.view.proxy.widget
+    button = win.button.proxy.widget
+    combo = win.combo.proxy.widget
+    enaml_qtbot.wait_until(lambda: view.pixmap() is not None)
+    assert view.image().pixel(0, 0) == QColor(201, 0, 0).rgba()
+    enaml_qtbot.wait_until(lambda: not button.icon().isNull())
+    enaml_qtbot.wait_until(
+        lambda: all(not combo.itemIcon(i).isNull() for i in range(3))
+    )
+    assert combo.count() == 3
+
+
 # XXX The following test require to compare to a reference image since we
 # cannot access the size of the painted area to ensure that scaling was done
 # properly
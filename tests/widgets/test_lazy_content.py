@@ -0,0 +1,131 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the lazy content pattern.
+
+"""
+import pytest
+
+from utils import is_qt_available, compile_source, wait_for_window_displayed
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+SOURCE = """
+from enaml.layout.api import TabLayout
+from enaml.widgets.api import (
+    Container, DockArea, DockItem, Field, LazyContent, Notebook, Page, Window
+)
+
+enamldef Main(Window):
+
+    attr built = []
+    alias nb
+    alias page1
+    alias page2
+    alias lazy_page
+    alias item1
+    alias item2
+    alias lazy_item
+
+    Container:
+        Notebook: nb:
+            Page: page1:
+                name = 'page1'
+                title = 'Page 1'
+                Container:
+                    Field:
+                        text = 'page 1'
+            Page: page2:
+                name = 'page2'
+                title = 'Page 2'
+                LazyContent: lazy_page:
+                    placeholder_size = (200, 100)
+                    unload_delay = 0.05
+                    Container:
+                        Field:
+                            text = 'page 2'
+                            initialized ::
+                                built.append('page2')
+        DockArea:
+            layout = TabLayout('item1', 'item2')
+            DockItem: item1:
+                name = 'item1'
+                Container:
+                    Field:
+                        text = 'item 1'
+            DockItem: item2:
+                name = 'item2'
+                LazyContent: lazy_item:
+                    Container:
+                        Field:
+                            text = 'item 2'
+                            initialized ::
+                                built.append('item2')
+
+"""
+
+
+def content_text(widget):
+    """ Get the text of the field of the content of a widget.
+
+    """
+    for child in reversed(widget.children):
+        if type(child).__name__ == 'Container':
+            for field in child.children:
+                return field.text
+
+
+def test_lazy_content(enaml_qtbot, enaml_sleep):
+    """Test that the content is built when its parent is first shown.
+
+    """
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    enaml_qtbot.wait(enaml_sleep)
+
+    assert win.built == []
+    assert not win.lazy_page.loaded
+    assert not win.lazy_item.loaded
+    placeholder = win.page2.page_widget()
+    assert placeholder is win.lazy_page.placeholder
+    assert placeholder.proxy.widget.minimumSize().width() == 200
+    assert content_text(win.page1) == 'page 1'
+
+    # Showing the page builds its content.
+    win.nb.selected_tab = 'page2'
+    enaml_qtbot.wait_until(lambda: win.lazy_page.loaded)
+    assert win.built == ['page2']
+    assert placeholder.is_destroyed
+    assert win.page2.page_widget().proxy_is_active
+    assert content_text(win.page2) == 'page 2'
+    assert win.page2.proxy.widget.pageWidget().isVisible()
+
+    # Hiding the page destroys the content after the unload delay.
+    win.nb.selected_tab = 'page1'
+    enaml_qtbot.wait_until(lambda: not win.lazy_page.loaded)
+    assert win.page2.page_widget() is win.lazy_page.placeholder
+
+    # A hidden tab of a dock area behaves the same way.
+    assert win.item2.dock_widget() is win.lazy_item.placeholder
+    win.item2.proxy.widget.parent().parent().setCurrentIndex(1)
+    enaml_qtbot.wait_until(lambda: win.lazy_item.loaded)
+    assert content_text(win.item2) == 'item 2'
+    assert win.item2.proxy.widget.dockWidget().isVisible()
+
+    # Showing the page again before the unload delay cancels the unload.
+    win.nb.selected_tab = 'page2'
+    enaml_qtbot.wait_until(lambda: win.lazy_page.loaded)
+    win.nb.selected_tab = 'page1'
+    win.nb.selected_tab = 'page2'
+    enaml_qtbot.wait(200)
+    assert win.lazy_page.loaded
+    assert win.built == ['page2', 'item2', 'page2']
+
+    win.close()
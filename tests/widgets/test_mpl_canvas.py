@@ -0,0 +1,188 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the live updates and the throttled redraws of the MPL canvas.
+
+"""
+import pytest
+
+from utils import is_qt_available, compile_source, wait_for_window_displayed
+
+try:
+    import matplotlib  # noqa
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
+else:
+    MATPLOTLIB_AVAILABLE = True
+
+pytestmark = [
+    pytest.mark.skipif(not is_qt_available(), reason='Requires a Qt binding'),
+    pytest.mark.skipif(not MATPLOTLIB_AVAILABLE, reason='Requires matplotlib'),
+]
+
+
+SOURCE = """
+from enaml.widgets.api import Window, Container, MPLCanvas
+
+enamldef Main(Window): main:
+
+    attr figure
+    alias canvas
+
+    initial_size = (400, 300)
+    Container:
+        MPLCanvas: canvas:
+            figure = main.figure
+            live_update = True
+            max_frame_rate = 10
+
+"""
+
+
+def make_figure():
+    """Create a figure with a single line.
+
+    """
+    from matplotlib.figure import Figure
+    figure = Figure()
+    line, = figure.add_subplot(111).plot([1, 3, 2])
+    return figure, line
+
+
+def show(enaml_qtbot, figure):
+    """Show a window with a canvas displaying a figure.
+
+    """
+    win = compile_source(SOURCE, 'Main')(figure=figure)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    return win
+
+
+def test_mpl_canvas_live_update(enaml_qtbot, enaml_sleep, monkeypatch):
+    """Test that the canvas is reused for a new figure.
+
+    """
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+
+    figure1, _ = make_figure()
+    win = show(enaml_qtbot, figure1)
+    proxy = win.canvas.proxy
+    canvas = proxy._get_canvas()
+    assert canvas.figure is figure1
+
+    # The dpi of the new figure is scaled by the device pixel ratio,
+    # and the old figure is detached from the canvas.
+    monkeypatch.setattr(FigureCanvasQTAgg, 'devicePixelRatioF',
+                        lambda self: 2.0)
+    canvas._update_pixel_ratio()
+    dpi = figure1._original_dpi
+    assert figure1.dpi == 2 * dpi
+
+    figure2, _ = make_figure()
+    win.canvas.figure = figure2
+    assert proxy._get_canvas() is canvas
+    assert canvas.figure is figure2
+    assert figure2.canvas is canvas
+    assert figure2.dpi == 2 * figure2._original_dpi
+    assert figure1.canvas is not canvas
+    assert figure1.dpi == dpi
+    width, height = canvas.get_width_height(physical=True)
+    assert (width, height) == (canvas.width() * 2, canvas.height() * 2)
+
+    draws = []
+    monkeypatch.setattr(canvas, 'draw_idle', lambda: draws.append(1))
+    figure1.canvas.draw_idle()
+    assert draws == []
+
+    # Without live updates the canvas is created anew.
+    win.canvas.live_update = False
+    win.canvas.figure = figure1
+    assert proxy._get_canvas() is not canvas
+    assert proxy._get_canvas().figure is figure1
+
+    win.close()
+
+
+def test_mpl_canvas_request_draw(enaml_qtbot, enaml_sleep, monkeypatch):
+    """Test that the requested redraws are coalesced.
+
+    """
+    figure, _ = make_figure()
+    win = show(enaml_qtbot, figure)
+    proxy = win.canvas.proxy
+    canvas = proxy._get_canvas()
+    enaml_qtbot.wait_until(lambda: not proxy._frame_timer.isActive())
+
+    draws = []
+    monkeypatch.setattr(canvas, 'draw_idle', lambda: draws.append(1))
+
+    # The first request is drawn at once and the following ones once
+    # at the end of the frame interval.
+    for _ in range(10):
+        win.canvas.request_draw()
+    assert draws == [1]
+    enaml_qtbot.wait_until(lambda: len(draws) == 2)
+    enaml_qtbot.wait_until(lambda: not proxy._frame_timer.isActive())
+    assert len(draws) == 2
+
+    win.close()
+
+
+def test_mpl_canvas_animated_artists(enaml_qtbot, enaml_sleep, monkeypatch):
+    """Test that the animated artists are blitted over the background.
+
+    """
+    figure, line = make_figure()
+    win = show(enaml_qtbot, figure)
+    proxy = win.canvas.proxy
+    canvas = proxy._get_canvas()
+
+    win.canvas.animated_artists = [line]
+    assert line.get_animated()
+    canvas.draw()
+    assert proxy._background is not None
+
+    calls = []
+    for name in ('draw_idle', 'restore_region', 'blit'):
+        monkeypatch.setattr(canvas, name,
+                            lambda *args, name=name: calls.append(name))
+    enaml_qtbot.wait_until(lambda: not proxy._frame_timer.isActive())
+    line.set_ydata([2, 1, 3])
+    win.canvas.request_draw()
+    assert calls == ['restore_region', 'blit']
+
+    # The background is dropped when the artists change.
+    win.canvas.animated_artists = []
+    assert not line.get_animated()
+    assert proxy._background is None
+    assert calls[-1] == 'draw_idle'
+
+    win.close()
+
+
+def test_mpl_canvas_destroy(enaml_qtbot, enaml_sleep):
+    """Test that the callbacks of the canvas are disconnected on destroy.
+
+    """
+    figure, _ = make_figure()
+    win = show(enaml_qtbot, figure)
+    proxy = win.canvas.proxy
+    canvas = proxy._get_canvas()
+    cids = list(proxy._mpl_cids)
+    assert cids
+
+    def connected():
+        registry = canvas.callbacks.callbacks
+        return [cid for callbacks in registry.values() for cid in callbacks
+                if cid in cids]
+
+    assert connected() == cids
+    win.canvas.destroy()
+    assert connected() == []
+
+    win.close()
@@ -0,0 +1,146 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the size hints of the notebook and stack widgets.
+
+"""
+import pytest
+
+from utils import is_qt_available, compile_source, wait_for_window_displayed
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+SOURCE = """
+from enaml.widgets.api import (
+    Container, Label, Notebook, Page, Stack, StackItem, Window
+)
+
+enamldef Main(Window):
+
+    attr mode = 'union'
+    attr long_text = 'page 1'
+    alias nb
+    alias stack
+
+    Container:
+        Notebook: nb:
+            size_hint_mode << mode
+            Page:
+                name = 'page1'
+                title = 'Page 1'
+                Container:
+                    Label:
+                        text << long_text
+            Page:
+                name = 'page2'
+                title = 'Page 2'
+                Container:
+                    Label:
+                        text = 'page 2'
+        Stack: stack:
+            size_hint_mode << mode
+            StackItem:
+                Container:
+                    Label:
+                        text << long_text
+            StackItem:
+                Container:
+                    Label:
+                        text = 'page 2'
+
+"""
+
+
+@pytest.mark.parametrize('mode', ['union', 'current'])
+def test_page_size_hints(enaml_qtbot, enaml_sleep, mode):
+    """Test that the size hints of the pages are cached per page.
+
+    """
+    from enaml.qt.QtWidgets import QStackedWidget, QTabWidget
+
+    win = compile_source(SOURCE, 'Main')(mode=mode)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    nb = win.nb.proxy.widget
+    stack = win.stack.proxy.widget
+
+    def check_hints():
+        # In union mode the hints match the ones computed by Qt.
+        if mode == 'union':
+            assert nb.sizeHint() == QTabWidget.sizeHint(nb)
+            assert nb.minimumSizeHint() == QTabWidget.minimumSizeHint(nb)
+            assert stack.sizeHint() == QStackedWidget.sizeHint(stack)
+            assert (stack.minimumSizeHint() ==
+                    QStackedWidget.minimumSizeHint(stack))
+        else:
+            assert stack.sizeHint() == stack.currentWidget().sizeHint()
+
+    check_hints()
+    nb_width = nb.sizeHint().width()
+    stack_width = stack.sizeHint().width()
+    pages = [nb.widget(i) for i in range(2)]
+    if mode == 'current':
+        # The hidden pages are not queried.
+        assert list(nb._page_hints._hints) == pages[:1]
+        assert list(stack._page_hints._hints) == [stack.widget(0)]
+    else:
+        assert list(nb._page_hints._hints) == pages
+        other_hints = nb._page_hints._hints[pages[1]]
+    hints = nb._page_hints._hints[pages[0]]
+
+    # A change in a page only invalidates the hints of that page.
+    win.long_text = 'a much longer text for the first page ' * 3
+    enaml_qtbot.wait_until(lambda: nb.sizeHint().width() > nb_width)
+    enaml_qtbot.wait_until(lambda: stack.sizeHint().width() > stack_width)
+    check_hints()
+    assert nb._page_hints._hints[pages[0]] != hints
+    if mode == 'union':
+        assert nb._page_hints._hints[pages[1]] is other_hints
+
+    # In current mode the hint follows the selected page.
+    if mode == 'current':
+        nb_width = nb.sizeHint().width()
+        win.nb.selected_tab = 'page2'
+        assert nb.sizeHint().width() < nb_width
+        assert list(nb._page_hints._hints) == pages
+
+    win.close()
+
+
+def test_notebook_page_without_layout_hints(qt_app):
+    """Test that the hints of a page without a layout are refreshed.
+
+    A label posts the change of its hints to the internal stacked
+    widget of the notebook rather than to itself or the notebook.
+
+    """
+    from enaml.qt.QtWidgets import QApplication, QLabel, QTabWidget
+    from enaml.qt.qt_notebook import QNotebook
+
+    nb = QNotebook()
+    label = QLabel('short')
+    nb.addTab(label, 'Page 1')
+    nb.addTab(QLabel('other'), 'Page 2')
+    nb.show()
+    QApplication.processEvents()
+    width = nb.sizeHint().width()
+    requests = []
+    nb.layoutRequested.connect(lambda: requests.append(True))
+
+    label.setText('a much longer text ' * 10)
+    QApplication.processEvents()
+    assert requests
+    assert nb.sizeHint() == QTabWidget.sizeHint(nb)
+    assert nb.sizeHint().width() > width
+
+    label.setMinimumSize(1000, 500)
+    QApplication.processEvents()
+    assert nb.minimumSizeHint() == QTabWidget.minimumSizeHint(nb)
+
+    nb.close()
@@ -0,0 +1,329 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the updates of the indicators and markers of the Scintilla widget.
+
+"""
+import pytest
+
+from utils import is_qt_available, compile_source, wait_for_window_displayed
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+try:
+    from PyQt5 import Qsci  # noqa
+except ImportError:
+    SCINTILLA_AVAILABLE = False
+else:
+    SCINTILLA_AVAILABLE = True
+
+
+@pytest.mark.parametrize('ranges, runs', [
+    ([], []),
+    ([(2, 5)], [(2, 5)]),
+    ([(2, 5), (4, 8)], [(2, 8)]),
+    ([(2, 5), (5, 8)], [(2, 8)]),
+    ([(2, 9), (3, 4)], [(2, 9)]),
+    ([(10, 12), (0, 3), (2, 4), (6, 7)], [(0, 4), (6, 7), (10, 12)]),
+    ([(4, 6), (4, 6)], [(4, 6)]),
+])
+def test_merge_ranges(ranges, runs):
+    """Test merging overlapping, adjacent, nested and unsorted ranges.
+
+    """
+    from enaml.qt.scintilla_ranges import merge_ranges
+    assert merge_ranges(ranges) == runs
+
+
+# A 1x1 transparent PNG used as the image of the markers.
+PNG = (
+    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01'
+    b'\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\x0bIDATx\x9cc`\x00\x02'
+    b'\x00\x00\x05\x00\x01z^\xab?\x00\x00\x00\x00IEND\xaeB`\x82'
+)
+
+
+SOURCE = """
+from enaml.widgets.api import Window, Container
+from enaml.scintilla.api import Scintilla
+
+enamldef Main(Window):
+
+    alias editor
+
+    Container:
+        Scintilla: editor:
+            pass
+
+"""
+
+
+@pytest.mark.skipif(not SCINTILLA_AVAILABLE, reason='Requires scintilla')
+def test_scintilla_indicator_and_marker_diffs(enaml_qtbot, enaml_sleep):
+    """Test that only the changed indicators and markers are updated.
+
+    """
+    from enaml.image import Image
+    from enaml.scintilla.api import ScintillaIndicator, ScintillaMarker
+
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    editor = win.editor
+    proxy = editor.proxy
+    widget = proxy.widget
+    proxy.set_text('\n'.join('line number %d' % i for i in range(10)))
+
+    calls = []
+    send = widget.SendScintilla
+    counted = (widget.SCI_INDICATORFILLRANGE, widget.SCI_INDICATORCLEARRANGE,
+               widget.SCI_MARKERADD, widget.SCI_MARKERDELETE)
+
+    def spy(message, *args):
+        if message in counted:
+            calls.append(message)
+        return send(message, *args)
+
+    widget.SendScintilla = spy
+
+    def indicator(start, stop, style='squiggle'):
+        return ScintillaIndicator(start=start, stop=stop, style=style)
+
+    def runs(style):
+        style_id = proxy.get_indicator_style_id(indicator((0, 0), (0, 0),
+                                                          style))
+        return [(widget.lineIndexFromPosition(start),
+                 widget.lineIndexFromPosition(stop))
+                for start, stop in proxy.get_indicator_runs(style_id)]
+
+    # Overlapping ranges of a style are filled as a single run.
+    editor.indicators = [
+        indicator((1, 0), (1, 4)), indicator((1, 2), (1, 6)),
+        indicator((3, 5), (4, 2), 'box'),
+    ]
+    assert runs('squiggle') == [((1, 0), (1, 6))]
+    assert runs('box') == [((3, 5), (4, 2))]
+
+    # Setting equal indicators does not touch the document.
+    del calls[:]
+    editor.indicators = [
+        indicator((1, 0), (1, 6)), indicator((3, 5), (4, 2), 'box'),
+    ]
+    assert calls == []
+
+    # Only the changed runs are cleared and filled.
+    editor.indicators = [
+        indicator((1, 0), (1, 6)), indicator((5, 0), (5, 3), 'box'),
+    ]
+    assert calls == [widget.SCI_INDICATORCLEARRANGE,
+                     widget.SCI_INDICATORFILLRANGE]
+    assert runs('squiggle') == [((1, 0), (1, 6))]
+    assert runs('box') == [((5, 0), (5, 3))]
+
+    # The runs moved by an edit are compared where they now are.
+    widget.insertAt('xx', 1, 0)
+    del calls[:]
+    editor.indicators = [
+        indicator((1, 2), (1, 8)), indicator((5, 0), (5, 3), 'box'),
+    ]
+    assert calls == []
+    editor.indicators = []
+    assert runs('squiggle') == runs('box') == []
+
+    # The markers are diffed in the same way.
+    image = Image(data=PNG)
+    editor.markers = [ScintillaMarker(line=1, image=image),
+                      ScintillaMarker(line=3, image=image)]
+    marker_id = proxy._marker_images[image]
+    assert proxy.get_marker_lines(marker_id) == [1, 3]
+    del calls[:]
+    editor.markers = [ScintillaMarker(line=3, image=image),
+                      ScintillaMarker(line=4, image=image)]
+    assert sorted(calls) == sorted([widget.SCI_MARKERDELETE,
+                                    widget.SCI_MARKERADD])
+    assert proxy.get_marker_lines(marker_id) == [3, 4]
+
+    widget.insertAt('\n', 0, 0)
+    assert proxy.get_marker_lines(marker_id) == [4, 5]
+    del calls[:]
+    editor.markers = [ScintillaMarker(line=4, image=image),
+                      ScintillaMarker(line=5, image=image)]
+    assert calls == []
+
+    win.close()
+
+
+API_SOURCE = """
+from enaml.widgets.api import Window, Container
+from enaml.scintilla.api import Scintilla
+
+enamldef Main(Window): main:
+
+    attr cache = ''
+    alias editor
+
+    Container:
+        Scintilla: editor:
+            syntax = 'python'
+            autocomplete = 'all'
+            autocompletions_cache = main.cache
+
+"""
+
+
+def show_api_editor(enaml_qtbot, cache=''):
+    """Show an editor using python syntax and autocompletions.
+
+    """
+    win = compile_source(API_SOURCE, 'Main')(cache=cache)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    return win
+
+
+def completions(api, prefix):
+    """Get the completions of a prefix from an API.
+
+    """
+    return sorted(c.strip() for c in api.updateAutoCompletionList([prefix], []))
+
+
+@pytest.mark.skipif(not SCINTILLA_AVAILABLE, reason='Requires scintilla')
+def test_scintilla_autocompletions_prepared(enaml_qtbot, enaml_sleep):
+    """Test that the previous API remains active until the new one is ready.
+
+    """
+    win = show_api_editor(enaml_qtbot)
+    editor = win.editor
+    proxy = editor.proxy
+    lexer = proxy.widget.lexer()
+
+    editor.autocompletions = ['alpha', 'alphabet']
+    enaml_qtbot.wait_until(lambda: proxy.pending_api is None)
+    old = proxy.qsci_api
+    assert lexer.apis() is old
+    assert completions(old, 'alp') == ['alpha', 'alphabet']
+
+    editor.autocompletions = ['delta', 'deltoid']
+    new = proxy.pending_api
+    assert new is not None
+    assert proxy.qsci_api is old
+    assert lexer.apis() is old
+
+    enaml_qtbot.wait_until(lambda: proxy.pending_api is None)
+    assert proxy.qsci_api is new
+    assert lexer.apis() is new
+    assert completions(new, 'del') == ['delta', 'deltoid']
+
+    win.close()
+
+
+@pytest.mark.skipif(not SCINTILLA_AVAILABLE, reason='Requires scintilla')
+def test_scintilla_autocompletions_cancelled(enaml_qtbot, enaml_sleep,
+                                             monkeypatch):
+    """Test that setting new options cancels the pending API.
+
+    """
+    from enaml.qt.qt_scintilla import QtScintilla
+
+    installed = []
+    install_api = QtScintilla.install_api
+
+    def spy(self, api):
+        installed.append(api)
+        install_api(self, api)
+
+    monkeypatch.setattr(QtScintilla, 'install_api', spy)
+
+    win = show_api_editor(enaml_qtbot)
+    editor = win.editor
+    proxy = editor.proxy
+
+    editor.autocompletions = ['alpha', 'alphabet']
+    first = proxy.pending_api
+    editor.autocompletions = ['delta', 'deltoid']
+    second = proxy.pending_api
+    assert second is not first
+
+    enaml_qtbot.wait_until(lambda: proxy.pending_api is None)
+    enaml_qtbot.wait(10)
+    assert installed == [second]
+    assert proxy.qsci_api is second
+    assert completions(second, 'alp') == []
+    assert completions(second, 'del') == ['delta', 'deltoid']
+
+    win.close()
+
+
+@pytest.mark.skipif(not SCINTILLA_AVAILABLE, reason='Requires scintilla')
+def test_scintilla_autocompletions_cache(enaml_qtbot, enaml_sleep, tmpdir):
+    """Test that the prepared API is saved and loaded from the cache.
+
+    """
+    cache = str(tmpdir.join('apis'))
+    win = show_api_editor(enaml_qtbot, cache)
+    editor = win.editor
+    proxy = editor.proxy
+
+    options = ['delta', 'deltoid']
+    editor.autocompletions = options
+    assert proxy.pending_api is not None
+    enaml_qtbot.wait_until(lambda: proxy.pending_api is None)
+    path = proxy.prepared_api_path(options)
+    assert tmpdir.join('apis').listdir() == [tmpdir.join('apis',
+                                                         path[len(cache)+1:])]
+
+    editor.autocompletions = ['alpha']
+    enaml_qtbot.wait_until(lambda: proxy.pending_api is None)
+
+    # A cache hit is installed without a background preparation.
+    editor.autocompletions = list(options)
+    assert proxy.pending_api is None
+    assert proxy.widget.lexer().apis() is proxy.qsci_api
+    assert completions(proxy.qsci_api, 'del') == ['delta', 'deltoid']
+
+    win.close()
+
+
+@pytest.mark.skipif(not SCINTILLA_AVAILABLE, reason='Requires scintilla')
+def test_scintilla_autocompletions_syntax(enaml_qtbot, enaml_sleep):
+    """Test that changing the syntax drops the active and pending APIs.
+
+    """
+    win = show_api_editor(enaml_qtbot)
+    editor = win.editor
+    proxy = editor.proxy
+
+    editor.autocompletions = ['alpha', 'alphabet']
+    enaml_qtbot.wait_until(lambda: proxy.pending_api is None)
+    old = proxy.qsci_api
+    editor.autocompletions = ['delta', 'deltoid']
+    pending = proxy.pending_api
+
+    # The options are prepared anew for the new lexer.
+    editor.syntax = 'cpp'
+    assert proxy.qsci_api is None
+    assert proxy.pending_api not in (None, old, pending)
+    enaml_qtbot.wait_until(lambda: proxy.pending_api is None)
+    enaml_qtbot.wait(10)
+    assert proxy.widget.lexer().apis() is proxy.qsci_api
+    assert completions(proxy.qsci_api, 'del') == ['delta', 'deltoid']
+
+    # Without a lexer there are no APIs.
+    editor.autocompletions = ['alpha']
+    editor.syntax = ''
+    assert proxy.widget.lexer() is None
+    assert proxy.qsci_api is None
+    assert proxy.pending_api is None
+    enaml_qtbot.wait(10)
+
+    editor.syntax = 'python'
+    enaml_qtbot.wait_until(lambda: proxy.pending_api is None)
+    assert completions(proxy.qsci_api, 'alp') == ['alpha']
+
+    win.close()
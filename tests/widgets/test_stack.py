@@ -0,0 +1,139 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the stack widget transitions.
+
+"""
+import pytest
+
+from utils import is_qt_available, compile_source, wait_for_window_displayed
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+SOURCE = """
+from enaml.widgets.api import (
+    Container, Field, Stack, StackItem, Transition, Window
+)
+
+enamldef Main(Window):
+
+    alias stack
+    alias field2
+
+    Container:
+        Stack: stack:
+            transition = Transition(type='slide', duration=50)
+            StackItem:
+                Container:
+                    Field:
+                        text = 'page 1'
+            StackItem:
+                Container:
+                    Field: field2:
+                        text = 'page 2'
+            StackItem:
+                Container:
+                    Field:
+                        text = 'page 3'
+
+"""
+
+
+def test_stack_transition_buffers(enaml_qtbot, enaml_sleep):
+    """Test the reuse of the pixmaps of the stack transitions.
+
+    """
+    from enaml.qt.QtCore import Qt
+    from enaml.qt.QtGui import QPixmap
+    from enaml.qt.QtWidgets import QApplication
+
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    stack = win.stack
+    qstack = stack.proxy.widget
+
+    def transition_to(index):
+        stack.index = index
+        enaml_qtbot.wait_until(lambda: qstack.currentIndex() == index and
+                               qstack.transition().state() !=
+                               qstack.transition().Running)
+
+    grabbed = []
+    transition = qstack.transition()
+    set_pixmaps = transition.setPixmaps
+
+    def record(start, end, out):
+        if end is not None:
+            grabbed.append((start, end, out, end.toImage()))
+        set_pixmaps(start, end, out)
+
+    transition.setPixmaps = record
+
+    # The pixmaps of a transition are returned to a pool and reused.
+    transition_to(1)
+    assert qstack.transition().outPixmap() is None
+    pixmaps = grabbed[-1][:3]
+    assert sorted(map(id, qstack._pixmaps)) == sorted(map(id, pixmaps))
+    transition_to(0)
+    assert sorted(map(id, grabbed[-1][:3])) == sorted(map(id, pixmaps))
+    assert len(qstack._pixmaps) == 3
+
+    # A change of a child of a hidden page is shown by the transition.
+    win.field2.text = 'changed while hidden'
+    transition_to(1)
+    image = grabbed[-1][3]
+    assert image != grabbed[0][3]
+    # The page is grabbed before the focus moves into it.
+    QApplication.focusWidget().clearFocus()
+    page2 = qstack.widget(1)
+    expected = QPixmap(page2.size())
+    expected.fill(Qt.transparent)
+    page2.render(expected)
+    assert image == expected.toImage()
+
+    # Rapid changes of the index end on the last requested page.
+    stack.index = 2
+    enaml_qtbot.wait(10)
+    stack.index = 0
+    enaml_qtbot.wait_until(lambda: qstack.currentIndex() == 0)
+    enaml_qtbot.wait(enaml_sleep)
+    assert stack.index == 0
+    assert qstack.currentWidget().isVisible()
+
+    qstack.clearPixmaps()
+    assert not qstack._pixmaps
+
+    win.close()
+
+
+def test_stack_page_without_layout_hints(qt_app):
+    """Test that the hints of a page without a layout are refreshed.
+
+    A label posts the change of its hints to its parent stack rather
+    than to itself.
+
+    """
+    from enaml.qt.QtWidgets import QApplication, QLabel, QStackedWidget
+    from enaml.qt.qt_stack import QStack
+
+    stack = QStack()
+    label = QLabel('short')
+    stack.addWidget(label)
+    stack.addWidget(QLabel('other'))
+    width = stack.sizeHint().width()
+
+    label.setText('a much longer text ' * 10)
+    QApplication.processEvents()
+    assert stack.sizeHint() == QStackedWidget.sizeHint(stack)
+    assert stack.sizeHint().width() > width
+
+    label.setMinimumSize(1000, 500)
+    QApplication.processEvents()
+    assert stack.minimumSizeHint() == QStackedWidget.minimumSizeHint(stack)
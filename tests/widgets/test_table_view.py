@@ -0,0 +1,268 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the table view and its data providers.
+
+"""
+import pytest
+
+from atom.api import Int, List
+
+from enaml.widgets.data_providers import ColumnTableProvider
+
+from utils import is_qt_available, compile_source, wait_for_window_displayed
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+class RecordingProvider(ColumnTableProvider):
+    """ A column provider recording the ranges of cells it fetched.
+
+    """
+    fetches = List()
+
+    def fetch(self, first_row, last_row, first_column, last_column):
+        self.fetches.append((first_row, last_row, first_column, last_column))
+        return super(RecordingProvider, self).fetch(
+            first_row, last_row, first_column, last_column
+        )
+
+
+def test_column_table_provider():
+    """Test fetching ranges of cells from columns.
+
+    """
+    provider = ColumnTableProvider(
+        columns=[range(10), ['a', 'b', 'c', 'd'], (1.5, 2.5, 3.5, 4.5, 5.5)],
+        headers=['x', 'y']
+    )
+    assert provider.row_count() == 4
+    assert provider.column_count() == 3
+    assert provider.fetch(1, 3, 0, 2) == [(1, 'b'), (2, 'c')]
+    assert provider.fetch(3, 4, 1, 3) == [('d', 4.5)]
+    assert [provider.column_header(i) for i in range(3)] == ['x', 'y', '2']
+
+    events = []
+    provider.observe('reset', lambda change: events.append('reset'))
+    provider.observe('cells_changed',
+                     lambda change: events.append(change['value']))
+    provider.columns = [range(2)]
+    provider.notify_changed(0, 1)
+    assert events == ['reset', (0, 1, 0, 1)]
+
+
+def test_column_table_provider_numpy():
+    """Test that the values of NumPy columns are Python scalars.
+
+    """
+    np = pytest.importorskip('numpy')
+    provider = ColumnTableProvider(
+        columns=[np.arange(5, dtype=np.int64), np.linspace(0, 1, 5)]
+    )
+    rows = provider.fetch(1, 3, 0, 2)
+    assert rows == [(1, 0.25), (2, 0.5)]
+    assert type(rows[0][0]) is int
+
+
+SOURCE = """
+from enaml.widgets.api import Window, Container, TableView
+
+enamldef Main(Window): main:
+
+    attr provider
+    alias table
+
+    initial_size = (400, 300)
+    Container:
+        TableView: table:
+            provider = main.provider
+
+"""
+
+
+def test_table_view(enaml_qtbot, enaml_sleep):
+    """Test that a table view only fetches the displayed cells.
+
+    """
+    n_rows = 1000000
+    provider = RecordingProvider(
+        columns=[list(range(n_rows)), ['row %d' % i for i in range(n_rows)]],
+        headers=['index', 'name'],
+    )
+    win = compile_source(SOURCE, 'Main')(provider=provider)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    table = win.table
+    widget = table.proxy.widget
+    model = widget.model()
+    assert model.rowCount() == n_rows
+    assert model.columnCount() == 2
+    assert model.headerData(1, 1) == 'name'
+
+    def fetched_rows():
+        return sum(last - first for first, last, _, _ in provider.fetches)
+
+    enaml_qtbot.wait_until(lambda: bool(provider.fetches))
+    assert fetched_rows() < 200
+
+    # Scrolling only fetches the cells which are displayed.
+    del provider.fetches[:]
+    table.scroll_to(n_rows - 1, 1)
+    enaml_qtbot.wait_until(lambda: bool(provider.fetches))
+    assert all(first >= n_rows - 200 for first, _, _, _ in provider.fetches)
+    assert fetched_rows() < 200
+    assert model.data(model.index(n_rows - 1, 1)) == 'row %d' % (n_rows - 1)
+
+    # The changes of the provider are forwarded to the view.
+    provider.columns[1][n_rows - 1] = 'changed'
+    provider.notify_changed(n_rows - 1, n_rows)
+    assert model.data(model.index(n_rows - 1, 1)) == 'changed'
+
+    provider.columns[0].append(n_rows)
+    provider.columns[1].append('new')
+    provider.notify_inserted(n_rows, 1)
+    assert model.rowCount() == n_rows + 1
+    assert model.data(model.index(n_rows, 1)) == 'new'
+
+    del provider.columns[0][:10]
+    del provider.columns[1][:10]
+    provider.notify_removed(0, 10)
+    assert model.rowCount() == n_rows - 9
+    assert model.data(model.index(0, 1)) == 'row 10'
+
+    provider.columns = [['a', 'b']]
+    assert model.rowCount() == 2
+    assert model.columnCount() == 1
+
+    # The current cell and activations are reported to the declaration.
+    activated = []
+    table.observe('activated', lambda change: activated.append(change))
+    widget.setCurrentIndex(model.index(1, 0))
+    assert (table.current_row, table.current_column) == (1, 0)
+    widget.activated.emit(model.index(1, 0))
+    assert activated[0]['value'] == (1, 0)
+
+    # Rows inserted above the current cell shift it.
+    provider.columns[0][0:0] = ['x', 'y']
+    provider.notify_inserted(0, 2)
+    assert (table.current_row, table.current_column) == (3, 0)
+
+    provider.columns = []
+    assert (table.current_row, table.current_column) == (-1, -1)
+
+    win.close()
+
+
+TREE_SOURCE = """
+from enaml.widgets.api import Window, Container, TreeView
+
+enamldef Main(Window): main:
+
+    attr provider
+    alias tree
+
+    initial_size = (400, 300)
+    Container:
+        TreeView: tree:
+            provider = main.provider
+
+"""
+
+
+def make_tree_provider():
+    """ Create a provider of a tree with 1000 children per node.
+
+    The nodes are tuples of indices from the root.
+
+    """
+    from enaml.widgets.data_providers import TreeProvider
+
+    class Provider(TreeProvider):
+
+        requests = List()
+
+        fetches = List()
+
+        count = Int(1000)
+
+        def column_count(self):
+            return 2
+
+        def child_count(self, node):
+            return self.count if node is None or len(node) < 2 else 0
+
+        def children(self, node, start, stop):
+            self.requests.append((node, start, stop))
+            node = node or ()
+            return [node + (i,) for i in range(start, stop)]
+
+        def fetch(self, node):
+            self.fetches.append(node)
+            return ['node %s' % '.'.join(map(str, node)), len(node)]
+
+    return Provider()
+
+
+def test_tree_view(enaml_qtbot, enaml_sleep):
+    """Test that a tree view fetches the nodes it displays.
+
+    """
+    provider = make_tree_provider()
+    win = compile_source(TREE_SOURCE, 'Main')(provider=provider)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    tree = win.tree
+    widget = tree.proxy.widget
+    model = widget.model()
+    enaml_qtbot.wait_until(lambda: bool(provider.fetches))
+    # The children are fetched by blocks and the values of the
+    # displayed nodes only.
+    assert all(node is None and stop - start <= 256
+               for node, start, stop in provider.requests)
+    assert len(provider.fetches) < 100
+
+    index = model.index(3, 0)
+    assert model.data(index) == 'node 3'
+    assert model.data(model.index(3, 1)) == 1
+    assert model.hasChildren(index)
+    assert not model.parent(index).isValid()
+    assert model.nodeAt(index) == (3,)
+
+    # The children of a node are fetched when it is expanded.
+    widget.expand(index)
+    child = model.index(300, 0, index)
+    assert model.data(child) == 'node 3.300'
+    assert model.parent(child) == index
+    assert not model.hasChildren(child)
+    assert ((3,), 256, 512) in provider.requests
+    assert model.indexOf((3, 300)) == child
+
+    # The changes of the provider are forwarded to the view.
+    provider.count = 10
+    provider.notify_children_changed((3,))
+    assert model.rowCount(index) == 10
+    assert model.data(model.index(5, 0, index)) == 'node 3.5'
+    assert not model.indexOf((3, 300)).isValid()
+
+    del provider.fetches[:]
+    provider.notify_node_changed((3, 5))
+    assert model.data(model.index(5, 0, index)) == 'node 3.5'
+    assert provider.fetches == [(3, 5)]
+
+    activated = []
+    tree.observe('activated', lambda change: activated.append(change))
+    widget.setCurrentIndex(model.index(5, 0, index))
+    assert tree.current_node == (3, 5)
+    widget.activated.emit(model.index(5, 1, index))
+    assert activated[0]['value'] == ((3, 5), 1)
+
+    provider.notify_children_changed()
+    assert model.rowCount() == 10
+    assert tree.current_node is None
+
+    win.close()
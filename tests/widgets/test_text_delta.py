@@ -0,0 +1,227 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the text deltas emitted by the text widgets.
+
+"""
+import random
+
+import pytest
+
+from enaml.widgets.text_delta import TextDelta
+
+from utils import is_qt_available, compile_source, wait_for_window_displayed
+
+
+@pytest.mark.parametrize('delta, expected', [
+    (TextDelta(line=0, column=1, removed=0, inserted='XY'), 'aXYbc\ndef\ng'),
+    (TextDelta(line=1, column=0, removed=3, inserted=''), 'abc\n\ng'),
+    (TextDelta(line=0, column=2, removed=3, inserted='-'), 'ab-ef\ng'),
+    (TextDelta(line=0, column=3, removed=5, inserted='\n1\n2'),
+     'abc\n1\n2g'),
+    (TextDelta(line=2, column=1, removed=0, inserted='\n'), 'abc\ndef\ng\n'),
+])
+def test_text_delta_apply(delta, expected):
+    """Test applying a delta to a string and to a list of lines.
+
+    """
+    text = 'abc\ndef\ng'
+    assert delta.apply(text) == expected
+    lines = text.split('\n')
+    delta.apply_lines(lines)
+    assert lines == expected.split('\n')
+
+
+SOURCE = """
+from enaml.widgets.api import Window, Container, MultilineField
+
+enamldef Main(Window):
+
+    attr deltas = []
+    alias field
+
+    Container:
+        MultilineField: field:
+            text = 'first line\\nsecond line'
+            auto_sync_text = False
+            text_edited ::
+                deltas.append(change['value'])
+
+"""
+
+
+@pytest.mark.skipif(not is_qt_available(), reason='Requires a Qt binding')
+def test_multiline_field_deltas(enaml_qtbot, enaml_sleep):
+    """Test that the deltas of a field keep a model of its text in sync.
+
+    """
+    from enaml.qt.QtGui import QTextCursor
+
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    widget = win.field.proxy.widget
+    text = win.field.text
+    lines = text.split('\n')
+
+    def check():
+        for delta in win.deltas:
+            delta.apply_lines(lines)
+        del win.deltas[:]
+        assert '\n'.join(lines) == widget.toPlainText()
+
+    rand = random.Random(0)
+    cursor = widget.textCursor()
+    for _ in range(100):
+        length = len(widget.toPlainText())
+        start = rand.randint(0, length)
+        stop = rand.randint(start, min(start + 10, length))
+        cursor.setPosition(start)
+        cursor.setPosition(stop, QTextCursor.KeepAnchor)
+        inserted = rand.choice(['', 'x', 'yz', '\n', 'a\nb', '\n\n'])
+        if inserted:
+            cursor.insertText(inserted)
+        else:
+            cursor.removeSelectedText()
+        check()
+
+    # Typing yields one delta per character.
+    widget.setFocus()
+    widget.moveCursor(QTextCursor.End)
+    enaml_qtbot.keyClicks(widget, 'typed')
+    assert [d.inserted for d in win.deltas] == list('typed')
+    check()
+
+    # The deltas cover the text set from the declaration.
+    win.field.text = 'new\ntext'
+    check()
+    assert lines == ['new', 'text']
+
+    win.close()
+
+
+ASTRAL_SOURCE = """
+from enaml.widgets.api import Window, Container, MultilineField
+
+enamldef Main(Window): main:
+
+    attr text
+    attr deltas = []
+    alias field
+
+    Container:
+        MultilineField: field:
+            text = main.text
+            auto_sync_text = False
+            text_edited ::
+                deltas.append(change['value'])
+
+"""
+
+
+@pytest.mark.skipif(not is_qt_available(), reason='Requires a Qt binding')
+@pytest.mark.parametrize('text', [u'abc\ndef', u'\U0001f600abx\n\U0001f601'])
+def test_multiline_field_surrogate_pairs(enaml_qtbot, enaml_sleep, text):
+    """Test the deltas of edits around characters outside of the BMP.
+
+    Qt counts such characters as two UTF-16 code units, while the
+    deltas count them as one character.
+
+    """
+    from enaml.qt.QtGui import QTextCursor
+
+    win = compile_source(ASTRAL_SOURCE, 'Main')(text=text)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    widget = win.field.proxy.widget
+    lines = text.split('\n')
+
+    def units(index):
+        current = widget.toPlainText()[:index]
+        return len(current.encode('utf-16-le')) // 2
+
+    def check():
+        for delta in win.deltas:
+            delta.apply_lines(lines)
+        del win.deltas[:]
+        assert '\n'.join(lines) == widget.toPlainText()
+
+    # Delete the first character.
+    cursor = widget.textCursor()
+    cursor.setPosition(0)
+    cursor.setPosition(units(1), QTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+    check()
+
+    rand = random.Random(0)
+    for _ in range(100):
+        length = len(widget.toPlainText())
+        start = rand.randint(0, length)
+        stop = rand.randint(start, min(start + 5, length))
+        cursor.setPosition(units(start))
+        cursor.setPosition(units(stop), QTextCursor.KeepAnchor)
+        inserted = rand.choice([u'', u'x', u'\U0001f602', u'\n',
+                                u'a\U0001f603\nb\U0001f604'])
+        if inserted:
+            cursor.insertText(inserted)
+        else:
+            cursor.removeSelectedText()
+        check()
+
+    win.close()
+
+
+@pytest.mark.skipif(not is_qt_available(), reason='Requires a Qt binding')
+def test_multiline_field_line_separators(enaml_qtbot, enaml_sleep):
+    """Test that Shift+Enter and pasted line breaks start new blocks.
+
+    A line separator inside of a block is a new line of the plain text
+    but not of the positions reported by the document.
+
+    """
+    from enaml.qt.QtCore import Qt, QMimeData
+    from enaml.qt.QtGui import QTextCursor
+
+    win = compile_source(ASTRAL_SOURCE, 'Main')(text=u'ab\ncd')
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    widget = win.field.proxy.widget
+    text = win.field.text
+    lines = text.split('\n')
+
+    def check():
+        nonlocal text
+        for delta in win.deltas:
+            text = delta.apply(text)
+            delta.apply_lines(lines)
+        del win.deltas[:]
+        assert text == widget.toPlainText()
+        assert lines == text.split('\n')
+        assert widget.document().blockCount() == len(lines)
+
+    widget.setFocus()
+    cursor = widget.textCursor()
+    cursor.setPosition(1)
+    widget.setTextCursor(cursor)
+    enaml_qtbot.keyClick(widget, Qt.Key_Return, Qt.ShiftModifier)
+    enaml_qtbot.keyClicks(widget, 'xy')
+    check()
+    assert text == u'a\nxyb\ncd'
+
+    for data in (u'p\u2028q', u'r<br>s'):
+        mime = QMimeData()
+        if '<' in data:
+            mime.setHtml(data)
+        else:
+            mime.setText(data)
+        widget.moveCursor(QTextCursor.End)
+        widget.insertFromMimeData(mime)
+        enaml_qtbot.keyClicks(widget, 'z')
+        check()
+    assert text == u'a\nxyb\ncdp\nqzr\nsz'
+
+    win.close()
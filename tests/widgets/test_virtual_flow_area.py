@@ -0,0 +1,100 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2020, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the virtual mode of the flow area.
+
+"""
+import pytest
+
+from utils import is_qt_available, compile_source, wait_for_window_displayed
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+SOURCE = """
+from enaml.widgets.api import (
+    Container, FlowArea, FlowItem, Label, VirtualLooper, Window
+)
+
+enamldef Main(Window):
+
+    attr data = list(range(10000))
+    alias area
+    alias looper
+
+    initial_size = (400, 300)
+    Container:
+        FlowArea: area:
+            VirtualLooper: looper:
+                iterable << data
+                item_size = (80, 50)
+                FlowItem:
+                    Container:
+                        Label:
+                            text << str(loop.item)
+
+"""
+
+
+def test_virtual_flow_area(enaml_qtbot, enaml_sleep):
+    """Test that only the visible items of a virtual area are created.
+
+    """
+    from enaml.widgets.api import FlowItem, Label
+
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    area = win.area
+    looper = win.looper
+    qarea = area.proxy.widget
+    layout = qarea.layout()
+
+    def flow_items():
+        return [c for c in area.children if isinstance(c, FlowItem)]
+
+    def check_items():
+        visible = qarea.visibleRect()
+        for iteration in looper.iterations():
+            item = iteration.nodes[0]
+            widget = item.proxy.widget
+            assert widget.isVisible()
+            rect = layout.itemRect(iteration.index)
+            assert widget.pos() == rect.topLeft()
+            label = item.children[0].children[0]
+            assert isinstance(label, Label)
+            assert label.text == str(win.data[iteration.index])
+        first, last = layout.itemRange(visible)
+        assert looper.first <= first < last <= looper.last
+
+    enaml_qtbot.wait_until(lambda: looper.last > 0)
+    # The unused items are kept hidden to be reused later.
+    created = len(flow_items())
+    assert len(looper.iterations()) == looper.last - looper.first
+    assert looper.last - looper.first <= created < 200
+    check_items()
+    # The range extends past the visible items by the overscan.
+    assert looper.last > layout.itemRange(qarea.visibleRect())[1]
+
+    # The widgets are reused when the area is scrolled.
+    widgets = set(c.proxy.widget for c in flow_items())
+    bar = qarea.verticalScrollBar()
+    for value in (bar.maximum() // 2, bar.maximum(), 0):
+        bar.setValue(value)
+        assert looper.first > 0 or value == 0
+        check_items()
+    assert len(flow_items()) <= created + 20
+    assert set(c.proxy.widget for c in flow_items()) >= widgets
+
+    # The items follow the changes of the iterable.
+    win.data = ['item %d' % i for i in range(5)]
+    enaml_qtbot.wait_until(lambda: looper.last == 5)
+    check_items()
+    enaml_qtbot.wait_until(lambda: bar.maximum() == 0)
+
+    win.close()